@@ -9,12 +9,13 @@ from discord.ext import commands
 from dotenv import load_dotenv
 
 from config.config_loader import ConfigLoader, normalize_prefix
-from helpers.http_helper import HTTPClient
+from helpers.http_helper import HTTPClient, TokenBucket
 from helpers.task_queue import start_task_workers, stop_task_workers
 from helpers.token_manager import cleanup_tokens
 from services.log_cleanup import LogCleanupService
 from utils.logging import get_logger
 from utils.tasks import spawn
+from verification.rsi_parser import configure_parse_executor, shutdown_parse_executor
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -140,8 +141,18 @@ class MyBot(commands.Bot):
         # Initialize the HTTP client with configurable user-agent (falls back internally)
         rsi_cfg = (self.config or {}).get("rsi", {}) or {}
         ua = rsi_cfg.get("user_agent")
+        # Global RSI request budget, shared by interactive and auto-recheck calls
+        rpm = float(rsi_cfg.get("requests_per_minute", 30) or 0)
+        request_budget = TokenBucket(rpm) if rpm > 0 else None
         # Reduce concurrency to avoid rate limiting from RSI website
-        self.http_client = HTTPClient(user_agent=ua, concurrency=3, timeout=20)
+        self.http_client = HTTPClient(
+            user_agent=ua,
+            concurrency=3,
+            timeout=20,
+            request_budget=request_budget,
+        )
+        # RSI HTML parsing runs on a worker pool, off the event loop
+        configure_parse_executor(self.config)
 
         # Initialize role cache and warning tracking
         self.role_cache = {}
@@ -196,6 +207,11 @@ class MyBot(commands.Bot):
 
         await Database.initialize()
 
+        # Rehydrate rate limit counters before any interaction can be served
+        from helpers.rate_limiter import load_attempts
+
+        await load_attempts()
+
         # Initialize services container
         from services.service_container import ServiceContainer
 
@@ -218,10 +234,19 @@ class MyBot(commands.Bot):
 
         await self.add_cog(BulkAnnouncer(self))
 
-        # Start the task queue workers
+        # Start the Discord request scheduler workers
+        queue_cfg = (self.config or {}).get("task_queue", {}) or {}
         await start_task_workers(
-            num_workers=2
-        )  # Adjust the number of workers as needed
+            num_workers=int(queue_cfg.get("workers", 2)),
+            rate_per_second=float(queue_cfg.get("rate_per_second", 45)),
+            bulk_share_every=int(queue_cfg.get("bulk_share_every", 5)),
+            bucket_concurrency=int(queue_cfg.get("bucket_concurrency", 2)),
+            bucket_limits={
+                str(name): int(limit)
+                for name, limit in (queue_cfg.get("bucket_limits") or {}).items()
+            }
+            or None,
+        )
 
         # Initialize the HTTP client session
         # We use _get_session to ensure the HTTP client is initialized
@@ -507,7 +532,13 @@ class MyBot(commands.Bot):
         )
 
     async def role_refresh_task(self) -> None:
-        """Background task that periodically refreshes guild role caches."""
+        """
+        Background task that periodically refreshes guild role caches.
+
+        Dashboard writes are pushed through the internal API as they happen;
+        this loop only catches missed notifications, using one batched
+        settings-version query for all guilds.
+        """
         await self.wait_until_ready()
         interval_seconds = 300  # 5 minutes
 
@@ -521,10 +552,11 @@ class MyBot(commands.Bot):
                     await asyncio.sleep(interval_seconds)
                     continue
 
-                for guild in list(self.guilds):
-                    refreshed = await self.services.config.maybe_refresh_guild(guild.id)
-                    if refreshed:
-                        await self.refresh_guild_roles(guild.id, source="scheduled")
+                stale_guild_ids = await self.services.config.refresh_stale_guilds(
+                    [guild.id for guild in self.guilds]
+                )
+                for guild_id in stale_guild_ids:
+                    await self.refresh_guild_roles(guild_id, source="scheduled")
             except asyncio.CancelledError:
                 logger.info("Role refresh task cancelled")
                 break
@@ -565,15 +597,19 @@ class MyBot(commands.Bot):
 
     async def attempts_cleanup_task(self) -> None:
         """
-        Periodically cleans up expired rate-limiting data.
+        Periodically persists rate limit counters and cleans up expired data.
         """
         # Import here to avoid circular import
-        from helpers.rate_limiter import cleanup_attempts
+        from helpers.rate_limiter import cleanup_attempts, flush_attempts
 
+        ticks = 0
         while not self.is_closed():
-            await asyncio.sleep(300)  # Run every 5 minutes
-            # Cleanup_attempts is an async coroutine; await it to avoid "coroutine was never awaited" warnings
-            await cleanup_attempts()
+            await asyncio.sleep(30)  # Flush counters every 30 seconds
+            ticks += 1
+            if ticks % 10 == 0:  # Cleanup every 5 minutes (also flushes)
+                await cleanup_attempts()
+            else:
+                await flush_attempts()
 
     async def log_cleanup_task(self) -> None:
         """
@@ -738,8 +774,22 @@ class MyBot(commands.Bot):
             await asyncio.gather(*self._background_tasks, return_exceptions=True)
             self._background_tasks.clear()
 
-        # Close the HTTP client
+        # Persist rate limit counters recorded since the last flush
+        from helpers.rate_limiter import flush_attempts
+
+        await flush_attempts()
+
+        # Close the HTTP client and the RSI parsing pool
         await self.http_client.close()
+        shutdown_parse_executor()
+
+        # Close pooled database connections last; services may flush on cleanup
+        from services.db.database import Database
+
+        try:
+            await Database.close()
+        except Exception as e:
+            logger.exception("Error closing database connection pool", exc_info=e)
 
         # Call parent close
         await super().close()
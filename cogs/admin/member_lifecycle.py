@@ -18,6 +18,7 @@ from helpers.leadership_log import (
 )
 from helpers.task_queue import flush_tasks
 from helpers.verification_logging import log_guild_sync
+from helpers.voice_utils import forget_voice_owner
 from services.db.database import Database
 from services.guild_sync import apply_state_to_guild
 from services.verification_scheduler import compute_next_retry, schedule_user_recheck
@@ -76,6 +77,7 @@ class MemberLifecycle(commands.Cog):
         if remaining_guilds:
             # User is still in other guilds - only remove guild-specific data
             deleted = await Database.cleanup_guild_specific_data(user_id, guild.id)
+            forget_voice_owner(self.bot, user_id, guild.id)
 
             guild_names = ", ".join([g.name for g in remaining_guilds])
             logger.info(
@@ -109,6 +111,7 @@ class MemberLifecycle(commands.Cog):
         else:
             # User is not in any other bot-managed guild - full cleanup
             deleted = await Database.cleanup_all_user_data(user_id)
+            forget_voice_owner(self.bot, user_id)
 
             logger.info(
                 f"User {user_id} left guild {guild.name} and is not in any other "
@@ -4,27 +4,57 @@ import io
 import re
 import time
 from collections import defaultdict
+from dataclasses import dataclass, field
 
 import discord
 from discord.ext import commands, tasks
 
+from helpers.circuit_breaker import get_rsi_circuit_breaker
 from helpers.http_helper import NotFoundError
 from helpers.leadership_log import EventType, resolve_leadership_channel
-from helpers.task_queue import flush_tasks
+from helpers.task_queue import Priority, flush_tasks, task_priority
 from helpers.username_404 import handle_username_404
 from helpers.verification_logging import _has_meaningful_change, log_guild_sync
+from helpers.voice_utils import forget_voice_owner
 from services.db.database import Database
-from services.guild_sync import sync_user_to_all_guilds
-from services.verification_scheduler import (
-    compute_next_retry,
-    handle_recheck_failure,
-    schedule_user_recheck,
+from services.guild_sync import GuildSyncResult, sync_user_to_all_guilds
+from services.verification_scheduler import compute_next_retry, recheck_failure_rows
+from services.verification_state import (
+    GlobalVerificationState,
+    compute_global_state,
+    store_global_states,
 )
-from services.verification_state import compute_global_state, store_global_state
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Outbound RSI requests per user check (organizations page + profile page)
+RSI_REQUESTS_PER_CHECK = 2
+
+
+def _new_guild_summary() -> dict:
+    return {"checked": 0, "changed": 0, "rows": []}
+
+
+@dataclass(slots=True)
+class _RecheckRun:
+    """Mutable state shared by the workers of one auto-recheck run."""
+
+    processed: int = 0
+    circuit_paused: bool = False
+    # (state, guild sync results, next_retry) awaiting the next batch write
+    states: list[
+        tuple[GlobalVerificationState, list[GuildSyncResult], int | None]
+    ] = field(default_factory=list)
+    failures: list[tuple[int, str]] = field(default_factory=list)
+    guild_summaries: dict[int, dict] = field(
+        default_factory=lambda: defaultdict(_new_guild_summary)
+    )
+
+    @property
+    def pending_writes(self) -> int:
+        return len(self.states) + len(self.failures)
+
 
 def _build_auto_check_csv(rows: list[dict], guild_name: str) -> tuple[str, bytes]:
     timestamp_str = time.strftime("%Y%m%d_%H%M", time.gmtime())
@@ -101,10 +131,18 @@ class AutoRecheck(commands.Cog):
         # New rate protection settings
         self.startup_delay_minutes = int(batch_cfg.get("startup_delay_minutes", 5))
         self.per_user_delay_seconds = float(
-            batch_cfg.get("per_user_delay_seconds", 1.5)
+            batch_cfg.get("per_user_delay_seconds", 0.0)
         )
         self.ramp_up_runs = int(batch_cfg.get("ramp_up_runs", 3))
 
+        # Pipeline settings: pacing comes from the shared RSI request budget
+        self.workers = max(1, int(batch_cfg.get("workers", 3)))
+        self.write_batch_size = max(1, int(batch_cfg.get("write_batch_size", 25)))
+        self.budget_reserve_tokens = max(
+            0, int(batch_cfg.get("budget_reserve_tokens", 2))
+        )
+        self.last_run_stats: dict = {}
+
         # Track runs since start for gradual ramp-up
         self._runs_since_start = 0
         self._startup_delay_done = False
@@ -155,10 +193,6 @@ class AutoRecheck(commands.Cog):
         else:
             effective_batch_size = self.max_users_per_run
 
-        guild_summaries: dict[int, dict] = defaultdict(
-            lambda: {"checked": 0, "changed": 0, "rows": []}
-        )
-
         # Check if manual bulk check is running - defer if so
         if (
             hasattr(self.bot, "services")
@@ -172,84 +206,192 @@ class AutoRecheck(commands.Cog):
         # Batch size cap from config (or ramp-up size)
         rows = await Database.get_due_auto_rechecks(now, effective_batch_size)
         if not rows:
+            await self._record_run_metrics(_RecheckRun(), elapsed=0.0)
             return
 
-        # Track metrics for health service
-        circuit_breaker_paused = False
-        users_processed = 0
+        start = time.monotonic()
+        run = await self._run_pipeline(rows)
+        elapsed = time.monotonic() - start
 
-        # Process users globally
-        for idx, (user_id, rsi_handle) in enumerate(rows):
-            # Per-user delay to pace requests (skip first user)
-            if idx > 0 and self.per_user_delay_seconds > 0:
-                await asyncio.sleep(self.per_user_delay_seconds)
+        await self._record_run_metrics(run, elapsed=elapsed)
+
+        if run.circuit_paused:
+            logger.info(
+                "Auto-recheck batch terminated early due to circuit breaker. "
+                "Processed %d/%d users. Will retry remaining users next run.",
+                run.processed,
+                len(rows),
+            )
 
+        await self._post_auto_summaries(run.guild_summaries)
+
+    async def _run_pipeline(self, rows: list[tuple[int, str]]) -> _RecheckRun:
+        """
+        Recheck ``rows`` with a pool of workers and batched schedule writes.
+
+        Workers wait for the shared request budget (one check plus
+        ``budget_reserve_tokens``) and reserve it before starting a user.
+        A recent 403 drops the pool to one worker; an open circuit stops
+        the run and leaves the remaining users due.
+        """
+        run = _RecheckRun()
+        queue: asyncio.Queue[tuple[int, str]] = asyncio.Queue()
+        for row in rows:
+            queue.put_nowait(row)
+
+        workers = [
+            asyncio.create_task(self._recheck_worker(index, queue, run))
+            for index in range(min(self.workers, len(rows)))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await self._flush_recheck_writes(run)
+        return run
+
+    async def _recheck_worker(
+        self, index: int, queue: asyncio.Queue[tuple[int, str]], run: _RecheckRun
+    ) -> None:
+        breaker = get_rsi_circuit_breaker(getattr(self.bot, "config", None))
+        first = True
+        while not run.circuit_paused:
+            if breaker.is_open():
+                run.circuit_paused = True
+                return
+            if index > 0 and breaker.failure_count > 0:
+                return  # RSI pushed back recently; drain with one worker
             try:
-                global_state = await compute_global_state(
-                    int(user_id),
-                    rsi_handle,
-                    self.bot.http_client,  # type: ignore[attr-defined]
-                    config=getattr(self.bot, "config", {}),
-                )
-            except NotFoundError:
-                await self._handle_not_found(user_id, rsi_handle)
-                users_processed += 1
-                continue
-            except Exception as e:
-                fail_count = await Database.get_auto_recheck_fail_count(int(user_id))
-                await handle_recheck_failure(
-                    int(user_id),
-                    str(e),
-                    fail_count=fail_count + 1,
-                    config=getattr(self.bot, "config", {}),
+                user_id, rsi_handle = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            # Optional extra pause between this worker's users (skip first user)
+            if not first and self.per_user_delay_seconds > 0:
+                await asyncio.sleep(self.per_user_delay_seconds)
+            first = False
+
+            budget = getattr(
+                getattr(self.bot, "http_client", None), "request_budget", None
+            )
+            if budget is not None:
+                await budget.reserve(
+                    RSI_REQUESTS_PER_CHECK, headroom=self.budget_reserve_tokens
                 )
-                users_processed += 1
-                continue
 
-            # Check for circuit breaker open state and pause batch
-            if global_state.error and "circuit" in global_state.error.lower():
+            await self._recheck_user(int(user_id), rsi_handle, run)
+
+            if run.pending_writes >= self.write_batch_size:
+                await self._flush_recheck_writes(run)
+
+    async def _recheck_user(
+        self, user_id: int, rsi_handle: str, run: _RecheckRun
+    ) -> None:
+        """Recheck one user, queueing its schedule update on ``run``."""
+        try:
+            global_state = await compute_global_state(
+                user_id,
+                rsi_handle,
+                self.bot.http_client,  # type: ignore[attr-defined]
+                config=getattr(self.bot, "config", {}),
+            )
+        except NotFoundError:
+            await self._handle_not_found(user_id, rsi_handle)
+            run.processed += 1
+            return
+        except Exception as e:
+            run.failures.append((user_id, str(e)))
+            run.processed += 1
+            return
+
+        # Check for circuit breaker open state and pause batch
+        if global_state.error and "circuit" in global_state.error.lower():
+            if not run.circuit_paused:
                 logger.warning(
                     "Auto-recheck pausing batch: circuit breaker is open (%s)",
                     global_state.error,
                 )
-                circuit_breaker_paused = True
+                run.circuit_paused = True
                 # Record metric if health service available
-                services = getattr(self.bot, "services", None)
-                health_service = getattr(services, "health", None)
+                health_service = self._health_service()
                 if health_service is not None:
                     await health_service.record_metric("auto_check_circuit_pauses")
-                break  # Exit batch early, will retry next loop
-
-            if global_state.error:
-                fail_count = await Database.get_auto_recheck_fail_count(int(user_id))
-                await handle_recheck_failure(
-                    int(user_id),
-                    global_state.error,
-                    fail_count=fail_count + 1,
-                    config=getattr(self.bot, "config", {}),
-                )
-                users_processed += 1
-                continue
+            return  # Will retry next loop
 
-            users_processed += 1
+        run.processed += 1
+        if global_state.error:
+            run.failures.append((user_id, global_state.error))
+            return
 
-            # Apply to guilds first so snapshot 'before' reflects prior DB state
+        # Apply to guilds first so snapshot 'before' reflects prior DB state.
+        # Role edits queue as BULK so interactive Discord actions go first.
+        with task_priority(Priority.BULK):
             results = await sync_user_to_all_guilds(
                 global_state,
                 self.bot,
                 batch_size=max(3, self.max_users_per_run // 5),
                 max_concurrency=3,
+                track_membership=False,
             )
 
-            # Persist updated global verification state after guild sync
-            try:
-                await store_global_state(global_state)
-            except ValueError as e:
-                logger.warning("Handle conflict for user %s: %s", user_id, e)
-                continue
+        try:
+            next_retry: int | None = compute_next_retry(
+                global_state,
+                fail_count=0,
+                config=getattr(self.bot, "config", {}),
+            )
+        except Exception as e:
+            logger.warning("Failed to schedule next retry for %s: %s", user_id, e)
+            next_retry = None
+
+        # Persisted with the next batch; summaries wait for that write so
+        # handle conflicts stay out of them.
+        run.states.append((global_state, results, next_retry))
+
+    async def _flush_recheck_writes(self, run: _RecheckRun) -> None:
+        """Persist queued states, schedules and failures in one transaction."""
+        states, run.states = run.states, []
+        failures, run.failures = run.failures, []
+        if not states and not failures:
+            return
+
+        try:
+            failure_rows = await recheck_failure_rows(
+                failures, config=getattr(self.bot, "config", {})
+            )
+            conflicts = await store_global_states(
+                [state for state, _, _ in states],
+                schedules=[
+                    (state.user_id, next_retry)
+                    for state, _, next_retry in states
+                    if next_retry is not None
+                ],
+                failures=failure_rows,
+                memberships=[
+                    (res.user_id, res.guild_id)
+                    for _, results, _ in states
+                    for res in results
+                ],
+            )
+        except Exception:
+            logger.exception(
+                "Failed to persist auto-recheck batch (%d states, %d failures)",
+                len(states),
+                len(failures),
+            )
+            return
 
+        for state, results, _ in states:
+            if state.user_id in conflicts:
+                logger.warning(
+                    "Handle conflict for user %s: %s",
+                    state.user_id,
+                    conflicts[state.user_id],
+                )
+                continue
             for res in results:
-                summary = guild_summaries[res.guild_id]
+                summary = run.guild_summaries[res.guild_id]
                 summary["checked"] += 1
                 if _has_meaningful_change(res.diff):
                     summary["changed"] += 1
@@ -257,34 +399,47 @@ class AutoRecheck(commands.Cog):
 
                 await log_guild_sync(res, EventType.AUTO_CHECK, self.bot)
 
-            try:
-                next_retry = compute_next_retry(
-                    global_state,
-                    fail_count=0,
-                    config=getattr(self.bot, "config", {}),
-                )
-                await schedule_user_recheck(int(user_id), next_retry)
-            except Exception as e:
-                logger.warning("Failed to schedule next retry for %s: %s", user_id, e)
-
-        # Record auto-check metrics
+    def _health_service(self):
         services = getattr(self.bot, "services", None)
-        health_service = getattr(services, "health", None)
-        if health_service is not None:
-            await health_service.record_metric("auto_check_runs")
-            await health_service.record_metric(
-                "auto_check_users_processed", users_processed
-            )
+        return getattr(services, "health", None)
 
-        if circuit_breaker_paused:
+    async def _record_run_metrics(self, run: _RecheckRun, *, elapsed: float) -> None:
+        """Record run counters plus throughput (users/min) and backlog gauges."""
+        try:
+            backlog = await Database.count_due_auto_rechecks(int(time.time()))
+        except Exception:
+            logger.exception("Failed to count auto-recheck backlog")
+            backlog = -1
+
+        users_per_minute = run.processed / (elapsed / 60) if elapsed > 0 else 0.0
+        self.last_run_stats = {
+            "processed": run.processed,
+            "elapsed_seconds": round(elapsed, 2),
+            "users_per_minute": round(users_per_minute, 2),
+            "backlog": backlog,
+            "circuit_paused": run.circuit_paused,
+        }
+        if run.processed:
             logger.info(
-                "Auto-recheck batch terminated early due to circuit breaker. "
-                "Processed %d/%d users. Will retry remaining users next run.",
-                users_processed,
-                len(rows),
+                "Auto-recheck run: %d users in %.1fs (%.1f users/min), backlog %d",
+                run.processed,
+                elapsed,
+                users_per_minute,
+                backlog,
             )
 
-        await self._post_auto_summaries(guild_summaries)
+        health_service = self._health_service()
+        if health_service is None:
+            return
+        if run.processed or elapsed:
+            await health_service.record_metric("auto_check_runs")
+            await health_service.record_metric(
+                "auto_check_users_processed", run.processed
+            )
+            await health_service.set_metric(
+                "auto_check_users_per_minute", self.last_run_stats["users_per_minute"]
+            )
+        await health_service.set_metric("auto_check_backlog", backlog)
 
     async def _prune_user_from_db(self, user_id: int) -> None:
         """Remove user data only when they have left all managed guilds."""
@@ -292,6 +447,7 @@ class AutoRecheck(commands.Cog):
         if remaining:
             return
         await Database.cleanup_all_user_data(int(user_id))
+        forget_voice_owner(self.bot, int(user_id))
 
     async def _fetch_member_or_prune(
         self, guild: discord.Guild, user_id: int
@@ -325,6 +481,7 @@ class AutoRecheck(commands.Cog):
 
         # Member not found anywhere - prune their data
         await Database.cleanup_all_user_data(int(user_id))
+        forget_voice_owner(self.bot, int(user_id))
         return None
 
     async def _handle_not_found(self, user_id: int, rsi_handle: str) -> None:
@@ -32,31 +32,39 @@ class MetricsEvents(commands.Cog):
             raise RuntimeError("Bot services not initialized")
         return self.bot.services.metrics  # type: ignore[attr-defined]
 
+    async def _excluded_channel_ids(self, guild_id: int) -> frozenset[int]:
+        """Excluded channels for a guild; only awaits on a cold cache."""
+        metrics = self.metrics_service
+        excluded = metrics.get_excluded_channel_ids_cached(guild_id)
+        if excluded is None:
+            excluded = await metrics.get_excluded_channel_ids(guild_id)
+        return excluded
+
     # ------------------------------------------------------------------
     # Message tracking
     # ------------------------------------------------------------------
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Count guild messages (ignore bots and DMs)."""
+        """Count guild messages (ignore bots and DMs).
+
+        Once a guild's excluded channels are cached this path never awaits:
+        the set lookup and ``record_message`` are both synchronous.
+        """
         if message.author.bot:
             return
-        if not message.guild:
+        guild = message.guild
+        if not guild:
             return
 
         try:
-            guild_id = message.guild.id
+            guild_id = guild.id
             channel_id = getattr(message.channel, "id", None)
-            excluded_channel_ids = await self.metrics_service.get_excluded_channel_ids(
-                guild_id
-            )
-            if channel_id in excluded_channel_ids:
+            if channel_id in await self._excluded_channel_ids(guild_id):
                 return
 
             self.metrics_service.record_message(
-                guild_id,
-                message.author.id,
-                channel_id=channel_id,
+                guild_id, message.author.id, channel_id=channel_id
             )
         except Exception:
             logger.debug("Failed to record message metric", exc_info=True)
@@ -90,9 +98,7 @@ class MetricsEvents(commands.Cog):
         user_id = member.id
 
         try:
-            excluded_channel_ids = await self.metrics_service.get_excluded_channel_ids(
-                guild_id
-            )
+            excluded_channel_ids = await self._excluded_channel_ids(guild_id)
 
             was_eligible = _is_voice_eligible(before, excluded_channel_ids)
             now_eligible = _is_voice_eligible(after, excluded_channel_ids)
@@ -142,9 +148,7 @@ class MetricsEvents(commands.Cog):
         user_id = after.id
 
         try:
-            excluded_channel_ids = await self.metrics_service.get_excluded_channel_ids(
-                guild_id
-            )
+            excluded_channel_ids = await self._excluded_channel_ids(guild_id)
             voice_state = getattr(after, "voice", None)
             current_voice_channel_id = (
                 voice_state.channel.id
@@ -196,7 +200,7 @@ class MetricsEvents(commands.Cog):
 
 
 def _is_voice_eligible(
-    state: discord.VoiceState, excluded_channel_ids: set[int]
+    state: discord.VoiceState, excluded_channel_ids: frozenset[int] | set[int]
 ) -> bool:
     """Return True when the voice state should count as active voice time.
 
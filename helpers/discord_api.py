@@ -13,6 +13,11 @@ Enqueues each call so they're rate-limited via task_queue.py.
 """
 
 
+def _id_of(obj) -> int | None:
+    """Snowflake used as the scheduler's major id (None if unavailable)."""
+    return getattr(obj, "id", None)
+
+
 async def delete_channel(channel: discord.abc.GuildChannel) -> None:
     async def _task() -> None:
         # Check if the channel still exists before deleting
@@ -35,7 +40,7 @@ async def delete_channel(channel: discord.abc.GuildChannel) -> None:
             logger.exception(f"HTTP error while deleting channel '{channel.id}'")
 
     try:
-        await enqueue_task(_task)
+        await enqueue_task(_task, bucket="channel", major_id=_id_of(channel))
     except Exception:
         logger.exception(f"Failed to enqueue delete task for channel '{channel.id}'")
 
@@ -61,7 +66,7 @@ async def edit_channel(channel: discord.abc.GuildChannel, **kwargs) -> None:
             logger.exception(f"HTTP error while editing channel '{channel.id}'")
 
     try:
-        await enqueue_task(_task)
+        await enqueue_task(_task, bucket="channel", major_id=_id_of(channel))
         logger.info(
             f"Enqueued edit for channel '{getattr(channel, 'name', channel.id)}' with {kwargs}."
         )
@@ -77,7 +82,9 @@ async def move_member(member: discord.Member, channel: discord.VoiceChannel) ->
         await member.move_to(channel)
 
     try:
-        await enqueue_task(_task)
+        await enqueue_task(
+            _task, bucket="member", major_id=_id_of(getattr(member, "guild", None))
+        )
         logger.debug(
             "Enqueued move to voice channel",
             extra={"user_id": member.id, "channel_id": channel.id},
@@ -92,7 +99,9 @@ async def add_roles(member: discord.Member, *roles, reason: str | None = None) -
         await member.add_roles(*roles, reason=reason)
 
     try:
-        await enqueue_task(_task)
+        await enqueue_task(
+            _task, bucket="member", major_id=_id_of(getattr(member, "guild", None))
+        )
         role_ids = [r.id for r in roles]
         logger.debug(
             "Enqueued add_roles", extra={"user_id": member.id, "role_ids": role_ids}
@@ -109,7 +118,9 @@ async def remove_roles(
         await member.remove_roles(*roles, reason=reason)
 
     try:
-        await enqueue_task(_task)
+        await enqueue_task(
+            _task, bucket="member", major_id=_id_of(getattr(member, "guild", None))
+        )
         role_ids = [r.id for r in roles]
         logger.debug(
             "Enqueued remove_roles", extra={"user_id": member.id, "role_ids": role_ids}
@@ -139,7 +150,9 @@ async def edit_member(member: discord.Member, **kwargs) -> None:
             logger.exception(f"Unexpected error editing member {member.id}")
 
     try:
-        await enqueue_task(_task)
+        await enqueue_task(
+            _task, bucket="member", major_id=_id_of(getattr(member, "guild", None))
+        )
         logger.debug(
             "Enqueued edit for user",
             extra={"user_id": member.id, "edit_keys": list(kwargs.keys())},
@@ -163,7 +176,7 @@ async def send_message(
     (i.e., uses interaction.response.send_message).
     """
     task = partial(send_message_task, interaction, content, ephemeral, embed, view)
-    await enqueue_task(task)
+    await enqueue_task(task, bucket="interaction", major_id=_id_of(interaction))
 
 
 async def send_message_task(
@@ -228,7 +241,7 @@ async def followup_send_message(
     task = partial(
         followup_send_message_task, interaction, content, ephemeral, embed, view
     )
-    await enqueue_task(task)
+    await enqueue_task(task, bucket="interaction", major_id=_id_of(interaction))
 
 
 async def followup_send_message_task(
@@ -272,7 +285,7 @@ async def channel_send_message(
     Enqueues a message to be sent to a specific channel.
     """
     task = partial(channel_send_message_task, channel, content, embed, view)
-    await enqueue_task(task)
+    await enqueue_task(task, bucket="message", major_id=_id_of(channel))
 
 
 async def channel_send_message_task(
@@ -306,7 +319,7 @@ async def send_direct_message(
     Enqueues a direct message (DM) to a member.
     """
     task = partial(send_direct_message_task, member, content, embed)
-    await enqueue_task(task)
+    await enqueue_task(task, bucket="dm", major_id=_id_of(member))
 
 
 async def send_direct_message_task(
@@ -334,7 +347,7 @@ async def edit_message(
     Enqueues a message edit to be sent as part of a follow-up interaction.
     """
     task = partial(edit_message_task, interaction, content, embed, view)
-    await enqueue_task(task)
+    await enqueue_task(task, bucket="interaction", major_id=_id_of(interaction))
 
 
 async def edit_message_task(
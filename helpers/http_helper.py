@@ -6,11 +6,14 @@ Provides a robust HTTP client wrapper with:
 - Retry with exponential backoff for transient failures
 - Clear error taxonomy (NotFoundError, ForbiddenError, RetryableError)
 - Session lifecycle management
+- Optional token-bucket request budget shared with background jobs
 - Structured logging for all operations
 """
 
 import asyncio
 import os
+import time
+from contextvars import ContextVar
 from dataclasses import dataclass
 
 import aiohttp
@@ -92,6 +95,141 @@ DEFAULT_RETRY_POLICY = HTTPRetryPolicy()
 NO_RETRY_POLICY = HTTPRetryPolicy(max_attempts=1)
 
 
+# ---------------------------------------------------------------------------
+# Request Budget
+# ---------------------------------------------------------------------------
+
+# Tokens the current task has reserved ahead of its requests, per bucket
+_reserved_tokens: ContextVar[dict[int, float] | None] = ContextVar(
+    "reserved_tokens", default=None
+)
+
+
+class TokenBucket:
+    """
+    Token-bucket request budget (``rate_per_minute`` sustained, ``burst`` peak).
+
+    The HTTP client spends one token per outbound attempt. Background jobs
+    hold a reference to the same bucket and :meth:`reserve` the tokens for a
+    unit of work up front, so they wait for headroom instead of competing
+    with interactive requests for the last tokens.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int | None = None) -> None:
+        self.rate_per_minute = max(0.1, float(rate_per_minute))
+        self.capacity = float(burst or max(1, int(self.rate_per_minute // 6)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._acquired = 0
+        self._wait_seconds = 0.0
+        self._headroom_clamped = False
+
+    @property
+    def _rate_per_second(self) -> float:
+        return self.rate_per_minute / 60.0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(
+                self.capacity, self._tokens + elapsed * self._rate_per_second
+            )
+            self._updated = now
+
+    def _check_fits(self, tokens: float) -> None:
+        if tokens > self.capacity:
+            raise ValueError(
+                f"Cannot take {tokens:g} tokens from a bucket of {self.capacity:g}"
+            )
+
+    async def _wait_until(self, tokens: float) -> None:
+        """Sleep until ``tokens`` are available; the caller holds ``_lock``."""
+        while (delay := self.seconds_until(tokens)) > 0:
+            self._wait_seconds += delay
+            await asyncio.sleep(delay)
+
+    def available(self) -> float:
+        """Tokens that could be spent right now."""
+        self._refill()
+        return self._tokens
+
+    def seconds_until(self, tokens: float) -> float:
+        """Seconds until ``tokens`` are available (0 if already available)."""
+        missing = tokens - self.available()
+        return max(0.0, missing / self._rate_per_second)
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """
+        Spend ``tokens``, sleeping until the bucket has refilled enough.
+
+        Tokens the current task reserved with :meth:`reserve` are used first.
+
+        Raises:
+            ValueError: If ``tokens`` exceeds the bucket capacity.
+        """
+        self._check_fits(tokens)
+        reserved = _reserved_tokens.get()
+        if reserved is not None and reserved.get(id(self), 0.0) >= tokens:
+            reserved[id(self)] -= tokens
+            self._acquired += 1
+            return
+        async with self._lock:
+            await self._wait_until(tokens)
+            self._tokens -= tokens
+            self._acquired += 1
+
+    async def reserve(self, tokens: float, *, headroom: float = 0.0) -> None:
+        """
+        Take ``tokens`` for the current task's upcoming requests.
+
+        Waits (in turn with other callers) until ``tokens + headroom`` are
+        available, then deducts ``tokens`` immediately, so concurrent workers
+        cannot all be woken by the same refill. The reservation is spent by
+        this task's later :meth:`acquire` calls; tokens still reserved from
+        a previous call count towards ``tokens``.
+
+        A ``headroom`` that cannot fit next to ``tokens`` is clamped to the
+        capacity (with a warning), since waiting for it would never finish.
+
+        Raises:
+            ValueError: If ``tokens`` alone exceeds the bucket capacity.
+        """
+        self._check_fits(tokens)
+        if tokens + headroom > self.capacity:
+            if not self._headroom_clamped:
+                logger.warning(
+                    "Request budget headroom of %g tokens does not fit a bucket "
+                    "of %g next to %g reserved tokens; clamping",
+                    headroom,
+                    self.capacity,
+                    tokens,
+                )
+                self._headroom_clamped = True
+            headroom = self.capacity - tokens
+
+        reserved = _reserved_tokens.get()
+        if reserved is None:
+            reserved = {}
+            _reserved_tokens.set(reserved)
+        needed = max(0.0, tokens - reserved.get(id(self), 0.0))
+        async with self._lock:
+            await self._wait_until(needed + headroom)
+            self._tokens -= needed
+        reserved[id(self)] = reserved.get(id(self), 0.0) + needed
+
+    def stats(self) -> dict:
+        """Return budget counters for health endpoints."""
+        return {
+            "rate_per_minute": self.rate_per_minute,
+            "capacity": self.capacity,
+            "available": round(self.available(), 2),
+            "acquired": self._acquired,
+            "wait_seconds": round(self._wait_seconds, 2),
+        }
+
+
 class HTTPClient:
     """
     HTTP client with retry support and observability.
@@ -103,12 +241,15 @@ class HTTPClient:
     - Clean session lifecycle management
     """
 
+    request_budget: TokenBucket | None = None
+
     def __init__(
         self,
         timeout: int = 15,
         concurrency: int = 8,
         user_agent: str | None = None,
         retry_policy: HTTPRetryPolicy | None = None,
+        request_budget: TokenBucket | None = None,
     ) -> None:
         """
         Initialize HTTP client.
@@ -119,11 +260,13 @@ class HTTPClient:
             user_agent: Optional UA string. If not provided a conservative default is used.
             retry_policy: Retry configuration. If None, uses default policy.
                          Set to NO_RETRY_POLICY to disable retries.
+            request_budget: Optional token bucket; every attempt spends one token.
         """
         self._timeout = aiohttp.ClientTimeout(total=timeout)
         self._sem = asyncio.Semaphore(concurrency)
         self._session: aiohttp.ClientSession | None = None
         self._user_agent = user_agent or "Mozilla/5.0 TESTBot"
+        self.request_budget = request_budget
 
         # Retry configuration (can be overridden via env)
         if retry_policy is None:
@@ -165,6 +308,9 @@ class HTTPClient:
             "total_errors": self._error_count,
             "total_retries": self._retry_count,
             "retry_enabled": self._retry_policy.max_attempts > 1,
+            "request_budget": self.request_budget.stats()
+            if self.request_budget
+            else None,
         }
 
     async def fetch_html(
@@ -199,6 +345,8 @@ class HTTPClient:
 
         for attempt in range(policy.max_attempts):
             self._request_count += 1
+            if self.request_budget is not None:
+                await self.request_budget.acquire()
 
             async with self._sem:
                 # Add delay between requests to avoid bot detection
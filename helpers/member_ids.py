@@ -0,0 +1,50 @@
+"""Compact wire format for guild member-ID sets.
+
+The bot's internal API serves a guild's member IDs as sorted, packed
+little-endian uint64 values (8 bytes per member) with a content-hash ETag,
+so the web backend can fetch them in one request and revalidate with
+``If-None-Match`` instead of paging through the full member payload.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sys
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+MEMBER_IDS_CONTENT_TYPE = "application/octet-stream"
+_ID_SIZE = 8
+
+
+def pack_member_ids(member_ids: Iterable[int]) -> bytes:
+    """Pack member IDs as sorted, de-duplicated little-endian uint64 values."""
+    packed = array("Q", sorted(set(member_ids)))
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def unpack_member_ids(payload: bytes) -> list[int]:
+    """Decode a payload produced by :func:`pack_member_ids`.
+
+    Raises:
+        ValueError: If the payload length is not a multiple of 8 bytes.
+    """
+    if len(payload) % _ID_SIZE:
+        raise ValueError(
+            f"member ID payload length {len(payload)} is not a multiple of {_ID_SIZE}"
+        )
+    ids = array("Q")
+    ids.frombytes(payload)
+    if sys.byteorder != "little":
+        ids.byteswap()
+    return ids.tolist()
+
+
+def member_ids_etag(payload: bytes) -> str:
+    """Return a strong HTTP ETag for a packed member-ID payload."""
+    return f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
@@ -198,14 +198,18 @@ async def update_channel_owner(
     jtc_channel_id=None,
 ) -> None:
     """
-    Update the owner of a voice channel in the database and permissions
+    Move owner permissions on a voice channel to a new owner.
+
+    The voice_channels row and the ownership index are updated by
+    VoiceService._perform_ownership_transfer before this is called; this
+    helper only edits the Discord permission overwrites.
 
     Args:
         channel: The voice channel to update
         new_owner_id: The ID of the new owner
         previous_owner_id: The ID of the previous owner
-        guild_id: Optional guild ID to filter by
-        jtc_channel_id: Optional join-to-create channel ID to filter by
+        guild_id: Guild ID of the channel (kept for existing call sites)
+        jtc_channel_id: Join-to-create channel ID (kept for existing call sites)
     """
     overwrites = channel.overwrites.copy()
     if prev := channel.guild.get_member(previous_owner_id):
@@ -222,12 +226,6 @@ async def update_channel_owner(
         f"Updated channel owner for '{channel.name}' from {previous_owner_id} to {new_owner_id}."
     )
 
-    # Update database record
-    await BaseRepository.execute(
-        "UPDATE voice_channels SET owner_id = ? WHERE voice_channel_id = ? AND guild_id = ? AND jtc_channel_id = ? AND is_active = 1",
-        (new_owner_id, channel.id, guild_id, jtc_channel_id),
-    )
-
 
 async def apply_permit_reject_settings(
     user_id: int, channel: discord.VoiceChannel
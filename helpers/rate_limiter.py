@@ -1,4 +1,17 @@
+"""
+Verification and recheck rate limiting.
+
+Counters live in an in-process :class:`RateLimitEngine` so checks on the
+interactive path never touch the database.  The engine is rehydrated from
+``rate_limits`` on startup and written back in periodic batches (and on
+shutdown) so limits survive restarts.
+"""
+
+from __future__ import annotations
+
+import asyncio
 import time
+from collections import OrderedDict
 
 from services.db.database import Database
 from services.db.repository import BaseRepository
@@ -12,6 +25,259 @@ DEFAULT_RATE_LIMITS = {
     "recheck": {"max_attempts": 1, "window_seconds": 300},
 }
 
+# Guild setting holding each action's window (see _get_limits)
+WINDOW_SETTING_KEYS = {
+    "verification": "rate_limits.window_seconds",
+    "recheck": "rate_limits.recheck_window_seconds",
+}
+
+# Upper bound on tracked (user, action) counters held in memory
+MAX_TRACKED_COUNTERS = 50_000
+
+_Key = tuple[int, str]
+
+# Longest window any guild configures for a setting key (values are JSON ints)
+_MAX_WINDOW_SQL = "SELECT MAX(CAST(value AS INTEGER)) FROM guild_settings WHERE key = ?"
+
+
+class RateLimitEngine:
+    """
+    In-memory fixed-window attempt counters with write-behind persistence.
+
+    Each ``(user_id, action)`` pair maps to
+    ``[attempt_count, first_attempt, window]`` with the same window semantics
+    as the ``rate_limits`` table: a window opens on the first attempt and
+    expires ``window`` seconds later.  ``window`` is the longest effective
+    (guild-configured) window seen for the counter, so pruning never cuts a
+    longer guild window short.
+
+    Mutations are recorded in ``_pending`` (``None`` marks a delete) and
+    per-user resets in ``_pending_user_resets``; :meth:`flush` writes both
+    in one transaction.  The counter dict is bounded: once full, expired
+    counters are dropped first, then the least recently touched ones.
+    """
+
+    _instance: RateLimitEngine | None = None
+
+    def __init__(self, max_entries: int = MAX_TRACKED_COUNTERS) -> None:
+        self._max_entries = max_entries
+        self._counters: OrderedDict[_Key, list[int]] = OrderedDict()
+        self._pending: dict[_Key, tuple[int, int] | None] = {}
+        self._pending_user_resets: set[int] = set()
+        self._flush_lock = asyncio.Lock()
+        self.loaded = False
+
+    # ------------------------------------------------------------------
+    # Singleton access
+    # ------------------------------------------------------------------
+    @classmethod
+    def get(cls) -> RateLimitEngine:
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """Reset the singleton (mainly for testing)."""
+        cls._instance = None
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._pending or self._pending_user_resets)
+
+    # ------------------------------------------------------------------
+    # Synchronous counter operations
+    # ------------------------------------------------------------------
+    def peek(
+        self, user_id: int, action: str, window: int, now: int | None = None
+    ) -> tuple[int, int] | None:
+        """Return ``(attempt_count, first_attempt)`` for a live window, else None."""
+        key = (user_id, action)
+        entry = self._counters.get(key)
+        if entry is None:
+            return None
+        now = int(time.time()) if now is None else now
+        if now - entry[1] >= window:
+            self._drop(key)
+            return None
+        entry[2] = max(entry[2], window)
+        return entry[0], entry[1]
+
+    def check(
+        self,
+        user_id: int,
+        action: str,
+        max_attempts: int,
+        window: int,
+        now: int | None = None,
+    ) -> tuple[bool, int]:
+        """Return ``(is_limited, wait_until)`` without recording an attempt."""
+        row = self.peek(user_id, action, window, now)
+        if row is not None and row[0] >= max_attempts:
+            return True, row[1] + window
+        return False, 0
+
+    def record(
+        self, user_id: int, action: str, window: int, now: int | None = None
+    ) -> int:
+        """Record one attempt, opening a new window if the old one expired."""
+        key = (user_id, action)
+        now = int(time.time()) if now is None else now
+        entry = self._counters.get(key)
+        if entry is None or now - entry[1] >= max(entry[2], window):
+            entry = [0, now, window]
+            self._counters[key] = entry
+        entry[0] += 1
+        entry[2] = max(entry[2], window)
+        self._counters.move_to_end(key)
+        self._pending[key] = (entry[0], entry[1])
+        self._evict(now)
+        return entry[0]
+
+    def reset_user(self, user_id: int) -> None:
+        """Forget every counter for ``user_id``."""
+        for key in [k for k in self._counters if k[0] == user_id]:
+            del self._counters[key]
+        for key in [k for k in self._pending if k[0] == user_id]:
+            del self._pending[key]
+        self._pending_user_resets.add(user_id)
+
+    def clear(self) -> None:
+        """Forget all counters and any unflushed writes."""
+        self._counters.clear()
+        self._pending.clear()
+        self._pending_user_resets.clear()
+
+    def prune(self, now: int | None = None) -> int:
+        """Drop counters whose own window has expired; return the count."""
+        now = int(time.time()) if now is None else now
+        expired = [
+            key
+            for key, (_, first, window) in self._counters.items()
+            if now - first >= window
+        ]
+        for key in expired:
+            del self._counters[key]
+        return len(expired)
+
+    def _drop(self, key: _Key) -> None:
+        del self._counters[key]
+        self._pending[key] = None
+
+    def _evict(self, now: int) -> None:
+        if len(self._counters) <= self._max_entries:
+            return
+        self.prune(now)
+        while len(self._counters) > self._max_entries:
+            # Unflushed writes stay in _pending, so eviction never loses them
+            self._counters.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    async def load(self) -> int:
+        """
+        Rehydrate live counters from ``rate_limits``; return rows loaded.
+
+        The table does not record which guild's window applied, so each
+        counter is restored with the longest window configured for its
+        action; checks still expire it by the caller's effective window.
+        """
+        now = int(time.time())
+        async with Database.get_read_connection() as db:
+            windows = {}
+            for action, setting_key in WINDOW_SETTING_KEYS.items():
+                cursor = await db.execute(_MAX_WINDOW_SQL, (setting_key,))
+                row = await cursor.fetchone()
+                configured = int(row[0]) if row and row[0] is not None else 0
+                windows[action] = max(_get_default_limits(action)[1], configured)
+            horizon = now - max(windows.values())
+            cursor = await db.execute(
+                """
+                SELECT user_id, action, attempt_count, first_attempt
+                FROM rate_limits
+                WHERE first_attempt > ?
+                ORDER BY first_attempt DESC
+                LIMIT ?
+                """,
+                (horizon, self._max_entries),
+            )
+            rows = await cursor.fetchall()
+
+        loaded: OrderedDict[_Key, list[int]] = OrderedDict()
+        for user_id, action, attempts, first in reversed(rows):
+            window = windows.get(action, windows["verification"])
+            if now - int(first) < window:
+                loaded[(int(user_id), action)] = [int(attempts), int(first), window]
+        # Attempts recorded before the load finished win over stored rows
+        loaded.update(self._counters)
+        self._counters = loaded
+        self.loaded = True
+        logger.info("Rate limit counters rehydrated.", extra={"count": len(loaded)})
+        return len(loaded)
+
+    async def flush(self) -> int:
+        """Write pending counter changes in one transaction; return rows touched."""
+        async with self._flush_lock:
+            if not self.dirty:
+                return 0
+            pending, self._pending = self._pending, {}
+            user_resets, self._pending_user_resets = self._pending_user_resets, set()
+            upserts = [
+                (user_id, action, row[0], row[1])
+                for (user_id, action), row in pending.items()
+                if row is not None
+            ]
+            deletes = [key for key, row in pending.items() if row is None]
+            try:
+                async with BaseRepository.transaction() as db:
+                    if user_resets:
+                        await db.executemany(
+                            "DELETE FROM rate_limits WHERE user_id = ?",
+                            [(user_id,) for user_id in user_resets],
+                        )
+                    if deletes:
+                        await db.executemany(
+                            "DELETE FROM rate_limits WHERE user_id = ? AND action = ?",
+                            deletes,
+                        )
+                    if upserts:
+                        # Placeholder verification rows keep legacy FK schemas happy
+                        await db.executemany(
+                            """
+                            INSERT OR IGNORE INTO verification(user_id, rsi_handle, last_updated, verification_payload, needs_reverify, needs_reverify_at, community_moniker)
+                            VALUES (?, '', 0, NULL, 0, 0, NULL)
+                            """,
+                            [(user_id,) for user_id in {row[0] for row in upserts}],
+                        )
+                        await db.executemany(
+                            """
+                            INSERT INTO rate_limits(user_id, action, attempt_count, first_attempt)
+                            VALUES (?, ?, ?, ?)
+                            ON CONFLICT(user_id, action) DO UPDATE SET
+                                attempt_count = excluded.attempt_count,
+                                first_attempt = excluded.first_attempt
+                            """,
+                            upserts,
+                        )
+            except Exception:
+                # Re-queue anything not superseded while the write was in flight
+                for key, row in pending.items():
+                    if key[0] not in self._pending_user_resets:
+                        self._pending.setdefault(key, row)
+                self._pending_user_resets |= user_resets
+                raise
+            return len(user_resets) + len(deletes) + len(upserts)
+
+    async def reset_all(self) -> None:
+        """Clear memory and the ``rate_limits`` table."""
+        async with self._flush_lock:
+            self.clear()
+            await Database.reset_rate_limit()
+
 
 async def _get_limits(guild_config, guild_id: int, action: str) -> tuple[int, int]:
     """
@@ -30,7 +296,7 @@ async def _get_limits(guild_config, guild_id: int, action: str) -> tuple[int, in
             guild_id, "rate_limits.recheck_max_attempts", default=1, parser=int
         )
         window = await guild_config.get_setting(
-            guild_id, "rate_limits.recheck_window_seconds", default=300, parser=int
+            guild_id, WINDOW_SETTING_KEYS["recheck"], default=300, parser=int
         )
         return max_attempts, window
 
@@ -38,7 +304,7 @@ async def _get_limits(guild_config, guild_id: int, action: str) -> tuple[int, in
         guild_id, "rate_limits.max_attempts", default=5, parser=int
     )
     window = await guild_config.get_setting(
-        guild_id, "rate_limits.window_seconds", default=1800, parser=int
+        guild_id, WINDOW_SETTING_KEYS["verification"], default=1800, parser=int
     )
     return max_attempts, window
 
@@ -49,6 +315,45 @@ def _get_default_limits(action: str) -> tuple[int, int]:
     return config["max_attempts"], config["window_seconds"]
 
 
+async def _resolve_call(
+    user_id_or_guild_config,
+    action_or_guild_id: str | int,
+    user_id: int | None,
+    action: str | None,
+) -> tuple[int, str, int, int] | None:
+    """
+    Resolve both call patterns to ``(user_id, action, max_attempts, window)``.
+
+    Returns None for the guild pattern without a user id.
+    """
+    if isinstance(user_id_or_guild_config, int):
+        # Old pattern: (user_id, action)
+        action_val = (
+            action_or_guild_id
+            if isinstance(action_or_guild_id, str)
+            else "verification"
+        )
+        return (
+            user_id_or_guild_config,
+            action_val,
+            *_get_default_limits(action_val),
+        )
+
+    # New pattern: (guild_config, guild_id, user_id, action)
+    action_val = action or "verification"
+    if not isinstance(action_or_guild_id, int):
+        # Fallback to default if guild_id is not int
+        user_id_val = user_id if user_id is not None else 0
+        return user_id_val, action_val, *_get_default_limits(action_val)
+    if user_id is None:
+        # Can't proceed without user_id
+        return None
+    max_attempts, window = await _get_limits(
+        user_id_or_guild_config, action_or_guild_id, action_val
+    )
+    return user_id, action_val, max_attempts, window
+
+
 async def check_rate_limit(
     user_id_or_guild_config,
     action_or_guild_id: str | int = "verification",
@@ -61,52 +366,45 @@ async def check_rate_limit(
     Old pattern: check_rate_limit(user_id, "verification")
     New pattern: check_rate_limit(guild_config, guild_id, user_id, "verification")
     """
-    # Detect call pattern
-    if isinstance(user_id_or_guild_config, int):
-        # Old pattern: check_rate_limit(user_id, action)
-        user_id_val = user_id_or_guild_config
-        action_val = (
-            action_or_guild_id
-            if isinstance(action_or_guild_id, str)
-            else "verification"
+    resolved = await _resolve_call(
+        user_id_or_guild_config, action_or_guild_id, user_id, action
+    )
+    if resolved is None:
+        return False, 0
+    user_id_val, action_val, max_attempts, window = resolved
+
+    limited, wait_until = RateLimitEngine.get().check(
+        user_id_val, action_val, max_attempts, window
+    )
+    if limited:
+        logger.info(
+            "Rate limit hit.", extra={"user_id": user_id_val, "action": action_val}
         )
-        max_attempts, window = _get_default_limits(action_val)
-    else:
-        # New pattern: check_rate_limit(guild_config, guild_id, user_id, action)
-        guild_config = user_id_or_guild_config
-        guild_id_raw = action_or_guild_id
-        if not isinstance(guild_id_raw, int):
-            # Fallback to default if guild_id is not int
-            max_attempts, window = _get_default_limits(action or "verification")
-            user_id_val = user_id if user_id is not None else 0
-            action_val = action or "verification"
-        else:
-            guild_id = guild_id_raw
-            if user_id is None:
-                # Can't proceed without user_id
-                return False, 0
-            user_id_val = user_id
-            action_val = action or "verification"
-            max_attempts, window = await _get_limits(guild_config, guild_id, action_val)
-
-    row = await Database.fetch_rate_limit(user_id_val, action_val)
-    now = int(time.time())
-    if row:
-        attempts, first = row
-        if now - first >= window:
-            await Database.reset_rate_limit(user_id_val, action_val)
-            return False, 0
-        if attempts >= max_attempts:
-            logger.info(
-                "Rate limit hit.", extra={"user_id": user_id_val, "action": action_val}
-            )
-            return True, first + window
-    return False, 0
+    return limited, wait_until
 
 
-async def log_attempt(user_id: int, action: str = "verification") -> None:
-    await Database.increment_rate_limit(user_id, action)
-    logger.debug("Logged attempt.", extra={"user_id": user_id, "action": action})
+async def log_attempt(
+    user_id_or_guild_config,
+    action_or_guild_id: str | int = "verification",
+    user_id: int | None = None,
+    action: str | None = None,
+) -> None:
+    """
+    Record an attempt. Supports both old and new call patterns.
+
+    Old pattern: log_attempt(user_id, "verification")
+    New pattern: log_attempt(guild_config, guild_id, user_id, "verification")
+    """
+    resolved = await _resolve_call(
+        user_id_or_guild_config, action_or_guild_id, user_id, action
+    )
+    if resolved is None:
+        return
+    user_id_val, action_val, _, window = resolved
+    RateLimitEngine.get().record(user_id_val, action_val, window)
+    logger.debug(
+        "Logged attempt.", extra={"user_id": user_id_val, "action": action_val}
+    )
 
 
 async def get_remaining_attempts(
@@ -121,46 +419,21 @@ async def get_remaining_attempts(
     Old pattern: get_remaining_attempts(user_id, "verification")
     New pattern: get_remaining_attempts(guild_config, guild_id, user_id, "verification")
     """
-    # Detect call pattern
-    if isinstance(user_id_or_guild_config, int):
-        # Old pattern
-        user_id_val = user_id_or_guild_config
-        action_val = (
-            action_or_guild_id
-            if isinstance(action_or_guild_id, str)
-            else "verification"
-        )
-        max_attempts, window = _get_default_limits(action_val)
-    else:
-        # New pattern
-        guild_config = user_id_or_guild_config
-        guild_id_raw = action_or_guild_id
-        if not isinstance(guild_id_raw, int):
-            # Fallback to default if guild_id is not int
-            max_attempts, window = _get_default_limits(action or "verification")
-            user_id_val = user_id if user_id is not None else 0
-            action_val = action or "verification"
-        else:
-            guild_id = guild_id_raw
-            if user_id is None:
-                # Can't proceed without user_id
-                return 0
-            user_id_val = user_id
-            action_val = action or "verification"
-            max_attempts, window = await _get_limits(guild_config, guild_id, action_val)
+    resolved = await _resolve_call(
+        user_id_or_guild_config, action_or_guild_id, user_id, action
+    )
+    if resolved is None:
+        return 0
+    user_id_val, action_val, max_attempts, window = resolved
 
-    row = await Database.fetch_rate_limit(user_id_val, action_val)
-    now = int(time.time())
+    row = RateLimitEngine.get().peek(user_id_val, action_val, window)
     if not row:
         return max_attempts
-    attempts, first = row
-    if now - first >= window:
-        return max_attempts
-    return max_attempts - attempts
+    return max_attempts - row[0]
 
 
 async def reset_attempts(user_id: int) -> None:
-    await Database.reset_rate_limit(user_id)
+    RateLimitEngine.get().reset_user(user_id)
     logger.info("Rate limit reset.", extra={"user_id": user_id})
 
 
@@ -168,29 +441,50 @@ async def cleanup_attempts() -> None:
     """
     Clean up expired rate limit entries (all guilds).
 
-    Note: Uses default windows for cleanup. This is a background task that
-    runs periodically to clean up old data across all guilds.
+    Rows are kept for the longest window any guild configures for their
+    action (never less than the default), so a guild with a longer window
+    does not lose live counters.
     """
-    # Use default windows for cleanup
     _, recheck_window = _get_default_limits("recheck")
     _, verify_window = _get_default_limits("verification")
 
     now = int(time.time())
+    engine = RateLimitEngine.get()
+    engine.prune(now)
     try:
+        await engine.flush()
         async with BaseRepository.transaction() as db:
             await db.execute(
-                "DELETE FROM rate_limits WHERE action = 'recheck' AND (? - first_attempt) > ?",
-                (now, recheck_window),
+                f"DELETE FROM rate_limits WHERE action = 'recheck' "
+                f"AND (? - first_attempt) > MAX(?, COALESCE(({_MAX_WINDOW_SQL}), 0))",
+                (now, recheck_window, WINDOW_SETTING_KEYS["recheck"]),
             )
             await db.execute(
-                "DELETE FROM rate_limits WHERE action != 'recheck' AND (? - first_attempt) > ?",
-                (now, verify_window),
+                f"DELETE FROM rate_limits WHERE action != 'recheck' "
+                f"AND (? - first_attempt) > MAX(?, COALESCE(({_MAX_WINDOW_SQL}), 0))",
+                (now, verify_window, WINDOW_SETTING_KEYS["verification"]),
             )
     except Exception:
         logger.exception("Failed to cleanup rate limit attempts")
     logger.debug("Cleaned up expired rate-limiting data.")
 
 
+async def load_attempts() -> None:
+    """Rehydrate rate limit counters from the database at startup."""
+    try:
+        await RateLimitEngine.get().load()
+    except Exception:
+        logger.exception("Failed to load rate limit counters")
+
+
+async def flush_attempts() -> None:
+    """Persist pending rate limit counters; failures are retried next flush."""
+    try:
+        await RateLimitEngine.get().flush()
+    except Exception:
+        logger.exception("Failed to persist rate limit counters")
+
+
 async def reset_all_attempts() -> None:
-    await Database.reset_rate_limit()
+    await RateLimitEngine.get().reset_all()
     logger.info("Reset all verification attempts.")
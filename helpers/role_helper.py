@@ -13,17 +13,27 @@ For full verification flow, use the unified pipeline:
     - services.verification_scheduler.schedule_user_recheck()
 """
 
+import unicodedata
+
 import discord
 
-from helpers.discord_api import add_roles, edit_member, remove_roles
 from helpers.task_queue import enqueue_task
 from services.db.database import Database
 from utils.logging import get_logger
 
-__all__ = ["apply_roles_for_status", "can_modify_nickname"]
+__all__ = ["apply_roles_for_status", "can_modify_nickname", "get_role_edit_stats"]
 
 logger = get_logger(__name__)
 
+# api_calls_saved compares against the former remove/add/nick call sequence
+_edit_stats: dict[str, int] = {
+    "members_evaluated": 0,
+    "edits_issued": 0,
+    "edits_skipped": 0,
+    "api_calls_saved": 0,
+    "forbidden_fallbacks": 0,
+}
+
 
 async def apply_roles_for_status(
     member: discord.Member,
@@ -34,8 +44,14 @@ async def apply_roles_for_status(
     community_moniker: str | None = None,
     main_orgs: list[str] | None = None,
     affiliate_orgs: list[str] | None = None,
+    track_membership: bool = True,
 ) -> tuple[str, str]:
-    """Apply roles/nickname for a derived status without DB side effects."""
+    """
+    Apply roles/nickname for a derived status without DB side effects.
+
+    The only write is the user_guild_membership touch; batch callers pass
+    ``track_membership=False`` and persist it with their own batch.
+    """
 
     if isinstance(bot, str):
         raise TypeError("apply_roles_for_status expects a bot instance, not string")
@@ -91,7 +107,8 @@ async def apply_roles_for_status(
         roles_to_add.append(non_member_role)
 
     # Track membership for cleanup logic
-    await Database.track_user_guild_membership(member.id, member.guild.id)
+    if track_membership:
+        await Database.track_user_guild_membership(member.id, member.guild.id)
 
     # Identify roles to remove (managed roles not in target set)
     managed_roles = [r for r in [main_role, affiliate_role, non_member_role] if r]
@@ -100,83 +117,117 @@ async def apply_roles_for_status(
     roles_to_remove = [
         r for r in managed_roles if r in current_roles and r not in target_roles
     ]
-
-    # Skip no-op
-    if (
-        not roles_to_add
-        and not roles_to_remove
-        and getattr(member, "nick", None) == rsi_handle
-    ):
+    roles_missing = [r for r in roles_to_add if r not in current_roles]
+
+    nick_final: str | None = None
+    if rsi_handle and can_modify_nickname(member):
+        candidate = _truncate_nickname(rsi_handle)
+        if getattr(member, "nick", None) != candidate:
+            nick_final = candidate
+
+    # Calls the previous add/remove/nick sequence would have made
+    legacy_calls = 0
+    if roles_to_add or roles_to_remove or getattr(member, "nick", None) != rsi_handle:
+        legacy_calls = (
+            bool(roles_to_remove) + bool(roles_to_add) + (nick_final is not None)
+        )
+
+    _edit_stats["members_evaluated"] += 1
+    if not roles_missing and not roles_to_remove and nick_final is None:
+        _edit_stats["edits_skipped"] += 1
+        _edit_stats["api_calls_saved"] += legacy_calls
         return status, status
 
-    if roles_to_remove:
-
-        async def remove_task() -> None:
-            try:
-                await remove_roles(
-                    member, *roles_to_remove, reason="Updating roles after verification"
-                )
-            except discord.Forbidden:
-                logger.warning(
-                    "Cannot remove roles due to permission hierarchy.",
-                    extra={"user_id": member.id},
-                )
-            except Exception as e:
-                logger.exception("Failed to remove roles: %s", e)
-
-        await enqueue_task(remove_task)
-
-    if roles_to_add:
-
-        async def add_task() -> None:
-            try:
-                await add_roles(
-                    member, *roles_to_add, reason="Roles assigned after verification"
-                )
-            except discord.Forbidden:
-                logger.warning(
-                    "Cannot assign roles due to permission hierarchy.",
-                    extra={"user_id": member.id},
-                )
-            except Exception as e:
-                logger.exception("Failed to assign roles: %s", e)
-
-        await enqueue_task(add_task)
-
-    preferred_nick = rsi_handle
-
-    def _truncate_nickname(nick: str, limit: int = 32) -> str:
-        if len(nick) <= limit:
-            return nick
-        import unicodedata
-
-        base = limit - 1
-        truncated = nick[:base]
-        while truncated and unicodedata.combining(truncated[-1]):
-            truncated = truncated[:-1]
-        return f"{truncated}…"
-
-    if preferred_nick and can_modify_nickname(member):
-        nick_final = _truncate_nickname(preferred_nick)
-        current_nick = getattr(member, "nick", None)
-        if current_nick != nick_final:
-
-            async def nickname_task() -> None:
-                try:
-                    await edit_member(member, nick=nick_final)
-                except discord.Forbidden:
-                    logger.warning(
-                        "Bot lacks permission to change nickname due to role hierarchy.",
-                        extra={"user_id": member.id},
-                    )
-                except Exception as e:
-                    logger.exception("Unexpected error when changing nickname: %s", e)
-
-            await enqueue_task(nickname_task)
+    _edit_stats["edits_issued"] += 1
+    _edit_stats["api_calls_saved"] += max(0, legacy_calls - 1)
+
+    async def edit_task() -> None:
+        await _edit_roles_and_nick(member, roles_missing, roles_to_remove, nick_final)
+
+    await enqueue_task(edit_task, bucket="member", major_id=member.guild.id)
 
     return status, status
 
 
+def _truncate_nickname(nick: str, limit: int = 32) -> str:
+    if len(nick) <= limit:
+        return nick
+
+    base = limit - 1
+    truncated = nick[:base]
+    while truncated and unicodedata.combining(truncated[-1]):
+        truncated = truncated[:-1]
+    return f"{truncated}…"
+
+
+async def _edit_roles_and_nick(
+    member: discord.Member,
+    roles_to_add: list,
+    roles_to_remove: list,
+    nick: str | None,
+) -> None:
+    """
+    Apply role and nickname changes with a single ``member.edit`` call.
+
+    AI Notes:
+        The final role list is rebuilt from ``member.roles`` when the task
+        runs, not when it was queued, so role changes made in between are
+        kept. ``@everyone`` is never sent. If a combined edit is Forbidden
+        (e.g. a target role sits above the bot), roles and nickname are
+        retried as separate edits so one failure does not block the other.
+    """
+    current = [r for r in member.roles if not getattr(r, "is_default", lambda: False)()]
+    final_roles = [r for r in current if r not in roles_to_remove]
+    final_roles += [r for r in roles_to_add if r not in final_roles]
+
+    edits: dict = {}
+    if set(final_roles) != set(current):
+        edits["roles"] = final_roles
+    if nick is not None:
+        edits["nick"] = nick
+    if not edits:
+        return
+
+    try:
+        await member.edit(**edits, reason="Roles updated after verification")
+        return
+    except discord.Forbidden:
+        if len(edits) == 1:
+            logger.warning(
+                "Cannot update %s due to permission hierarchy.",
+                next(iter(edits)),
+                extra={"user_id": member.id},
+            )
+            return
+    except discord.NotFound:
+        logger.warning(
+            "Member left before roles could be updated.",
+            extra={"user_id": member.id},
+        )
+        return
+    except Exception:
+        logger.exception("Failed to update roles/nickname for %s", member.id)
+        return
+
+    _edit_stats["forbidden_fallbacks"] += 1
+    for key, value in edits.items():
+        try:
+            await member.edit(**{key: value}, reason="Roles updated after verification")
+        except discord.Forbidden:
+            logger.warning(
+                "Cannot update %s due to permission hierarchy.",
+                key,
+                extra={"user_id": member.id},
+            )
+        except Exception:
+            logger.exception("Failed to update %s for %s", key, member.id)
+
+
+def get_role_edit_stats() -> dict[str, int]:
+    """Return counters for coalesced role/nickname edits."""
+    return dict(_edit_stats)
+
+
 def can_modify_nickname(member: discord.Member) -> bool:
     """
     Strict nickname guard:
@@ -1,5 +1,32 @@
+"""
+Discord request scheduler.
+
+Every Discord mutation goes through ``enqueue_task``. Tasks are grouped into
+sub-queues keyed by (priority, bucket, major id) — e.g. ``("member", guild_id)``
+or ``("channel", channel_id)`` — mirroring Discord's per-route rate-limit
+buckets. Each sub-queue runs at most ``bucket_concurrency`` tasks at a time
+(channel edits, whose per-channel limits are tight, one at a time), so a slow
+bucket only delays itself, while a shared worker pool and a global limiter keep
+the bot under Discord's global rate limit.
+
+Priority classes:
+    INTERACTIVE  user-facing actions (default)
+    BULK         background sync/recheck work; enqueue inside
+                 ``with task_priority(Priority.BULK):`` to tag a whole call tree
+
+Interactive work is always preferred, but every ``bulk_share_every``-th pick
+goes to bulk work when both are waiting so bulk sync cannot starve.
+"""
+
 import asyncio
 import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any
 
 import discord
 from aiolimiter import AsyncLimiter
@@ -9,40 +36,293 @@ from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_WORKERS = 2
+DEFAULT_RATE_PER_SECOND = 45
+DEFAULT_BULK_SHARE_EVERY = 5
+DEFAULT_BUCKET = "default"
+DEFAULT_BUCKET_CONCURRENCY = 2
+DEFAULT_BUCKET_LIMITS: Mapping[str, int] = {"channel": 1}
 
-task_queue = asyncio.Queue()
 
-# Track worker tasks for clean shutdown
-_worker_tasks: set[asyncio.Task] = set()
+class Priority(IntEnum):
+    """Scheduling class; lower values are served first."""
+
+    INTERACTIVE = 0
+    BULK = 1
+
+
+_priority_ctx: ContextVar[Priority] = ContextVar(
+    "task_priority", default=Priority.INTERACTIVE
+)
+
+
+@contextmanager
+def task_priority(priority: Priority) -> Iterator[None]:
+    """Set the default priority for tasks enqueued inside this block."""
+    token = _priority_ctx.set(priority)
+    try:
+        yield
+    finally:
+        _priority_ctx.reset(token)
+
+
+QueueKey = tuple[Priority, str, int | None]
+
 
-api_limiter = AsyncLimiter(max_rate=45, time_period=1)
+@dataclass(slots=True)
+class _QueuedTask:
+    task: Callable[[], Awaitable[Any]]
+    enqueued_at: float
 
 
-async def worker() -> None:
+@dataclass(slots=True)
+class _SubQueue:
+    key: QueueKey
+    limit: int
+    items: deque[_QueuedTask] = field(default_factory=deque)
+    in_flight: int = 0
+    ready: bool = False
+
+
+@dataclass(slots=True)
+class BucketStats:
+    """Counters for one (priority, bucket) pair, aggregated over major ids."""
+
+    enqueued: int = 0
+    completed: int = 0
+    failed: int = 0
+    depth: int = 0
+    max_depth: int = 0
+    wait_ms_total: float = 0.0
+    wait_ms_max: float = 0.0
+    run_ms_total: float = 0.0
+    run_ms_max: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        done = self.completed + self.failed
+        return {
+            "enqueued": self.enqueued,
+            "completed": self.completed,
+            "failed": self.failed,
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "avg_wait_ms": round(self.wait_ms_total / done, 2) if done else 0.0,
+            "max_wait_ms": round(self.wait_ms_max, 2),
+            "avg_run_ms": round(self.run_ms_total / done, 2) if done else 0.0,
+            "max_run_ms": round(self.run_ms_max, 2),
+        }
+
+
+class TaskScheduler:
     """
-    Worker coroutine that processes tasks from the task_queue.
+    Priority-aware scheduler with one bounded sub-queue per bucket.
+
+    AI Notes:
+        Sub-queues with pending work and fewer than ``limit`` tasks in
+        flight sit in a per-priority ready deque (at most once, tracked by
+        ``ready``); workers take from the front and re-append the sub-queue
+        while it still has room, or once one of its tasks finishes, giving
+        round-robin fairness across buckets. Idle sub-queues are dropped so major ids (guilds,
+        channels) do not accumulate; stats are kept per bucket name only.
+        Asyncio primitives are created in ``start`` so the scheduler can be
+        restarted on a new event loop (tests).
     """
-    while True:
-        task = await task_queue.get()
-        if task is None:
-            task_queue.task_done()
-            logger.info("Worker received shutdown signal.")
-            break  # Exit the worker
-        try:
-            async with api_limiter:
-                await run_task(task)
-        except Exception:
-            logger.exception("Error running queued task")
-        finally:
-            task_queue.task_done()
 
+    def __init__(self) -> None:
+        self._subqueues: dict[QueueKey, _SubQueue] = {}
+        self._ready: dict[Priority, deque[_SubQueue]] = {
+            priority: deque() for priority in Priority
+        }
+        self._stats: dict[tuple[Priority, str], BucketStats] = {}
+        self._pending = 0
+        self._in_flight = 0
+        self._interactive_streak = 0
+        self._bulk_share_every = DEFAULT_BULK_SHARE_EVERY
+        self._bucket_concurrency = DEFAULT_BUCKET_CONCURRENCY
+        self._bucket_limits: dict[str, int] = dict(DEFAULT_BUCKET_LIMITS)
+        self._cond: asyncio.Condition | None = None
+        self._idle: asyncio.Event | None = None
+        self._stopping = False
+        self.limiter = AsyncLimiter(max_rate=DEFAULT_RATE_PER_SECOND, time_period=1)
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def start(
+        self,
+        *,
+        rate_per_second: float = DEFAULT_RATE_PER_SECOND,
+        bulk_share_every: int = DEFAULT_BULK_SHARE_EVERY,
+        bucket_concurrency: int = DEFAULT_BUCKET_CONCURRENCY,
+        bucket_limits: Mapping[str, int] | None = None,
+    ) -> None:
+        self._cond = asyncio.Condition()
+        self._idle = asyncio.Event()
+        if self._pending == 0 and self._in_flight == 0:
+            self._idle.set()
+        self._stopping = False
+        self._bulk_share_every = max(1, bulk_share_every)
+        self._bucket_concurrency = max(1, bucket_concurrency)
+        limits = DEFAULT_BUCKET_LIMITS if bucket_limits is None else bucket_limits
+        self._bucket_limits = {name: max(1, limit) for name, limit in limits.items()}
+        self.limiter = AsyncLimiter(max_rate=rate_per_second, time_period=1)
+
+    async def stop(self) -> None:
+        """Drain queued work, then release all workers."""
+        if self._cond is None:
+            return
+        await self.join()
+        async with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+
+    async def join(self) -> None:
+        if self._idle is not None:
+            await self._idle.wait()
+
+    # -- queueing ----------------------------------------------------------
+
+    def qsize(self) -> int:
+        return self._pending
+
+    def empty(self) -> bool:
+        return self._pending == 0
+
+    def idle(self) -> bool:
+        return self._pending == 0 and self._in_flight == 0
+
+    async def put(
+        self,
+        task: Callable[[], Awaitable[Any]],
+        *,
+        priority: Priority,
+        bucket: str,
+        major_id: int | None,
+    ) -> None:
+        if self._cond is None or self._idle is None:
+            raise RuntimeError("Task scheduler not started")
+        key: QueueKey = (priority, bucket, major_id)
+        stats = self._bucket_stats(priority, bucket)
+        async with self._cond:
+            subqueue = self._subqueues.get(key)
+            if subqueue is None:
+                limit = self._bucket_limits.get(bucket, self._bucket_concurrency)
+                subqueue = self._subqueues[key] = _SubQueue(key, limit)
+            subqueue.items.append(_QueuedTask(task, time.monotonic()))
+            self._mark_ready(subqueue)
+            self._pending += 1
+            self._idle.clear()
+            stats.enqueued += 1
+            stats.depth += 1
+            stats.max_depth = max(stats.max_depth, stats.depth)
+            self._cond.notify()
+
+    def _bucket_stats(self, priority: Priority, bucket: str) -> BucketStats:
+        stats = self._stats.get((priority, bucket))
+        if stats is None:
+            stats = self._stats[(priority, bucket)] = BucketStats()
+        return stats
+
+    def _mark_ready(self, subqueue: _SubQueue) -> bool:
+        """Queue *subqueue* for a worker if it has work and a free slot."""
+        if subqueue.ready or not subqueue.items or subqueue.in_flight >= subqueue.limit:
+            return False
+        subqueue.ready = True
+        self._ready[subqueue.key[0]].append(subqueue)
+        return True
+
+    def _has_ready(self) -> bool:
+        return self._stopping or any(self._ready.values())
+
+    def _pick(self) -> _SubQueue:
+        interactive = self._ready[Priority.INTERACTIVE]
+        bulk = self._ready[Priority.BULK]
+        if bulk and (
+            not interactive or self._interactive_streak >= self._bulk_share_every
+        ):
+            self._interactive_streak = 0
+            return bulk.popleft()
+        self._interactive_streak += 1
+        return interactive.popleft()
+
+    # -- workers -----------------------------------------------------------
+
+    async def worker(self) -> None:
+        """Run tasks until ``stop`` is called."""
+        if self._cond is None or self._idle is None:
+            raise RuntimeError("Task scheduler not started")
+        while True:
+            async with self._cond:
+                await self._cond.wait_for(self._has_ready)
+                if not any(self._ready.values()):
+                    logger.info("Worker received shutdown signal.")
+                    return
+                subqueue = self._pick()
+                subqueue.ready = False
+                item = subqueue.items.popleft()
+                subqueue.in_flight += 1
+                self._pending -= 1
+                self._in_flight += 1
+                if self._mark_ready(subqueue):
+                    self._cond.notify()
+
+            priority, bucket, _ = subqueue.key
+            stats = self._bucket_stats(priority, bucket)
+            stats.depth -= 1
+            started = time.monotonic()
+            wait_ms = (started - item.enqueued_at) * 1000
+            failed = False
+            try:
+                async with self.limiter:
+                    # Queued tasks come from enqueue_task, which retries
+                    # transient errors and resolves the caller's future
+                    await item.task()
+            except Exception:
+                failed = True
+                logger.exception("Error running queued task")
+            finally:
+                run_ms = (time.monotonic() - started) * 1000
+                stats.wait_ms_total += wait_ms
+                stats.wait_ms_max = max(stats.wait_ms_max, wait_ms)
+                stats.run_ms_total += run_ms
+                stats.run_ms_max = max(stats.run_ms_max, run_ms)
+                if failed:
+                    stats.failed += 1
+                else:
+                    stats.completed += 1
+                async with self._cond:
+                    subqueue.in_flight -= 1
+                    self._in_flight -= 1
+                    if self._mark_ready(subqueue):
+                        self._cond.notify()
+                    elif not subqueue.items and not subqueue.in_flight:
+                        self._subqueues.pop(subqueue.key, None)
+                    if self._pending == 0 and self._in_flight == 0:
+                        self._idle.set()
+
+    def stats(self) -> dict[str, Any]:
+        """Per-bucket latency/queue-depth counters plus overall totals."""
+        return {
+            "pending": self._pending,
+            "in_flight": self._in_flight,
+            "active_subqueues": len(self._subqueues),
+            "buckets": {
+                f"{priority.name.lower()}:{bucket}": stats.as_dict()
+                for (priority, bucket), stats in sorted(self._stats.items())
+            },
+        }
+
+
+task_queue = TaskScheduler()
 
-async def run_task(task) -> None:
+# Track worker tasks for clean shutdown
+_worker_tasks: set[asyncio.Task] = set()
+
+
+async def _run_with_retries(task):
     """
-    Executes the given task.
+    Await ``task()``, retrying transient Discord server errors.
 
-    Args:
-        task (Callable): An asynchronous callable representing the task.
+    Raises the last exception once the task fails for good.
     """
     # Retry transient Discord server errors (5xx/DiscordServerError).
     MAX_RETRIES = 3
@@ -74,17 +354,43 @@ async def run_task(task) -> None:
                 )
                 await asyncio.sleep(delay)
                 continue
+            raise
 
-            logger.exception("Exception in task")
-            return None
 
+async def run_task(task) -> None:
+    """
+    Executes the given task.
 
-async def enqueue_task(task) -> None:
+    Args:
+        task (Callable): An asynchronous callable representing the task.
+    """
+    try:
+        return await _run_with_retries(task)
+    except Exception:
+        logger.exception("Exception in task")
+        return None
+
+
+async def enqueue_task(
+    task,
+    *,
+    priority: Priority | None = None,
+    bucket: str = DEFAULT_BUCKET,
+    major_id: int | None = None,
+) -> asyncio.Future:
     """
     Enqueues a task to be processed by the worker.
 
     Args:
         task (Callable): An asynchronous callable representing the task.
+        priority: Scheduling class; defaults to the enclosing ``task_priority``
+            block (INTERACTIVE outside one).
+        bucket: Route family, e.g. ``"member"``, ``"channel"``, ``"message"``.
+        major_id: Discord major parameter for the route (guild or channel ID).
+
+    Returns:
+        Future resolved with the task's result, or with its exception once
+        retries are exhausted.
     """
     loop = asyncio.get_event_loop()
     future = loop.create_future()
@@ -99,27 +405,58 @@ async def enqueue_task(task) -> None:
         except Exception as exc:  # pragma: no cover - defensive safety
             if not future.done():
                 future.set_exception(exc)
-        return future  # type: ignore[return-value]
+        return future
 
     async def wrapped_task() -> None:
-        result = await task()
+        try:
+            result = await _run_with_retries(task)
+        except Exception as exc:
+            if not future.done():
+                future.set_exception(exc)
+                # The worker logs the failure; callers that drop the future
+                # should not also get "exception was never retrieved".
+                future.exception()
+            raise
         if not future.done():
             future.set_result(result)
 
-    await task_queue.put(wrapped_task)
+    await task_queue.put(
+        wrapped_task,
+        priority=_priority_ctx.get() if priority is None else priority,
+        bucket=bucket,
+        major_id=major_id,
+    )
     logger.debug("Task enqueued.")
-    return future  # type: ignore[return-value]
+    return future
 
 
-async def start_task_workers(num_workers=2) -> None:
+async def start_task_workers(
+    num_workers: int = DEFAULT_WORKERS,
+    *,
+    rate_per_second: float = DEFAULT_RATE_PER_SECOND,
+    bulk_share_every: int = DEFAULT_BULK_SHARE_EVERY,
+    bucket_concurrency: int = DEFAULT_BUCKET_CONCURRENCY,
+    bucket_limits: Mapping[str, int] | None = None,
+) -> None:
     """
     Starts the specified number of worker tasks.
 
     Args:
         num_workers (int): Number of worker coroutines to start.
+        rate_per_second: Global cap on Discord calls across all buckets.
+        bulk_share_every: Serve bulk work at least once per this many picks.
+        bucket_concurrency: Tasks one sub-queue may run at once.
+        bucket_limits: Per-bucket overrides of ``bucket_concurrency``
+            (defaults to ``DEFAULT_BUCKET_LIMITS``).
     """
+    task_queue.start(
+        rate_per_second=rate_per_second,
+        bulk_share_every=bulk_share_every,
+        bucket_concurrency=bucket_concurrency,
+        bucket_limits=bucket_limits,
+    )
     for idx in range(num_workers):
-        task = asyncio.create_task(worker(), name=f"task_queue_worker_{idx}")
+        task = asyncio.create_task(task_queue.worker(), name=f"task_queue_worker_{idx}")
         _worker_tasks.add(task)
 
         def _cleanup(done: asyncio.Task) -> None:
@@ -147,35 +484,41 @@ async def stop_task_workers() -> None:
     if not _worker_tasks:
         return
 
-    for _ in range(len(_worker_tasks)):
-        await task_queue.put(None)
-
-    await task_queue.join()
+    await task_queue.stop()
     await asyncio.gather(*_worker_tasks, return_exceptions=True)
     _worker_tasks.clear()
 
 
 async def flush_tasks(max_wait: float = 2.0) -> None:
-    """Best-effort wait until the task_queue is drained or timeout.
+    """Best-effort wait until queued and in-flight tasks finish or timeout.
 
     Ensures leadership logging can observe role/nickname changes that were
     enqueued just prior. Non-blocking (uses asyncio.sleep)."""
-    deadline = time.time() + max_wait
     # Initial yield to let workers pick up tasks
     await asyncio.sleep(0)
-    while time.time() < deadline:
-        if task_queue.empty():
-            # Give in-flight task a brief chance to finish
-            await asyncio.sleep(0.05)
-            if task_queue.empty():
-                break
-        await asyncio.sleep(0.05)
+    if not _worker_tasks or task_queue.idle():
+        return
+    try:
+        await asyncio.wait_for(task_queue.join(), timeout=max_wait)
+    except TimeoutError:
+        logger.debug(
+            "flush_tasks timed out with %d task(s) pending", task_queue.qsize()
+        )
+
+
+def get_queue_stats() -> dict[str, Any]:
+    """Return scheduler counters (per-bucket latency and queue depth)."""
+    return task_queue.stats()
 
 
 __all__ = [
+    "Priority",
+    "TaskScheduler",
     "enqueue_task",
     "flush_tasks",
+    "get_queue_stats",
     "start_task_workers",
     "stop_task_workers",
+    "task_priority",
     "task_queue",
 ]
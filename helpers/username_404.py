@@ -87,7 +87,7 @@ async def remove_bot_roles(member: discord.Member, bot) -> bool:
         except Exception as e:
             logger.warning(f"Failed removing roles for {member.id}: {e}")
 
-    await enqueue_task(task)
+    await enqueue_task(task, bucket="member", major_id=member.guild.id)
     return True
 
 
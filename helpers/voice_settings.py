@@ -8,6 +8,7 @@ Note: Database imports are done lazily inside functions to avoid circular import
 through services/__init__.py -> VoiceService -> voice_settings.
 """
 
+from collections.abc import Callable, Iterable, Sequence
 from typing import TYPE_CHECKING, Any
 
 import discord
@@ -17,6 +18,9 @@ from utils.logging import get_logger
 if TYPE_CHECKING:
     from utils.types import VoiceSettingsSnapshot
 
+# (guild_id, jtc_channel_id, user_id) - the key every voice settings table uses
+SettingsScopeKey = tuple[int, int, int]
+
 logger = get_logger(__name__)
 
 
@@ -35,26 +39,16 @@ VOICE_SETTINGS_FEATURE_SOURCES: tuple[tuple[str, str, str], ...] = (
     ),
 )
 
+# Scopes per bulk query: three bound parameters each keeps a chunk under
+# SQLite's default 999-variable limit.
+BULK_SCOPE_CHUNK_SIZE = 300
 
-async def resolve_target_names(
-    guild: discord.Guild,
-    snapshot: "VoiceSettingsSnapshot",
-) -> None:
-    """
-    Resolve target names in a VoiceSettingsSnapshot.
-
-    Annotates all TargetEntry objects (permissions, PTT, priority, soundboard)
-    with resolved names and metadata flags:
-    - target_name: Display name for the target
-    - is_everyone: True if target is @everyone
-    - unknown_role: True if target is a role that no longer exists
-
-    This replaces all duplicated name resolution logic across commands and API.
 
-    Args:
-        guild: Discord guild for name resolution
-        snapshot: VoiceSettingsSnapshot to annotate in-place
-    """
+def _make_target_resolver(
+    guild: discord.Guild,
+) -> Callable[[str, str], tuple[str | None, bool, bool]]:
+    """Return a memoized (target_id, target_type) -> (name, is_everyone, unknown_role) lookup."""
+    resolved: dict[tuple[str, str], tuple[str | None, bool, bool]] = {}
 
     def resolve_single_target(
         target_id: str, target_type: str
@@ -90,26 +84,63 @@ async def resolve_target_names(
 
         return (str(target_id), False, False)
 
-    # Resolve all target entries
-    for perm in snapshot.permissions:
-        perm.target_name, perm.is_everyone, perm.unknown_role = resolve_single_target(
-            perm.target_id, perm.target_type
-        )
+    def resolve(target_id: str, target_type: str) -> tuple[str | None, bool, bool]:
+        key = (target_id, target_type)
+        if key not in resolved:
+            resolved[key] = resolve_single_target(target_id, target_type)
+        return resolved[key]
 
-    for ptt in snapshot.ptt_settings:
-        ptt.target_name, ptt.is_everyone, ptt.unknown_role = resolve_single_target(
-            ptt.target_id, ptt.target_type
-        )
+    return resolve
 
-    for priority in snapshot.priority_speaker_settings:
-        priority.target_name, priority.is_everyone, priority.unknown_role = (
-            resolve_single_target(priority.target_id, priority.target_type)
-        )
 
-    for soundboard in snapshot.soundboard_settings:
-        soundboard.target_name, soundboard.is_everyone, soundboard.unknown_role = (
-            resolve_single_target(soundboard.target_id, soundboard.target_type)
-        )
+async def resolve_target_names(
+    guild: discord.Guild,
+    snapshot: "VoiceSettingsSnapshot",
+) -> None:
+    """
+    Resolve target names in a VoiceSettingsSnapshot.
+
+    Annotates all TargetEntry objects (permissions, PTT, priority, soundboard)
+    with resolved names and metadata flags:
+    - target_name: Display name for the target
+    - is_everyone: True if target is @everyone
+    - unknown_role: True if target is a role that no longer exists
+
+    This replaces all duplicated name resolution logic across commands and API.
+
+    Args:
+        guild: Discord guild for name resolution
+        snapshot: VoiceSettingsSnapshot to annotate in-place
+    """
+    await resolve_target_names_bulk(guild, [snapshot])
+
+
+async def resolve_target_names_bulk(
+    guild: discord.Guild,
+    snapshots: Iterable["VoiceSettingsSnapshot"],
+) -> None:
+    """
+    Resolve target names for many snapshots of the same guild.
+
+    Each distinct (target_id, target_type) is looked up once for the whole
+    batch, so a role referenced by fifty channels costs one guild lookup.
+
+    Args:
+        guild: Discord guild for name resolution
+        snapshots: VoiceSettingsSnapshots to annotate in-place
+    """
+    resolve = _make_target_resolver(guild)
+
+    for snapshot in snapshots:
+        for entry in (
+            *snapshot.permissions,
+            *snapshot.ptt_settings,
+            *snapshot.priority_speaker_settings,
+            *snapshot.soundboard_settings,
+        ):
+            entry.target_name, entry.is_everyone, entry.unknown_role = resolve(
+                entry.target_id, entry.target_type
+            )
 
 
 async def get_voice_settings_snapshots(
@@ -122,6 +153,38 @@ async def get_voice_settings_snapshots(
     using guild role/member lookups).
     """
 
+    snapshots: list[VoiceSettingsSnapshot] = []
+
+    all_settings = await _get_all_user_jtc_settings(guild_id, user_id)
+
+    for jtc_channel_id, settings in all_settings.items():
+        if not settings:
+            continue
+
+        snapshots.append(
+            build_voice_settings_snapshot(guild_id, jtc_channel_id, user_id, settings)
+        )
+
+    return snapshots
+
+
+def build_voice_settings_snapshot(
+    guild_id: int,
+    jtc_channel_id: int,
+    owner_id: int,
+    settings: dict[str, Any],
+    *,
+    voice_channel_id: int | None = None,
+    created_at: int | None = None,
+    last_activity: int | None = None,
+    is_active: bool = False,
+) -> "VoiceSettingsSnapshot":
+    """Build a VoiceSettingsSnapshot from one entry of a settings map.
+
+    ``settings`` has the shape produced by ``_fetch_user_settings_map`` and
+    ``fetch_voice_settings_bulk``: the channel_settings columns plus a list of
+    ``(target_id, target_type, value)`` rows per feature group.
+    """
     from utils.types import (
         PermissionOverride,
         PrioritySpeakerSetting,
@@ -130,71 +193,62 @@ async def get_voice_settings_snapshots(
         VoiceSettingsSnapshot,
     )
 
-    snapshots: list[VoiceSettingsSnapshot] = []
-
-    all_settings = await _get_all_user_jtc_settings(guild_id, user_id)
-
-    for jtc_channel_id, settings in all_settings.items():
-        if not settings:
-            continue
+    permissions = [
+        PermissionOverride(
+            target_id=str(target_id),
+            target_type=target_type,
+            permission=permission,
+        )
+        for target_id, target_type, permission in settings.get("permissions", [])
+    ]
 
-        permissions = [
-            PermissionOverride(
-                target_id=str(target_id),
-                target_type=target_type,
-                permission=permission,
-            )
-            for target_id, target_type, permission in settings.get("permissions", [])
-        ]
-
-        ptt_settings = [
-            PTTSetting(
-                target_id=str(target_id),
-                target_type=target_type,
-                ptt_enabled=bool(ptt_enabled),
-            )
-            for target_id, target_type, ptt_enabled in settings.get("ptt_settings", [])
-        ]
-
-        priority_settings = [
-            PrioritySpeakerSetting(
-                target_id=str(target_id),
-                target_type=target_type,
-                priority_enabled=bool(priority_enabled),
-            )
-            for target_id, target_type, priority_enabled in settings.get(
-                "priority_settings", []
-            )
-        ]
+    ptt_settings = [
+        PTTSetting(
+            target_id=str(target_id),
+            target_type=target_type,
+            ptt_enabled=bool(ptt_enabled),
+        )
+        for target_id, target_type, ptt_enabled in settings.get("ptt_settings", [])
+    ]
 
-        soundboard_settings = [
-            SoundboardSetting(
-                target_id=str(target_id),
-                target_type=target_type,
-                soundboard_enabled=bool(soundboard_enabled),
-            )
-            for target_id, target_type, soundboard_enabled in settings.get(
-                "soundboard_settings", []
-            )
-        ]
+    priority_settings = [
+        PrioritySpeakerSetting(
+            target_id=str(target_id),
+            target_type=target_type,
+            priority_enabled=bool(priority_enabled),
+        )
+        for target_id, target_type, priority_enabled in settings.get(
+            "priority_settings", []
+        )
+    ]
 
-        snapshots.append(
-            VoiceSettingsSnapshot(
-                guild_id=guild_id,
-                jtc_channel_id=jtc_channel_id,
-                owner_id=user_id,
-                voice_channel_id=None,
-                channel_name=settings.get("channel_name"),
-                user_limit=settings.get("user_limit"),
-                is_locked=bool(settings.get("lock", False)),
-                permissions=permissions,
-                ptt_settings=ptt_settings,
-                priority_speaker_settings=priority_settings,
-                soundboard_settings=soundboard_settings,
-            )
+    soundboard_settings = [
+        SoundboardSetting(
+            target_id=str(target_id),
+            target_type=target_type,
+            soundboard_enabled=bool(soundboard_enabled),
         )
+        for target_id, target_type, soundboard_enabled in settings.get(
+            "soundboard_settings", []
+        )
+    ]
 
-    return snapshots
+    return VoiceSettingsSnapshot(
+        guild_id=guild_id,
+        jtc_channel_id=jtc_channel_id,
+        owner_id=owner_id,
+        voice_channel_id=voice_channel_id,
+        channel_name=settings.get("channel_name"),
+        user_limit=settings.get("user_limit"),
+        is_locked=bool(settings.get("lock", False)),
+        created_at=created_at,
+        last_activity=last_activity,
+        is_active=is_active,
+        permissions=permissions,
+        ptt_settings=ptt_settings,
+        priority_speaker_settings=priority_settings,
+        soundboard_settings=soundboard_settings,
+    )
 
 
 async def fetch_channel_settings(
@@ -467,6 +521,130 @@ async def _fetch_user_settings_map(
     return settings_map
 
 
+def _build_scope_cte(scope_count: int) -> str:
+    """Build a VALUES CTE named ``scope`` holding ``scope_count`` key triples."""
+    values = ", ".join("(?, ?, ?)" for _ in range(scope_count))
+    return f"WITH scope(guild_id, jtc_channel_id, user_id) AS (VALUES {values})\n"
+
+
+def _build_bulk_feature_union_query(scope_count: int) -> str:
+    """Build the UNION ALL feature query joined against a scope CTE."""
+    select_clauses = [
+        (
+            "SELECT t.guild_id, t.jtc_channel_id, t.user_id, "
+            f"'{setting_group}' AS setting_group, "
+            "t.target_id, "
+            "t.target_type, "
+            f"t.{value_column} AS setting_value "
+            f"FROM {table_name} AS t "
+            "JOIN scope AS s ON t.guild_id = s.guild_id "
+            "AND t.jtc_channel_id = s.jtc_channel_id AND t.user_id = s.user_id"
+        )
+        for setting_group, table_name, value_column in VOICE_SETTINGS_FEATURE_SOURCES
+    ]
+    return _build_scope_cte(scope_count) + "\nUNION ALL\n".join(select_clauses)
+
+
+async def fetch_voice_settings_bulk(
+    scopes: Iterable[SettingsScopeKey],
+) -> dict[SettingsScopeKey, dict[str, Any]]:
+    """Fetch saved voice settings for many (guild, jtc, user) scopes at once.
+
+    Costs two queries per ``BULK_SCOPE_CHUNK_SIZE`` distinct scopes: one for
+    channel_settings and one UNION ALL over every feature table. Scopes without
+    a channel_settings row are left out, matching the single-scope snapshot
+    which returns None in that case.
+
+    Returns:
+        Settings maps keyed by scope, in the shape ``build_voice_settings_snapshot``
+        expects.
+    """
+    from services.db.database import Database
+
+    unique_scopes: list[SettingsScopeKey] = list(
+        dict.fromkeys((int(g), int(j), int(u)) for g, j, u in scopes)
+    )
+    settings_map: dict[SettingsScopeKey, dict[str, Any]] = {}
+    if not unique_scopes:
+        return settings_map
+
+    try:
+        async with Database.get_read_connection() as db:
+            for start in range(0, len(unique_scopes), BULK_SCOPE_CHUNK_SIZE):
+                chunk = unique_scopes[start : start + BULK_SCOPE_CHUNK_SIZE]
+                params = tuple(value for scope in chunk for value in scope)
+
+                basic_cursor = await db.execute(
+                    _build_scope_cte(len(chunk))
+                    + """
+                    SELECT c.guild_id, c.jtc_channel_id, c.user_id,
+                           c.channel_name, c.user_limit, c.lock
+                    FROM channel_settings AS c
+                    JOIN scope AS s ON c.guild_id = s.guild_id
+                        AND c.jtc_channel_id = s.jtc_channel_id
+                        AND c.user_id = s.user_id
+                    """,
+                    params,
+                )
+                for row in await basic_cursor.fetchall():
+                    guild_id, jtc_channel_id, user_id, name, limit, lock = row
+                    settings_map[(guild_id, jtc_channel_id, user_id)] = {
+                        "channel_name": name,
+                        "user_limit": limit,
+                        "lock": bool(lock),
+                    }
+
+                feature_cursor = await db.execute(
+                    _build_bulk_feature_union_query(len(chunk)), params
+                )
+                for row in await feature_cursor.fetchall():
+                    guild_id, jtc_channel_id, user_id, group, *entry = row
+                    settings = settings_map.get((guild_id, jtc_channel_id, user_id))
+                    if settings is None:
+                        continue
+                    settings.setdefault(group, []).append(tuple(entry))
+
+    except Exception as e:
+        logger.exception("Error bulk-fetching voice settings", exc_info=e)
+
+    return settings_map
+
+
+async def fetch_voice_channel_metadata(
+    voice_channel_ids: Sequence[int],
+) -> dict[int, tuple[int, int | None, int | None, bool]]:
+    """Return ``voice_channel_id -> (owner_id, created_at, last_activity, is_active)``."""
+    from services.db.repository import BaseRepository
+
+    unique_ids = list(dict.fromkeys(int(cid) for cid in voice_channel_ids))
+    metadata: dict[int, tuple[int, int | None, int | None, bool]] = {}
+    chunk_size = BULK_SCOPE_CHUNK_SIZE * 3
+
+    try:
+        for start in range(0, len(unique_ids), chunk_size):
+            chunk = unique_ids[start : start + chunk_size]
+            placeholders = ",".join("?" for _ in chunk)
+            rows = await BaseRepository.fetch_all(
+                f"""
+                SELECT voice_channel_id, owner_id, created_at, last_activity, is_active
+                FROM voice_channels
+                WHERE voice_channel_id IN ({placeholders})
+                """,
+                tuple(chunk),
+            )
+            for voice_channel_id, owner_id, created_at, last_activity, is_active in rows:
+                metadata[voice_channel_id] = (
+                    owner_id,
+                    created_at,
+                    last_activity,
+                    bool(is_active),
+                )
+    except Exception as e:
+        logger.exception("Error fetching voice channel metadata", exc_info=e)
+
+    return metadata
+
+
 async def _get_last_used_jtc_channel(guild_id: int, user_id: int) -> int | None:
     """Get the last used JTC channel for a user in a guild."""
     # Lazy import to avoid circular dependency
@@ -10,6 +10,25 @@ from utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+def _voice_service(bot: discord.Client):
+    services = getattr(bot, "services", None)
+    return getattr(services, "voice", None)
+
+
+def forget_voice_owner(
+    bot: discord.Client, owner_id: int, guild_id: int | None = None
+) -> None:
+    """
+    Drop an owner's channels from the voice ownership index.
+
+    Call after deleting the owner's voice_channels rows outside VoiceService
+    (e.g. the Database member cleanup helpers) so owner lookups stay correct.
+    """
+    voice_service = _voice_service(bot)
+    if voice_service is not None:
+        voice_service.forget_owned_channels(owner_id, guild_id)
+
+
 async def get_user_channel(
     bot: discord.Client,
     user: discord.abc.User,
@@ -73,6 +92,9 @@ async def get_user_channel(
                             delete_query += " AND guild_id = ? AND jtc_channel_id = ?"
                             delete_params = (channel_id, guild_id, jtc_channel_id)
                         await db.execute(delete_query, delete_params)
+                        voice_service = _voice_service(bot)
+                        if voice_service is not None:
+                            voice_service.forget_channel(channel_id)
                     return None
                 except discord.HTTPException:
                     logger.exception("Failed to fetch channel %s", channel_id)
@@ -3,7 +3,10 @@
 import asyncio
 import copy
 import json
-from collections.abc import Callable
+import logging
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from config.config_loader import ConfigLoader
@@ -49,6 +52,85 @@ CONFIG_LEADERSHIP_ANNOUNCE_CHANNEL = "channels.leadership_announcement_channel_i
 CONFIG_JTC_CHANNELS = "voice.jtc_channels"
 
 
+_MISSING = object()
+
+
+@lru_cache(maxsize=1024)
+def _key_path(key: str) -> tuple[str, ...]:
+    """Split a dotted setting key once and reuse the parts."""
+    return tuple(key.split("."))
+
+
+def _lookup_path(data: Any, path: tuple[str, ...]) -> Any:
+    """Walk ``path`` through nested mappings, returning None when absent."""
+    try:
+        for part in path:
+            data = data[part]
+        return data
+    except (KeyError, TypeError):
+        return None
+
+
+class GuildSettingsSnapshot(Mapping[str, Any]):
+    """
+    Immutable view of one guild's stored settings.
+
+    Snapshots are never modified after construction; writers build a new one
+    and swap it into the cache, so readers need no lock. Resolved lookups
+    (guild exact key, guild nested key, then global config) are memoized per
+    snapshot.
+    """
+
+    __slots__ = ("_global_config", "_resolved", "_settings")
+
+    def __init__(
+        self, settings: Mapping[str, Any], global_config: Mapping[str, Any]
+    ) -> None:
+        self._settings = MappingProxyType(dict(settings))
+        self._global_config = global_config
+        self._resolved: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        return self._settings[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._settings)
+
+    def __len__(self) -> int:
+        return len(self._settings)
+
+    def with_setting(self, key: str, value: Any) -> "GuildSettingsSnapshot":
+        """Return a copy of this snapshot with ``key`` set to ``value``."""
+        settings = dict(self._settings)
+        settings[key] = value
+        return GuildSettingsSnapshot(settings, self._global_config)
+
+    def resolve(self, key: str, global_config: Mapping[str, Any]) -> Any:
+        """Resolve ``key`` against guild then global settings, or ``_MISSING``."""
+        if global_config is not self._global_config:
+            # Global config was reloaded; memoized fallbacks are stale
+            self._global_config = global_config
+            self._resolved = {}
+
+        resolved = self._resolved.get(key, _MISSING)
+        if resolved is not _MISSING:
+            return resolved
+
+        # First try exact key match (for flat keys like "test.setting")
+        if key in self._settings:
+            value = self._settings[key]
+        else:
+            path = _key_path(key)
+            value = _lookup_path(self._settings, path)
+            if value is None:
+                value = _lookup_path(global_config, path)
+                if value is None:
+                    value = _MISSING
+
+        self._resolved[key] = value
+        return value
+
+
 class ConfigService(BaseService):
     """
     Service for managing per-guild configuration and global settings.
@@ -60,9 +142,15 @@ class ConfigService(BaseService):
     def __init__(self, config_loader: ConfigLoader | None = None) -> None:
         super().__init__("config")
         self._global_config: dict[str, Any] = {}
-        self._guild_cache: dict[int, dict[str, Any]] = {}
+        # Immutable per-guild snapshots; replaced wholesale on write so
+        # readers never take the lock (see get_cached)
+        self._guild_cache: dict[int, GuildSettingsSnapshot] = {}
         self._cache_lock = asyncio.Lock()
+        # Version each guild's snapshot was fully loaded at; the stale-guild
+        # poll compares against this, so only full reloads may advance it
         self._guild_versions: dict[int, str | None] = {}
+        # Versions already applied by keyed pushes, to skip repeated pushes
+        self._pushed_versions: dict[int, str] = {}
         # Use centralized ConfigLoader to avoid duplicate path resolution/reads
         self._config_loader = config_loader or ConfigLoader()
 
@@ -78,6 +166,10 @@ class ConfigService(BaseService):
 
         # Normalize role IDs to integers at load time
         self._coerce_role_types(self._global_config)
+        # Snapshots memoize global fallbacks; drop them with the old config
+        self._guild_cache = {}
+        self._guild_versions = {}
+        self._pushed_versions = {}
 
         if self._global_config:
             self.logger.info("Global configuration loaded successfully")
@@ -139,13 +231,16 @@ class ConfigService(BaseService):
         Returns:
             Setting value (parsed if parser provided) or default
         """
-        self.logger.debug(
-            f"ConfigService.get: guild_id={guild_id}, key='{key}', parser={parser.__name__ if parser else None}"
-        )
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug(
+                f"ConfigService.get: guild_id={guild_id}, key='{key}', parser={parser.__name__ if parser else None}"
+            )
         value = await self.get_guild_setting(guild_id, key, default)
-        self.logger.debug(
-            f"  ConfigService.get result: {value} (type: {type(value).__name__ if value is not None else 'None'})"
-        )
+        if debug:
+            self.logger.debug(
+                f"  ConfigService.get result: {value} (type: {type(value).__name__ if value is not None else 'None'})"
+            )
 
         # Apply parser if provided and value is not None/default
         if parser and value is not None and value != default:
@@ -176,21 +271,50 @@ class ConfigService(BaseService):
         """
         self._ensure_initialized()
 
-        # Check guild-specific settings first
-        guild_settings = await self._get_guild_settings(guild_id)
+        snapshot = self._guild_cache.get(guild_id)
+        if snapshot is None:
+            settings = await self._get_guild_settings(guild_id)
+            snapshot = (
+                settings
+                if isinstance(settings, GuildSettingsSnapshot)
+                else GuildSettingsSnapshot(settings, self._global_config)
+            )
 
-        # First try exact key match (for flat keys like "test.setting")
-        if key in guild_settings:
-            return guild_settings[key]
+        value = snapshot.resolve(key, self._global_config)
+        return default if value is _MISSING else value
 
-        # Then try nested key support for dot notation
-        value = self._get_nested_value(guild_settings, key)
-        if value is not None:
-            return value
+    def get_cached(self, guild_id: int, key: str, default: Any = None) -> Any:
+        """
+        Get a guild setting synchronously from the in-memory snapshot.
+
+        Intended for hot paths (per-message, per-voice-event). Never awaits or
+        locks. Returns ``default`` if the guild's settings have not been loaded
+        yet; use ``get_guild_setting`` (or ``warm_guilds``) to load them.
+
+        Args:
+            guild_id: Discord guild ID
+            key: Setting key (supports dot notation like "roles.admin")
+            default: Default value if setting not found or guild not loaded
 
-        # Fall back to global config
-        global_value = self._get_nested_value(self._global_config, key)
-        return global_value if global_value is not None else default
+        Returns:
+            Setting value or default
+        """
+        snapshot = self._guild_cache.get(guild_id)
+        if snapshot is None:
+            return default
+        value = snapshot.resolve(key, self._global_config)
+        return default if value is _MISSING else value
+
+    def is_guild_cached(self, guild_id: int) -> bool:
+        """Return True when ``get_cached`` can answer for this guild."""
+        return guild_id in self._guild_cache
+
+    async def warm_guilds(self, guild_ids: Iterable[int]) -> None:
+        """Load settings snapshots for guilds not cached yet."""
+        self._ensure_initialized()
+        for guild_id in guild_ids:
+            if guild_id not in self._guild_cache:
+                await self._get_guild_settings(guild_id)
 
     async def set_guild_setting(self, guild_id: int, key: str, value: Any) -> None:
         """
@@ -214,13 +338,16 @@ class ConfigService(BaseService):
             (guild_id, key, json.dumps(value)),
         )
 
-        # Update cache
+        # Copy-on-write: readers keep whichever snapshot they already hold.
+        # Uncached guilds stay uncached so the next read loads every key.
         async with self._cache_lock:
-            if guild_id not in self._guild_cache:
-                self._guild_cache[guild_id] = {}
-            self._guild_cache[guild_id][key] = value
-            if key == SETTINGS_VERSION_KEY:
-                self._guild_versions[guild_id] = self._extract_version_value(value)
+            current = self._guild_cache.get(guild_id)
+            if current is not None:
+                self._guild_cache[guild_id] = current.with_setting(key, value)
+                if key == SETTINGS_VERSION_KEY:
+                    self._guild_versions[guild_id] = self._extract_version_value(
+                        value
+                    )
 
         self.logger.debug(f"Set guild {guild_id} setting {key} = {value}")
 
@@ -239,40 +366,28 @@ class ConfigService(BaseService):
         value = self._get_nested_value(self._global_config, key)
         return value if value is not None else default
 
-    async def _get_guild_settings(self, guild_id: int) -> dict[str, Any]:
+    async def _get_guild_settings(self, guild_id: int) -> GuildSettingsSnapshot:
         """Get all settings for a guild, using cache when possible."""
-        async with self._cache_lock:
-            if guild_id in self._guild_cache:
-                self.logger.debug(
-                    f"Cache HIT for guild {guild_id}: {len(self._guild_cache[guild_id])} settings"
-                )
-                return self._guild_cache[guild_id]
+        cached = self._guild_cache.get(guild_id)
+        if cached is not None:
+            return cached
 
         self.logger.debug(f"Cache MISS for guild {guild_id} - loading from database")
 
         # Load from database
-        import json
-
-        settings = {}
         rows = await BaseRepository.fetch_all(
             "SELECT key, value FROM guild_settings WHERE guild_id = ?", (guild_id,)
         )
-        for row in rows:
-            key, value_json = row
-            try:
-                settings[key] = json.loads(value_json)
-                self.logger.debug(f"  Loaded setting: {key} = {settings[key]}")
-            except (json.JSONDecodeError, TypeError):
-                self.logger.warning(
-                    f"Failed to parse setting {key} for guild {guild_id}"
-                )
+        settings = self._decode_setting_rows(guild_id, rows)
 
         # Cache the settings
+        snapshot = GuildSettingsSnapshot(settings, self._global_config)
         async with self._cache_lock:
-            self._guild_cache[guild_id] = settings
+            self._guild_cache[guild_id] = snapshot
             self._guild_versions[guild_id] = self._extract_version_value(
                 settings.get(SETTINGS_VERSION_KEY)
             )
+            self._pushed_versions.pop(guild_id, None)
 
         self.logger.info(
             f"Loaded {len(settings)} settings from database for guild {guild_id}"
@@ -280,19 +395,27 @@ class ConfigService(BaseService):
         if settings:
             self.logger.info(f"  Settings keys: {list(settings.keys())}")
 
+        return snapshot
+
+    def _decode_setting_rows(
+        self, guild_id: int, rows: Iterable[Any]
+    ) -> dict[str, Any]:
+        """Decode ``(key, value_json)`` rows, skipping values that fail to parse."""
+        settings: dict[str, Any] = {}
+        for row in rows:
+            key, value_json = row
+            try:
+                settings[key] = json.loads(value_json)
+                self.logger.debug(f"  Loaded setting: {key} = {settings[key]}")
+            except (json.JSONDecodeError, TypeError):
+                self.logger.warning(
+                    f"Failed to parse setting {key} for guild {guild_id}"
+                )
         return settings
 
-    def _get_nested_value(self, data: dict[str, Any], key: str) -> Any:
+    def _get_nested_value(self, data: Mapping[str, Any], key: str) -> Any:
         """Get a value from nested dict using dot notation."""
-        keys = key.split(".")
-        current = data
-
-        try:
-            for k in keys:
-                current = current[k]
-            return current
-        except (KeyError, TypeError):
-            return None
+        return _lookup_path(data, _key_path(key))
 
     async def get_guild_roles(self, guild_id: int) -> dict[str, int]:
         """
@@ -378,6 +501,7 @@ class ConfigService(BaseService):
         async with self._cache_lock:
             self._guild_cache.pop(guild_id, None)
             self._guild_versions.pop(guild_id, None)
+            self._pushed_versions.pop(guild_id, None)
 
         self.logger.debug(f"Cleared cache for guild {guild_id}")
 
@@ -399,6 +523,124 @@ class ConfigService(BaseService):
         await self._get_guild_settings(guild_id)
         return True
 
+    async def apply_invalidation(
+        self,
+        guild_id: int,
+        *,
+        version: str | None = None,
+        keys: Iterable[str] | None = None,
+    ) -> bool:
+        """
+        Apply a change notification pushed by the web dashboard.
+
+        The reload is skipped when ``version`` is already cached or was
+        already pushed. With ``keys`` only those rows are re-read and swapped
+        into the guild's snapshot; without them the whole guild is reloaded.
+        Guilds that were never loaded are left alone and load fresh on first
+        read.
+
+        A keyed reload does not advance the guild's cached version marker:
+        pushes are best-effort, and an earlier one for other keys may have
+        been lost. :meth:`refresh_stale_guilds` therefore still sees the
+        guild as behind and reloads it in full.
+
+        Args:
+            guild_id: Discord guild ID
+            version: Settings version written alongside the change, if known
+            keys: Setting keys touched by the change, if known
+
+        Returns:
+            True if cached settings were replaced
+        """
+        self._ensure_initialized()
+
+        if guild_id not in self._guild_cache:
+            return False
+        if version is not None and version in (
+            self._guild_versions.get(guild_id),
+            self._pushed_versions.get(guild_id),
+        ):
+            self.logger.debug(
+                f"Guild {guild_id} already at settings version {version}; skipping"
+            )
+            return False
+
+        if keys is None:
+            await self.clear_guild_cache(guild_id)
+            await self._get_guild_settings(guild_id)
+        else:
+            await self._reload_guild_keys(guild_id, keys, version=version)
+        return True
+
+    async def _reload_guild_keys(
+        self,
+        guild_id: int,
+        keys: Iterable[str],
+        *,
+        version: str | None = None,
+    ) -> None:
+        """Re-read selected keys for a cached guild and swap in a new snapshot.
+
+        The version marker is left as fully loaded (see :meth:`apply_invalidation`).
+        """
+        wanted = set(keys) - {SETTINGS_VERSION_KEY}
+        if not wanted:
+            return
+        placeholders = ", ".join("?" for _ in wanted)
+        rows = await BaseRepository.fetch_all(
+            f"SELECT key, value FROM guild_settings WHERE guild_id = ? AND key IN ({placeholders})",
+            (guild_id, *wanted),
+        )
+        fresh = self._decode_setting_rows(guild_id, rows)
+
+        async with self._cache_lock:
+            current = self._guild_cache.get(guild_id)
+            if current is None:
+                # Cleared while we were reading; the next read reloads everything
+                return
+            settings = {k: v for k, v in current.items() if k not in wanted}
+            settings.update(fresh)
+            self._guild_cache[guild_id] = GuildSettingsSnapshot(
+                settings, self._global_config
+            )
+            if version is not None:
+                self._pushed_versions[guild_id] = version
+
+        self.logger.debug(
+            f"Reloaded {len(wanted)} settings keys for guild {guild_id}: {sorted(wanted)}"
+        )
+
+    async def refresh_stale_guilds(self, guild_ids: Iterable[int]) -> list[int]:
+        """
+        Reload cached guilds whose stored version marker changed.
+
+        Fallback for missed push notifications: the version markers of all
+        guilds are read in a single query rather than one query per guild.
+        Guilds that are not cached have nothing stale and are skipped.
+
+        Returns:
+            IDs of guilds that were reloaded
+        """
+        self._ensure_initialized()
+
+        cached_ids = {gid for gid in guild_ids if gid in self._guild_cache}
+        if not cached_ids:
+            return []
+
+        db_versions = await self._fetch_settings_versions_from_db()
+        stale = [
+            gid
+            for gid in cached_ids
+            if db_versions.get(gid) != self._guild_versions.get(gid)
+        ]
+        for gid in stale:
+            await self.clear_guild_cache(gid)
+            await self._get_guild_settings(gid)
+
+        if stale:
+            self.logger.info(f"Reloaded settings for {len(stale)} stale guild(s)")
+        return stale
+
     async def health_check(self) -> dict[str, Any]:
         """Return health information for the config service."""
         base_health = await super().health_check()
@@ -423,9 +665,9 @@ class ConfigService(BaseService):
         if not isinstance(existing, list):
             existing = []
 
-        # Add new channel if not already present
+        # Add new channel if not already present (never mutate the cached list)
         if channel_id not in existing:
-            existing.append(channel_id)
+            existing = [*existing, channel_id]
             await self.set_guild_setting(guild_id, "voice.jtc_channels", existing)
             self.logger.info(f"Added JTC channel {channel_id} to guild {guild_id}")
 
@@ -444,9 +686,9 @@ class ConfigService(BaseService):
         if not isinstance(existing, list):
             return
 
-        # Remove channel if present
+        # Remove channel if present (never mutate the cached list)
         if channel_id in existing:
-            existing.remove(channel_id)
+            existing = [c for c in existing if c != channel_id]
             await self.set_guild_setting(guild_id, "voice.jtc_channels", existing)
             self.logger.info(f"Removed JTC channel {channel_id} from guild {guild_id}")
 
@@ -495,6 +737,22 @@ class ConfigService(BaseService):
 
         return self._extract_version_value(payload)
 
+    async def _fetch_settings_versions_from_db(self) -> dict[int, str | None]:
+        """Return the settings version marker of every guild that has one."""
+        rows = await BaseRepository.fetch_all(
+            "SELECT guild_id, value FROM guild_settings WHERE key = ?",
+            (SETTINGS_VERSION_KEY,),
+        )
+
+        versions: dict[int, str | None] = {}
+        for guild_id, raw in rows:
+            try:
+                payload = json.loads(raw) if isinstance(raw, str) else raw
+            except (json.JSONDecodeError, TypeError):
+                payload = None
+            versions[guild_id] = self._extract_version_value(payload)
+        return versions
+
     def get_config(self) -> dict[str, Any]:
         """
         Get the global configuration dictionary.
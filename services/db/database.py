@@ -10,15 +10,97 @@ import json
 import sqlite3
 import time
 from contextlib import asynccontextmanager
+from typing import Any
 
 import aiosqlite
 
 from utils.logging import get_logger
 
+from .pool import SQLitePool, open_connection
 from .schema import init_schema
 
 logger = get_logger(__name__)
 
+DUE_AUTO_RECHECKS_SQL = """
+    SELECT s.user_id, v.rsi_handle
+    FROM auto_recheck_state s
+    JOIN verification v ON v.user_id = s.user_id
+    WHERE s.needs_reverify = 0
+      AND s.next_retry_at <= ?
+      AND v.needs_reverify = 0
+    ORDER BY s.next_retry_at ASC, s.last_auto_recheck ASC
+    LIMIT ?
+"""
+"""Due auto-recheck users as a range scan over ``idx_auto_recheck_due``."""
+
+DUE_AUTO_RECHECKS_COUNT_SQL = """
+    SELECT COUNT(*)
+    FROM auto_recheck_state
+    WHERE needs_reverify = 0
+      AND next_retry_at <= ?
+"""
+"""Backlog size, counted inside ``idx_auto_recheck_due`` alone.
+
+No join to ``verification``: the triggers keep one state row per verified
+user with ``needs_reverify`` mirrored, and a join lets the planner drive the
+count from a full ``verification`` scan instead of the due range."""
+
+_HANDLE_CONFLICT_SQL = (
+    "SELECT user_id FROM verification "
+    "WHERE LOWER(rsi_handle) = LOWER(?) AND user_id != ?"
+)
+
+_UPSERT_VERIFICATION_STATE_SQL = """
+    INSERT INTO verification (
+        user_id, rsi_handle, main_orgs, affiliate_orgs,
+        community_moniker, last_updated, needs_reverify, needs_reverify_at
+    ) VALUES (?, ?, ?, ?, ?, ?, 0, NULL)
+    ON CONFLICT(user_id) DO UPDATE SET
+        rsi_handle = excluded.rsi_handle,
+        main_orgs = excluded.main_orgs,
+        affiliate_orgs = excluded.affiliate_orgs,
+        community_moniker = excluded.community_moniker,
+        last_updated = excluded.last_updated,
+        needs_reverify = 0,
+        needs_reverify_at = NULL
+"""
+
+_UPSERT_RECHECK_SUCCESS_SQL = """
+    INSERT INTO auto_recheck_state(user_id, last_auto_recheck, next_retry_at, fail_count, last_error)
+    VALUES (?, ?, ?, 0, NULL)
+    ON CONFLICT(user_id) DO UPDATE SET
+        last_auto_recheck=excluded.last_auto_recheck,
+        next_retry_at=excluded.next_retry_at,
+        fail_count=0,
+        last_error=NULL
+"""
+
+_UPSERT_RECHECK_FAILURE_SQL = """
+    INSERT INTO auto_recheck_state(user_id, last_auto_recheck, next_retry_at, fail_count, last_error)
+    VALUES (?, ?, ?, 0, ?)
+    ON CONFLICT(user_id) DO UPDATE SET
+        last_auto_recheck=excluded.last_auto_recheck,
+        next_retry_at=excluded.next_retry_at,
+        last_error=excluded.last_error
+"""
+
+_TRACK_MEMBERSHIP_SQL = """
+    INSERT INTO user_guild_membership (user_id, guild_id, joined_at, last_seen)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(user_id, guild_id) DO UPDATE SET last_seen = excluded.last_seen
+"""
+
+
+def _verification_state_params(user_id: int, state: dict) -> tuple:
+    return (
+        user_id,
+        state.get("rsi_handle", ""),
+        json.dumps(state.get("main_orgs")),
+        json.dumps(state.get("affiliate_orgs")),
+        state.get("community_moniker"),
+        int(state.get("last_updated", 0)),
+    )
+
 
 def derive_membership_status(
     main_orgs: list[str] | None,
@@ -70,8 +152,8 @@ async def get_cross_guild_membership_status(user_id: int) -> str:
     Determine a user's highest membership status across ALL guilds tracking their orgs.
 
     Returns the highest status ("main", "affiliate", or "non_member") by:
-    1. Fetching user's main_orgs and affiliate_orgs from verification table
-    2. Finding all guilds that track ANY of those organizations
+    1. Looking up the user's rows in ``verification_org_membership``
+    2. Keeping only orgs tracked by at least one guild
     3. Returning "main" if user is main member of ANY tracked org
     4. Returning "affiliate" if only affiliate across all tracked orgs
     5. Returning "non_member" if not a member of any tracked org
@@ -85,63 +167,35 @@ async def get_cross_guild_membership_status(user_id: int) -> str:
         str: "main", "affiliate", or "non_member"
     """
     async with Database.get_connection() as db:
-        # Get user's organization memberships
+        # Indexed lookup against the trigger-maintained org membership table
         cur = await db.execute(
-            "SELECT main_orgs, affiliate_orgs FROM verification WHERE user_id = ?",
+            """
+            SELECT MIN(CASE m.kind WHEN 'main' THEN 0 ELSE 1 END)
+            FROM verification_org_membership AS m
+            WHERE m.user_id = ?
+            AND m.org_sid IN (
+                SELECT upper(trim(json_extract(value, '$'), '"'))
+                FROM guild_settings
+                WHERE key = 'organization.sid'
+                AND json_extract(value, '$') IS NOT NULL
+            )
+            """,
             (user_id,),
         )
         row = await cur.fetchone()
 
-        if not row:
-            return "non_member"
-
-        main_orgs_json, affiliate_orgs_json = row
-        main_orgs = json.loads(main_orgs_json) if main_orgs_json else []
-        affiliate_orgs = json.loads(affiliate_orgs_json) if affiliate_orgs_json else []
-
-        # Filter out REDACTED
-        main_orgs = [sid for sid in main_orgs if sid != "REDACTED"]
-        affiliate_orgs = [sid for sid in affiliate_orgs if sid != "REDACTED"]
-
-        if not main_orgs and not affiliate_orgs:
-            return "non_member"
-
-        # Get all tracked organization SIDs from guild_settings
-        # We need to find guilds where organization.sid matches any of user's orgs
-        all_user_orgs = set(main_orgs + affiliate_orgs)
-
-        # Query guild_settings for any guild tracking these orgs
-        tracked_orgs_query = """
-            SELECT json_extract(value, '$') as org_sid
-            FROM guild_settings
-            WHERE key = 'organization.sid'
-            AND json_extract(value, '$') IS NOT NULL
-        """
-        cur = await db.execute(tracked_orgs_query)
-        tracked_sids_rows = await cur.fetchall()
-        tracked_sids = {
-            row[0].strip('"').upper() for row in tracked_sids_rows if row[0]
-        }
-
-        # Check intersection
-        tracked_user_orgs = all_user_orgs.intersection(tracked_sids)
-
-        if not tracked_user_orgs:
-            return "non_member"
-
-        # Determine highest status
-        for org_sid in tracked_user_orgs:
-            if org_sid in main_orgs:
-                return "main"  # Highest status
-
-        # If we get here, user is only affiliate in tracked orgs
-        return "affiliate"
+    if not row or row[0] is None:
+        return "non_member"
+    return "main" if row[0] == 0 else "affiliate"
 
 
 class Database:
     _db_path: str = "TESTDatabase.db"
     _lock = asyncio.Lock()  # Ensures that only one initialization happens
     _initialized = False
+    _pool: SQLitePool | None = None
+    # Pool sizing: readers serve BaseRepository fetch_* concurrently under WAL
+    _pool_readers: int = 4
 
     @classmethod
     async def get_auto_recheck_fail_count(cls, user_id: int) -> int:
@@ -186,6 +240,9 @@ class Database:
             if not needs_init:
                 return
 
+            # Pooled connections may point at a previous (or deleted) file
+            await cls._close_pool()
+
             async with aiosqlite.connect(cls._db_path) as db:
                 # Enable foreign key constraints
                 await db.execute("PRAGMA foreign_keys=ON")
@@ -216,34 +273,91 @@ class Database:
             )
             await db.commit()
 
+    @classmethod
+    async def _get_pool(cls) -> SQLitePool:
+        """Return the pool for the current database path, creating it on demand."""
+        if not cls._initialized:
+            await cls.initialize()
+        pool = cls._pool
+        if pool is None or pool.closed or pool.db_path != cls._db_path:
+            if pool is not None and not pool.closed:
+                await pool.close()
+            pool = SQLitePool(cls._db_path, readers=cls._pool_readers)
+            cls._pool = pool
+        return pool
+
+    @classmethod
+    async def _close_pool(cls) -> None:
+        pool, cls._pool = cls._pool, None
+        if pool is not None:
+            await pool.close()
+
     @classmethod
     @asynccontextmanager
     async def get_connection(cls):
         """
-        Get a connection to the database with optimized settings.
+        Lease the pooled writer connection (safe for reads and writes).
+
+        PRAGMAs are applied once when the pooled connection is created.
+        Uncommitted changes are rolled back when the block exits.
 
         Usage:
             async with Database.get_connection() as db:
                 await db.execute("SELECT * FROM table")
         """
+        pool = await cls._get_pool()
+        async with pool.writer() as db:
+            yield db
+
+    @classmethod
+    @asynccontextmanager
+    async def get_read_connection(cls):
+        """
+        Lease a pooled read-only connection for SELECT queries.
+
+        Readers run concurrently with each other and with the writer (WAL).
+        Any write attempted on this connection raises ``OperationalError``.
+
+        Usage:
+            async with Database.get_read_connection() as db:
+                cursor = await db.execute("SELECT * FROM table")
+        """
+        pool = await cls._get_pool()
+        async with pool.reader() as db:
+            yield db
+
+    @classmethod
+    @asynccontextmanager
+    async def get_transient_connection(cls):
+        """
+        Open a dedicated, unpooled connection for the duration of the block.
+
+        For long-lived scopes (a web request spanning HTTP calls) that must
+        not hold the single pooled writer. Same PRAGMAs as pooled connections.
+
+        Usage:
+            async with Database.get_transient_connection() as db:
+                await db.execute("UPDATE table SET ...")
+                await db.commit()
+        """
         if not cls._initialized:
             await cls.initialize()
-        async with aiosqlite.connect(cls._db_path) as db:
-            # Optimize database performance and reliability
-            await db.execute("PRAGMA busy_timeout=5000")
-            await db.execute("PRAGMA foreign_keys=ON")
-            try:
-                await db.execute("PRAGMA journal_mode=WAL")
-            except sqlite3.OperationalError as exc:
-                # WAL transition can fail briefly if another writer holds a lock; retry once
-                if "database is locked" in str(exc).lower():
-                    await asyncio.sleep(0.05)
-                    await db.execute("PRAGMA journal_mode=WAL")
-                else:
-                    raise
-            await db.execute("PRAGMA synchronous=NORMAL")
-            db.row_factory = aiosqlite.Row
+        db = await open_connection(cls._db_path)
+        try:
             yield db
+        finally:
+            await db.close()
+
+    @classmethod
+    async def close(cls) -> None:
+        """Close all pooled connections (call on shutdown)."""
+        await cls._close_pool()
+        logger.info("Database connection pool closed.")
+
+    @classmethod
+    def pool_stats(cls) -> dict[str, Any]:
+        """Return connection pool counters, or an empty dict if no pool exists."""
+        return cls._pool.stats() if cls._pool is not None else {}
 
     @classmethod
     async def fetch_rate_limit(
@@ -442,24 +556,75 @@ class Database:
             await db.commit()
 
     @classmethod
-    async def get_due_auto_rechecks(cls, now: int, limit: int) -> list[tuple[int, str]]:
+    async def upsert_auto_recheck_successes(
+        cls, rows: list[tuple[int, int]], now: int
+    ) -> None:
+        """Batch form of upsert_auto_recheck_success: rows of (user_id, next_retry_at)."""
+        if not rows:
+            return
+        async with cls.get_connection() as db:
+            await db.executemany(
+                _UPSERT_RECHECK_SUCCESS_SQL,
+                [(user_id, now, next_retry_at) for user_id, next_retry_at in rows],
+            )
+            await db.commit()
+
+    @classmethod
+    async def upsert_auto_recheck_failures(
+        cls, rows: list[tuple[int, int, str]], now: int
+    ) -> None:
         """
-        Returns list of (user_id, rsi_handle) that are due for auto recheck.
-        If a user has no row in auto_recheck_state, treat as due (bootstrap on first touch).
+        Batch form of upsert_auto_recheck_failure(inc=False).
+
+        Rows are (user_id, next_retry_at, error_msg).
         """
+        if not rows:
+            return
         async with cls.get_connection() as db:
+            await db.executemany(
+                _UPSERT_RECHECK_FAILURE_SQL,
+                [
+                    (user_id, now, next_retry_at, error_msg[:500])
+                    for user_id, next_retry_at, error_msg in rows
+                ],
+            )
+            await db.commit()
+
+    @classmethod
+    async def get_auto_recheck_fail_counts(cls, user_ids: list[int]) -> dict[int, int]:
+        """Return {user_id: fail_count} for the given users (missing rows -> 0)."""
+        counts = dict.fromkeys(user_ids, 0)
+        if not user_ids:
+            return counts
+        async with cls.get_read_connection() as db:
             cursor = await db.execute(
-                """
-                SELECT v.user_id, v.rsi_handle
-                FROM verification v
-                LEFT JOIN auto_recheck_state s ON s.user_id = v.user_id
-                WHERE COALESCE(s.next_retry_at, 0) <= ?
-                  AND v.needs_reverify = 0
-                ORDER BY COALESCE(s.last_auto_recheck, 0) ASC
-                LIMIT ?
-            """,
-                (now, limit),
+                "SELECT s.user_id, s.fail_count FROM auto_recheck_state s "
+                "JOIN json_each(?) j ON j.value = s.user_id",
+                (json.dumps(user_ids),),
             )
+            for user_id, fail_count in await cursor.fetchall():
+                counts[int(user_id)] = int(fail_count or 0)
+        return counts
+
+    @classmethod
+    async def count_due_auto_rechecks(cls, now: int) -> int:
+        """Return how many users are currently due for auto recheck (the backlog)."""
+        async with cls.get_read_connection() as db:
+            cursor = await db.execute(DUE_AUTO_RECHECKS_COUNT_SQL, (now,))
+            row = await cursor.fetchone()
+            return int(row[0]) if row else 0
+
+    @classmethod
+    async def get_due_auto_rechecks(cls, now: int, limit: int) -> list[tuple[int, str]]:
+        """
+        Returns list of (user_id, rsi_handle) that are due for auto recheck.
+
+        Every verification row has an auto_recheck_state row (kept by schema
+        triggers), so this walks idx_auto_recheck_due in order: most overdue
+        first, then least recently checked.
+        """
+        async with cls.get_connection() as db:
+            cursor = await db.execute(DUE_AUTO_RECHECKS_SQL, (now, limit))
             rows = await cursor.fetchall()
             # Normalize to a list of simple tuples for typing clarity
             return [(int(r[0]), str(r[1])) for r in rows]
@@ -553,31 +718,89 @@ class Database:
         )
         async with cls.get_connection() as db:
             await db.execute(
-                """
-                INSERT INTO verification (
-                    user_id, rsi_handle, main_orgs, affiliate_orgs,
-                    community_moniker, last_updated, needs_reverify, needs_reverify_at
-                ) VALUES (?, ?, ?, ?, ?, ?, 0, NULL)
-                ON CONFLICT(user_id) DO UPDATE SET
-                    rsi_handle = excluded.rsi_handle,
-                    main_orgs = excluded.main_orgs,
-                    affiliate_orgs = excluded.affiliate_orgs,
-                    community_moniker = excluded.community_moniker,
-                    last_updated = excluded.last_updated,
-                    needs_reverify = 0,
-                    needs_reverify_at = NULL
-                """,
-                (
-                    user_id,
-                    state.get("rsi_handle", ""),
-                    json.dumps(state.get("main_orgs")),
-                    json.dumps(state.get("affiliate_orgs")),
-                    state.get("community_moniker"),
-                    int(state.get("last_updated", 0)),
-                ),
+                _UPSERT_VERIFICATION_STATE_SQL,
+                _verification_state_params(user_id, state),
             )
             await db.commit()
 
+    @classmethod
+    async def store_verification_batch(
+        cls,
+        states: list[tuple[int, dict]],
+        *,
+        schedules: list[tuple[int, int]] | None = None,
+        failures: list[tuple[int, int, str]] | None = None,
+        memberships: list[tuple[int, int]] | None = None,
+        now: int | None = None,
+    ) -> dict[int, int]:
+        """
+        Persist many verification results in a single transaction.
+
+        Args:
+            states: (user_id, state) pairs shaped like update_global_verification_state
+            schedules: (user_id, next_retry_at) rows as in upsert_auto_recheck_successes
+            failures: (user_id, next_retry_at, error_msg) rows as in
+                upsert_auto_recheck_failures
+            memberships: (user_id, guild_id) pairs as in track_user_guild_membership
+            now: Timestamp for schedule/membership rows (defaults to now)
+
+        Returns:
+            {user_id: conflicting_user_id} for states that were skipped because
+            the handle is verified by another user (0 when the row hit a
+            constraint instead).  Conflicts never abort the batch, and
+            schedules and memberships for skipped users are not written.
+        """
+        now = int(time.time()) if now is None else now
+        conflicts: dict[int, int] = {}
+        async with cls.get_connection() as db:
+            await db.execute("BEGIN TRANSACTION")
+            try:
+                for user_id, state in states:
+                    cursor = await db.execute(
+                        _HANDLE_CONFLICT_SQL, (state.get("rsi_handle", ""), user_id)
+                    )
+                    row = await cursor.fetchone()
+                    if row:
+                        conflicts[user_id] = int(row[0])
+                        continue
+                    try:
+                        await db.execute(
+                            _UPSERT_VERIFICATION_STATE_SQL,
+                            _verification_state_params(user_id, state),
+                        )
+                    except sqlite3.IntegrityError:
+                        # A failed statement is rolled back on its own; the
+                        # transaction and earlier rows are kept.
+                        conflicts[user_id] = 0
+
+                schedule_rows = [
+                    (user_id, now, next_retry_at)
+                    for user_id, next_retry_at in schedules or []
+                    if user_id not in conflicts
+                ]
+                if schedule_rows:
+                    await db.executemany(_UPSERT_RECHECK_SUCCESS_SQL, schedule_rows)
+                if failures:
+                    await db.executemany(
+                        _UPSERT_RECHECK_FAILURE_SQL,
+                        [
+                            (user_id, now, next_retry_at, error_msg[:500])
+                            for user_id, next_retry_at, error_msg in failures
+                        ],
+                    )
+                membership_rows = [
+                    (user_id, guild_id, now, now)
+                    for user_id, guild_id in memberships or []
+                    if user_id not in conflicts
+                ]
+                if membership_rows:
+                    await db.executemany(_TRACK_MEMBERSHIP_SQL, membership_rows)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+        return conflicts
+
     @classmethod
     async def purge_voice_data(
         cls, guild_id: int, user_id: int | None = None
@@ -774,17 +997,23 @@ class Database:
 
     @classmethod
     async def fetch_audit_logs_by_guild(
-        cls, guild_id: str, limit: int = 1000
+        cls,
+        guild_id: str,
+        limit: int = 1000,
+        before: tuple[int, int] | None = None,
     ) -> list[dict]:
         """
-        Fetch audit log entries for a specific guild.
+        Fetch audit log entries for a specific guild, newest first.
 
         Args:
             guild_id: Discord guild ID to filter by
             limit: Maximum number of rows to return (default 1000)
+            before: ``(timestamp, id)`` of the last entry already returned;
+                the page continues past it (keyset pagination)
 
         Returns:
             List of audit log dictionaries with keys:
+            - id: Row ID (with timestamp, forms the pagination key)
             - timestamp: Unix timestamp
             - admin_user_id: Discord ID of admin who performed action
             - action: Action type (e.g., "RECHECK_USER", "BULK_RECHECK")
@@ -792,26 +1021,35 @@ class Database:
             - details: JSON string with additional details (may be None)
             - status: Action status (e.g., "success", "error")
         """
+        where = "WHERE guild_id = ?"
+        params: list[Any] = [guild_id]
+        if before is not None:
+            where += " AND (timestamp, id) < (?, ?)"
+            params.extend(before)
+        params.append(limit)
+
         async with cls.get_connection() as db:
             cursor = await db.execute(
-                """SELECT timestamp, admin_user_id, action, target_user_id, details, status
+                f"""SELECT id, timestamp, admin_user_id, action, target_user_id,
+                          details, status
                    FROM admin_action_log
-                   WHERE guild_id = ?
-                   ORDER BY timestamp DESC
+                   {where}
+                   ORDER BY timestamp DESC, id DESC
                    LIMIT ?""",
-                (guild_id, limit),
+                params,
             )
             rows = await cursor.fetchall()
 
             # Convert rows to dictionaries
             return [
                 {
-                    "timestamp": row[0],
-                    "admin_user_id": row[1],
-                    "action": row[2],
-                    "target_user_id": row[3],
-                    "details": row[4],
-                    "status": row[5],
+                    "id": row[0],
+                    "timestamp": row[1],
+                    "admin_user_id": row[2],
+                    "action": row[3],
+                    "target_user_id": row[4],
+                    "details": row[5],
+                    "status": row[6],
                 }
                 for row in rows
             ]
@@ -827,14 +1065,7 @@ class Database:
         """
         now = int(time.time())
         async with cls.get_connection() as db:
-            await db.execute(
-                """
-                INSERT INTO user_guild_membership (user_id, guild_id, joined_at, last_seen)
-                VALUES (?, ?, ?, ?)
-                ON CONFLICT(user_id, guild_id) DO UPDATE SET last_seen = excluded.last_seen
-                """,
-                (user_id, guild_id, now, now),
-            )
+            await db.execute(_TRACK_MEMBERSHIP_SQL, (user_id, guild_id, now, now))
             await db.commit()
 
     @classmethod
@@ -868,10 +1099,7 @@ class Database:
             The user_id of the conflicting account, or None if no conflict
         """
         async with cls.get_connection() as db:
-            cursor = await db.execute(
-                "SELECT user_id FROM verification WHERE LOWER(rsi_handle) = LOWER(?) AND user_id != ?",
-                (rsi_handle, user_id),
-            )
+            cursor = await db.execute(_HANDLE_CONFLICT_SQL, (rsi_handle, user_id))
             row = await cursor.fetchone()
             return row[0] if row else None
 
@@ -6,14 +6,15 @@ game activity, message counts). Isolated from the main bot database to avoid
 write contention from high-frequency metric inserts.
 """
 
-import asyncio
-import sqlite3
 from contextlib import asynccontextmanager
+from typing import Any
 
 import aiosqlite
 
 from utils.logging import get_logger
 
+from .pool import SQLitePool
+
 logger = get_logger(__name__)
 
 
@@ -22,11 +23,14 @@ class MetricsDatabase:
     Manages a separate SQLite database exclusively for metrics data.
 
     Uses WAL mode and busy_timeout for concurrent read/write safety.
+    Connections are pooled (see ``SQLitePool``): one serialized writer for
+    inserts/rollups plus read-only connections for dashboard queries.
     Schema is initialized via init_metrics_schema().
     """
 
     _db_path: str | None = None
     _initialized: bool = False
+    _pool: SQLitePool | None = None
 
     @classmethod
     async def initialize(cls, db_path: str | None = None) -> None:
@@ -42,42 +46,71 @@ class MetricsDatabase:
         cls._db_path = db_path or "metrics.db"
         logger.info("Initializing metrics database at %s", cls._db_path)
 
+        await cls._close_pool()
         async with cls.get_connection() as db:
             await init_metrics_schema(db)
 
         cls._initialized = True
         logger.info("Metrics database initialized successfully")
 
+    @classmethod
+    async def _get_pool(cls) -> SQLitePool:
+        if not cls._db_path:
+            raise RuntimeError(
+                "MetricsDatabase not initialized — call initialize() first"
+            )
+        pool = cls._pool
+        if pool is None or pool.closed or pool.db_path != cls._db_path:
+            if pool is not None and not pool.closed:
+                await pool.close()
+            pool = SQLitePool(cls._db_path, readers=2)
+            cls._pool = pool
+        return pool
+
+    @classmethod
+    async def _close_pool(cls) -> None:
+        pool, cls._pool = cls._pool, None
+        if pool is not None:
+            await pool.close()
+
     @classmethod
     @asynccontextmanager
     async def get_connection(cls):
         """
-        Get a connection to the metrics database with optimized settings.
+        Lease the pooled metrics writer connection.
 
         Usage:
             async with MetricsDatabase.get_connection() as db:
                 await db.execute("SELECT * FROM voice_sessions")
         """
-        if not cls._db_path:
-            raise RuntimeError(
-                "MetricsDatabase not initialized — call initialize() first"
-            )
+        pool = await cls._get_pool()
+        async with pool.writer() as db:
+            yield db
+
+    @classmethod
+    @asynccontextmanager
+    async def get_read_connection(cls):
+        """
+        Lease a pooled read-only metrics connection for dashboard queries.
 
-        async with aiosqlite.connect(cls._db_path) as db:
-            await db.execute("PRAGMA busy_timeout=5000")
-            await db.execute("PRAGMA foreign_keys=ON")
-            try:
-                await db.execute("PRAGMA journal_mode=WAL")
-            except sqlite3.OperationalError as exc:
-                if "database is locked" in str(exc).lower():
-                    await asyncio.sleep(0.05)
-                    await db.execute("PRAGMA journal_mode=WAL")
-                else:
-                    raise
-            await db.execute("PRAGMA synchronous=NORMAL")
-            db.row_factory = aiosqlite.Row
+        Usage:
+            async with MetricsDatabase.get_read_connection() as db:
+                cursor = await db.execute("SELECT * FROM metrics_hourly")
+        """
+        pool = await cls._get_pool()
+        async with pool.reader() as db:
             yield db
 
+    @classmethod
+    async def close(cls) -> None:
+        """Close pooled metrics connections (call on shutdown)."""
+        await cls._close_pool()
+
+    @classmethod
+    def pool_stats(cls) -> dict[str, Any]:
+        """Return connection pool counters, or an empty dict if no pool exists."""
+        return cls._pool.stats() if cls._pool is not None else {}
+
     @classmethod
     def reset(cls) -> None:
         """Reset initialization state (for testing)."""
@@ -146,6 +179,11 @@ async def init_metrics_schema(db: aiosqlite.Connection) -> None:
         "CREATE INDEX IF NOT EXISTS idx_voice_sessions_open "
         "ON voice_sessions(left_at) WHERE left_at IS NULL"
     )
+    # Hourly rollups select sessions overlapping an hour by end time
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_voice_sessions_left "
+        "ON voice_sessions(left_at, joined_at)"
+    )
 
     # -----------------------------------------------------------------------
     # Game Sessions — raw activity/presence log
@@ -184,6 +222,10 @@ async def init_metrics_schema(db: aiosqlite.Connection) -> None:
         "CREATE INDEX IF NOT EXISTS idx_game_sessions_open "
         "ON game_sessions(ended_at) WHERE ended_at IS NULL"
     )
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_game_sessions_ended "
+        "ON game_sessions(ended_at, started_at)"
+    )
 
     # -----------------------------------------------------------------------
     # Message Counts — message-window bucketed counters
@@ -276,5 +318,26 @@ async def init_metrics_schema(db: aiosqlite.Connection) -> None:
         "ON metrics_user_hourly(guild_id, user_id, hour_bucket)"
     )
 
+    # -----------------------------------------------------------------------
+    # Rollup State — persisted high-water mark for the hourly rollup engine
+    # `next_hour_bucket` is the first hour not yet rolled up; late-arriving
+    # raw rows rewind it so affected hours are recomputed.
+    # -----------------------------------------------------------------------
+    await db.execute(
+        """
+        CREATE TABLE IF NOT EXISTS metrics_rollup_state (
+            name TEXT PRIMARY KEY,
+            next_hour_bucket INTEGER NOT NULL,
+            updated_at INTEGER NOT NULL
+        )
+        """
+    )
+    await db.execute(
+        """
+        INSERT OR IGNORE INTO metrics_schema_migrations (version, applied_at)
+        VALUES (2, strftime('%s','now'))
+        """
+    )
+
     await db.commit()
     logger.info("Metrics schema initialization complete")
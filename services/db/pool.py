@@ -0,0 +1,406 @@
+"""
+SQLite Connection Pool
+
+Long-lived aiosqlite connections for the bot and metrics databases.
+
+Opening an aiosqlite connection spawns a worker thread and re-runs every
+PRAGMA, which dominates the cost of the small queries issued on hot paths
+(voice_state_update, message metrics). The pool keeps:
+
+- a bounded set of reader connections (``PRAGMA query_only=ON``) that serve
+  SELECT-only work concurrently under WAL, and
+- a single writer connection that is leased to one task at a time so writes
+  never contend with each other for the SQLite write lock.
+
+AI Notes:
+    Callers nested inside an existing writer lease (same task) or waiting
+    longer than ``writer_wait_seconds`` get a transient connection with the
+    same PRAGMAs instead of blocking. That keeps the legacy one-connection-
+    per-block semantics as a fallback and rules out self-deadlocks when a
+    writer block awaits work that itself needs the database.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+import aiosqlite
+
+from utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+logger = get_logger(__name__)
+
+
+async def configure_connection(
+    db: aiosqlite.Connection, *, read_only: bool = False
+) -> None:
+    """
+    Apply the standard PRAGMAs used by every bot database connection.
+
+    Args:
+        db: Freshly opened aiosqlite connection
+        read_only: When True, reject writes on this connection
+    """
+    await db.execute("PRAGMA busy_timeout=5000")
+    await db.execute("PRAGMA foreign_keys=ON")
+    try:
+        await db.execute("PRAGMA journal_mode=WAL")
+    except sqlite3.OperationalError as exc:
+        # WAL transition can fail briefly if another writer holds a lock; retry once
+        if "database is locked" in str(exc).lower():
+            await asyncio.sleep(0.05)
+            await db.execute("PRAGMA journal_mode=WAL")
+        else:
+            raise
+    await db.execute("PRAGMA synchronous=NORMAL")
+    if read_only:
+        await db.execute("PRAGMA query_only=ON")
+    db.row_factory = aiosqlite.Row
+
+
+async def open_connection(
+    db_path: str, *, read_only: bool = False, daemon: bool = False
+) -> aiosqlite.Connection:
+    """
+    Open and configure a new aiosqlite connection.
+
+    Args:
+        db_path: SQLite database file path
+        read_only: Apply ``PRAGMA query_only`` to the connection
+        daemon: Run the aiosqlite worker thread as a daemon thread
+
+    Returns:
+        Open, configured connection (caller owns closing it)
+    """
+    pending = aiosqlite.connect(db_path)
+    if daemon:
+        # Pooled connections live for the whole process; a non-daemon worker
+        # thread would block interpreter exit if shutdown never closes them.
+        worker = getattr(pending, "_thread", pending)
+        if isinstance(worker, threading.Thread):
+            worker.daemon = True
+    db = await pending
+    try:
+        await configure_connection(db, read_only=read_only)
+    except Exception:
+        await db.close()
+        raise
+    return db
+
+
+@dataclass(slots=True, eq=False)
+class _PooledConnection:
+    """A pooled connection plus bookkeeping for health checks (identity-hashed)."""
+
+    conn: aiosqlite.Connection
+    created_at: float
+    last_used: float
+
+
+@dataclass(slots=True)
+class PoolStats:
+    """Counters describing pool usage since creation."""
+
+    readers_open: int = 0
+    readers_idle: int = 0
+    readers_in_use: int = 0
+    writer_open: bool = False
+    writer_in_use: bool = False
+    reader_leases: int = 0
+    writer_leases: int = 0
+    writer_wait_seconds_total: float = 0.0
+    transient_connections: int = 0
+    connections_opened: int = 0
+    connections_replaced: int = 0
+
+
+class SQLitePool:
+    """
+    Pool of long-lived aiosqlite connections for a single database file.
+
+    Usage:
+        pool = SQLitePool("bot.db")
+        async with pool.writer() as db:
+            await db.execute("INSERT ...")
+            await db.commit()
+        async with pool.reader() as db:
+            cursor = await db.execute("SELECT ...")
+        await pool.close()
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        readers: int = 4,
+        writer_wait_seconds: float = 2.0,
+        health_check_interval: float = 30.0,
+        close_timeout: float = 5.0,
+    ) -> None:
+        if readers < 1:
+            raise ValueError("readers must be >= 1")
+        self.db_path = db_path
+        self._max_readers = readers
+        self._writer_wait_seconds = writer_wait_seconds
+        self._health_check_interval = health_check_interval
+        self._close_timeout = close_timeout
+
+        self._idle_readers: list[_PooledConnection] = []
+        self._readers_open = 0
+        self._writer: _PooledConnection | None = None
+        self._writer_owner: asyncio.Task | None = None
+        # Pooled connections currently leased out; close() waits for these
+        self._leased: set[_PooledConnection] = set()
+        self._drained: asyncio.Event | None = None
+        self._closed = False
+        self._stats = PoolStats()
+
+        # asyncio primitives are bound lazily to the running loop (see _bind_loop)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._reader_slots: asyncio.Semaphore | None = None
+        self._writer_lock: asyncio.Lock | None = None
+
+    @property
+    def closed(self) -> bool:
+        """True once close() has been called."""
+        return self._closed
+
+    def _bind_loop(self) -> None:
+        """(Re)create asyncio primitives when first used on a new event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self._loop = loop
+        self._reader_slots = asyncio.Semaphore(self._max_readers)
+        self._writer_lock = asyncio.Lock()
+        self._writer_owner = None
+
+    async def _open(self, *, read_only: bool) -> _PooledConnection:
+        conn = await open_connection(self.db_path, read_only=read_only, daemon=True)
+        now = time.monotonic()
+        self._stats.connections_opened += 1
+        return _PooledConnection(conn=conn, created_at=now, last_used=now)
+
+    async def _is_healthy(self, entry: _PooledConnection) -> bool:
+        """Ping a connection that has been idle longer than the check interval."""
+        if time.monotonic() - entry.last_used < self._health_check_interval:
+            return True
+        try:
+            cursor = await entry.conn.execute("SELECT 1")
+            await cursor.close()
+            return True
+        except Exception as e:
+            logger.warning(
+                "Pooled SQLite connection failed health check; replacing",
+                extra={"db_path": self.db_path, "error": str(e)},
+            )
+            return False
+
+    async def _discard(self, entry: _PooledConnection) -> None:
+        try:
+            await entry.conn.close()
+        except Exception as e:
+            logger.debug("Error closing discarded pooled connection: %s", e)
+
+    async def _release(self, entry: _PooledConnection) -> bool:
+        """
+        Return a connection to a clean state after a lease.
+
+        Returns:
+            True if the connection can be reused, False if it must be discarded
+        """
+        entry.last_used = time.monotonic()
+        try:
+            if entry.conn.in_transaction:
+                # Uncommitted work is discarded, matching the old behaviour
+                # of closing a per-call connection without committing.
+                await entry.conn.rollback()
+            entry.conn.row_factory = aiosqlite.Row
+            return True
+        except Exception as e:
+            logger.warning(
+                "Pooled SQLite connection unusable after lease; discarding",
+                extra={"db_path": self.db_path, "error": str(e)},
+            )
+            return False
+
+    @asynccontextmanager
+    async def _transient(
+        self, *, read_only: bool
+    ) -> AsyncIterator[aiosqlite.Connection]:
+        """One-off connection used when the pooled writer cannot be leased."""
+        self._stats.transient_connections += 1
+        conn = await open_connection(self.db_path, read_only=read_only)
+        try:
+            yield conn
+        finally:
+            await conn.close()
+
+    @asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Lease a read-only connection.
+
+        Writes on the yielded connection fail with ``sqlite3.OperationalError``.
+        """
+        if self._closed:
+            raise RuntimeError("SQLitePool is closed")
+        self._bind_loop()
+        assert self._reader_slots is not None
+        async with self._reader_slots:
+            entry: _PooledConnection | None = None
+            while self._idle_readers and entry is None:
+                candidate = self._idle_readers.pop()
+                if await self._is_healthy(candidate):
+                    entry = candidate
+                else:
+                    self._readers_open -= 1
+                    self._stats.connections_replaced += 1
+                    await self._discard(candidate)
+            if entry is None:
+                entry = await self._open(read_only=True)
+                self._readers_open += 1
+
+            self._stats.reader_leases += 1
+            self._leased.add(entry)
+            try:
+                yield entry.conn
+            finally:
+                if not self._closed and await self._release(entry):
+                    self._idle_readers.append(entry)
+                else:
+                    self._readers_open -= 1
+                    await self._discard(entry)
+                self._end_lease(entry)
+
+    @asynccontextmanager
+    async def writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Lease the serialized writer connection.
+
+        Falls back to a transient connection when the current task already
+        holds the writer or the writer stays busy past ``writer_wait_seconds``.
+        """
+        if self._closed:
+            raise RuntimeError("SQLitePool is closed")
+        self._bind_loop()
+        assert self._writer_lock is not None
+        lock = self._writer_lock
+        task = asyncio.current_task()
+
+        if task is not None and self._writer_owner is task:
+            async with self._transient(read_only=False) as conn:
+                yield conn
+            return
+
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(lock.acquire(), timeout=self._writer_wait_seconds)
+            acquired = True
+        except TimeoutError:
+            acquired = False
+        self._stats.writer_wait_seconds_total += time.monotonic() - started
+
+        if not acquired:
+            logger.debug(
+                "Pooled writer busy; using transient connection",
+                extra={"db_path": self.db_path},
+            )
+            async with self._transient(read_only=False) as conn:
+                yield conn
+            return
+
+        self._writer_owner = task
+        try:
+            entry = self._writer
+            if entry is not None and not await self._is_healthy(entry):
+                self._writer = None
+                self._stats.connections_replaced += 1
+                await self._discard(entry)
+                entry = None
+            if entry is None:
+                entry = await self._open(read_only=False)
+                self._writer = entry
+
+            self._stats.writer_leases += 1
+            self._leased.add(entry)
+            try:
+                yield entry.conn
+            finally:
+                if self._closed or not await self._release(entry):
+                    self._writer = None
+                    await self._discard(entry)
+                self._end_lease(entry)
+        finally:
+            self._writer_owner = None
+            lock.release()
+
+    def _end_lease(self, entry: _PooledConnection) -> None:
+        self._leased.discard(entry)
+        if not self._leased and self._drained is not None:
+            self._drained.set()
+
+    async def close(self, timeout: float | None = None) -> None:
+        """
+        Refuse further leases, wait for active ones, then close every connection.
+
+        Leased connections are closed by their lease as it ends, so in-flight
+        queries and commits finish first. Leases still held after *timeout*
+        seconds (``close_timeout`` by default) are closed from under their
+        holders. Transient connections belong to their callers and are not
+        tracked.
+        """
+        self._closed = True
+        idle, self._idle_readers = self._idle_readers, []
+        for entry in idle:
+            self._readers_open -= 1
+            await self._discard(entry)
+        writer = self._writer
+        if writer is not None and writer not in self._leased:
+            self._writer = None
+            await self._discard(writer)
+
+        if self._leased:
+            self._drained = asyncio.Event()
+            wait = self._close_timeout if timeout is None else timeout
+            try:
+                await asyncio.wait_for(self._drained.wait(), timeout=wait)
+            except TimeoutError:
+                stuck = list(self._leased)
+                logger.warning(
+                    "Closing %d SQLite connection(s) still leased after %.1fs",
+                    len(stuck),
+                    wait,
+                    extra={"db_path": self.db_path},
+                )
+                for entry in stuck:
+                    await self._discard(entry)
+        logger.debug("SQLite pool closed", extra={"db_path": self.db_path})
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of pool counters for health reporting."""
+        idle = len(self._idle_readers)
+        self._stats.readers_open = self._readers_open
+        self._stats.readers_idle = idle
+        self._stats.readers_in_use = self._readers_open - idle
+        self._stats.writer_open = self._writer is not None
+        self._stats.writer_in_use = self._writer_owner is not None
+        snapshot = asdict(self._stats)
+        snapshot["writer_wait_seconds_total"] = round(
+            self._stats.writer_wait_seconds_total, 4
+        )
+        return {
+            "db_path": self.db_path,
+            "max_readers": self._max_readers,
+            "closed": self._closed,
+            **snapshot,
+        }
@@ -4,6 +4,9 @@ Base Repository Pattern for Database Access.
 Provides a unified interface for database operations, eliminating
 repetitive connection/cursor patterns throughout the codebase.
 
+Read helpers (fetch_one, fetch_all, fetch_value, exists) lease pooled
+read-only connections; writes and transactions use the pooled writer.
+
 Usage:
     class UserRepository(BaseRepository):
         async def get_user(self, user_id: int) -> dict | None:
@@ -96,7 +99,7 @@ class BaseRepository:
         Returns:
             Single row or None if not found
         """
-        async with Database.get_connection() as db:
+        async with Database.get_read_connection() as db:
             cursor = await db.execute(query, params)
             return await cursor.fetchone()
 
@@ -115,7 +118,7 @@ class BaseRepository:
         Returns:
             List of rows (empty list if none found)
         """
-        async with Database.get_connection() as db:
+        async with Database.get_read_connection() as db:
             cursor = await db.execute(query, params)
             return list(await cursor.fetchall())
 
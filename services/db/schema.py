@@ -5,6 +5,8 @@ Schema definitions for the Discord bot's database. This module centralizes
 all table creation logic to ensure consistency and avoid duplication.
 """
 
+import sqlite3
+
 import aiosqlite
 
 from utils.logging import get_logger
@@ -147,6 +149,336 @@ async def ensure_ticket_schema_compatibility(db: aiosqlite.Connection) -> None:
     await _ensure_ticket_channel_config_columns(db)
 
 
+# Org SIDs are stored upper-cased, without REDACTED placeholders, so lookups
+# match derive_membership_status (case-insensitive, REDACTED ignored).
+_ORG_MEMBERSHIP_SELECT = """
+    SELECT {row}.user_id, upper(value), '{kind}'
+    FROM {source}json_each(
+        CASE WHEN json_valid({row}.{column}) AND json_type({row}.{column}) = 'array'
+        THEN {row}.{column} END
+    )
+    WHERE type = 'text' AND value != '' AND value != 'REDACTED'
+"""
+
+
+def _org_membership_insert(row: str, source: str = "") -> str:
+    """INSERT statement materialising *row*'s main and affiliate org SIDs.
+
+    *source* is joined ahead of ``json_each`` (e.g. ``"verification, "``)
+    when *row* names a table rather than a trigger's ``NEW`` row.
+    """
+    main = _ORG_MEMBERSHIP_SELECT.format(
+        row=row, source=source, kind="main", column="main_orgs"
+    )
+    affiliate = _ORG_MEMBERSHIP_SELECT.format(
+        row=row, source=source, kind="affiliate", column="affiliate_orgs"
+    )
+    return (
+        "INSERT OR IGNORE INTO verification_org_membership (user_id, org_sid, kind) "
+        f"{main} UNION ALL {affiliate}"
+    )
+
+
+async def _ensure_verification_org_membership(db: aiosqlite.Connection) -> None:
+    """Create the normalized org-membership index and keep it in sync.
+
+    ``verification_org_membership`` holds one row per (user, org SID, kind)
+    so status breakdowns and filters are indexed lookups instead of JSON
+    parsing.  Triggers maintain it on every write to ``verification``; a
+    one-time backfill (migration version 2) covers pre-existing rows.
+    """
+    await db.execute(
+        """
+        CREATE TABLE IF NOT EXISTS verification_org_membership (
+            user_id INTEGER NOT NULL,
+            org_sid TEXT NOT NULL,
+            kind TEXT NOT NULL CHECK (kind IN ('main', 'affiliate')),
+            PRIMARY KEY (user_id, kind, org_sid)
+        ) WITHOUT ROWID
+        """
+    )
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_verification_org_membership_org "
+        "ON verification_org_membership(org_sid, kind, user_id)"
+    )
+
+    # The insert trigger clears first so INSERT OR REPLACE (which skips
+    # delete triggers) cannot leave stale rows behind.
+    await db.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_verification_orgs_insert
+        AFTER INSERT ON verification
+        BEGIN
+            DELETE FROM verification_org_membership WHERE user_id = NEW.user_id;
+            {_org_membership_insert("NEW")};
+        END
+        """
+    )
+    await db.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_verification_orgs_update
+        AFTER UPDATE OF user_id, main_orgs, affiliate_orgs ON verification
+        BEGIN
+            DELETE FROM verification_org_membership
+            WHERE user_id IN (OLD.user_id, NEW.user_id);
+            {_org_membership_insert("NEW")};
+        END
+        """
+    )
+    await db.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_verification_orgs_delete
+        AFTER DELETE ON verification
+        BEGIN
+            DELETE FROM verification_org_membership WHERE user_id = OLD.user_id;
+        END
+        """
+    )
+
+    cursor = await db.execute("SELECT 1 FROM schema_migrations WHERE version = 2")
+    if await cursor.fetchone():
+        return
+
+    await db.execute("DELETE FROM verification_org_membership")
+    await db.execute(_org_membership_insert("verification", "verification, "))
+    await db.execute(
+        "INSERT OR IGNORE INTO schema_migrations (version, applied_at) "
+        "VALUES (2, strftime('%s','now'))"
+    )
+    logger.info("Backfilled verification org membership index")
+
+
+VERIFICATION_SEARCH_TABLE = "verification_search"
+"""FTS5 trigram index over verification handles and monikers (optional)."""
+
+
+async def _ensure_verification_search_index(db: aiosqlite.Connection) -> None:
+    """Create the trigram full-text index used for substring search.
+
+    The index keeps its own copy of ``rsi_handle`` / ``community_moniker``
+    keyed by ``user_id`` (rowid), so triggers can clear a row by id even
+    when ``INSERT OR REPLACE`` skips delete triggers.  SQLite builds without
+    FTS5 or the trigram tokenizer (< 3.34) skip the index; search then
+    falls back to ``LIKE``.  Migration version 3 records the backfill.
+    """
+    try:
+        await db.execute(
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {VERIFICATION_SEARCH_TABLE}
+            USING fts5(rsi_handle, community_moniker, tokenize='trigram')
+            """
+        )
+    except sqlite3.OperationalError as e:
+        logger.warning(
+            "FTS5 trigram search index unavailable; verification search "
+            "will use LIKE scans",
+            extra={"error": str(e)},
+        )
+        return
+
+    index_new_row = (
+        f"INSERT INTO {VERIFICATION_SEARCH_TABLE}"
+        "(rowid, rsi_handle, community_moniker) "
+        "VALUES (NEW.user_id, NEW.rsi_handle, NEW.community_moniker)"
+    )
+    await db.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_verification_search_insert
+        AFTER INSERT ON verification
+        BEGIN
+            DELETE FROM {VERIFICATION_SEARCH_TABLE} WHERE rowid = NEW.user_id;
+            {index_new_row};
+        END
+        """
+    )
+    await db.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_verification_search_update
+        AFTER UPDATE OF user_id, rsi_handle, community_moniker ON verification
+        BEGIN
+            DELETE FROM {VERIFICATION_SEARCH_TABLE}
+            WHERE rowid IN (OLD.user_id, NEW.user_id);
+            {index_new_row};
+        END
+        """
+    )
+    await db.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_verification_search_delete
+        AFTER DELETE ON verification
+        BEGIN
+            DELETE FROM {VERIFICATION_SEARCH_TABLE} WHERE rowid = OLD.user_id;
+        END
+        """
+    )
+
+    cursor = await db.execute("SELECT 1 FROM schema_migrations WHERE version = 3")
+    if await cursor.fetchone():
+        return
+
+    await db.execute(f"DELETE FROM {VERIFICATION_SEARCH_TABLE}")
+    await db.execute(
+        f"INSERT INTO {VERIFICATION_SEARCH_TABLE}"
+        "(rowid, rsi_handle, community_moniker) "
+        "SELECT user_id, rsi_handle, community_moniker FROM verification"
+    )
+    await db.execute(
+        "INSERT OR IGNORE INTO schema_migrations (version, applied_at) "
+        "VALUES (3, strftime('%s','now'))"
+    )
+    logger.info("Backfilled verification search index")
+
+
+async def _ensure_auto_recheck_queue(db: aiosqlite.Connection) -> None:
+    """Keep one ``auto_recheck_state`` row per verified user, indexed by due time.
+
+    ``needs_reverify`` is mirrored from ``verification`` so the partial index
+    ``idx_auto_recheck_due`` only holds schedulable users and the due query
+    is a covering range scan over it. The flag column is carried in the
+    index, so the partial-index predicate needs no table lookup. Triggers on
+    both tables keep the mirror in step; a one-time backfill (migration
+    version 4) seeds missing rows.
+    """
+    cursor = await db.execute("PRAGMA table_info(auto_recheck_state)")
+    existing_columns = {str(row[1]) for row in await cursor.fetchall()}
+    if "needs_reverify" not in existing_columns:
+        await db.execute(
+            "ALTER TABLE auto_recheck_state "
+            "ADD COLUMN needs_reverify INTEGER NOT NULL DEFAULT 0"
+        )
+        logger.info(
+            "Added missing column to table",
+            extra={"table": "auto_recheck_state", "column": "needs_reverify"},
+        )
+
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_auto_recheck_due "
+        "ON auto_recheck_state(next_retry_at, last_auto_recheck, needs_reverify) "
+        "WHERE needs_reverify = 0"
+    )
+
+    schedule_new_row = """
+        INSERT INTO auto_recheck_state(user_id, needs_reverify)
+        VALUES (NEW.user_id, COALESCE(NEW.needs_reverify, 0))
+        ON CONFLICT(user_id) DO UPDATE SET needs_reverify = excluded.needs_reverify
+    """
+    await db.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_verification_recheck_insert
+        AFTER INSERT ON verification
+        BEGIN
+            {schedule_new_row};
+        END
+        """
+    )
+    # Clearing the flag re-creates a due row if unschedule_auto_recheck
+    # removed it while the user was flagged.
+    await db.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_verification_recheck_flag
+        AFTER UPDATE OF needs_reverify ON verification
+        BEGIN
+            {schedule_new_row};
+        END
+        """
+    )
+    await db.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_auto_recheck_state_insert
+        AFTER INSERT ON auto_recheck_state
+        BEGIN
+            UPDATE auto_recheck_state
+            SET needs_reverify = COALESCE(
+                (SELECT needs_reverify FROM verification WHERE user_id = NEW.user_id),
+                0
+            )
+            WHERE user_id = NEW.user_id;
+        END
+        """
+    )
+
+    cursor = await db.execute("SELECT 1 FROM schema_migrations WHERE version = 4")
+    if await cursor.fetchone():
+        return
+
+    await db.execute(
+        "INSERT OR IGNORE INTO auto_recheck_state(user_id) "
+        "SELECT user_id FROM verification"
+    )
+    await db.execute(
+        """
+        UPDATE auto_recheck_state
+        SET next_retry_at = COALESCE(next_retry_at, 0),
+            last_auto_recheck = COALESCE(last_auto_recheck, 0),
+            needs_reverify = COALESCE(
+                (
+                    SELECT v.needs_reverify FROM verification v
+                    WHERE v.user_id = auto_recheck_state.user_id
+                ),
+                0
+            )
+        """
+    )
+    await db.execute(
+        "INSERT OR IGNORE INTO schema_migrations (version, applied_at) "
+        "VALUES (4, strftime('%s','now'))"
+    )
+    logger.info("Backfilled auto-recheck due queue")
+
+
+async def _ensure_verification_keyset(db: aiosqlite.Connection) -> None:
+    """Index the listing sort key and keep ``last_updated`` non-NULL.
+
+    Web listings page by the row value ``(last_updated, user_id)``; a NULL
+    ``last_updated`` would compare as unknown and drop the row from every
+    page after the first.  The column keeps its ``DEFAULT 0`` and triggers
+    map explicit NULL writes to 0 (rebuilding the table for a ``NOT NULL``
+    constraint would also drop its other triggers); migration version 5
+    rewrites existing NULLs.  The composite index serves both sort terms,
+    so a page is a range scan with no sort step.
+    """
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_verification_keyset "
+        "ON verification(last_updated DESC, user_id DESC)"
+    )
+    # Superseded by idx_verification_keyset
+    await db.execute("DROP INDEX IF EXISTS idx_verification_last_updated")
+
+    await db.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_verification_last_updated_insert
+        AFTER INSERT ON verification
+        WHEN NEW.last_updated IS NULL
+        BEGIN
+            UPDATE verification SET last_updated = 0 WHERE user_id = NEW.user_id;
+        END
+        """
+    )
+    await db.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_verification_last_updated_update
+        AFTER UPDATE OF last_updated ON verification
+        WHEN NEW.last_updated IS NULL
+        BEGIN
+            UPDATE verification SET last_updated = 0 WHERE user_id = NEW.user_id;
+        END
+        """
+    )
+
+    cursor = await db.execute("SELECT 1 FROM schema_migrations WHERE version = 5")
+    if await cursor.fetchone():
+        return
+
+    await db.execute(
+        "UPDATE verification SET last_updated = 0 WHERE last_updated IS NULL"
+    )
+    await db.execute(
+        "INSERT OR IGNORE INTO schema_migrations (version, applied_at) "
+        "VALUES (5, strftime('%s','now'))"
+    )
+    logger.info("Normalised NULL verification last_updated values")
+
+
 async def init_schema(db: aiosqlite.Connection) -> None:
     """
     Initialize the database schema with all required tables.
@@ -198,12 +530,22 @@ async def init_schema(db: aiosqlite.Connection) -> None:
     await db.execute(
         "CREATE INDEX IF NOT EXISTS idx_verification_rsi_handle ON verification(rsi_handle)"
     )
+    # Case-insensitive handle conflict checks (check_rsi_handle_conflict)
     await db.execute(
-        "CREATE INDEX IF NOT EXISTS idx_verification_moniker ON verification(community_moniker)"
+        "CREATE INDEX IF NOT EXISTS idx_verification_rsi_handle_lower "
+        "ON verification(LOWER(rsi_handle))"
     )
     await db.execute(
-        "CREATE INDEX IF NOT EXISTS idx_verification_last_updated ON verification(last_updated DESC)"
+        "CREATE INDEX IF NOT EXISTS idx_verification_moniker ON verification(community_moniker)"
     )
+    # Keyset listings order by (last_updated DESC, user_id DESC)
+    await _ensure_verification_keyset(db)
+
+    # Normalized per-org membership, trigger-maintained from verification
+    await _ensure_verification_org_membership(db)
+
+    # Trigram full-text index for handle/moniker substring search
+    await _ensure_verification_search_index(db)
 
     # User guild membership tracking - tracks which guilds each verified user is active in
     await db.execute(
@@ -434,10 +776,12 @@ async def init_schema(db: aiosqlite.Connection) -> None:
             last_auto_recheck INTEGER DEFAULT 0,
             next_retry_at INTEGER DEFAULT 0,
             fail_count INTEGER DEFAULT 0,
-            last_error TEXT
+            last_error TEXT,
+            needs_reverify INTEGER NOT NULL DEFAULT 0
         )
         """
     )
+    await _ensure_auto_recheck_queue(db)
 
     # User JTC preferences (for deterministic inactive channel selection)
     await db.execute(
@@ -504,6 +848,10 @@ async def init_schema(db: aiosqlite.Connection) -> None:
     await db.execute(
         "CREATE INDEX IF NOT EXISTS idx_admin_action_log_admin ON admin_action_log(admin_user_id)"
     )
+    # Keyset pagination: per-guild listing newest first (id is the implicit rowid)
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_admin_action_log_guild_timestamp ON admin_action_log(guild_id, timestamp)"
+    )
     # Composite index for common query pattern: pending announcements by guild
     await db.execute(
         "CREATE INDEX IF NOT EXISTS idx_announcement_events_pending ON announcement_events(guild_id, announced_at) WHERE announced_at IS NULL"
@@ -647,6 +995,13 @@ async def init_schema(db: aiosqlite.Connection) -> None:
     await db.execute(
         "CREATE INDEX IF NOT EXISTS idx_tickets_guild_user_status ON tickets(guild_id, user_id, status)"
     )
+    # Keyset pagination of ticket listings on (created_at, id), newest first
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_tickets_guild_created ON tickets(guild_id, created_at)"
+    )
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_tickets_guild_status_created ON tickets(guild_id, status, created_at)"
+    )
     await db.execute(
         "CREATE INDEX IF NOT EXISTS idx_tickets_thread ON tickets(thread_id)"
     )
@@ -55,6 +55,8 @@ async def apply_state_to_guild(
     global_state: GlobalVerificationState,
     guild: discord.Guild,
     bot,
+    *,
+    track_membership: bool = True,
 ) -> GuildSyncResult | None:
     """Apply a global verification state to a specific guild."""
     member = guild.get_member(global_state.user_id)
@@ -83,6 +85,7 @@ async def apply_state_to_guild(
         community_moniker=global_state.community_moniker,
         main_orgs=global_state.main_orgs,
         affiliate_orgs=global_state.affiliate_orgs,
+        track_membership=track_membership,
     )
 
     # Flush queued Discord tasks for timely state
@@ -110,8 +113,14 @@ async def sync_user_to_all_guilds(
     *,
     batch_size: int = 5,
     max_concurrency: int = 3,
+    track_membership: bool = True,
 ) -> list[GuildSyncResult]:
-    """Sync a user to all guilds with bounded parallelism."""
+    """
+    Sync a user to all guilds with bounded parallelism.
+
+    With ``track_membership=False`` the caller records membership for the
+    returned results itself (see ``store_global_states``).
+    """
     guild_ids = await Database.get_user_active_guilds(global_state.user_id)
     if not guild_ids:
         # Fallback to bot guilds if membership table missing
@@ -125,7 +134,9 @@ async def sync_user_to_all_guilds(
         if not guild:
             return None
         async with semaphore:
-            res = await apply_state_to_guild(global_state, guild, bot)
+            res = await apply_state_to_guild(
+                global_state, guild, bot, track_membership=track_membership
+            )
             return res
 
     # Process in batches to avoid thundering herd
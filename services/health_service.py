@@ -14,7 +14,10 @@ try:
 except Exception:  # ModuleNotFoundError, ImportError, etc.
     psutil = None  # type: ignore
 
+from helpers.role_helper import get_role_edit_stats
+from services.db.database import Database
 from services.db.repository import BaseRepository
+from services.verification_state import get_cache_stats
 
 from .base import BaseService
 
@@ -52,6 +55,8 @@ class HealthService(BaseService):
                 "auto_check_runs": 0,
                 "auto_check_users_processed": 0,
                 "auto_check_circuit_pauses": 0,
+                "auto_check_users_per_minute": 0.0,
+                "auto_check_backlog": 0,
             }
 
     async def record_metric(self, metric_name: str, increment: int = 1) -> None:
@@ -66,6 +71,17 @@ class HealthService(BaseService):
             current = self._metrics.get(metric_name, 0)
             self._metrics[metric_name] = current + increment
 
+    async def set_metric(self, metric_name: str, value: float) -> None:
+        """
+        Set a gauge metric to its latest value.
+
+        Args:
+            metric_name: Name of the metric to set
+            value: Current value (replaces the previous one)
+        """
+        async with self._metrics_lock:
+            self._metrics[metric_name] = value
+
     async def get_system_info(self) -> dict[str, Any]:
         """
         Get system information.
@@ -112,6 +128,7 @@ class HealthService(BaseService):
             "latency_ms": round(bot.latency * 1000, 2),
             "is_ready": bot.is_ready(),
             "is_closed": bot.is_closed(),
+            "role_edits": get_role_edit_stats(),
         }
 
     async def get_database_info(self) -> dict[str, Any]:
@@ -154,6 +171,7 @@ class HealthService(BaseService):
                 return {
                     "connected": True,
                     "tables": tables_info,
+                    "pool": Database.pool_stats(),
                 }
         except Exception as e:
             return {
@@ -182,6 +200,7 @@ class HealthService(BaseService):
             "system": await self.get_system_info(),
             "discord": await self.get_discord_info(bot),
             "database": await self.get_database_info(),
+            "caches": {"verification_state": get_cache_stats()},
             "services": {},
         }
 
@@ -16,6 +16,11 @@ from aiohttp import web
 from helpers.announcement import send_admin_bulk_check_summary
 from helpers.bulk_check import StatusRow, build_summary_embed
 from helpers.leadership_log import InitiatorKind, InitiatorSource
+from helpers.member_ids import (
+    MEMBER_IDS_CONTENT_TYPE,
+    member_ids_etag,
+    pack_member_ids,
+)
 from services.db.repository import BaseRepository
 from utils.logging import get_logger
 
@@ -75,11 +80,17 @@ class InternalAPIServer:
             "/guilds/{guild_id}/voice/occupied",
             self.get_guild_occupied_voice_channels,
         )
+        self.app.router.add_post(
+            "/voice/ownership/reload", self.reload_voice_ownership
+        )
         self.app.router.add_get("/guilds", self.get_guilds)
         self.app.router.add_get("/guilds/{guild_id}/roles", self.get_guild_roles)
         self.app.router.add_get("/guilds/{guild_id}/channels", self.get_guild_channels)
         self.app.router.add_get("/guilds/{guild_id}/stats", self.get_guild_stats)
         self.app.router.add_get("/guilds/{guild_id}/members", self.get_guild_members)
+        self.app.router.add_get(
+            "/guilds/{guild_id}/member-ids", self.get_guild_member_ids
+        )
         self.app.router.add_get(
             "/guilds/{guild_id}/members/{user_id}", self.get_guild_member
         )
@@ -304,7 +315,13 @@ class InternalAPIServer:
             return web.json_response({"error": "Internal server error"}, status=500)
 
     async def refresh_guild_config(self, request: web.Request) -> web.Response:
-        """Invalidate guild configuration caches and refresh role mappings."""
+        """
+        Invalidate guild configuration caches and refresh role mappings.
+
+        The optional JSON body carries ``source``, the ``version`` marker written
+        with the change and the ``keys`` it touched, so the bot can skip
+        duplicate notifications and reload only what changed.
+        """
         if not self._check_auth(request):
             return web.json_response({"error": "Unauthorized"}, status=401)
 
@@ -314,23 +331,47 @@ class InternalAPIServer:
             return web.json_response({"error": "Invalid guild id"}, status=400)
 
         source = None
+        version: str | None = None
+        keys: list[str] | None = None
         try:
             payload = await request.json()
             if isinstance(payload, dict):
                 source = payload.get("source")
+                if isinstance(payload.get("version"), str):
+                    version = payload["version"]
+                raw_keys = payload.get("keys")
+                if isinstance(raw_keys, list) and all(
+                    isinstance(key, str) for key in raw_keys
+                ):
+                    keys = raw_keys
         except Exception:
             logger.debug("No JSON body or invalid JSON in refresh request")
 
         cache_refreshed = False
         roles_refreshed = False
+        roles_affected = keys is None or any(key.startswith("roles.") for key in keys)
 
         try:
             config_service = getattr(self.services, "config", None)
             if config_service:
-                await config_service.maybe_refresh_guild(guild_id, force=True)
-                cache_refreshed = True
-
-            if self.bot and hasattr(self.bot, "refresh_guild_roles"):
+                was_cached = config_service.is_guild_cached(guild_id)
+                cache_refreshed = await config_service.apply_invalidation(
+                    guild_id, version=version, keys=keys
+                )
+                # A cached guild that was not refreshed already has this version
+                roles_affected = roles_affected and (cache_refreshed or not was_cached)
+
+            metrics_service = getattr(self.services, "metrics", None)
+            if metrics_service and (
+                keys is None or any(key.startswith("metrics.") for key in keys)
+            ):
+                await metrics_service.invalidate_guild_settings(guild_id)
+
+            if (
+                roles_affected
+                and self.bot
+                and hasattr(self.bot, "refresh_guild_roles")
+            ):
                 await self.bot.refresh_guild_roles(guild_id, source or "config_refresh")  # type: ignore[attr-defined]
                 roles_refreshed = True
 
@@ -599,6 +640,25 @@ class InternalAPIServer:
             )
             return web.json_response({"error": "Internal server error"}, status=500)
 
+    async def reload_voice_ownership(self, request: web.Request) -> web.Response:
+        """
+        Reload the voice ownership index after an out-of-process write.
+
+        Path: POST /voice/ownership/reload
+        Headers: Authorization: Bearer <api_key>
+
+        Returns: {"status": "ok", "channels": int}
+        """
+        if not self._check_auth(request):
+            return web.json_response({"error": "Unauthorized"}, status=401)
+
+        try:
+            channels = await self.services.voice.reload_ownership_index()
+            return web.json_response({"status": "ok", "channels": channels})
+        except Exception as e:
+            logger.exception("Error reloading voice ownership index", exc_info=e)
+            return web.json_response({"error": "Internal server error"}, status=500)
+
     async def get_guild_occupied_voice_channels(
         self, request: web.Request
     ) -> web.Response:
@@ -945,6 +1005,42 @@ class InternalAPIServer:
             }
         )
 
+    async def get_guild_member_ids(self, request: web.Request) -> web.Response:
+        """
+        Get every member ID of a guild in one compact response.
+
+        Path: GET /guilds/{guild_id}/member-ids
+        Headers: Authorization: Bearer <api_key>, optional If-None-Match
+
+        Returns: sorted little-endian uint64 IDs (``helpers.member_ids``) with
+        an ``ETag`` header, or 304 when the member set matches If-None-Match.
+        """
+        if not self._check_auth(request):
+            return web.json_response({"error": "Unauthorized"}, status=401)
+
+        if not self.bot:
+            return web.json_response({"error": "Bot unavailable"}, status=503)
+
+        try:
+            guild_id = int(request.match_info["guild_id"])
+        except (KeyError, ValueError):
+            return web.json_response({"error": "Invalid guild ID"}, status=400)
+
+        guild = self.bot.get_guild(guild_id)
+        if guild is None:
+            return web.json_response({"error": "Guild not found"}, status=404)
+
+        payload = pack_member_ids(member.id for member in guild.members)
+        etag = member_ids_etag(payload)
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+
+        return web.Response(
+            body=payload,
+            content_type=MEMBER_IDS_CONTENT_TYPE,
+            headers={"ETag": etag},
+        )
+
     async def get_guild_members(self, request: web.Request) -> web.Response:
         """
         Get paginated list of guild members with enriched Discord data.
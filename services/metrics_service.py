@@ -20,11 +20,25 @@ from services.base import BaseService
 from services.db.metrics_db import MetricsDatabase
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import aiosqlite
     from discord.ext.commands import Bot
 
     from services.config_service import ConfigService
 
 
+# Longest duration among session rows above a given id (sessions are insert-only)
+_SESSION_SPAN_SQL: dict[str, str] = {
+    "voice_sessions": (
+        "SELECT MAX(left_at - joined_at), MAX(id) FROM voice_sessions WHERE id > ?"
+    ),
+    "game_sessions": (
+        "SELECT MAX(ended_at - started_at), MAX(id) FROM game_sessions WHERE id > ?"
+    ),
+}
+
+
 # ---------------------------------------------------------------------------
 # Data classes for in-memory session tracking
 # ---------------------------------------------------------------------------
@@ -72,7 +86,10 @@ class MetricsService(BaseService):
     Architecture:
         - Events call record_*() methods which update in-memory state
         - A periodic flush task writes buffered message counts to the DB
-        - A periodic rollup task pre-aggregates hourly data
+        - Completed voice/game sessions are queued and written in batches
+          (size- or time-triggered) by a session writer task
+        - A periodic rollup task pre-aggregates hourly data, catching up from
+          a persisted high-water mark so missed hours are backfilled
         - A periodic purge task removes data older than retention_days
 
     The service owns its own MetricsDatabase connection (separate SQLite file).
@@ -93,7 +110,11 @@ class MetricsService(BaseService):
         # Configuration (populated in _initialize_impl)
         self._retention_days: int = 90
         self._rollup_interval: int = 3600  # seconds
+        self._rollup_batch_hours: int = 24
         self._flush_interval: int = 30  # seconds
+        self._session_flush_interval: float = 5.0  # seconds
+        self._session_batch_size: int = 200
+        self._session_queue_limit: int = 50_000
         self._enabled: bool = True
         self._db_path: str = "metrics.db"
 
@@ -105,21 +126,38 @@ class MetricsService(BaseService):
         # Buffered message counts: (guild_id, user_id, message_bucket) -> count
         self._message_buffer: defaultdict[tuple[int, int, int], int] = defaultdict(int)
         self._message_buffer_lock = asyncio.Lock()
+        # Completed sessions awaiting a batched INSERT (row tuples)
+        self._pending_voice_rows: list[tuple[int, int, int, int, int, int]] = []
+        self._pending_game_rows: list[tuple[int, int, str, int, int, int]] = []
+        self._session_flush_lock = asyncio.Lock()
+        self._session_flush_wakeup = asyncio.Event()
+        # Longest stored session per table, and the highest row id it covers
+        self._session_spans: dict[str, tuple[int, int]] = {}
 
         # Background task handles
         self._flush_task: asyncio.Task | None = None
+        self._session_flush_task: asyncio.Task | None = None
         self._rollup_task: asyncio.Task | None = None
         self._purge_task: asyncio.Task | None = None
 
         # Stats for health_check
         self._last_flush_at: float = 0
         self._last_rollup_at: float = 0
+        self._rollup_next_hour: int | None = None
+        self._rollup_hours_processed: int = 0
         self._total_messages_buffered: int = 0
-
-        # Guild-level metrics channel exclusions cache
-        self._excluded_channels_cache: dict[int, tuple[float, set[int]]] = {}
+        self._session_flush_count: int = 0
+        self._session_rows_flushed: int = 0
+        self._session_flush_failures: int = 0
+        self._session_rows_dropped: int = 0
+        self._last_session_flush_latency_ms: float = 0.0
+
+        # Guild-level metrics channel exclusions cache. Sets are frozen so the
+        # synchronous message path can hand them out without copying.
+        self._excluded_channels_cache: dict[int, tuple[float, frozenset[int]]] = {}
         self._excluded_channels_ttl_seconds: int = 30
         self._excluded_channels_lock = asyncio.Lock()
+        self._excluded_channels_refreshes: dict[int, asyncio.Task] = {}
 
         # Guild-level tracked games config cache
         self._tracked_games_cache: dict[int, tuple[float, str, set[str]]] = {}
@@ -155,7 +193,16 @@ class MetricsService(BaseService):
 
         self._retention_days = metrics_cfg.get("retention_days", 90)
         self._rollup_interval = metrics_cfg.get("rollup_interval_minutes", 60) * 60
+        self._rollup_batch_hours = max(1, int(metrics_cfg.get("rollup_batch_hours", 24)))
         self._flush_interval = metrics_cfg.get("buffer_flush_seconds", 30)
+        self._session_flush_interval = float(
+            metrics_cfg.get("session_flush_seconds", 5)
+        )
+        self._session_batch_size = max(1, int(metrics_cfg.get("session_batch_size", 200)))
+        self._session_queue_limit = max(
+            self._session_batch_size,
+            int(metrics_cfg.get("session_queue_max_rows", 50_000)),
+        )
         self._db_path = metrics_cfg.get("database_path", "metrics.db")
 
         # Resolve relative path against project root
@@ -171,6 +218,9 @@ class MetricsService(BaseService):
             self._flush_task = asyncio.create_task(
                 self._flush_loop(), name="metrics_flush"
             )
+            self._session_flush_task = asyncio.create_task(
+                self._session_flush_loop(), name="metrics_session_flush"
+            )
             self._rollup_task = asyncio.create_task(
                 self._rollup_loop(), name="metrics_rollup"
             )
@@ -188,7 +238,12 @@ class MetricsService(BaseService):
     async def _shutdown_impl(self) -> None:
         """Flush buffers, close open sessions, cancel tasks."""
         # Cancel background tasks
-        for task in (self._flush_task, self._rollup_task, self._purge_task):
+        for task in (
+            self._flush_task,
+            self._session_flush_task,
+            self._rollup_task,
+            self._purge_task,
+        ):
             if task and not task.done():
                 task.cancel()
                 try:
@@ -196,6 +251,10 @@ class MetricsService(BaseService):
                 except asyncio.CancelledError:
                     continue
 
+        for task in list(self._excluded_channels_refreshes.values()):
+            task.cancel()
+        self._excluded_channels_refreshes.clear()
+
         if not self._enabled:
             return
 
@@ -213,6 +272,10 @@ class MetricsService(BaseService):
             session = self._game_sessions.pop(key)
             await self._write_game_session_end(session, now)
 
+        # Drain queued session rows, then release pooled connections
+        await self._flush_session_rows()
+        await MetricsDatabase.close()
+
         self.logger.info("MetricsService shut down — all sessions closed")
 
     # ------------------------------------------------------------------
@@ -221,7 +284,7 @@ class MetricsService(BaseService):
 
     async def get_excluded_channel_ids(
         self, guild_id: int, *, force_refresh: bool = False
-    ) -> set[int]:
+    ) -> frozenset[int]:
         """Return excluded channel IDs for metrics collection in this guild."""
         async with self._excluded_channels_lock:
             now = time.monotonic()
@@ -231,7 +294,7 @@ class MetricsService(BaseService):
                 and cached is not None
                 and (now - cached[0]) < self._excluded_channels_ttl_seconds
             ):
-                return set(cached[1])
+                return cached[1]
 
             raw_value = await self._config_service.get_guild_setting(
                 guild_id,
@@ -239,16 +302,73 @@ class MetricsService(BaseService):
                 [],
             )
 
-            parsed: set[int] = set()
-            if isinstance(raw_value, list):
-                for item in raw_value:
-                    try:
-                        parsed.add(int(item))
-                    except (TypeError, ValueError):
-                        continue
+            parsed = _parse_channel_ids(raw_value)
+            self._excluded_channels_cache[guild_id] = (time.monotonic(), parsed)
+            return parsed
+
+    def get_excluded_channel_ids_cached(self, guild_id: int) -> frozenset[int] | None:
+        """
+        Return excluded channel IDs without awaiting (for per-event hot paths).
 
+        Serves the cached set even past its TTL and schedules a background
+        refresh instead of blocking. On a cold cache the set is built from the
+        config service's in-memory snapshot when available; otherwise None is
+        returned and the caller awaits ``get_excluded_channel_ids``, which fills
+        the cache (no background refresh is started, so it is read only once).
+        """
+        cached = self._excluded_channels_cache.get(guild_id)
+        if cached is not None:
+            if time.monotonic() - cached[0] >= self._excluded_channels_ttl_seconds:
+                self._schedule_excluded_channels_refresh(guild_id)
+            return cached[1]
+
+        raw_value = self._config_service.get_cached(
+            guild_id, "metrics.excluded_channel_ids", None
+        )
+        if isinstance(raw_value, list):
+            parsed = _parse_channel_ids(raw_value)
             self._excluded_channels_cache[guild_id] = (time.monotonic(), parsed)
-            return set(parsed)
+            return parsed
+
+        return None
+
+    def _schedule_excluded_channels_refresh(self, guild_id: int) -> None:
+        """Refresh a guild's excluded channels in the background (once at a time)."""
+        if guild_id in self._excluded_channels_refreshes:
+            return
+        try:
+            task = asyncio.get_running_loop().create_task(
+                self.get_excluded_channel_ids(guild_id, force_refresh=True),
+                name=f"metrics_excluded_refresh_{guild_id}",
+            )
+        except RuntimeError:
+            return  # No running loop (sync callers in tests); next async read refreshes
+        self._excluded_channels_refreshes[guild_id] = task
+        task.add_done_callback(
+            lambda t: self._on_excluded_channels_refreshed(guild_id, t)
+        )
+
+    def _on_excluded_channels_refreshed(self, guild_id: int, task: asyncio.Task) -> None:
+        self._excluded_channels_refreshes.pop(guild_id, None)
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.debug(
+                "Background excluded-channel refresh failed for guild %s",
+                guild_id,
+                exc_info=task.exception(),
+            )
+
+    async def invalidate_guild_settings(self, guild_id: int) -> None:
+        """
+        Drop cached per-guild metrics settings after a config change.
+
+        Excluded channels are re-read immediately so the synchronous message
+        path picks up the new set without waiting for the TTL.
+        """
+        async with self._tracked_games_lock:
+            self._tracked_games_cache.pop(guild_id, None)
+        async with self._activity_thresholds_lock:
+            self._activity_thresholds_cache.pop(guild_id, None)
+        await self.get_excluded_channel_ids(guild_id, force_refresh=True)
 
     async def get_tracked_game_config(
         self, guild_id: int, *, force_refresh: bool = False
@@ -471,7 +591,7 @@ class MetricsService(BaseService):
             )
             chat_days: dict[int, set[int]] = {}
             last_chat: dict[int, int] = {}
-            async with MetricsDatabase.get_connection() as db:
+            async with MetricsDatabase.get_read_connection() as db:
                 cursor = await db.execute(sql_msg, [*params_prefix, cutoff_ts])
                 for uid, day_bucket, day_message_count, max_ts in await cursor.fetchall():
                     if day_message_count < min_msg_windows:
@@ -490,7 +610,7 @@ class MetricsService(BaseService):
             )
             voice_day_secs: dict[tuple[int, int], int] = {}
             voice_last: dict[int, int] = {}
-            async with MetricsDatabase.get_connection() as db:
+            async with MetricsDatabase.get_read_connection() as db:
                 cursor = await db.execute(
                     sql_voice,
                     [now, *params_prefix, now, now, cutoff_ts],
@@ -566,7 +686,7 @@ class MetricsService(BaseService):
 
             game_day_secs: dict[tuple[int, int], int] = {}
             game_last: dict[int, int] = {}
-            async with MetricsDatabase.get_connection() as db:
+            async with MetricsDatabase.get_read_connection() as db:
                 cursor = await db.execute(sql_game, game_params)
                 for uid, started_at, ended_at in await cursor.fetchall():
                     clamped_start = max(started_at, cutoff_ts)
@@ -900,7 +1020,7 @@ class MetricsService(BaseService):
 
         persisted_today = 0
         try:
-            async with MetricsDatabase.get_connection() as db:
+            async with MetricsDatabase.get_read_connection() as db:
                 cursor = await db.execute(
                     "SELECT COALESCE(SUM(message_count), 0) "
                     "FROM message_counts "
@@ -950,7 +1070,7 @@ class MetricsService(BaseService):
             uid_filter = f" AND user_id IN ({placeholders})"
             uid_params = list(user_ids)
 
-        async with MetricsDatabase.get_connection() as db:
+        async with MetricsDatabase.get_read_connection() as db:
             if user_ids is not None:
                 # Filtered path: use per-user hourly rollups
                 cursor = await db.execute(
@@ -1067,7 +1187,7 @@ class MetricsService(BaseService):
             uid_filter = f" AND user_id IN ({placeholders})"
             uid_params = list(user_ids)
 
-        async with MetricsDatabase.get_connection() as db:
+        async with MetricsDatabase.get_read_connection() as db:
             cursor = await db.execute(
                 "SELECT user_id, SUM(voice_seconds) as total "
                 "FROM metrics_user_hourly "
@@ -1100,7 +1220,7 @@ class MetricsService(BaseService):
             uid_filter = f" AND user_id IN ({placeholders})"
             uid_params = list(user_ids)
 
-        async with MetricsDatabase.get_connection() as db:
+        async with MetricsDatabase.get_read_connection() as db:
             cursor = await db.execute(
                 "SELECT user_id, SUM(messages_sent) as total "
                 "FROM metrics_user_hourly "
@@ -1139,7 +1259,7 @@ class MetricsService(BaseService):
             uid_filter = f" AND user_id IN ({placeholders})"
             uid_params = list(user_ids)
 
-        async with MetricsDatabase.get_connection() as db:
+        async with MetricsDatabase.get_read_connection() as db:
             if metric == "messages":
                 if user_ids is not None:
                     cursor = await db.execute(
@@ -1268,7 +1388,7 @@ class MetricsService(BaseService):
             uid_filter = f" AND user_id IN ({placeholders})"
             uid_params = list(user_ids)
 
-        async with MetricsDatabase.get_connection() as db:
+        async with MetricsDatabase.get_read_connection() as db:
             cursor = await db.execute(
                 "SELECT game_name, SUM(duration_seconds) as total_time, "
                 "COUNT(*) as session_count, "
@@ -1320,7 +1440,7 @@ class MetricsService(BaseService):
             uid_filter = f" AND user_id IN ({placeholders})"
             uid_params = list(user_ids)
 
-        async with MetricsDatabase.get_connection() as db:
+        async with MetricsDatabase.get_read_connection() as db:
             cursor = await db.execute(
                 "SELECT COALESCE(SUM(duration_seconds), 0), "
                 "COUNT(*), "
@@ -1403,7 +1523,7 @@ class MetricsService(BaseService):
         cutoff = int(time.time()) - (days * 86400)
         cutoff_hour = _hour_bucket(cutoff)
 
-        async with MetricsDatabase.get_connection() as db:
+        async with MetricsDatabase.get_read_connection() as db:
             # Aggregate totals
             cursor = await db.execute(
                 "SELECT COALESCE(SUM(message_count), 0) "
@@ -1414,52 +1534,79 @@ class MetricsService(BaseService):
             row = await cursor.fetchone()
             total_messages = row[0] if row else 0
 
+            # Hours from the rollup watermark on are not rolled up yet
             cursor = await db.execute(
-                "SELECT COALESCE(SUM(duration_seconds), 0) "
-                "FROM voice_sessions "
-                "WHERE guild_id = ? AND user_id = ? AND left_at IS NOT NULL AND left_at >= ?",
-                (guild_id, user_id, cutoff),
+                "SELECT next_hour_bucket FROM metrics_rollup_state WHERE name = ?",
+                ("hourly",),
             )
             row = await cursor.fetchone()
-            total_voice_seconds = row[0] if row else 0
+            live_from = max(
+                cutoff_hour, row[0] if row else _hour_bucket(int(time.time()))
+            )
 
-            # Time series for this user
+            # Voice and game time come from the hour-clipped rollups
             cursor = await db.execute(
-                "SELECT hour_bucket, SUM(message_count) "
-                "FROM message_counts "
-                "WHERE guild_id = ? AND user_id = ? AND hour_bucket >= ? "
-                "GROUP BY hour_bucket "
-                "ORDER BY hour_bucket",
-                (guild_id, user_id, cutoff_hour),
+                "SELECT hour_bucket, voice_seconds, games_json "
+                "FROM metrics_user_hourly "
+                "WHERE guild_id = ? AND user_id = ? "
+                "AND hour_bucket >= ? AND hour_bucket < ?",
+                (guild_id, user_id, cutoff_hour, live_from),
             )
-            msg_by_hour: dict[int, int] = {r[0]: r[1] for r in await cursor.fetchall()}
+            voice_by_hour: dict[int, int] = {}
+            game_by_hour: dict[int, int] = {}
+            game_totals: defaultdict[str, int] = defaultdict(int)
+            for hour_bucket, voice_seconds, games_json in await cursor.fetchall():
+                if voice_seconds:
+                    voice_by_hour[hour_bucket] = voice_seconds
+                try:
+                    payload = json.loads(games_json) if games_json else {}
+                except json.JSONDecodeError:
+                    continue
+                if not isinstance(payload, dict):
+                    continue
+                for game_name, seconds in payload.items():
+                    try:
+                        duration = int(seconds)
+                    except (TypeError, ValueError):
+                        continue
+                    if duration <= 0:
+                        continue
+                    game_totals[str(game_name)] += duration
+                    game_by_hour[hour_bucket] = game_by_hour.get(hour_bucket, 0) + duration
 
+            # ...and the rest (at least the current hour) from the raw sessions
             cursor = await db.execute(
-                "SELECT (left_at - (left_at % 3600)) as hour_bucket, SUM(duration_seconds) "
-                "FROM voice_sessions "
-                "WHERE guild_id = ? AND user_id = ? AND left_at IS NOT NULL AND left_at >= ? "
-                "AND duration_seconds IS NOT NULL "
-                "GROUP BY hour_bucket "
-                "ORDER BY hour_bucket",
-                (guild_id, user_id, cutoff),
+                "SELECT joined_at, left_at FROM voice_sessions "
+                "WHERE guild_id = ? AND user_id = ? AND left_at > ?",
+                (guild_id, user_id, live_from),
             )
-            voice_by_hour: dict[int, int] = {
-                r[0]: r[1] for r in await cursor.fetchall()
-            }
+            for joined_at, left_at in await cursor.fetchall():
+                for hour, seconds in _split_by_hour(joined_at, left_at, live_from):
+                    voice_by_hour[hour] = voice_by_hour.get(hour, 0) + seconds
+            cursor = await db.execute(
+                "SELECT game_name, started_at, ended_at FROM game_sessions "
+                "WHERE guild_id = ? AND user_id = ? AND ended_at > ?",
+                (guild_id, user_id, live_from),
+            )
+            for game_name, started_at, ended_at in await cursor.fetchall():
+                for hour, seconds in _split_by_hour(started_at, ended_at, live_from):
+                    game_totals[game_name] += seconds
+                    game_by_hour[hour] = game_by_hour.get(hour, 0) + seconds
+            total_voice_seconds = sum(voice_by_hour.values())
 
-            # Game time per hour for this user
+            # Time series for this user
             cursor = await db.execute(
-                "SELECT (ended_at - (ended_at % 3600)) as hour_bucket, SUM(duration_seconds) "
-                "FROM game_sessions "
-                "WHERE guild_id = ? AND user_id = ? AND ended_at IS NOT NULL AND ended_at >= ? "
-                "AND duration_seconds IS NOT NULL "
+                "SELECT hour_bucket, SUM(message_count) "
+                "FROM message_counts "
+                "WHERE guild_id = ? AND user_id = ? AND hour_bucket >= ? "
                 "GROUP BY hour_bucket "
                 "ORDER BY hour_bucket",
-                (guild_id, user_id, cutoff),
+                (guild_id, user_id, cutoff_hour),
             )
-            game_by_hour: dict[int, int] = {
-                r[0]: r[1] for r in await cursor.fetchall()
-            }
+            msg_by_hour: dict[int, int] = {}
+            for message_bucket, count in await cursor.fetchall():
+                hour_bucket = _hour_bucket(message_bucket)
+                msg_by_hour[hour_bucket] = msg_by_hour.get(hour_bucket, 0) + count
 
             all_hours = sorted(set(msg_by_hour) | set(voice_by_hour) | set(game_by_hour))
             timeseries = [
@@ -1472,20 +1619,11 @@ class MetricsService(BaseService):
                 for hour_bucket in all_hours
             ]
 
-            # Top games for this user
-            cursor = await db.execute(
-                "SELECT game_name, SUM(duration_seconds) as total_seconds "
-                "FROM game_sessions "
-                "WHERE guild_id = ? AND user_id = ? AND ended_at IS NOT NULL AND ended_at >= ? "
-                "AND duration_seconds IS NOT NULL "
-                "GROUP BY game_name "
-                "ORDER BY total_seconds DESC "
-                "LIMIT 10",
-                (guild_id, user_id, cutoff),
-            )
             top_games = [
-                {"game_name": r[0], "total_seconds": r[1]}
-                for r in await cursor.fetchall()
+                {"game_name": game_name, "total_seconds": total}
+                for game_name, total in sorted(
+                    game_totals.items(), key=lambda item: item[1], reverse=True
+                )[:10]
             ]
 
             avg_messages_per_day = round(total_messages / max(days, 1), 1)
@@ -1614,12 +1752,31 @@ class MetricsService(BaseService):
                 self.logger.exception("Error in metrics flush loop")
                 await asyncio.sleep(5)
 
+    async def _session_flush_loop(self) -> None:
+        """Flush queued session rows every interval or when a batch fills."""
+        while True:
+            try:
+                try:
+                    await asyncio.wait_for(
+                        self._session_flush_wakeup.wait(),
+                        timeout=self._session_flush_interval,
+                    )
+                except TimeoutError:
+                    pass
+                self._session_flush_wakeup.clear()
+                await self._flush_session_rows()
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                self.logger.exception("Error in metrics session flush loop")
+                await asyncio.sleep(5)
+
     async def _rollup_loop(self) -> None:
-        """Periodically aggregate raw data into hourly rollups."""
+        """Catch up missed hourly rollups, then keep them current periodically."""
         while True:
             try:
-                await asyncio.sleep(self._rollup_interval)
                 await self._perform_rollup()
+                await asyncio.sleep(self._rollup_interval)
             except asyncio.CancelledError:
                 break
             except Exception:
@@ -1645,86 +1802,162 @@ class MetricsService(BaseService):
     async def _write_voice_session_end(
         self, session: VoiceSessionInfo, ended_at: int
     ) -> None:
-        """Write a completed voice session to the database."""
+        """Queue a completed voice session for the next batched write."""
         duration = max(0, ended_at - session.joined_at)
-        try:
-            async with MetricsDatabase.get_connection() as db:
-                await db.execute(
-                    "INSERT INTO voice_sessions (guild_id, user_id, channel_id, joined_at, left_at, duration_seconds) "
-                    "VALUES (?, ?, ?, ?, ?, ?)",
-                    (
-                        session.guild_id,
-                        session.user_id,
-                        session.channel_id,
-                        session.joined_at,
-                        ended_at,
-                        duration,
-                    ),
-                )
-                await db.commit()
-            self._invalidate_activity_group_counts_cache(session.guild_id)
-        except Exception:
-            self.logger.exception(
-                "Failed to write voice session for user %d in guild %d",
-                session.user_id,
+        self._pending_voice_rows.append(
+            (
                 session.guild_id,
+                session.user_id,
+                session.channel_id,
+                session.joined_at,
+                ended_at,
+                duration,
             )
+        )
+        await self._after_session_queued()
 
     async def _write_game_session_end(
         self, session: GameSessionInfo, ended_at: int
     ) -> None:
-        """Write a completed game session to the database."""
+        """Queue a completed game session for the next batched write."""
         duration = max(0, ended_at - session.started_at)
-        try:
-            async with MetricsDatabase.get_connection() as db:
-                await db.execute(
-                    "INSERT INTO game_sessions (guild_id, user_id, game_name, started_at, ended_at, duration_seconds) "
-                    "VALUES (?, ?, ?, ?, ?, ?)",
-                    (
-                        session.guild_id,
-                        session.user_id,
-                        session.game_name,
-                        session.started_at,
-                        ended_at,
-                        duration,
-                    ),
-                )
-                await db.commit()
-            self._invalidate_activity_group_counts_cache(session.guild_id)
-        except Exception:
-            self.logger.exception(
-                "Failed to write game session for user %d in guild %d",
-                session.user_id,
+        self._pending_game_rows.append(
+            (
                 session.guild_id,
+                session.user_id,
+                session.game_name,
+                session.started_at,
+                ended_at,
+                duration,
             )
+        )
+        await self._after_session_queued()
+
+    async def _after_session_queued(self) -> None:
+        """
+        Trigger a flush when the queue is full or no writer task is running.
+
+        AI Notes:
+            Without the background writer (test mode, or before initialize has
+            started tasks) rows are written through immediately so callers
+            still observe them in the DB right after record_*_leave/stop.
+        """
+        writer = self._session_flush_task
+        if writer is None or writer.done():
+            await self._flush_session_rows()
+        elif (
+            len(self._pending_voice_rows) + len(self._pending_game_rows)
+            >= self._session_batch_size
+        ):
+            self._session_flush_wakeup.set()
+
+    async def _flush_session_rows(self) -> None:
+        """Write all queued voice/game session rows in a single transaction."""
+        async with self._session_flush_lock:
+            voice_rows, self._pending_voice_rows = self._pending_voice_rows, []
+            game_rows, self._pending_game_rows = self._pending_game_rows, []
+            if not voice_rows and not game_rows:
+                return
+
+            started = time.perf_counter()
+            try:
+                async with MetricsDatabase.get_connection() as db:
+                    if voice_rows:
+                        await db.executemany(
+                            "INSERT INTO voice_sessions (guild_id, user_id, channel_id, joined_at, left_at, duration_seconds) "
+                            "VALUES (?, ?, ?, ?, ?, ?)",
+                            voice_rows,
+                        )
+                    if game_rows:
+                        await db.executemany(
+                            "INSERT INTO game_sessions (guild_id, user_id, game_name, started_at, ended_at, duration_seconds) "
+                            "VALUES (?, ?, ?, ?, ?, ?)",
+                            game_rows,
+                        )
+                    # joined_at / started_at share index 3 in both row shapes
+                    await self._rewind_rollup_watermark(
+                        db, min(row[3] for row in (*voice_rows, *game_rows))
+                    )
+                    await db.commit()
+            except Exception:
+                self._session_flush_failures += 1
+                self.logger.exception(
+                    "Failed to write %d voice / %d game session rows",
+                    len(voice_rows),
+                    len(game_rows),
+                )
+                # Re-queue ahead of rows that arrived during the failed write
+                self._pending_voice_rows[:0] = voice_rows
+                self._pending_game_rows[:0] = game_rows
+                self._trim_session_queue()
+                return
+
+            self._last_session_flush_latency_ms = (time.perf_counter() - started) * 1000
+            self._session_flush_count += 1
+            self._session_rows_flushed += len(voice_rows) + len(game_rows)
+
+        for guild_id in {row[0] for row in voice_rows} | {row[0] for row in game_rows}:
+            self._invalidate_activity_group_counts_cache(guild_id)
+
+    def _trim_session_queue(self) -> None:
+        """
+        Drop the oldest queued session rows beyond ``_session_queue_limit``.
+
+        Failed writes re-queue their rows, so a database that stays
+        unavailable would otherwise grow the queue without bound.
+        """
+        for kind, rows in (
+            ("voice", self._pending_voice_rows),
+            ("game", self._pending_game_rows),
+        ):
+            overflow = len(rows) - self._session_queue_limit
+            if overflow > 0:
+                del rows[:overflow]
+                self._session_rows_dropped += overflow
+                self.logger.warning(
+                    "Session write queue full; dropped %d oldest %s session rows",
+                    overflow,
+                    kind,
+                )
 
     async def _flush_message_buffer(self) -> None:
-        """Write buffered message counts to the database via upsert."""
+        """
+        Write buffered message counts to the database via one bulk upsert.
+
+        AI Notes:
+            The buffer is swapped out (not copied) under the lock, and every
+            key goes through a single ``executemany`` so a flush costs one
+            thread hop and one transaction regardless of how many keys were
+            buffered. Keys are unique within a snapshot, so the upsert never
+            has to merge two rows from the same batch.
+        """
         async with self._message_buffer_lock:
             if not self._message_buffer:
                 return
-            # Snapshot and clear
-            snapshot = dict(self._message_buffer)
-            self._message_buffer.clear()
+            snapshot = self._message_buffer
+            self._message_buffer = defaultdict(int)
 
         try:
             async with MetricsDatabase.get_connection() as db:
-                touched_guilds: set[int] = set()
-                for (guild_id, user_id, hour_bucket), count in snapshot.items():
-                    touched_guilds.add(guild_id)
-                    await db.execute(
-                        "INSERT INTO message_counts ("
-                        "guild_id, user_id, hour_bucket, bucket_seconds, message_count"
-                        ") "
-                        "VALUES (?, ?, ?, ?, ?) "
-                        "ON CONFLICT(guild_id, user_id, hour_bucket) "
-                        "DO UPDATE SET "
-                        "message_count = message_count + excluded.message_count, "
-                        "bucket_seconds = excluded.bucket_seconds",
-                        (guild_id, user_id, hour_bucket, 180, count),
-                    )
+                await db.executemany(
+                    "INSERT INTO message_counts ("
+                    "guild_id, user_id, hour_bucket, bucket_seconds, message_count"
+                    ") "
+                    "VALUES (?, ?, ?, 180, ?) "
+                    "ON CONFLICT(guild_id, user_id, hour_bucket) "
+                    "DO UPDATE SET "
+                    "message_count = message_count + excluded.message_count, "
+                    "bucket_seconds = excluded.bucket_seconds",
+                    [
+                        (guild_id, user_id, bucket, count)
+                        for (guild_id, user_id, bucket), count in snapshot.items()
+                    ],
+                )
+                await self._rewind_rollup_watermark(
+                    db, min(bucket for _, _, bucket in snapshot)
+                )
                 await db.commit()
-            for guild_id in touched_guilds:
+            for guild_id in {guild_id for guild_id, _, _ in snapshot}:
                 self._invalidate_activity_group_counts_cache(guild_id)
             self._last_flush_at = time.time()
         except Exception:
@@ -1736,163 +1969,300 @@ class MetricsService(BaseService):
 
     async def _perform_rollup(self) -> None:
         """
-        Aggregate raw data from the last rollup period into hourly rollup tables.
+        Roll up every completed hour from the high-water mark to now.
 
-        Covers the previous hour's worth of data.
+        Hours are processed in batches of ``rollup_batch_hours``, each in its
+        own transaction that also advances the persisted watermark, so a
+        restart resumes where the last committed batch stopped.
         """
-        now = int(time.time())
-        hour_start = _hour_bucket(now) - 3600  # Previous completed hour
-        hour_end = hour_start + 3600
+        # Sessions still queued for the batched writer must be visible here
+        await self._flush_session_rows()
+
+        target = _hour_bucket(int(time.time()))  # first incomplete hour
 
         try:
-            async with MetricsDatabase.get_connection() as db:
-                # ---------- Server-wide hourly rollup ----------
-                # Messages
-                cursor = await db.execute(
-                    "SELECT guild_id, SUM(message_count), COUNT(DISTINCT user_id) "
-                    "FROM message_counts "
-                    "WHERE hour_bucket >= ? AND hour_bucket < ? "
-                    "GROUP BY guild_id",
-                    (hour_start, hour_end),
-                )
-                msg_rows = await cursor.fetchall()
+            while True:
+                async with MetricsDatabase.get_connection() as db:
+                    next_hour = await self._load_rollup_watermark(db, target)
+                    if next_hour >= target:
+                        await db.commit()  # persist a freshly seeded watermark
+                        self._rollup_next_hour = next_hour
+                        break
+                    batch_end = min(
+                        target, next_hour + self._rollup_batch_hours * 3600
+                    )
+                    voice_span = await self._max_session_span(db, "voice_sessions")
+                    game_span = await self._max_session_span(db, "game_sessions")
+                    for hour_start in range(next_hour, batch_end, 3600):
+                        await self._rollup_hour(
+                            db, hour_start, voice_span=voice_span, game_span=game_span
+                        )
+                    await db.execute(
+                        "UPDATE metrics_rollup_state "
+                        "SET next_hour_bucket = ?, updated_at = ? WHERE name = ?",
+                        (batch_end, int(time.time()), "hourly"),
+                    )
+                    await db.commit()
 
-                # Voice
-                cursor = await db.execute(
-                    "SELECT guild_id, SUM(duration_seconds), COUNT(DISTINCT user_id) "
-                    "FROM voice_sessions "
-                    "WHERE joined_at < ? AND (left_at >= ? OR left_at IS NULL) "
-                    "AND duration_seconds IS NOT NULL "
-                    "GROUP BY guild_id",
-                    (hour_end, hour_start),
+                self._rollup_next_hour = batch_end
+                self._rollup_hours_processed += (batch_end - next_hour) // 3600
+                self.logger.debug(
+                    "Hourly rollup completed for buckets %d..%d", next_hour, batch_end
                 )
-                voice_rows = {r[0]: (r[1], r[2]) for r in await cursor.fetchall()}
+                # Yield between batches so a long backfill never starves events
+                await asyncio.sleep(0)
 
-                # Top game per guild
-                cursor = await db.execute(
-                    "SELECT guild_id, game_name, SUM(duration_seconds) as total "
-                    "FROM game_sessions "
-                    "WHERE started_at < ? AND (ended_at >= ? OR ended_at IS NULL) "
-                    "AND duration_seconds IS NOT NULL "
-                    "GROUP BY guild_id, game_name "
-                    "ORDER BY total DESC",
-                    (hour_end, hour_start),
-                )
-                top_games: dict[int, str] = {}
-                for r in await cursor.fetchall():
-                    if r[0] not in top_games:
-                        top_games[r[0]] = r[1]
-
-                # Upsert server-wide
-                guild_ids = set()
-                for r in msg_rows:
-                    guild_ids.add(r[0])
-                guild_ids.update(voice_rows.keys())
-                guild_ids.update(top_games.keys())
-
-                for gid in guild_ids:
-                    msg_data = next((r for r in msg_rows if r[0] == gid), None)
-                    total_msgs = msg_data[1] if msg_data else 0
-                    unique_msgs = msg_data[2] if msg_data else 0
-                    v_secs, v_users = voice_rows.get(gid, (0, 0))
-                    top_game = top_games.get(gid)
+            self._last_rollup_at = time.time()
 
-                    await db.execute(
-                        "INSERT INTO metrics_hourly "
-                        "(guild_id, hour_bucket, total_messages, unique_messagers, "
-                        "total_voice_seconds, unique_voice_users, top_game) "
-                        "VALUES (?, ?, ?, ?, ?, ?, ?) "
-                        "ON CONFLICT(guild_id, hour_bucket) DO UPDATE SET "
-                        "total_messages = excluded.total_messages, "
-                        "unique_messagers = excluded.unique_messagers, "
-                        "total_voice_seconds = excluded.total_voice_seconds, "
-                        "unique_voice_users = excluded.unique_voice_users, "
-                        "top_game = excluded.top_game",
-                        (
-                            gid,
-                            hour_start,
-                            total_msgs,
-                            unique_msgs,
-                            v_secs,
-                            v_users,
-                            top_game,
-                        ),
-                    )
+        except Exception:
+            self.logger.exception("Failed to perform hourly rollup")
 
-                # ---------- Per-user hourly rollup ----------
-                # Messages per user
-                cursor = await db.execute(
-                    "SELECT guild_id, user_id, SUM(message_count) "
-                    "FROM message_counts "
-                    "WHERE hour_bucket >= ? AND hour_bucket < ? "
-                    "GROUP BY guild_id, user_id",
-                    (hour_start, hour_end),
-                )
-                user_msg_rows = await cursor.fetchall()
+    async def _load_rollup_watermark(
+        self, db: aiosqlite.Connection, target: int
+    ) -> int:
+        """
+        Return the first hour bucket that still needs rolling up.
 
-                # Voice per user
-                cursor = await db.execute(
-                    "SELECT guild_id, user_id, SUM(duration_seconds) "
-                    "FROM voice_sessions "
-                    "WHERE joined_at < ? AND (left_at >= ? OR left_at IS NULL) "
-                    "AND duration_seconds IS NOT NULL "
-                    "GROUP BY guild_id, user_id",
-                    (hour_end, hour_start),
-                )
-                user_voice: dict[tuple[int, int], int] = {
-                    (r[0], r[1]): r[2] for r in await cursor.fetchall()
-                }
+        Seeds the watermark from the oldest raw row on first run, and never
+        reaches back past the retention window (raw data there is purged).
+        """
+        floor = _hour_bucket(target - self._retention_days * 86400)
+        cursor = await db.execute(
+            "SELECT next_hour_bucket FROM metrics_rollup_state WHERE name = ?",
+            ("hourly",),
+        )
+        row = await cursor.fetchone()
+        if row is not None:
+            return max(floor, int(row[0]))
+
+        cursor = await db.execute(
+            "SELECT MIN(ts) FROM ("
+            "SELECT MIN(hour_bucket) AS ts FROM message_counts "
+            "UNION ALL SELECT MIN(joined_at) FROM voice_sessions "
+            "UNION ALL SELECT MIN(started_at) FROM game_sessions)"
+        )
+        row = await cursor.fetchone()
+        earliest = row[0] if row and row[0] is not None else target
+        start = max(floor, _hour_bucket(earliest))
+        await db.execute(
+            "INSERT INTO metrics_rollup_state (name, next_hour_bucket, updated_at) "
+            "VALUES (?, ?, ?)",
+            ("hourly", start, int(time.time())),
+        )
+        return start
 
-                # Games per user (as JSON)
-                cursor = await db.execute(
-                    "SELECT guild_id, user_id, game_name, SUM(duration_seconds) "
-                    "FROM game_sessions "
-                    "WHERE started_at < ? AND (ended_at >= ? OR ended_at IS NULL) "
-                    "AND duration_seconds IS NOT NULL "
-                    "GROUP BY guild_id, user_id, game_name",
-                    (hour_end, hour_start),
-                )
-                user_games: dict[tuple[int, int], dict[str, int]] = defaultdict(dict)
-                for r in await cursor.fetchall():
-                    user_games[(r[0], r[1])][r[2]] = r[3]
-
-                # Collect all user keys
-                user_keys: set[tuple[int, int]] = set()
-                for r in user_msg_rows:
-                    user_keys.add((r[0], r[1]))
-                user_keys.update(user_voice.keys())
-                user_keys.update(user_games.keys())
-
-                for gid, uid in user_keys:
-                    msgs = next(
-                        (r[2] for r in user_msg_rows if r[0] == gid and r[1] == uid), 0
-                    )
-                    voice_secs = user_voice.get((gid, uid), 0)
-                    games_dict = user_games.get((gid, uid))
-                    games_json = json.dumps(games_dict) if games_dict else None
+    async def _rewind_rollup_watermark(
+        self, db: aiosqlite.Connection, earliest: int
+    ) -> None:
+        """
+        Move the rollup watermark back so hours touched by late rows recompute.
 
-                    await db.execute(
-                        "INSERT INTO metrics_user_hourly "
-                        "(guild_id, user_id, hour_bucket, messages_sent, voice_seconds, games_json) "
-                        "VALUES (?, ?, ?, ?, ?, ?) "
-                        "ON CONFLICT(guild_id, user_id, hour_bucket) DO UPDATE SET "
-                        "messages_sent = excluded.messages_sent, "
-                        "voice_seconds = excluded.voice_seconds, "
-                        "games_json = excluded.games_json",
-                        (gid, uid, hour_start, msgs, voice_secs, games_json),
-                    )
+        Runs inside the caller's write transaction, so the raw rows and the
+        rewind commit (or roll back) together.
+        """
+        hour = _hour_bucket(earliest)
+        await db.execute(
+            "UPDATE metrics_rollup_state SET next_hour_bucket = ?, updated_at = ? "
+            "WHERE name = ? AND next_hour_bucket > ?",
+            (hour, int(time.time()), "hourly", hour),
+        )
 
-                await db.commit()
+    async def _max_session_span(self, db: aiosqlite.Connection, table: str) -> int:
+        """
+        Return the longest session duration (seconds) stored in ``table``.
 
-            self._last_rollup_at = time.time()
-            self.logger.debug("Hourly rollup completed for bucket %d", hour_start)
+        Session rows are insert-only with AUTOINCREMENT ids, so the cached
+        maximum is only extended with rows above the last id seen; after the
+        first call this is a short rowid range scan. Deleting session rows
+        drops the cached span (``_forget_session_spans``) so the next call
+        rescans the table and the span can shrink again.
+        """
+        span, last_id = self._session_spans.get(table, (0, 0))
+        cursor = await db.execute(_SESSION_SPAN_SQL[table], (last_id,))
+        row = await cursor.fetchone()
+        if row is not None and row[1] is not None:
+            span = max(span, row[0] or 0)
+            last_id = row[1]
+            self._session_spans[table] = (span, last_id)
+        return span
+
+    def _forget_session_spans(self, deleted: dict[str, int]) -> None:
+        """Drop cached session spans for tables that just lost rows."""
+        for table, count in deleted.items():
+            if count and table in _SESSION_SPAN_SQL:
+                self._session_spans.pop(table, None)
+
+    async def _rollup_hour(
+        self,
+        db: aiosqlite.Connection,
+        hour_start: int,
+        *,
+        voice_span: int,
+        game_span: int,
+    ) -> None:
+        """
+        Upsert metrics_hourly and metrics_user_hourly rows for one hour bucket.
 
-        except Exception:
-            self.logger.exception("Failed to perform hourly rollup")
+        The caller owns the transaction (commit/rollback). ``voice_span`` and
+        ``game_span`` are upper bounds on session duration (see
+        ``_max_session_span``).
+
+        AI Notes:
+            SQLite does the grouping; Python only merges the grouped result
+            sets through dicts keyed by guild or (guild, user), so the work
+            is linear in the number of active users. Each table is then
+            written with a single executemany.
+
+            Voice and game time is clipped to [hour_start, hour_end): a
+            session spanning five hours contributes only its overlap to each
+            bucket instead of its full duration to all five. Open sessions
+            live in memory and are picked up once written (the write rewinds
+            the watermark to the session's first hour).
+
+            A session overlapping the hour started before ``hour_end`` and
+            lasted at most the span, so its end time falls in
+            ``(hour_start, hour_end + span)``. Bounding ``left_at`` /
+            ``ended_at`` on both sides keeps each hour to a narrow range of
+            idx_voice_sessions_left / idx_game_sessions_ended instead of
+            every session that ended after the hour, which made a backfill
+            quadratic.
+        """
+        hour_end = hour_start + 3600
+        voice_params = (
+            hour_end, hour_start, hour_start, hour_end + voice_span, hour_end
+        )
+        game_params = (hour_end, hour_start, hour_start, hour_end + game_span, hour_end)
+
+        # ---------- Server-wide hourly rollup ----------
+        # Messages
+        cursor = await db.execute(
+            "SELECT guild_id, SUM(message_count), COUNT(DISTINCT user_id) "
+            "FROM message_counts "
+            "WHERE hour_bucket >= ? AND hour_bucket < ? "
+            "GROUP BY guild_id",
+            (hour_start, hour_end),
+        )
+        guild_msgs: dict[int, tuple[int, int]] = {
+            r[0]: (r[1], r[2]) for r in await cursor.fetchall()
+        }
+
+        # Voice (each session clipped to the hour)
+        cursor = await db.execute(
+            "SELECT guild_id, SUM(MIN(left_at, ?) - MAX(joined_at, ?)), "
+            "COUNT(DISTINCT user_id) "
+            "FROM voice_sessions "
+            "WHERE left_at > ? AND left_at < ? AND joined_at < ? "
+            "GROUP BY guild_id",
+            voice_params,
+        )
+        guild_voice: dict[int, tuple[int, int]] = {
+            r[0]: (r[1], r[2]) for r in await cursor.fetchall()
+        }
+
+        # Top game per guild
+        cursor = await db.execute(
+            "SELECT guild_id, game_name, "
+            "SUM(MIN(ended_at, ?) - MAX(started_at, ?)) as total "
+            "FROM game_sessions "
+            "WHERE ended_at > ? AND ended_at < ? AND started_at < ? "
+            "GROUP BY guild_id, game_name "
+            "ORDER BY total DESC",
+            game_params,
+        )
+        top_games: dict[int, str] = {}
+        for r in await cursor.fetchall():
+            top_games.setdefault(r[0], r[1])
+
+        guild_ids = guild_msgs.keys() | guild_voice.keys() | top_games.keys()
+        await db.executemany(
+            "INSERT INTO metrics_hourly "
+            "(guild_id, hour_bucket, total_messages, unique_messagers, "
+            "total_voice_seconds, unique_voice_users, top_game) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(guild_id, hour_bucket) DO UPDATE SET "
+            "total_messages = excluded.total_messages, "
+            "unique_messagers = excluded.unique_messagers, "
+            "total_voice_seconds = excluded.total_voice_seconds, "
+            "unique_voice_users = excluded.unique_voice_users, "
+            "top_game = excluded.top_game",
+            [
+                (
+                    gid,
+                    hour_start,
+                    *guild_msgs.get(gid, (0, 0)),
+                    *guild_voice.get(gid, (0, 0)),
+                    top_games.get(gid),
+                )
+                for gid in guild_ids
+            ],
+        )
+
+        # ---------- Per-user hourly rollup ----------
+        # Messages per user
+        cursor = await db.execute(
+            "SELECT guild_id, user_id, SUM(message_count) "
+            "FROM message_counts "
+            "WHERE hour_bucket >= ? AND hour_bucket < ? "
+            "GROUP BY guild_id, user_id",
+            (hour_start, hour_end),
+        )
+        user_msgs: dict[tuple[int, int], int] = {
+            (r[0], r[1]): r[2] for r in await cursor.fetchall()
+        }
+
+        # Voice per user
+        cursor = await db.execute(
+            "SELECT guild_id, user_id, SUM(MIN(left_at, ?) - MAX(joined_at, ?)) "
+            "FROM voice_sessions "
+            "WHERE left_at > ? AND left_at < ? AND joined_at < ? "
+            "GROUP BY guild_id, user_id",
+            voice_params,
+        )
+        user_voice: dict[tuple[int, int], int] = {
+            (r[0], r[1]): r[2] for r in await cursor.fetchall()
+        }
+
+        # Games per user (as JSON)
+        cursor = await db.execute(
+            "SELECT guild_id, user_id, game_name, "
+            "SUM(MIN(ended_at, ?) - MAX(started_at, ?)) "
+            "FROM game_sessions "
+            "WHERE ended_at > ? AND ended_at < ? AND started_at < ? "
+            "GROUP BY guild_id, user_id, game_name",
+            game_params,
+        )
+        user_games: dict[tuple[int, int], dict[str, int]] = defaultdict(dict)
+        for r in await cursor.fetchall():
+            user_games[(r[0], r[1])][r[2]] = r[3]
+
+        user_keys = user_msgs.keys() | user_voice.keys() | user_games.keys()
+        await db.executemany(
+            "INSERT INTO metrics_user_hourly "
+            "(guild_id, user_id, hour_bucket, messages_sent, voice_seconds, games_json) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(guild_id, user_id, hour_bucket) DO UPDATE SET "
+            "messages_sent = excluded.messages_sent, "
+            "voice_seconds = excluded.voice_seconds, "
+            "games_json = excluded.games_json",
+            [
+                (
+                    gid,
+                    uid,
+                    hour_start,
+                    user_msgs.get((gid, uid), 0),
+                    user_voice.get((gid, uid), 0),
+                    json.dumps(user_games[(gid, uid)])
+                    if (gid, uid) in user_games
+                    else None,
+                )
+                for gid, uid in user_keys
+            ],
+        )
 
     async def _purge_old_data(self) -> None:
         """Delete metrics data older than retention_days."""
         cutoff = int(time.time()) - (self._retention_days * 86400)
+        purged: dict[str, int] = {}
 
         try:
             async with MetricsDatabase.get_connection() as db:
@@ -1907,6 +2277,7 @@ class MetricsService(BaseService):
                         f"DELETE FROM {table} WHERE {col} < ?", (cutoff,)
                     )
                     deleted = cursor.rowcount
+                    purged[table] = deleted
                     if deleted:
                         self.logger.info(
                             "Purged %d rows from %s (older than %d days)",
@@ -1917,6 +2288,8 @@ class MetricsService(BaseService):
                 await db.commit()
         except Exception:
             self.logger.exception("Failed to purge old metrics data")
+            return
+        self._forget_session_spans(purged)
 
     # ------------------------------------------------------------------
     # Per-user data erasure (GDPR / Discord data deletion)
@@ -1942,6 +2315,17 @@ class MetricsService(BaseService):
 
         self._voice_sessions.pop((guild_id, user_id), None)
         self._game_sessions.pop((guild_id, user_id), None)
+        async with self._session_flush_lock:
+            self._pending_voice_rows = [
+                row
+                for row in self._pending_voice_rows
+                if (row[0], row[1]) != (guild_id, user_id)
+            ]
+            self._pending_game_rows = [
+                row
+                for row in self._pending_game_rows
+                if (row[0], row[1]) != (guild_id, user_id)
+            ]
 
         try:
             async with MetricsDatabase.get_connection() as db:
@@ -1957,6 +2341,7 @@ class MetricsService(BaseService):
                     )
                     deleted[table] = cursor.rowcount
                 await db.commit()
+            self._forget_session_spans(deleted)
         except Exception:
             self.logger.exception(
                 "Failed to delete metrics for user %d in guild %d",
@@ -1988,7 +2373,19 @@ class MetricsService(BaseService):
                 "message_buffer_size": sum(self._message_buffer.values()),
                 "last_flush_at": self._last_flush_at,
                 "last_rollup_at": self._last_rollup_at,
+                "rollup_next_hour": self._rollup_next_hour,
+                "rollup_hours_processed": self._rollup_hours_processed,
                 "total_messages_buffered": self._total_messages_buffered,
+                "session_queue_depth": len(self._pending_voice_rows)
+                + len(self._pending_game_rows),
+                "session_flush_count": self._session_flush_count,
+                "session_rows_flushed": self._session_rows_flushed,
+                "session_flush_failures": self._session_flush_failures,
+                "session_rows_dropped": self._session_rows_dropped,
+                "last_session_flush_latency_ms": round(
+                    self._last_session_flush_latency_ms, 2
+                ),
+                "db_pool": MetricsDatabase.pool_stats(),
             }
         )
         return base
@@ -2004,6 +2401,28 @@ def _hour_bucket(epoch: int) -> int:
     return epoch - (epoch % 3600)
 
 
+def _split_by_hour(start: int, end: int, floor: int) -> Iterator[tuple[int, int]]:
+    """Yield ``(hour_bucket, seconds)`` for the part of [start, end) after ``floor``."""
+    start = max(start, floor)
+    while start < end:
+        hour_end = _hour_bucket(start) + 3600
+        stop = min(end, hour_end)
+        yield hour_end - 3600, stop - start
+        start = stop
+
+
 def _message_window_bucket(epoch: int) -> int:
     """Truncate a Unix timestamp to the start of its 3-minute message window."""
     return epoch - (epoch % 180)
+
+
+def _parse_channel_ids(raw_value: Any) -> frozenset[int]:
+    """Normalize a stored channel-ID list, dropping values that are not ints."""
+    parsed: set[int] = set()
+    if isinstance(raw_value, list):
+        for item in raw_value:
+            try:
+                parsed.add(int(item))
+            except (TypeError, ValueError):
+                continue
+    return frozenset(parsed)
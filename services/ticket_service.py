@@ -935,6 +935,7 @@ class TicketService(BaseService):
         status: str | None = None,
         limit: int = 50,
         offset: int = 0,
+        after: tuple[int, int] | None = None,
     ) -> list[dict[str, Any]]:
         """Return tickets with optional status filter and pagination.
 
@@ -942,20 +943,26 @@ class TicketService(BaseService):
             guild_id: Discord guild ID.
             status: ``'open'``, ``'closed'``, or ``None`` for all.
             limit: Max rows.
-            offset: Row offset for pagination.
+            offset: Row offset for pagination (ignored when *after* is set).
+            after: ``(created_at, id)`` of the last ticket already returned;
+                the page continues past it with an indexed range scan.
 
         Returns:
-            List of ticket dicts.
+            List of ticket dicts, newest first.
         """
         where = "WHERE guild_id = ?"
         params: list[Any] = [guild_id]
         if status:
             where += " AND status = ?"
             params.append(status)
+        if after is not None:
+            where += " AND (created_at, id) < (?, ?)"
+            params.extend(after)
+            offset = 0
         params.extend([limit, offset])
         rows = await BaseRepository.fetch_all(
             f"SELECT {_TICKET_COLUMNS} FROM tickets {where} "
-            "ORDER BY created_at DESC LIMIT ? OFFSET ?",
+            "ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?",
             tuple(params),
         )
         return [self._row_to_ticket(r) for r in rows]
@@ -4,7 +4,7 @@ Verification Bulk Service
 Manages queued batch-processing jobs for bulk verification status checks.
 
 This service uses the unified verification pipeline (compute_global_state,
-store_global_state, schedule_user_recheck) for all RSI verification checks,
+store_global_states with recheck schedules) for all RSI verification checks,
 ensuring consistent state management, caching, and auto-recheck scheduling.
 
 Coordinates with auto-recheck loop to avoid conflicts.
@@ -15,18 +15,20 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING, Any
 
 import discord
 
 from helpers.secure_random import secure_uniform
+from helpers.task_queue import Priority, task_priority
 from utils.logging import get_logger
 
 if TYPE_CHECKING:
     from discord.ext import commands
 
     from bot import MyBot
+    from services.verification_state import GlobalVerificationState
 
 
 logger = get_logger(__name__)
@@ -378,8 +380,9 @@ class VerificationBulkService:
         """
         Perform live RSI verification for each member in the batch using the unified pipeline.
 
-        This method always uses compute_global_state + store_global_state + schedule_user_recheck
-        to ensure consistent state management, caching, and auto-recheck scheduling.
+        This method always uses compute_global_state + store_global_states (with
+        recheck schedules) to ensure consistent state management, caching, and
+        auto-recheck scheduling.
 
         Args:
             status_rows: List of StatusRow objects from DB (max 50 per batch)
@@ -527,16 +530,25 @@ class VerificationBulkService:
         - Maintain consistency across multi-guild users
 
         Suitable for bulk operations where admin wants to update stored state
-        and trigger recheck scheduling.
+        and trigger recheck scheduling.  States, schedules, failures and guild
+        memberships for the whole batch are committed in one transaction once
+        every check has finished; if that write fails, each user is retried in
+        its own transaction.  Users whose handle is held by someone else (in
+        the database or earlier in this batch) are reported as errors before
+        any guild roles are applied.
         """
         from helpers.bulk_check import StatusRow
         from services.guild_sync import sync_user_to_all_guilds
         from services.verification_scheduler import (
             compute_next_retry,
-            handle_recheck_failure,
-            schedule_user_recheck,
+            recheck_failure_rows,
+        )
+        from services.verification_state import (
+            compute_global_state,
+            find_handle_conflict,
+            handle_conflict_reason,
+            store_global_states,
         )
-        from services.verification_state import compute_global_state, store_global_state
 
         current_time = int(time.time())
 
@@ -553,8 +565,15 @@ class VerificationBulkService:
             except Exception:
                 logger.debug("Failed to read org name config for guild %s", guild_id)
 
+        config = getattr(self.bot, "config", None)
+        pending_states: list[GlobalVerificationState] = []
+        pending_schedules: list[tuple[int, int]] = []
+        pending_failures: list[tuple[int, str]] = []
+        pending_memberships: list[tuple[int, int]] = []
+        claimed_handles: dict[str, int] = {}
+
         async def check_with_unified_pipeline(row: StatusRow) -> RsiStatusResult:
-            """Check using unified pipeline and persist state."""
+            """Check using unified pipeline and queue state for the batch write."""
             if not row.rsi_handle:
                 return RsiStatusResult(
                     status="unknown", checked_at=current_time, error="No RSI handle"
@@ -566,7 +585,7 @@ class VerificationBulkService:
                     row.user_id,
                     row.rsi_handle,
                     self.bot.http_client,
-                    config=getattr(self.bot, "config", None),
+                    config=config,
                     org_name=org_name,
                     force_refresh=True,  # Admin bulk checks want fresh data
                 )
@@ -578,40 +597,51 @@ class VerificationBulkService:
                         row.user_id,
                         global_state.error,
                     )
-                    try:
-                        config = getattr(self.bot, "config", None)
-                        from services.db.database import Database
+                    pending_failures.append((row.user_id, global_state.error))
+                    return RsiStatusResult(
+                        status=global_state.status,
+                        checked_at=global_state.checked_at,
+                        main_orgs=global_state.main_orgs,
+                        affiliate_orgs=global_state.affiliate_orgs,
+                        error=global_state.error,
+                    )
 
-                        fail_count = await Database.get_auto_recheck_fail_count(
-                            row.user_id
-                        )
-                        await handle_recheck_failure(
-                            row.user_id,
-                            global_state.error,
-                            fail_count=fail_count + 1,
-                            config=config,
-                        )
-                    except Exception as e:
-                        logger.warning(
-                            "Failed to record recheck failure for user %s: %s",
-                            row.user_id,
-                            e,
+                # Skip users the batch write would reject for a handle
+                # conflict, so they never receive roles for a handle they
+                # do not hold.
+                conflict = await find_handle_conflict(global_state)
+                if conflict is None:
+                    claimed_by = claimed_handles.setdefault(
+                        global_state.rsi_handle.lower(), row.user_id
+                    )
+                    if claimed_by != row.user_id:
+                        conflict = handle_conflict_reason(
+                            global_state.rsi_handle, claimed_by
                         )
+                if conflict:
+                    logger.warning(
+                        "Skipping guild sync for user %s: %s", row.user_id, conflict
+                    )
                     return RsiStatusResult(
                         status=global_state.status,
                         checked_at=global_state.checked_at,
                         main_orgs=global_state.main_orgs,
                         affiliate_orgs=global_state.affiliate_orgs,
-                        error=global_state.error,
+                        error=conflict[:200],
                     )
 
                 # Apply state to all guilds BEFORE persisting so
                 # "before" snapshots capture pre-update DB state.
                 try:
-                    await sync_user_to_all_guilds(
-                        global_state,
-                        self.bot,
-                        max_concurrency=2,  # Conservative for bulk
+                    with task_priority(Priority.BULK):
+                        sync_results = await sync_user_to_all_guilds(
+                            global_state,
+                            self.bot,
+                            max_concurrency=2,  # Conservative for bulk
+                            track_membership=False,
+                        )
+                    pending_memberships.extend(
+                        (res.user_id, res.guild_id) for res in sync_results or []
                     )
                 except Exception as e:
                     logger.warning(
@@ -620,21 +650,11 @@ class VerificationBulkService:
                         e,
                     )
 
-                # Persist state (only for non-error states)
+                # Queue state (only for non-error states) and its recheck
+                pending_states.append(global_state)
                 try:
-                    await store_global_state(global_state)
-                except Exception as e:
-                    logger.warning(
-                        "Failed to store global state for user %s: %s",
-                        row.user_id,
-                        e,
-                    )
-
-                # Schedule recheck
-                try:
-                    config = getattr(self.bot, "config", None)
                     next_retry = compute_next_retry(global_state, config=config)
-                    await schedule_user_recheck(row.user_id, next_retry)
+                    pending_schedules.append((row.user_id, next_retry))
                 except Exception as e:
                     logger.warning(
                         "Failed to schedule recheck for user %s: %s",
@@ -663,6 +683,38 @@ class VerificationBulkService:
         tasks = [check_with_unified_pipeline(row) for row in status_rows]
         rsi_results = await asyncio.gather(*tasks, return_exceptions=True)
 
+        # Persist the whole batch in one transaction
+        conflicts: dict[int, str] = {}
+        if pending_states or pending_failures or pending_memberships:
+            try:
+                conflicts = await store_global_states(
+                    pending_states,
+                    schedules=pending_schedules,
+                    failures=await recheck_failure_rows(
+                        pending_failures, config=config
+                    ),
+                    memberships=pending_memberships,
+                )
+            except Exception as e:
+                logger.warning(
+                    "Failed to persist verification batch of %d users, "
+                    "retrying per user: %s",
+                    len(pending_states) + len(pending_failures),
+                    e,
+                )
+                conflicts = await self._store_results_per_user(
+                    pending_states,
+                    schedules=pending_schedules,
+                    failures=pending_failures,
+                    memberships=pending_memberships,
+                )
+            for user_id, reason in conflicts.items():
+                logger.warning(
+                    "Failed to store global state for user %s: %s",
+                    user_id,
+                    reason,
+                )
+
         # Build updated rows
         updated_rows = []
         for row, result in zip(status_rows, rsi_results, strict=False):
@@ -679,6 +731,10 @@ class VerificationBulkService:
             if not isinstance(result, RsiStatusResult):
                 continue
 
+            if row.user_id in conflicts and not result.error:
+                # State was not stored; surface the conflict instead of a result
+                result = replace(result, error=conflicts[row.user_id][:200])
+
             updated_row = StatusRow(
                 user_id=row.user_id,
                 username=row.username,
@@ -696,6 +752,56 @@ class VerificationBulkService:
 
         return updated_rows
 
+    async def _store_results_per_user(
+        self,
+        states: list[GlobalVerificationState],
+        *,
+        schedules: list[tuple[int, int]],
+        failures: list[tuple[int, str]],
+        memberships: list[tuple[int, int]],
+    ) -> dict[int, str]:
+        """
+        Fallback for a failed batch write: store each user on its own.
+
+        One bad row then only loses that user's state instead of the batch.
+        Returns {user_id: reason} for states that were still not stored.
+        """
+        from services.verification_scheduler import recheck_failure_rows
+        from services.verification_state import store_global_states
+
+        next_retry = dict(schedules)
+        unsaved: dict[int, str] = {}
+        for state in states:
+            user_id = state.user_id
+            try:
+                unsaved.update(
+                    await store_global_states(
+                        [state],
+                        schedules=(
+                            [(user_id, next_retry[user_id])]
+                            if user_id in next_retry
+                            else None
+                        ),
+                        memberships=[m for m in memberships if m[0] == user_id],
+                    )
+                )
+            except Exception as e:
+                unsaved[user_id] = f"Failed to store verification state: {e}"
+
+        if failures:
+            try:
+                await store_global_states(
+                    [],
+                    failures=await recheck_failure_rows(
+                        failures, config=getattr(self.bot, "config", None)
+                    ),
+                )
+            except Exception as e:
+                logger.warning(
+                    "Failed to record %d recheck failures: %s", len(failures), e
+                )
+        return unsaved
+
 
 async def initialize(bot: commands.Bot) -> VerificationBulkService:
     """Initialize the verification bulk service."""
@@ -87,3 +87,55 @@ async def handle_recheck_failure(
         error_msg=error,
         inc=False,
     )
+
+
+async def schedule_user_rechecks(schedules: list[tuple[int, int]]) -> None:
+    """Batch form of schedule_user_recheck: (user_id, next_retry) pairs."""
+    await Database.upsert_auto_recheck_successes(schedules, now=int(time.time()))
+
+
+async def handle_recheck_failures(
+    failures: list[tuple[int, str]],
+    *,
+    config: dict[str, Any] | None = None,
+) -> None:
+    """
+    Batch form of handle_recheck_failure for (user_id, error) pairs.
+
+    Fail counts are read in one query and backoff uses ``fail_count + 1``,
+    matching the per-user path in the auto-recheck loop.
+    """
+    if not failures:
+        return
+    await Database.upsert_auto_recheck_failures(
+        await recheck_failure_rows(failures, config=config),
+        now=int(time.time()),
+    )
+
+
+async def recheck_failure_rows(
+    failures: list[tuple[int, str]],
+    *,
+    config: dict[str, Any] | None = None,
+) -> list[tuple[int, int, str]]:
+    """
+    Turn (user_id, error) pairs into (user_id, next_retry_at, error) rows.
+
+    Reads current fail counts in one query so callers can hand the rows to a
+    batched writer (upsert_auto_recheck_failures or store_global_states).
+    """
+    if not failures:
+        return []
+    now = int(time.time())
+    fail_counts = await Database.get_auto_recheck_fail_counts(
+        [user_id for user_id, _ in failures]
+    )
+    return [
+        (
+            user_id,
+            now
+            + _compute_backoff_seconds(config, max(1, fail_counts.get(user_id, 0) + 1)),
+            error,
+        )
+        for user_id, error in failures
+    ]
@@ -11,8 +11,9 @@ from __future__ import annotations
 
 import asyncio
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Literal
+from typing import Any, Generic, Literal, TypeVar
 
 from helpers.circuit_breaker import (
     CIRCUIT_OPEN_ERROR_MESSAGE,
@@ -26,6 +27,12 @@ logger = get_logger(__name__)
 
 VerificationStatus = Literal["main", "affiliate", "non_member"]
 
+K = TypeVar("K")
+V = TypeVar("V")
+
+DEFAULT_CACHE_MAX_ENTRIES = 5000
+DEFAULT_NEGATIVE_CACHE_TTL = 60
+
 
 @dataclass
 class GlobalVerificationState:
@@ -39,9 +46,80 @@ class GlobalVerificationState:
     error: str | None = None
 
 
-# In-process cache: {(user_id, handle_lower): (expires_at, GlobalVerificationState)}
-_cache: dict[tuple[int, str], tuple[float, GlobalVerificationState]] = {}
-_cache_lock = asyncio.Lock()
+class _TTLCache(Generic[K, V]):
+    """
+    Size-bounded LRU cache with per-entry expiry and hit/miss/eviction counters.
+
+    AI Notes:
+        All operations are synchronous, so callers on the event loop need no
+        lock. Expired entries are dropped when read, and on insert the LRU
+        end is trimmed of expired entries before evicting live ones, so the
+        cache never holds more than ``max_entries`` items.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: K, value: V, ttl: float) -> None:
+        now = time.monotonic()
+        self._entries[key] = (now + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            _, (expires_at, _) = self._entries.popitem(last=False)
+            if expires_at <= now:
+                self.expirations += 1
+            else:
+                self.evictions += 1
+
+    def pop(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+# Fresh verification results: {(user_id, handle_lower): GlobalVerificationState}
+_cache: _TTLCache[tuple[int, str], GlobalVerificationState] = _TTLCache(
+    DEFAULT_CACHE_MAX_ENTRIES
+)
+# Handles RSI answered with 404: {handle_lower: True}. Short-lived so repeated
+# button presses do not refetch, but a newly created handle is seen quickly.
+_not_found_cache: _TTLCache[str, bool] = _TTLCache(DEFAULT_CACHE_MAX_ENTRIES)
 
 # Simple concurrency + pacing controls for RSI fetches
 _rsi_semaphore: asyncio.Semaphore | None = None
@@ -53,6 +131,12 @@ def _get_limits(config: dict[str, Any] | None) -> dict[str, Any]:
     rsi_cfg = (config or {}).get("rsi", {}) if isinstance(config, dict) else {}
     return {
         "cache_ttl": int(rsi_cfg.get("cache_ttl_seconds", 300)),
+        "cache_max_entries": int(
+            rsi_cfg.get("cache_max_entries", DEFAULT_CACHE_MAX_ENTRIES)
+        ),
+        "negative_cache_ttl": int(
+            rsi_cfg.get("negative_cache_ttl_seconds", DEFAULT_NEGATIVE_CACHE_TTL)
+        ),
         "max_concurrency": int(rsi_cfg.get("max_concurrent_requests", 3)),
         "min_interval": float(rsi_cfg.get("min_interval_seconds", 0.5)),
         "backoff_base": int(rsi_cfg.get("backoff_base_seconds", 60)),
@@ -60,6 +144,17 @@ def _get_limits(config: dict[str, Any] | None) -> dict[str, Any]:
     }
 
 
+def get_cache_stats() -> dict[str, Any]:
+    """Return counters for the verification state and 404 caches."""
+    return {"states": _cache.stats(), "not_found": _not_found_cache.stats()}
+
+
+def clear_caches() -> None:
+    """Drop all cached verification results and counters (for testing)."""
+    _cache.clear()
+    _not_found_cache.clear()
+
+
 async def _maybe_init_semaphore(max_concurrency: int) -> asyncio.Semaphore:
     global _rsi_semaphore
     if _rsi_semaphore is None:
@@ -102,7 +197,9 @@ async def compute_global_state(
         http_client: Shared HTTP client with connection pooling.
         config: Optional bot config for rate limit settings.
         org_name: Optional org name fallback for RSI parsing (default "test").
-        force_refresh: Bypass cache when True.
+        force_refresh: Bypass the result cache when True. A handle that
+            recently returned 404 is still answered from the short-lived
+            negative cache.
 
     Returns:
         GlobalVerificationState with error populated on failure instead of raising
@@ -126,14 +223,22 @@ async def compute_global_state(
 
     limits = _get_limits(config)
     cache_ttl = limits["cache_ttl"]
-    key = (int(user_id), rsi_handle.lower())
+    negative_ttl = limits["negative_cache_ttl"]
+    _cache.max_entries = _not_found_cache.max_entries = max(
+        1, limits["cache_max_entries"]
+    )
+    handle_key = rsi_handle.lower()
+    key = (int(user_id), handle_key)
+
+    # A recent 404 short-circuits even forced refreshes
+    if negative_ttl > 0 and _not_found_cache.get(handle_key):
+        raise NotFoundError(f"RSI handle {rsi_handle!r} not found (cached)")
 
     # Cache check
     if not force_refresh:
-        async with _cache_lock:
-            cached = _cache.get(key)
-            if cached and cached[0] > time.monotonic():
-                return cached[1]
+        cached = _cache.get(key)
+        if cached is not None:
+            return cached
 
     semaphore = await _maybe_init_semaphore(limits["max_concurrency"])
 
@@ -175,6 +280,9 @@ async def compute_global_state(
     except NotFoundError:
         # 404 is a valid response (handle doesn't exist), record as success for circuit
         circuit_breaker.record_success()
+        _cache.pop(key)
+        if negative_ttl > 0:
+            _not_found_cache.set(handle_key, True, negative_ttl)
         raise
     except ForbiddenError:
         # 403 Forbidden - RSI is blocking us, record failure for circuit breaker
@@ -268,8 +376,8 @@ async def compute_global_state(
     )
 
     # Update cache
-    async with _cache_lock:
-        _cache[key] = (time.monotonic() + cache_ttl, state)
+    if cache_ttl > 0:
+        _cache.set(key, state, cache_ttl)
 
     return state
 
@@ -290,11 +398,9 @@ async def store_global_state(state: GlobalVerificationState) -> None:
             "Use handle_recheck_failure() for error states."
         )
 
-    conflict = await Database.check_rsi_handle_conflict(state.rsi_handle, state.user_id)
+    conflict = await find_handle_conflict(state)
     if conflict:
-        raise ValueError(
-            f"RSI handle '{state.rsi_handle}' is already verified by another user: {conflict}"
-        )
+        raise ValueError(conflict)
 
     # Log what we're about to persist for observability
     from utils.logging import get_logger
@@ -324,6 +430,88 @@ async def store_global_state(state: GlobalVerificationState) -> None:
     )
 
 
+def handle_conflict_reason(rsi_handle: str, other_user_id: int) -> str:
+    """Message for a state skipped because another user holds its handle."""
+    return f"RSI handle '{rsi_handle}' is already verified by another user: {other_user_id}"
+
+
+async def find_handle_conflict(state: GlobalVerificationState) -> str | None:
+    """Return why *state* cannot be stored, if another user holds its handle."""
+    from services.db.database import Database
+
+    conflict = await Database.check_rsi_handle_conflict(state.rsi_handle, state.user_id)
+    return handle_conflict_reason(state.rsi_handle, conflict) if conflict else None
+
+
+async def store_global_states(
+    states: list[GlobalVerificationState],
+    *,
+    schedules: list[tuple[int, int]] | None = None,
+    failures: list[tuple[int, int, str]] | None = None,
+    memberships: list[tuple[int, int]] | None = None,
+) -> dict[int, str]:
+    """Batch form of store_global_state that commits once per call.
+
+    Schedule, failure and membership rows are written in the same
+    transaction (see ``Database.store_verification_batch``).  A handle
+    conflict skips only that user's state, schedule and membership rows.
+
+    Returns:
+        {user_id: reason} for states that were not persisted.
+
+    Raises:
+        RuntimeError: If any state has an error (route those through
+            ``failures`` instead).
+    """
+    from services.db.database import Database
+
+    for state in states:
+        if state.error:
+            raise RuntimeError(
+                f"Refusing to persist error state for user {state.user_id}: {state.error}. "
+                "Use handle_recheck_failure() for error states."
+            )
+
+    if states:
+        logger.info(
+            "Persisting verification state batch",
+            extra={
+                "count": len(states),
+                "schedules": len(schedules or []),
+                "failures": len(failures or []),
+            },
+        )
+
+    conflicts = await Database.store_verification_batch(
+        [
+            (
+                state.user_id,
+                {
+                    "rsi_handle": state.rsi_handle,
+                    "main_orgs": state.main_orgs,
+                    "affiliate_orgs": state.affiliate_orgs,
+                    "community_moniker": state.community_moniker,
+                    "last_updated": state.checked_at,
+                },
+            )
+            for state in states
+        ],
+        schedules=schedules,
+        failures=failures,
+        memberships=memberships,
+    )
+
+    handles = {state.user_id: state.rsi_handle for state in states}
+    return {
+        user_id: (
+            handle_conflict_reason(handles[user_id], other)
+            if other
+            else f"RSI handle '{handles[user_id]}' could not be stored"
+        )
+        for user_id, other in conflicts.items()
+    }
+
+
 async def get_global_state(user_id: int) -> GlobalVerificationState | None:
     """Load the latest stored global verification state from the database."""
     from services.db.database import Database
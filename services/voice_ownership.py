@@ -0,0 +1,207 @@
+"""
+In-memory index of active voice channel ownership.
+
+VoiceService keeps this index write-through: every path that inserts,
+deletes, orphans or transfers an active ``voice_channels`` row updates the
+index right after its DB write. Writers outside VoiceService notify it
+(``forget_voice_owner`` after member cleanup, the internal API reload after
+web dashboard purges). Voice state updates and owner lookups then read from
+memory only; the database stays the durable copy that the index is loaded
+from on startup and audited (and repaired) against hourly.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+# (voice_channel_id, guild_id, jtc_channel_id, owner_id, created_at)
+OwnershipRow = tuple[int, int, int, int, int | None]
+
+
+@dataclass(slots=True, frozen=True)
+class OwnedChannel:
+    """One active managed voice channel."""
+
+    voice_channel_id: int
+    guild_id: int
+    jtc_channel_id: int
+    owner_id: int
+    created_at: int
+
+    @classmethod
+    def from_row(cls, row: OwnershipRow) -> "OwnedChannel":
+        voice_channel_id, guild_id, jtc_channel_id, owner_id, created_at = row
+        return cls(
+            voice_channel_id=int(voice_channel_id),
+            guild_id=int(guild_id),
+            jtc_channel_id=int(jtc_channel_id),
+            owner_id=int(owner_id),
+            created_at=int(created_at or 0),
+        )
+
+
+class VoiceOwnershipIndex:
+    """
+    Two-way index over active managed channels.
+
+    ``channel_id -> OwnedChannel`` answers "is this channel managed / who owns
+    it", ``(guild_id, owner_id) -> channel ids`` answers "which channels does
+    this user own". Lookups that the SQL used to answer with
+    ``ORDER BY created_at DESC LIMIT 1`` return the newest channel first.
+
+    The index is not thread-safe; all mutation happens on the event loop.
+    """
+
+    __slots__ = ("_by_channel", "_by_owner", "loaded")
+
+    def __init__(self) -> None:
+        self._by_channel: dict[int, OwnedChannel] = {}
+        self._by_owner: dict[tuple[int, int], set[int]] = {}
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._by_channel)
+
+    def __contains__(self, channel_id: object) -> bool:
+        return channel_id in self._by_channel
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def load(self, rows: Iterable[OwnershipRow]) -> None:
+        """Replace the whole index with ``rows`` from the database."""
+        self._by_channel.clear()
+        self._by_owner.clear()
+        for row in rows:
+            self.upsert(OwnedChannel.from_row(row))
+        self.loaded = True
+
+    def upsert(self, record: OwnedChannel) -> None:
+        """Insert or replace the entry for ``record.voice_channel_id``."""
+        self.remove(record.voice_channel_id)
+        self._by_channel[record.voice_channel_id] = record
+        self._by_owner.setdefault((record.guild_id, record.owner_id), set()).add(
+            record.voice_channel_id
+        )
+
+    def remove(self, channel_id: int) -> OwnedChannel | None:
+        """Drop a channel; returns the removed entry, if any."""
+        record = self._by_channel.pop(channel_id, None)
+        if record is None:
+            return None
+        key = (record.guild_id, record.owner_id)
+        owned = self._by_owner.get(key)
+        if owned is not None:
+            owned.discard(channel_id)
+            if not owned:
+                del self._by_owner[key]
+        return record
+
+    def set_owner(self, channel_id: int, owner_id: int) -> OwnedChannel | None:
+        """Move a channel to a new owner (transfer, claim or orphan)."""
+        record = self._by_channel.get(channel_id)
+        if record is None:
+            return None
+        updated = OwnedChannel(
+            voice_channel_id=record.voice_channel_id,
+            guild_id=record.guild_id,
+            jtc_channel_id=record.jtc_channel_id,
+            owner_id=owner_id,
+            created_at=record.created_at,
+        )
+        self.upsert(updated)
+        return updated
+
+    def remove_owner(self, owner_id: int, guild_id: int | None = None) -> list[int]:
+        """Drop every channel owned by ``owner_id`` (optionally in one guild)."""
+        keys = [
+            key
+            for key in self._by_owner
+            if key[1] == owner_id and (guild_id is None or key[0] == guild_id)
+        ]
+        removed: list[int] = []
+        for key in keys:
+            for channel_id in list(self._by_owner.get(key, ())):
+                self.remove(channel_id)
+                removed.append(channel_id)
+        return removed
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def get(self, channel_id: int) -> OwnedChannel | None:
+        return self._by_channel.get(channel_id)
+
+    def owned_by(
+        self, guild_id: int, owner_id: int, jtc_channel_id: int | None = None
+    ) -> list[OwnedChannel]:
+        """Channels a user owns in a guild, newest first."""
+        records = [
+            self._by_channel[channel_id]
+            for channel_id in self._by_owner.get((guild_id, owner_id), ())
+        ]
+        if jtc_channel_id is not None:
+            records = [r for r in records if r.jtc_channel_id == jtc_channel_id]
+        return _newest_first(records)
+
+    def latest_owned(
+        self, guild_id: int, owner_id: int, jtc_channel_id: int | None = None
+    ) -> OwnedChannel | None:
+        """Newest channel a user owns in a guild (optionally for one JTC)."""
+        records = self.owned_by(guild_id, owner_id, jtc_channel_id)
+        return records[0] if records else None
+
+    def in_guild(
+        self, guild_id: int, jtc_channel_ids: Iterable[int] | None = None
+    ) -> list[OwnedChannel]:
+        """All channels in a guild (optionally limited to some JTCs), newest first."""
+        wanted = set(jtc_channel_ids) if jtc_channel_ids is not None else None
+        return _newest_first(
+            record
+            for record in self._by_channel.values()
+            if record.guild_id == guild_id
+            and (wanted is None or record.jtc_channel_id in wanted)
+        )
+
+    # ------------------------------------------------------------------
+    # Consistency
+    # ------------------------------------------------------------------
+
+    def diff(self, rows: Iterable[OwnershipRow]) -> dict[str, Any]:
+        """
+        Compare the index against authoritative DB rows.
+
+        Returns channel ids present only in the DB (``missing``), only in the
+        index (``stale``) and present in both with different fields
+        (``mismatched``).
+        """
+        expected = {
+            record.voice_channel_id: record
+            for record in map(OwnedChannel.from_row, rows)
+        }
+        missing = sorted(set(expected) - set(self._by_channel))
+        stale = sorted(set(self._by_channel) - set(expected))
+        mismatched = sorted(
+            channel_id
+            for channel_id, record in expected.items()
+            if channel_id in self._by_channel
+            and self._by_channel[channel_id] != record
+        )
+        return {
+            "db_rows": len(expected),
+            "indexed": len(self._by_channel),
+            "missing": missing,
+            "stale": stale,
+            "mismatched": mismatched,
+            "consistent": not (missing or stale or mismatched),
+        }
+
+
+def _newest_first(records: Iterable[OwnedChannel]) -> list[OwnedChannel]:
+    return sorted(
+        records,
+        key=lambda r: (r.created_at, r.voice_channel_id),
+        reverse=True,
+    )
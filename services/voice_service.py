@@ -6,7 +6,7 @@ import asyncio
 import contextlib
 import sqlite3
 import time
-from collections.abc import Coroutine, Iterable
+from collections.abc import Coroutine, Iterable, Sequence
 from inspect import isawaitable
 from typing import TYPE_CHECKING, Any, ClassVar, cast
 
@@ -14,15 +14,22 @@ import discord  # type: ignore[import-not-found]
 
 from helpers.discord_api import delete_channel
 from helpers.embeds import EmbedColors
-from helpers.task_queue import enqueue_task
+from helpers.task_queue import Priority, enqueue_task
 from helpers.voice_permissions import enforce_permission_changes
-from helpers.voice_settings import get_voice_settings_snapshots
+from helpers.voice_settings import (
+    build_voice_settings_snapshot,
+    fetch_voice_channel_metadata,
+    fetch_voice_settings_bulk,
+    get_voice_settings_snapshots,
+    resolve_target_names_bulk,
+)
 from services.db.database import Database
 from services.db.repository import BaseRepository
-from utils.types import VoiceChannelInfo, VoiceChannelResult
+from utils.types import VoiceChannelInfo, VoiceChannelResult, VoiceSettingsScope
 
 from .base import BaseService
 from .config_service import ConfigService
+from .voice_ownership import OwnedChannel, VoiceOwnershipIndex
 
 if TYPE_CHECKING:
     from utils.types import VoiceSettingsSnapshot
@@ -46,6 +53,11 @@ class VoiceService(BaseService):
 
     # Owner ID used to mark channels as orphaned (no owner)
     ORPHAN_OWNER_ID = 0
+    # Row shape consumed by VoiceOwnershipIndex.load / .diff
+    _OWNERSHIP_ROWS_QUERY = (
+        "SELECT voice_channel_id, guild_id, jtc_channel_id, owner_id, created_at "
+        "FROM voice_channels WHERE is_active = 1"
+    )
     # Seconds to keep users marked as creating (prevents duplicate events)
     CREATION_UNMARK_DELAY_SECONDS = 2.0
     # Seconds before stale creation locks are cleaned up
@@ -54,6 +66,8 @@ class VoiceService(BaseService):
     CHANNEL_CREATION_TIMEOUT_SECONDS = 10.0
     # Days before inactive voice channels are purged (7 days)
     INACTIVE_CHANNEL_PURGE_DAYS = 7
+    # Guilds reconciled concurrently on startup (voice.reconcile_guild_concurrency)
+    RECONCILE_GUILD_CONCURRENCY = 4
     # Critical bot permissions that must be present on a newly created channel
     # to avoid lockout while still inheriting JTC/category permissions.
     #
@@ -95,6 +109,11 @@ class VoiceService(BaseService):
         # Track managed voice channels like the old code
         self.managed_voice_channels: set[int] = set()
 
+        # Write-through mirror of active voice_channels rows. Loaded once in
+        # _load_managed_channels; ownership lookups read from here instead of
+        # querying SQLite on every voice state update.
+        self.ownership_index = VoiceOwnershipIndex()
+
         # Track users currently in the process of creating a channel
         # Keyed by (guild_id, user_id) so hopping between different JTC entry channels
         # cannot trigger parallel creations for the same user
@@ -235,10 +254,10 @@ class VoiceService(BaseService):
             )
 
             async with BaseRepository.transaction() as db:
-                cursor = await db.execute(
-                    "SELECT voice_channel_id FROM voice_channels WHERE is_active = 1"
-                )
-                rows = await cursor.fetchall()
+                cursor = await db.execute(self._OWNERSHIP_ROWS_QUERY)
+                ownership_rows = await cursor.fetchall()
+                self.ownership_index.load(ownership_rows)
+                rows = [(row[0],) for row in ownership_rows]
 
                 loaded_count = 0
                 deferred_count = 0
@@ -290,7 +309,7 @@ class VoiceService(BaseService):
                             f"startup: channel {channel_id} not in cache yet, deferring to reconcile"
                         )
 
-                log_msg = f"Loaded {loaded_count} managed voice channels for later reconciliation; {deferred_count} deferred due to not in cache"
+                log_msg = f"Loaded {loaded_count} managed voice channels for later reconciliation; {deferred_count} deferred due to not in cache; ownership index holds {len(self.ownership_index)} channels"
                 if empty_immediate_count > 0:
                     log_msg += f"; {empty_immediate_count} empty channels immediately cleaned per startup_cleanup_mode"
                 self.logger.info(log_msg)
@@ -337,6 +356,11 @@ class VoiceService(BaseService):
                     deleted_counts = await Database.cleanup_orphaned_jtc_data(
                         guild_id, set(valid_jtc_ids)
                     )
+                    if deleted_counts.get("voice_channels"):
+                        valid_jtc_set = set(valid_jtc_ids)
+                        for record in self.ownership_index.in_guild(guild_id):
+                            if record.jtc_channel_id not in valid_jtc_set:
+                                self.ownership_index.remove(record.voice_channel_id)
 
                     guild_total = sum(deleted_counts.values())
                     if guild_total > 0:
@@ -616,6 +640,7 @@ class VoiceService(BaseService):
                         old_channel_id,
                     ),
                 )
+            self.ownership_index.set_owner(old_channel_id, self.ORPHAN_OWNER_ID)
 
             if isinstance(old_channel, discord.VoiceChannel):
                 return old_channel
@@ -632,6 +657,7 @@ class VoiceService(BaseService):
             "DELETE FROM voice_channels WHERE voice_channel_id = ?",
             (old_channel_id,),
         )
+        self.ownership_index.remove(old_channel_id)
 
         cleanup_target: discord.VoiceChannel | int | None
         cleanup_target = (
@@ -827,6 +853,12 @@ class VoiceService(BaseService):
         Returns:
             Voice channel ID or None if not found
         """
+        if self.ownership_index.loaded:
+            record = self.ownership_index.latest_owned(
+                guild_id, user_id, jtc_channel_id
+            )
+            return record.voice_channel_id if record else None
+
         return await BaseRepository.fetch_value(
             """
             SELECT voice_channel_id FROM voice_channels
@@ -850,6 +882,10 @@ class VoiceService(BaseService):
         Returns:
             Voice channel ID or None if not found
         """
+        if self.ownership_index.loaded:
+            record = self.ownership_index.latest_owned(guild_id, user_id)
+            return record.voice_channel_id if record else None
+
         return await BaseRepository.fetch_value(
             """
             SELECT voice_channel_id FROM voice_channels
@@ -945,6 +981,15 @@ class VoiceService(BaseService):
             """,
             (guild_id, jtc_channel_id, owner_id, voice_channel_id),
         )
+        self.ownership_index.upsert(
+            OwnedChannel(
+                voice_channel_id=voice_channel_id,
+                guild_id=guild_id,
+                jtc_channel_id=jtc_channel_id,
+                owner_id=owner_id,
+                created_at=int(time.time()),
+            )
+        )
 
     async def cleanup_by_channel_id(self, voice_channel_id: int) -> None:
         """Clean up database records for a specific voice channel."""
@@ -966,6 +1011,7 @@ class VoiceService(BaseService):
                 """,
                 (voice_channel_id,),
             )
+        self.ownership_index.remove(voice_channel_id)
 
     async def _purge_inactive_voice_channels(
         self, older_than_seconds: int | None = None
@@ -1018,6 +1064,9 @@ class VoiceService(BaseService):
 
                 await self._cleanup_stale_locks()
 
+                # Also repairs drift from writers outside this process
+                await self.audit_ownership_index()
+
             except asyncio.CancelledError:
                 self.logger.debug("Cleanup task cancelled, exiting gracefully")
                 break
@@ -1049,8 +1098,65 @@ class VoiceService(BaseService):
             "active_voice_channels": active_channels,
             "cooldown_records": cooldown_records,
             "creation_locks": len(self._creation_locks),
+            "ownership_index_size": len(self.ownership_index),
         }
 
+    async def audit_ownership_index(self) -> dict[str, Any]:
+        """Compare the in-memory ownership index with active voice_channels rows.
+
+        The index is write-through, so drift points at a write path that
+        bypassed VoiceService (or a write from the web process whose reload
+        notification was lost). Drift is logged and repaired by reloading the
+        index from the rows just read.
+
+        Returns:
+            The diff from ``VoiceOwnershipIndex.diff``.
+        """
+        rows = await BaseRepository.fetch_all(self._OWNERSHIP_ROWS_QUERY)
+        report = self.ownership_index.diff(rows)
+        if report["consistent"]:
+            self.logger.debug(
+                "Voice ownership index consistent (%s channels)", report["indexed"]
+            )
+        else:
+            self.logger.warning(
+                "Voice ownership index drift: missing=%s stale=%s mismatched=%s",
+                report["missing"],
+                report["stale"],
+                report["mismatched"],
+            )
+            self.ownership_index.load(rows)
+        return report
+
+    async def reload_ownership_index(self) -> int:
+        """Reload the ownership index from the database.
+
+        Used after writes made outside this process (web dashboard purges).
+
+        Returns:
+            Number of channels in the reloaded index.
+        """
+        rows = await BaseRepository.fetch_all(self._OWNERSHIP_ROWS_QUERY)
+        self.ownership_index.load(rows)
+        return len(self.ownership_index)
+
+    def forget_owned_channels(
+        self, owner_id: int, guild_id: int | None = None
+    ) -> list[int]:
+        """Drop an owner's channels from the ownership index.
+
+        Call after deleting the owner's voice_channels rows outside
+        VoiceService (member cleanup).
+
+        Returns:
+            The channel ids removed from the index.
+        """
+        return self.ownership_index.remove_owner(owner_id, guild_id)
+
+    def forget_channel(self, voice_channel_id: int) -> None:
+        """Drop a channel whose row was deactivated outside VoiceService."""
+        self.ownership_index.remove(voice_channel_id)
+
     async def get_jtc_for_owned_channel(
         self, voice_channel_id: int, owner_id: int
     ) -> int | None:
@@ -1064,6 +1170,12 @@ class VoiceService(BaseService):
             The JTC channel ID if the channel is active and owned by the user,
             otherwise ``None``.
         """
+        if self.ownership_index.loaded:
+            record = self.ownership_index.get(voice_channel_id)
+            if record is None or record.owner_id != owner_id:
+                return None
+            return record.jtc_channel_id
+
         return await BaseRepository.fetch_value(
             "SELECT jtc_channel_id FROM voice_channels "
             "WHERE voice_channel_id = ? AND owner_id = ? AND is_active = 1",
@@ -1095,161 +1207,94 @@ class VoiceService(BaseService):
         Returns:
             VoiceSettingsSnapshot or None if no settings found
         """
-        from utils.types import (
-            PermissionOverride,
-            PrioritySpeakerSetting,
-            PTTSetting,
-            SoundboardSetting,
-            VoiceSettingsSnapshot,
-        )
-
-        try:
-            async with BaseRepository.transaction() as db:
-                # Get basic channel settings
-                cursor = await db.execute(
-                    """
-                    SELECT channel_name, user_limit, lock
-                    FROM channel_settings
-                    WHERE guild_id = ? AND jtc_channel_id = ? AND user_id = ?
-                    """,
-                    (guild_id, jtc_channel_id, owner_id),
+        snapshots = await self.get_voice_settings_snapshots_bulk(
+            [
+                VoiceSettingsScope(
+                    guild_id, jtc_channel_id, owner_id, voice_channel_id
                 )
-                row = await cursor.fetchone()
-
-                if not row:
-                    # No settings found
-                    return None
-
-                channel_name, user_limit, lock = row
+            ],
+            guild=guild,
+        )
+        return snapshots[0]
 
-                # Get channel metadata if voice_channel_id provided
-                created_at = None
-                last_activity = None
-                is_active = False
+    async def get_voice_settings_snapshots_bulk(
+        self,
+        scopes: Sequence[VoiceSettingsScope],
+        guild: discord.Guild | None = None,
+    ) -> list["VoiceSettingsSnapshot | None"]:
+        """
+        Get snapshots for many (guild, JTC, owner) scopes in one pass.
 
-                if voice_channel_id:
-                    cursor = await db.execute(
-                        """
-                        SELECT created_at, last_activity, is_active
-                        FROM voice_channels
-                        WHERE voice_channel_id = ? AND owner_id = ?
-                    """,
-                        (voice_channel_id, owner_id),
-                    )
-                    vc_row = await cursor.fetchone()
-                    if vc_row:
-                        created_at, last_activity, is_active = vc_row
-                        is_active = bool(is_active)
+        Settings for every scope come from two queries per chunk (see
+        ``fetch_voice_settings_bulk``) plus one voice_channels lookup for the
+        scopes that carry a ``voice_channel_id``. Target names are resolved
+        once per distinct target when ``guild`` is given, so it should only be
+        passed when all scopes belong to that guild.
 
-                # Get permissions
-                cursor = await db.execute(
-                    """
-                    SELECT target_id, target_type, permission
-                    FROM channel_permissions
-                    WHERE guild_id = ? AND jtc_channel_id = ? AND user_id = ?
-                """,
-                    (guild_id, jtc_channel_id, owner_id),
-                )
-                perm_rows = await cursor.fetchall()
+        Args:
+            scopes: Scopes to load; duplicates are fetched once
+            guild: Optional Discord guild object for name resolution
 
-                # Get PTT settings
-                cursor = await db.execute(
-                    """
-                    SELECT target_id, target_type, ptt_enabled
-                    FROM channel_ptt_settings
-                    WHERE guild_id = ? AND jtc_channel_id = ? AND user_id = ?
-                """,
-                    (guild_id, jtc_channel_id, owner_id),
-                )
-                ptt_rows = await cursor.fetchall()
+        Returns:
+            One snapshot (or None when no settings exist) per scope, in order
+        """
+        try:
+            settings_map = await fetch_voice_settings_bulk(
+                (scope.guild_id, scope.jtc_channel_id, scope.owner_id)
+                for scope in scopes
+            )
+            metadata = await fetch_voice_channel_metadata(
+                [
+                    scope.voice_channel_id
+                    for scope in scopes
+                    if scope.voice_channel_id
+                    and (scope.guild_id, scope.jtc_channel_id, scope.owner_id)
+                    in settings_map
+                ]
+            )
 
-                # Get priority speaker settings
-                cursor = await db.execute(
-                    """
-                    SELECT target_id, target_type, priority_enabled
-                    FROM channel_priority_speaker_settings
-                    WHERE guild_id = ? AND jtc_channel_id = ? AND user_id = ?
-                """,
-                    (guild_id, jtc_channel_id, owner_id),
+            snapshots: list[VoiceSettingsSnapshot | None] = []
+            for scope in scopes:
+                settings = settings_map.get(
+                    (scope.guild_id, scope.jtc_channel_id, scope.owner_id)
                 )
-                priority_rows = await cursor.fetchall()
+                if settings is None:
+                    snapshots.append(None)
+                    continue
 
-                # Get soundboard settings
-                cursor = await db.execute(
-                    """
-                    SELECT target_id, target_type, soundboard_enabled
-                    FROM channel_soundboard_settings
-                    WHERE guild_id = ? AND jtc_channel_id = ? AND user_id = ?
-                """,
-                    (guild_id, jtc_channel_id, owner_id),
+                created_at = last_activity = None
+                is_active = False
+                channel_meta = (
+                    metadata.get(scope.voice_channel_id)
+                    if scope.voice_channel_id
+                    else None
                 )
-                soundboard_rows = await cursor.fetchall()
-
-                # Build snapshot with unresolved names (resolution happens separately)
-                permissions = [
-                    PermissionOverride(
-                        target_id=str(target_id),
-                        target_type=target_type,
-                        permission=permission,
-                    )
-                    for target_id, target_type, permission in perm_rows
-                ]
-
-                ptt_settings = [
-                    PTTSetting(
-                        target_id=str(target_id),
-                        target_type=target_type,
-                        ptt_enabled=bool(ptt_enabled),
-                    )
-                    for target_id, target_type, ptt_enabled in ptt_rows
-                ]
-
-                priority_settings = [
-                    PrioritySpeakerSetting(
-                        target_id=str(target_id),
-                        target_type=target_type,
-                        priority_enabled=bool(priority_enabled),
-                    )
-                    for target_id, target_type, priority_enabled in priority_rows
-                ]
-
-                soundboard_settings = [
-                    SoundboardSetting(
-                        target_id=str(target_id),
-                        target_type=target_type,
-                        soundboard_enabled=bool(soundboard_enabled),
+                if channel_meta and channel_meta[0] == scope.owner_id:
+                    _owner_id, created_at, last_activity, is_active = channel_meta
+
+                snapshots.append(
+                    build_voice_settings_snapshot(
+                        scope.guild_id,
+                        scope.jtc_channel_id,
+                        scope.owner_id,
+                        settings,
+                        voice_channel_id=scope.voice_channel_id,
+                        created_at=created_at,
+                        last_activity=last_activity,
+                        is_active=is_active,
                     )
-                    for target_id, target_type, soundboard_enabled in soundboard_rows
-                ]
-
-                snapshot = VoiceSettingsSnapshot(
-                    guild_id,
-                    jtc_channel_id,
-                    owner_id,
-                    voice_channel_id,
-                    channel_name,
-                    user_limit,
-                    bool(lock),
-                    created_at,
-                    last_activity,
-                    is_active,
-                    permissions,
-                    ptt_settings,
-                    priority_settings,
-                    soundboard_settings,
                 )
 
-                # Resolve names if guild provided
-                if guild:
-                    from helpers.voice_settings import resolve_target_names
-
-                    await resolve_target_names(guild, snapshot)
+            if guild:
+                await resolve_target_names_bulk(
+                    guild, [snapshot for snapshot in snapshots if snapshot]
+                )
 
-                return snapshot
+            return snapshots
 
         except Exception as e:
-            self.logger.exception("Error getting voice settings snapshot", exc_info=e)
-            return None
+            self.logger.exception("Error getting voice settings snapshots", exc_info=e)
+            return [None] * len(scopes)
 
     async def get_user_settings_snapshots(
         self, guild_id: int, user_id: int
@@ -1553,10 +1598,13 @@ class VoiceService(BaseService):
     async def _is_managed_channel(self, channel_id: int) -> bool:
         """Check if a channel is managed by the bot."""
         try:
-            is_managed = await BaseRepository.exists(
-                "SELECT 1 FROM voice_channels WHERE voice_channel_id = ? AND is_active = 1 LIMIT 1",
-                (channel_id,),
-            )
+            if self.ownership_index.loaded:
+                is_managed = channel_id in self.ownership_index
+            else:
+                is_managed = await BaseRepository.exists(
+                    "SELECT 1 FROM voice_channels WHERE voice_channel_id = ? AND is_active = 1 LIMIT 1",
+                    (channel_id,),
+                )
             if self.debug_logging_enabled:
                 self.logger.debug(
                     "Channel %s is %smanaged",
@@ -2433,6 +2481,7 @@ class VoiceService(BaseService):
                     )
 
                 # Insert the new channel atomically
+                now = int(time.time())
                 await db.execute(
                     """
                     INSERT INTO voice_channels
@@ -2444,11 +2493,20 @@ class VoiceService(BaseService):
                         jtc_channel_id,
                         user_id,
                         channel_id,
-                        int(time.time()),
-                        int(time.time()),
+                        now,
+                        now,
                         1,
                     ),
                 )
+                self.ownership_index.upsert(
+                    OwnedChannel(
+                        voice_channel_id=channel_id,
+                        guild_id=guild_id,
+                        jtc_channel_id=jtc_channel_id,
+                        owner_id=user_id,
+                        created_at=now,
+                    )
+                )
 
                 # Context manager auto-commits on success
 
@@ -2604,6 +2662,10 @@ class VoiceService(BaseService):
         DOES NOT create new channels. Only moves users back to existing channels
         if they have one. Users without existing channels must rejoin the JTC
         channel to trigger creation (prevents startup spam and race conditions).
+
+        Guilds are processed concurrently (bounded by
+        ``voice.reconcile_guild_concurrency``); each guild's owned channels are
+        prefetched once and moves go through the task queue as interactive work.
         """
         try:
             # Ensure bot is ready
@@ -2627,129 +2689,206 @@ class VoiceService(BaseService):
                 "Reconciling JTC channel members (no new channel creation)..."
             )
 
-            total_moved = 0
-            total_skipped = 0
-            total_errors = 0
+            started = time.perf_counter()
+            totals = {"moved": 0, "skipped": 0, "errors": 0}
+            semaphore = asyncio.Semaphore(await self._get_reconcile_concurrency())
 
-            # Process each guild the bot is in
-            for guild in self.bot.guilds:
-                try:
-                    # Get JTC channel IDs for this guild
-                    jtc_ids = await self.config_service.get_guild_jtc_channels(guild.id)
+            async def _reconcile_guild(guild: discord.Guild) -> None:
+                async with semaphore:
+                    try:
+                        counts = await self._reconcile_guild_jtc_members(guild)
+                    except Exception as e:
+                        self.logger.exception(
+                            f"Error processing guild {guild.name} ({guild.id}) for JTC reconciliation",
+                            exc_info=e,
+                        )
+                        return
+                    for key, value in counts.items():
+                        totals[key] += value
+
+            guilds = list(self.bot.guilds)
+            await asyncio.gather(*(_reconcile_guild(guild) for guild in guilds))
 
-                    if not jtc_ids:
+            self.logger.info(
+                f"JTC member reconciliation complete in {self._elapsed_ms(started)} ms "
+                f"across {len(guilds)} guilds: {totals['moved']} moved to existing channels, "
+                f"{totals['skipped']} skipped (no existing channel), {totals['errors']} errors"
+            )
+
+        except Exception as e:
+            self.logger.exception("Error during JTC member reconciliation", exc_info=e)
+
+    async def _reconcile_guild_jtc_members(self, guild: discord.Guild) -> dict[str, int]:
+        """Move one guild's JTC lobby members back to their existing channels."""
+        counts = {"moved": 0, "skipped": 0, "errors": 0}
+
+        # Get JTC channel IDs for this guild
+        jtc_ids = await self.config_service.get_guild_jtc_channels(guild.id)
+        if not jtc_ids:
+            return counts
+
+        started = time.perf_counter()
+        owned = await self._prefetch_guild_owned_channels(guild.id, jtc_ids)
+        prefetch_ms = self._elapsed_ms(started)
+
+        pending_moves: list[asyncio.Future] = []
+
+        # Process each JTC channel
+        for jtc_id in jtc_ids:
+            try:
+                # Try to get channel from cache first, then fetch
+                vc = guild.get_channel(jtc_id)
+                if not vc and self.bot:
+                    try:
+                        vc = await self.bot.fetch_channel(jtc_id)
+                    except discord.NotFound:
+                        self.logger.warning(
+                            f"JTC channel {jtc_id} no longer exists in guild {guild.name}"
+                        )
+                        continue
+                    except Exception as e:
+                        self.logger.warning(
+                            f"Failed to fetch JTC channel {jtc_id} in guild {guild.name}: {e}"
+                        )
                         continue
 
-                    # Process each JTC channel
-                    for jtc_id in jtc_ids:
-                        try:
-                            # Try to get channel from cache first, then fetch
-                            vc = guild.get_channel(jtc_id)
-                            if not vc:
-                                try:
-                                    vc = await self.bot.fetch_channel(jtc_id)
-                                except discord.NotFound:
-                                    self.logger.warning(
-                                        f"JTC channel {jtc_id} no longer exists in guild {guild.name}"
-                                    )
-                                    continue
-                                except Exception as e:
-                                    self.logger.warning(
-                                        f"Failed to fetch JTC channel {jtc_id} in guild {guild.name}: {e}"
-                                    )
-                                    continue
+                # Ensure it's a voice channel
+                if not isinstance(vc, discord.VoiceChannel):
+                    self.logger.warning(
+                        f"JTC channel {jtc_id} in guild {guild.name} is not a voice channel"
+                    )
+                    continue
 
-                            # Ensure it's a voice channel
-                            if not isinstance(vc, discord.VoiceChannel):
-                                self.logger.warning(
-                                    f"JTC channel {jtc_id} in guild {guild.name} is not a voice channel"
+                # Use list() to avoid iteration issues during moves
+                for member in list(vc.members):
+                    if member.bot:
+                        continue  # Skip bots
+
+                    try:
+                        existing_channel_id = owned.get((jtc_id, member.id))
+
+                        if not existing_channel_id:
+                            # No existing channel - user must rejoin JTC to create one
+                            if self.debug_logging_enabled:
+                                self.logger.debug(
+                                    f"User {member.display_name} has no existing channel, must rejoin JTC to create"
                                 )
-                                continue
+                            counts["skipped"] += 1
+                            continue
 
-                            # Process each human member in the JTC channel
-                            for member in list(
-                                vc.members
-                            ):  # Use list() to avoid iteration issues during moves
-                                if member.bot:
-                                    continue  # Skip bots
+                        existing_channel = guild.get_channel(existing_channel_id)
+                        if existing_channel and isinstance(
+                            existing_channel, discord.VoiceChannel
+                        ):
+                            pending_moves.append(
+                                await self._enqueue_startup_move(
+                                    guild.id, member, existing_channel
+                                )
+                            )
+                        else:
+                            # Channel in DB but doesn't exist in Discord - clean up
+                            self.logger.info(
+                                f"Cleaning up stale channel reference {existing_channel_id} for user {member.id}"
+                            )
+                            await self.cleanup_by_channel_id(existing_channel_id)
+                            owned.pop((jtc_id, member.id), None)
+                            counts["skipped"] += 1
 
-                                try:
-                                    # Check if user has an existing active channel for this JTC
-                                    existing_channel_id = (
-                                        await BaseRepository.fetch_value(
-                                            """
-                                        SELECT voice_channel_id FROM voice_channels
-                                        WHERE guild_id = ? AND jtc_channel_id = ? AND owner_id = ? AND is_active = 1
-                                        LIMIT 1
-                                        """,
-                                            (guild.id, jtc_id, member.id),
-                                        )
-                                    )
+                    except Exception as e:
+                        self.logger.exception(
+                            f"Failed to reconcile {member.display_name} ({member.id}) in JTC {jtc_id}",
+                            exc_info=e,
+                        )
+                        counts["errors"] += 1
 
-                                    if existing_channel_id:
-                                        existing_channel = guild.get_channel(
-                                            existing_channel_id
-                                        )
-
-                                        if existing_channel and isinstance(
-                                            existing_channel, discord.VoiceChannel
-                                        ):
-                                            # Move user back to their existing channel
-                                            try:
-                                                await member.move_to(existing_channel)
-                                                self.logger.info(
-                                                    f"Moved {member.display_name} back to existing channel {existing_channel.name}"
-                                                )
-                                                total_moved += 1
-                                            except discord.HTTPException as e:
-                                                self.logger.warning(
-                                                    f"Failed to move {member.display_name} to existing channel: {e}"
-                                                )
-                                                total_errors += 1
-                                        else:
-                                            # Channel in DB but doesn't exist in Discord - clean up
-                                            self.logger.info(
-                                                f"Cleaning up stale channel reference {existing_channel_id} for user {member.id}"
-                                            )
-                                            await self.cleanup_by_channel_id(
-                                                existing_channel_id
-                                            )
-                                            total_skipped += 1
-                                    else:
-                                        # No existing channel - user must rejoin JTC to create one
-                                        if self.debug_logging_enabled:
-                                            self.logger.debug(
-                                                f"User {member.display_name} has no existing channel, must rejoin JTC to create"
-                                            )
-                                        total_skipped += 1
+            except Exception as e:
+                self.logger.exception(
+                    f"Error processing JTC channel {jtc_id} in guild {guild.name}",
+                    exc_info=e,
+                )
+                counts["errors"] += 1
 
-                                except Exception as e:
-                                    self.logger.exception(
-                                        f"Failed to reconcile {member.display_name} ({member.id}) in JTC {jtc_id}",
-                                        exc_info=e,
-                                    )
-                                    total_errors += 1
+        started = time.perf_counter()
+        # A failed move resolves its future with the exception; count it
+        for moved in await asyncio.gather(*pending_moves, return_exceptions=True):
+            counts["moved" if moved is True else "errors"] += 1
 
-                        except Exception as e:
-                            self.logger.exception(
-                                f"Error processing JTC channel {jtc_id} in guild {guild.name}",
-                                exc_info=e,
-                            )
-                            total_errors += 1
+        if pending_moves or self.debug_logging_enabled:
+            self.logger.info(
+                f"JTC reconcile guild {guild.id}: prefetched {len(owned)} owned channels "
+                f"in {prefetch_ms} ms, {len(pending_moves)} moves finished in "
+                f"{self._elapsed_ms(started)} ms"
+            )
 
-                except Exception as e:
-                    self.logger.exception(
-                        f"Error processing guild {guild.name} ({guild.id}) for JTC reconciliation",
-                        exc_info=e,
-                    )
+        return counts
+
+    async def _prefetch_guild_owned_channels(
+        self, guild_id: int, jtc_ids: Iterable[int]
+    ) -> dict[tuple[int, int], int]:
+        """Map ``(jtc_channel_id, owner_id)`` to the owner's newest channel in a guild."""
+        jtc_set = set(jtc_ids)
+        if self.ownership_index.loaded:
+            records = self.ownership_index.in_guild(guild_id, jtc_set)
+        else:
+            rows = await BaseRepository.fetch_all(
+                self._OWNERSHIP_ROWS_QUERY
+                + " AND guild_id = ? ORDER BY created_at DESC",
+                (guild_id,),
+            )
+            records = [
+                record
+                for record in map(OwnedChannel.from_row, rows)
+                if record.jtc_channel_id in jtc_set
+            ]
+
+        owned: dict[tuple[int, int], int] = {}
+        for record in records:
+            owned.setdefault(
+                (record.jtc_channel_id, record.owner_id), record.voice_channel_id
+            )
+        return owned
+
+    async def _enqueue_startup_move(
+        self,
+        guild_id: int,
+        member: discord.Member,
+        channel: discord.VoiceChannel,
+    ) -> asyncio.Future:
+        """Queue a move back to ``channel``; the future resolves to whether it succeeded."""
 
+        async def _task() -> bool:
+            try:
+                await member.move_to(channel)
+            except discord.HTTPException as e:
+                self.logger.warning(
+                    f"Failed to move {member.display_name} to existing channel: {e}"
+                )
+                return False
             self.logger.info(
-                f"JTC member reconciliation complete: {total_moved} moved to existing channels, "
-                f"{total_skipped} skipped (no existing channel), {total_errors} errors"
+                f"Moved {member.display_name} back to existing channel {channel.name}"
             )
+            return True
 
-        except Exception as e:
-            self.logger.exception("Error during JTC member reconciliation", exc_info=e)
+        return await enqueue_task(
+            _task,
+            priority=Priority.INTERACTIVE,
+            bucket="member",
+            major_id=guild_id,
+        )
+
+    async def _get_reconcile_concurrency(self) -> int:
+        """Number of guilds startup reconciliation may process at once."""
+        value = await self.config_service.get_global_setting(
+            "voice.reconcile_guild_concurrency", self.RECONCILE_GUILD_CONCURRENCY
+        )
+        try:
+            return max(1, int(value))
+        except (TypeError, ValueError):
+            return self.RECONCILE_GUILD_CONCURRENCY
+
+    @staticmethod
+    def _elapsed_ms(started: float) -> int:
+        return int((time.perf_counter() - started) * 1000)
 
     async def reconcile_all_guilds_on_ready(self) -> None:
         """
@@ -2762,62 +2901,84 @@ class VoiceService(BaseService):
         - If not exists → remove DB row
         - If exists and has members or owner connected → keep and rehydrate management
         - If exists but empty → schedule deletion with delay
+
+        All active rows are read in one query; guilds are then reconciled
+        concurrently (bounded by ``voice.reconcile_guild_concurrency``) while
+        channels inside a guild are handled in order.
         """
         if not self.bot:
             self.logger.warning("Bot instance not available for reconciliation")
             return
+        bot = self.bot
 
         self.logger.info("Starting voice channel reconciliation across all guilds")
 
+        started = time.perf_counter()
         deleted_inactive = await self._purge_inactive_voice_channels()
         if deleted_inactive:
             self.logger.info(
                 f"Purged {deleted_inactive} inactive voice channel rows before reconciliation"
             )
+        purge_ms = self._elapsed_ms(started)
 
-        total_reconciled = 0
-        total_removed = 0
-        total_rehydrated = 0
-        total_scheduled_cleanup = 0
+        totals = {"reconciled": 0, "removed": 0, "rehydrated": 0, "scheduled": 0}
+        rows_by_guild: dict[int, list[tuple[int, int, int, int, int]]] = {}
+        fetch_ms = reconcile_ms = 0
 
         try:
             # Fetch all user voice channels across all guilds
+            started = time.perf_counter()
             all_channels = await BaseRepository.fetch_all(
                 """SELECT guild_id, voice_channel_id, owner_id, jtc_channel_id, created_at
                    FROM voice_channels WHERE is_active = 1""",
             )
+            for row in all_channels:
+                rows_by_guild.setdefault(row[0], []).append(tuple(row))
+            fetch_ms = self._elapsed_ms(started)
 
-            for (
-                guild_id,
-                voice_channel_id,
-                owner_id,
-                jtc_channel_id,
-                created_at,
-            ) in all_channels:
-                try:
-                    await self._reconcile_single_channel(
+            semaphore = asyncio.Semaphore(await self._get_reconcile_concurrency())
+
+            async def _reconcile_guild(
+                rows: list[tuple[int, int, int, int, int]],
+            ) -> None:
+                async with semaphore:
+                    for (
                         guild_id,
                         voice_channel_id,
                         owner_id,
                         jtc_channel_id,
                         created_at,
-                    )
-                    total_reconciled += 1
-
-                    # Track reconciliation results based on what happened
-                    channel = self.bot.get_channel(voice_channel_id)
-                    if not channel:
-                        total_removed += 1
-                    elif voice_channel_id in self.managed_voice_channels:
-                        total_rehydrated += 1
-                    else:
-                        total_scheduled_cleanup += 1
+                    ) in rows:
+                        try:
+                            await self._reconcile_single_channel(
+                                guild_id,
+                                voice_channel_id,
+                                owner_id,
+                                jtc_channel_id,
+                                created_at,
+                            )
+                            totals["reconciled"] += 1
+
+                            # Track reconciliation results based on what happened
+                            channel = bot.get_channel(voice_channel_id)
+                            if not channel:
+                                totals["removed"] += 1
+                            elif voice_channel_id in self.managed_voice_channels:
+                                totals["rehydrated"] += 1
+                            else:
+                                totals["scheduled"] += 1
 
-                except Exception as e:
-                    self.logger.exception(
-                        f"Error reconciling channel {voice_channel_id} (guild {guild_id})",
-                        exc_info=e,
-                    )
+                        except Exception as e:
+                            self.logger.exception(
+                                f"Error reconciling channel {voice_channel_id} (guild {guild_id})",
+                                exc_info=e,
+                            )
+
+            started = time.perf_counter()
+            await asyncio.gather(
+                *(_reconcile_guild(rows) for rows in rows_by_guild.values())
+            )
+            reconcile_ms = self._elapsed_ms(started)
 
         except Exception as e:
             self.logger.exception(
@@ -2825,8 +2986,10 @@ class VoiceService(BaseService):
             )
 
         self.logger.info(
-            f"Voice channel reconciliation complete: {total_reconciled} channels processed, "
-            f"{total_removed} removed, {total_rehydrated} rehydrated, {total_scheduled_cleanup} scheduled for cleanup"
+            f"Voice channel reconciliation complete: {totals['reconciled']} channels processed "
+            f"across {len(rows_by_guild)} guilds, {totals['removed']} removed, "
+            f"{totals['rehydrated']} rehydrated, {totals['scheduled']} scheduled for cleanup "
+            f"(purge {purge_ms} ms, fetch {fetch_ms} ms, reconcile {reconcile_ms} ms)"
         )
 
     async def _reconcile_single_channel(
@@ -3215,6 +3378,7 @@ class VoiceService(BaseService):
 
         if not success:
             return VoiceChannelResult(success=False, error="DB_TEMP_ERROR")
+        self.ownership_index.set_owner(channel.id, new_owner_id)
 
         await update_channel_owner(
             channel=channel,
@@ -3599,8 +3763,12 @@ class VoiceService(BaseService):
             )
 
         try:
-            # enqueue_task is annotated to return None but actually returns a Future
-            future = await enqueue_task(_task)  # type: ignore[func-returns-value]
+            future = await enqueue_task(
+                _task,
+                priority=Priority.INTERACTIVE,
+                bucket="channel_create",
+                major_id=category.guild.id,
+            )
             if isinstance(future, asyncio.Future):
                 return await asyncio.shield(future)
             return None
@@ -3741,6 +3909,8 @@ class VoiceService(BaseService):
             result["db_purge"] = await Database.purge_stale_jtc_data(
                 guild_id, {channel_id}
             )
+            for record in self.ownership_index.in_guild(guild_id, [channel_id]):
+                self.ownership_index.remove(record.voice_channel_id)
 
             self.logger.info(
                 f"JTC channel {channel_id} removal complete for guild {guild_id}: "
@@ -3977,6 +4147,11 @@ class VoiceService(BaseService):
 
         # Purge database records
         deleted_counts = await Database.purge_voice_data(guild_id, user_id)
+        if user_id is None:
+            for record in self.ownership_index.in_guild(guild_id):
+                self.ownership_index.remove(record.voice_channel_id)
+        else:
+            self.ownership_index.remove_owner(user_id, guild_id)
 
         # Clear cache entries for affected channels
         for channel_id in managed_channels:
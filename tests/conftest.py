@@ -19,6 +19,16 @@ from services.voice_service import VoiceService
 from tests.test_helpers import FakeInteraction, FakeUser
 
 
+@pytest.fixture(autouse=True)
+def fresh_rate_limit_engine():
+    """Give every test its own in-memory rate limit counters."""
+    from helpers.rate_limiter import RateLimitEngine
+
+    RateLimitEngine.reset_instance()
+    yield
+    RateLimitEngine.reset_instance()
+
+
 @pytest.fixture
 def mock_bot():
     """A minimal bot-like object for cogs/views tests."""
@@ -101,6 +111,7 @@ def mock_db_connection():
     with (
         patch("services.voice_service.Database.get_connection") as mock_db1,
         patch("services.db.database.Database.get_connection") as mock_db2,
+        patch("services.db.database.Database.get_read_connection", mock_db2),
     ):
         mock_db1.return_value.__aenter__.return_value = helper.mock_conn
         mock_db2.return_value.__aenter__.return_value = helper.mock_conn
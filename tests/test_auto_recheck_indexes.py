@@ -0,0 +1,65 @@
+"""
+Test that auto-recheck scheduling is served by the due-queue index.
+"""
+
+import time
+
+import pytest
+
+from services.db.database import (
+    DUE_AUTO_RECHECKS_COUNT_SQL,
+    DUE_AUTO_RECHECKS_SQL,
+    Database,
+)
+
+
+@pytest.mark.asyncio
+async def test_due_query_is_index_range_scan(temp_db) -> None:
+    """The due query walks idx_auto_recheck_due without scanning or sorting."""
+    async with Database.get_connection() as db:
+        cursor = await db.execute(
+            "EXPLAIN QUERY PLAN " + DUE_AUTO_RECHECKS_SQL, (int(time.time()), 50)
+        )
+        plan = " | ".join(str(row[3]) for row in await cursor.fetchall())
+
+    assert "COVERING INDEX idx_auto_recheck_due" in plan, plan
+    assert "SCAN" not in plan, plan
+    assert "TEMP B-TREE" not in plan, plan
+
+
+@pytest.mark.asyncio
+async def test_backlog_count_stays_inside_due_index(temp_db) -> None:
+    """Counting the backlog never touches the verification table."""
+    async with Database.get_connection() as db:
+        cursor = await db.execute(
+            "EXPLAIN QUERY PLAN " + DUE_AUTO_RECHECKS_COUNT_SQL, (int(time.time()),)
+        )
+        plan = " | ".join(str(row[3]) for row in await cursor.fetchall())
+
+    assert "COVERING INDEX idx_auto_recheck_due" in plan, plan
+    assert "verification" not in plan, plan
+    assert "SCAN" not in plan, plan
+
+
+@pytest.mark.asyncio
+async def test_verified_users_are_queued_by_trigger(temp_db) -> None:
+    """New verification rows are immediately due; flagged users are skipped."""
+    now = int(time.time())
+    async with Database.get_connection() as db:
+        await db.executemany(
+            "INSERT INTO verification (user_id, rsi_handle, last_updated) "
+            "VALUES (?, ?, 1)",
+            [(1, "one"), (2, "two"), (3, "three")],
+        )
+        await db.commit()
+
+    await Database.upsert_auto_recheck_success(3, next_retry_at=now + 3600, now=now)
+    await Database.flag_needs_reverify(2, now)
+    await Database.unschedule_auto_recheck(2)
+
+    assert await Database.get_due_auto_rechecks(now, 10) == [(1, "one")]
+    assert await Database.count_due_auto_rechecks(now) == 1
+
+    # Clearing the flag puts the user back in the queue
+    await Database.clear_needs_reverify(2)
+    assert await Database.get_due_auto_rechecks(now, 10) == [(1, "one"), (2, "two")]
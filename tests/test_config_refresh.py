@@ -77,3 +77,98 @@ async def test_maybe_refresh_guild_force_refreshes_without_version_change(temp_d
     assert service._guild_versions[guild_id] == "same"
 
     await service.shutdown()
+
+
+async def _write_setting(guild_id: int, key: str, value) -> None:
+    async with Database.get_connection() as db:
+        await db.execute(
+            """
+            INSERT OR REPLACE INTO guild_settings (guild_id, key, value)
+            VALUES (?, ?, ?)
+            """,
+            (guild_id, key, json.dumps(value)),
+        )
+        await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_apply_invalidation_reloads_only_pushed_keys(temp_db):
+    service = ConfigService()
+    await service.initialize()
+
+    guild_id = 987
+    await _write_setting(guild_id, "roles.main_role", ["1"])
+    await _write_setting(guild_id, "channels.bot_spam_channel_id", 10)
+    await _write_setting(guild_id, SETTINGS_VERSION_KEY, {"version": "v1"})
+    await service.get_guild_setting(guild_id, "roles.main_role")
+
+    await _write_setting(guild_id, "roles.main_role", ["2"])
+    await _write_setting(guild_id, "channels.bot_spam_channel_id", 20)
+    await _write_setting(guild_id, SETTINGS_VERSION_KEY, {"version": "v2"})
+
+    refreshed = await service.apply_invalidation(
+        guild_id, version="v2", keys=["roles.main_role"]
+    )
+    assert refreshed is True
+    assert service.get_cached(guild_id, "roles.main_role") == ["2"]
+    # Keys outside the notification keep their cached value
+    assert service.get_cached(guild_id, "channels.bot_spam_channel_id") == 10
+    # Only a full reload advances the version the stale-guild poll compares
+    assert service._guild_versions[guild_id] == "v1"
+
+    # A repeated notification for the same version is a no-op
+    assert await service.apply_invalidation(guild_id, version="v2") is False
+
+    await service.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_stale_guild_poll_recovers_keys_from_a_dropped_push(temp_db):
+    service = ConfigService()
+    await service.initialize()
+
+    guild_id = 988
+    await _write_setting(guild_id, "roles.main_role", ["1"])
+    await _write_setting(guild_id, "channels.bot_spam_channel_id", 10)
+    await _write_setting(guild_id, SETTINGS_VERSION_KEY, {"version": "v1"})
+    await service.get_guild_setting(guild_id, "roles.main_role")
+
+    # v2 changes the channel, but its notification never arrives
+    await _write_setting(guild_id, "channels.bot_spam_channel_id", 20)
+    await _write_setting(guild_id, SETTINGS_VERSION_KEY, {"version": "v2"})
+    # v3 changes the role and is pushed with its keys
+    await _write_setting(guild_id, "roles.main_role", ["2"])
+    await _write_setting(guild_id, SETTINGS_VERSION_KEY, {"version": "v3"})
+    assert await service.apply_invalidation(
+        guild_id, version="v3", keys=["roles.main_role"]
+    )
+    assert service.get_cached(guild_id, "roles.main_role") == ["2"]
+    assert service.get_cached(guild_id, "channels.bot_spam_channel_id") == 10
+
+    # The fallback poll still sees the guild as behind and reloads it in full
+    assert await service.refresh_stale_guilds([guild_id]) == [guild_id]
+    assert service.get_cached(guild_id, "channels.bot_spam_channel_id") == 20
+    assert service._guild_versions[guild_id] == "v3"
+    assert await service.refresh_stale_guilds([guild_id]) == []
+
+    await service.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_refresh_stale_guilds_reloads_changed_versions_only(temp_db):
+    service = ConfigService()
+    await service.initialize()
+
+    for guild_id in (1, 2):
+        await _write_setting(guild_id, SETTINGS_VERSION_KEY, {"version": "v1"})
+        await service.get_guild_setting(guild_id, "roles.main_role")
+
+    await _write_setting(2, SETTINGS_VERSION_KEY, {"version": "v2"})
+
+    # Guild 3 was never loaded, so it has nothing stale to reload
+    assert await service.refresh_stale_guilds([1, 2, 3]) == [2]
+    assert service._guild_versions[2] == "v2"
+    assert not service.is_guild_cached(3)
+    assert await service.refresh_stale_guilds([1, 2, 3]) == []
+
+    await service.shutdown()
@@ -2,11 +2,11 @@
 Unit tests for ConfigService.get method.
 """
 
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from services.config_service import ConfigService
+from services.config_service import ConfigService, GuildSettingsSnapshot
 
 
 @pytest.fixture
@@ -208,3 +208,59 @@ class TestConfigServiceGet:
 
         # Should find "global_default" from the global config
         assert result == "global_default"
+
+
+class TestConfigServiceGetCached:
+    """Test cases for the synchronous snapshot read path."""
+
+    @pytest.mark.asyncio
+    async def test_get_cached_matches_async_lookup(self, config_service):
+        """get_cached resolves guild, nested and global keys like get_guild_setting."""
+        config_service._guild_cache[123] = GuildSettingsSnapshot(
+            {"simple_key": "direct", "voice": {"cooldown_seconds": "120"}},
+            config_service._global_config,
+        )
+
+        for key in ("simple_key", "voice.cooldown_seconds", "voice.user_limit"):
+            assert config_service.get_cached(
+                123, key
+            ) == await config_service.get_guild_setting(123, key)
+        assert config_service.get_cached(123, "test.nested.value") == "global_default"
+        assert config_service.get_cached(123, "missing.key", "fallback") == "fallback"
+
+    def test_get_cached_returns_default_for_unloaded_guild(self, config_service):
+        """Guilds without a snapshot never fall through to global config."""
+        assert not config_service.is_guild_cached(999)
+        assert config_service.get_cached(999, "voice.user_limit", "unset") == "unset"
+
+    @pytest.mark.asyncio
+    async def test_get_cached_does_not_wait_for_cache_lock(self, config_service):
+        """Reads come from the snapshot even while a writer holds the cache lock."""
+        config_service._guild_cache[123] = GuildSettingsSnapshot(
+            {"roles.bot_admins": [1, 2, 3], "voice": {"cooldown_seconds": 30}},
+            config_service._global_config,
+        )
+
+        async with config_service._cache_lock:
+            assert config_service.get_cached(123, "roles.bot_admins") == [1, 2, 3]
+            assert config_service.get_cached(123, "voice.cooldown_seconds") == 30
+            assert config_service.get_cached(123, "voice.user_limit") == "5"
+
+    @pytest.mark.asyncio
+    async def test_set_guild_setting_swaps_snapshot(self, config_service):
+        """Writes replace the snapshot instead of mutating the one readers hold."""
+        original = GuildSettingsSnapshot(
+            {"voice": {"cooldown_seconds": "120"}}, config_service._global_config
+        )
+        config_service._guild_cache[123] = original
+
+        with patch(
+            "services.config_service.BaseRepository.execute", AsyncMock()
+        ) as mock_execute:
+            await config_service.set_guild_setting(123, "voice.user_limit", 9)
+
+        mock_execute.assert_awaited_once()
+        assert config_service._guild_cache[123] is not original
+        assert "voice.user_limit" not in original
+        assert original.resolve("voice.user_limit", config_service._global_config) == "5"
+        assert config_service.get_cached(123, "voice.user_limit") == 9
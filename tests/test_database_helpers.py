@@ -23,3 +23,44 @@ async def test_database_initialize_and_tables(temp_db) -> None:
         await Database.reset_rate_limit(1, "verification")
         row = await Database.fetch_rate_limit(1, "verification")
         assert row is None
+
+
+@pytest.mark.asyncio
+async def test_store_verification_batch_skips_handle_conflicts(temp_db) -> None:
+    """A handle owned by another user is skipped without aborting the batch."""
+    async with Database.get_connection() as db:
+        await db.execute(
+            "INSERT INTO verification(user_id, rsi_handle, last_updated) VALUES (?,?,?)",
+            (1, "Taken", 0),
+        )
+        await db.commit()
+
+    conflicts = await Database.store_verification_batch(
+        [
+            (2, {"rsi_handle": "taken", "main_orgs": ["TEST"], "last_updated": 5}),
+            (3, {"rsi_handle": "Free", "main_orgs": ["TEST"], "last_updated": 5}),
+        ],
+        schedules=[(2, 100), (3, 200)],
+        failures=[(4, 300, "boom")],
+        memberships=[(2, 42), (3, 42)],
+        now=10,
+    )
+
+    assert conflicts == {2: 1}
+    async with Database.get_connection() as db:
+        cursor = await db.execute(
+            "SELECT user_id, rsi_handle FROM verification ORDER BY user_id"
+        )
+        rows = await cursor.fetchall()
+        assert [tuple(r) for r in rows] == [(1, "Taken"), (3, "Free")]
+        cursor = await db.execute(
+            "SELECT user_id, next_retry_at, last_error FROM auto_recheck_state "
+            "WHERE user_id IN (2, 3, 4) ORDER BY user_id"
+        )
+        rows = await cursor.fetchall()
+        assert [tuple(r) for r in rows] == [(3, 200, None), (4, 300, "boom")]
+        cursor = await db.execute(
+            "SELECT user_id, guild_id FROM user_guild_membership ORDER BY user_id"
+        )
+        rows = await cursor.fetchall()
+        assert [tuple(r) for r in rows] == [(3, 42)]
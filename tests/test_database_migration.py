@@ -67,3 +67,148 @@ async def test_init_schema_backfills_legacy_ticket_categories_channel_id() -> No
         )
         index_columns = [row[2] for row in await cursor.fetchall()]
         assert index_columns == ["guild_id", "channel_id"]
+
+
+async def _org_rows(db: aiosqlite.Connection) -> list[tuple]:
+    cursor = await db.execute(
+        "SELECT user_id, org_sid, kind FROM verification_org_membership "
+        "ORDER BY user_id, kind, org_sid"
+    )
+    return [tuple(row) for row in await cursor.fetchall()]
+
+
+@pytest.mark.asyncio
+async def test_init_schema_backfills_org_membership_index() -> None:
+    async with aiosqlite.connect(":memory:") as db:
+        await db.execute(
+            """
+            CREATE TABLE verification (
+                user_id INTEGER PRIMARY KEY,
+                rsi_handle TEXT NOT NULL UNIQUE,
+                last_updated INTEGER DEFAULT 0,
+                needs_reverify INTEGER DEFAULT 0,
+                community_moniker TEXT,
+                main_orgs TEXT DEFAULT NULL,
+                affiliate_orgs TEXT DEFAULT NULL
+            )
+            """
+        )
+        await db.execute(
+            "INSERT INTO verification (user_id, rsi_handle, main_orgs, affiliate_orgs) "
+            "VALUES (1, 'a', '[\"test\"]', '[\"ALLY\", \"REDACTED\"]'), "
+            "(2, 'b', 'bad', NULL)"
+        )
+        await db.commit()
+
+        await init_schema(db)
+        await init_schema(db)
+
+        assert await _org_rows(db) == [(1, "ALLY", "affiliate"), (1, "TEST", "main")]
+
+
+@pytest.mark.asyncio
+async def test_org_membership_index_follows_verification_writes() -> None:
+    async with aiosqlite.connect(":memory:") as db:
+        await init_schema(db)
+
+        await db.execute(
+            "INSERT INTO verification (user_id, rsi_handle, main_orgs, affiliate_orgs) "
+            "VALUES (1, 'a', '[\"TEST\"]', '[]'), (2, 'b', '[]', '[\"TEST\"]')"
+        )
+        await db.execute(
+            "INSERT INTO verification (user_id, rsi_handle, main_orgs, affiliate_orgs) "
+            "VALUES (1, 'a', '[\"OTHER\"]', '[]') "
+            "ON CONFLICT(user_id) DO UPDATE SET main_orgs = excluded.main_orgs"
+        )
+        await db.execute(
+            "INSERT OR REPLACE INTO verification "
+            "(user_id, rsi_handle, main_orgs, affiliate_orgs) "
+            "VALUES (2, 'b', NULL, '[\"ALLY\"]')"
+        )
+        assert await _org_rows(db) == [(1, "OTHER", "main"), (2, "ALLY", "affiliate")]
+
+        await db.execute("DELETE FROM verification WHERE user_id = 1")
+        assert await _org_rows(db) == [(2, "ALLY", "affiliate")]
+
+
+@pytest.mark.asyncio
+async def test_verification_search_index_tracks_handle_changes() -> None:
+    async with aiosqlite.connect(":memory:") as db:
+        await init_schema(db)
+
+        async def _match(term: str) -> list[int]:
+            cursor = await db.execute(
+                "SELECT rowid FROM verification_search "
+                "WHERE verification_search MATCH ? ORDER BY rowid",
+                (f'"{term}"',),
+            )
+            return [row[0] for row in await cursor.fetchall()]
+
+        await db.execute(
+            "INSERT INTO verification (user_id, rsi_handle, community_moniker) "
+            "VALUES (1, 'AlphaWolf', 'Pack Leader'), (2, 'BetaFox', NULL)"
+        )
+        assert await _match("alpha") == [1]
+        assert await _match("leade") == [1]
+
+        await db.execute(
+            "UPDATE verification SET rsi_handle = 'Omega' WHERE user_id = 1"
+        )
+        await db.execute(
+            "INSERT OR REPLACE INTO verification (user_id, rsi_handle) "
+            "VALUES (2, 'GammaRay')"
+        )
+        assert await _match("alpha") == []
+        assert await _match("betafox") == []
+        assert await _match("mega") == [1]
+        assert await _match("gamma") == [2]
+
+
+@pytest.mark.asyncio
+async def test_init_schema_backfills_auto_recheck_queue() -> None:
+    async with aiosqlite.connect(":memory:") as db:
+        await db.execute(
+            """
+            CREATE TABLE verification (
+                user_id INTEGER PRIMARY KEY,
+                rsi_handle TEXT NOT NULL UNIQUE,
+                last_updated INTEGER DEFAULT 0,
+                needs_reverify INTEGER DEFAULT 0,
+                community_moniker TEXT,
+                main_orgs TEXT DEFAULT NULL,
+                affiliate_orgs TEXT DEFAULT NULL
+            )
+            """
+        )
+        await db.execute(
+            """
+            CREATE TABLE auto_recheck_state (
+                user_id INTEGER PRIMARY KEY,
+                last_auto_recheck INTEGER DEFAULT 0,
+                next_retry_at INTEGER DEFAULT 0,
+                fail_count INTEGER DEFAULT 0,
+                last_error TEXT
+            )
+            """
+        )
+        await db.execute(
+            "INSERT INTO verification (user_id, rsi_handle, needs_reverify) "
+            "VALUES (1, 'a', 0), (2, 'b', 1), (3, 'c', 0)"
+        )
+        await db.execute(
+            "INSERT INTO auto_recheck_state (user_id, next_retry_at) VALUES (3, 50)"
+        )
+        await db.commit()
+
+        await init_schema(db)
+        await init_schema(db)
+
+        cursor = await db.execute(
+            "SELECT user_id, next_retry_at, needs_reverify "
+            "FROM auto_recheck_state ORDER BY user_id"
+        )
+        assert [tuple(row) for row in await cursor.fetchall()] == [
+            (1, 0, 0),
+            (2, 0, 1),
+            (3, 50, 0),
+        ]
@@ -0,0 +1,263 @@
+"""
+Tests for the pooled SQLite connections behind Database.get_connection.
+"""
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from services.db.database import Database
+from services.db.pool import SQLitePool
+from services.db.repository import BaseRepository
+
+
+@pytest.mark.asyncio
+async def test_writer_connection_is_reused(temp_db) -> None:
+    """Consecutive writer leases share one long-lived connection."""
+    # Act
+    async with Database.get_connection() as first:
+        pass
+    async with Database.get_connection() as second:
+        pass
+
+    # Assert
+    assert first is second
+    stats = Database.pool_stats()
+    assert stats["connections_opened"] == 1
+    assert stats["writer_leases"] == 2
+
+
+@pytest.mark.asyncio
+async def test_sequential_lookups_share_one_reader(temp_db) -> None:
+    """Hot-path lookups reuse a pooled reader instead of connecting per call."""
+    async with Database.get_connection() as db:
+        await db.execute(
+            "INSERT INTO voice_channels (guild_id, jtc_channel_id, owner_id, "
+            "voice_channel_id, created_at, last_activity, is_active) "
+            "VALUES (1, 10, 5, 1000, 0, 0, 1)"
+        )
+        await db.commit()
+    opened = Database.pool_stats()["connections_opened"]
+
+    found = [
+        await BaseRepository.exists(
+            "SELECT 1 FROM voice_channels "
+            "WHERE guild_id = ? AND voice_channel_id = ? AND is_active = 1",
+            (1, channel_id),
+        )
+        for channel_id in (1000, 1001) * 25
+    ]
+
+    assert found == [True, False] * 25
+    stats = Database.pool_stats()
+    assert stats["reader_leases"] == 50
+    assert stats["connections_opened"] - opened == 1
+    assert stats["transient_connections"] == 0
+
+
+@pytest.mark.asyncio
+async def test_read_connection_rejects_writes(temp_db) -> None:
+    """Reader connections are query_only so writes cannot bypass the writer."""
+    async with Database.get_read_connection() as db:
+        with pytest.raises(sqlite3.OperationalError):
+            await db.execute(
+                "INSERT INTO verification(user_id, rsi_handle, last_updated) "
+                "VALUES (1, 'x', 0)"
+            )
+
+
+@pytest.mark.asyncio
+async def test_uncommitted_writes_rolled_back_on_release(temp_db) -> None:
+    """A lease that exits without commit does not leak its transaction."""
+    # Arrange / Act
+    async with Database.get_connection() as db:
+        await db.execute(
+            "INSERT INTO verification(user_id, rsi_handle, last_updated) "
+            "VALUES (42, 'pending', 0)"
+        )
+
+    # Assert
+    value = await BaseRepository.fetch_value(
+        "SELECT rsi_handle FROM verification WHERE user_id = ?", (42,)
+    )
+    assert value is None
+
+
+@pytest.mark.asyncio
+async def test_nested_writer_lease_uses_transient_connection(temp_db) -> None:
+    """Re-entering get_connection in the same task must not deadlock."""
+    async with Database.get_connection() as outer:
+        async with Database.get_connection() as inner:
+            assert inner is not outer
+            cursor = await inner.execute("SELECT 1")
+            assert (await cursor.fetchone())[0] == 1
+
+    assert Database.pool_stats()["transient_connections"] == 1
+
+
+@pytest.mark.asyncio
+async def test_transient_connection_does_not_hold_writer(temp_db) -> None:
+    """A long-lived transient scope leaves the pooled writer free."""
+    async with Database.get_transient_connection() as request_db:
+        await request_db.execute(
+            "INSERT INTO verification(user_id, rsi_handle, last_updated) "
+            "VALUES (7, 'web', 0)"
+        )
+        await request_db.commit()
+        async with asyncio.timeout(1):
+            async with Database.get_connection() as db:
+                cursor = await db.execute(
+                    "SELECT rsi_handle FROM verification WHERE user_id = 7"
+                )
+                assert (await cursor.fetchone())[0] == "web"
+
+    stats = Database.pool_stats()
+    assert stats["writer_leases"] == 1
+    assert stats["transient_connections"] == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_readers_bounded_by_pool_size(tmp_path) -> None:
+    """No more reader connections are opened than the pool allows."""
+    # Arrange
+    pool = SQLitePool(str(tmp_path / "pool.db"), readers=2)
+    in_flight = 0
+    peak = 0
+
+    async def read() -> None:
+        nonlocal in_flight, peak
+        async with pool.reader() as db:
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await db.execute("SELECT 1")
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    # Act
+    try:
+        await asyncio.gather(*(read() for _ in range(10)))
+        stats = pool.stats()
+    finally:
+        await pool.close()
+
+    # Assert
+    assert peak == 2
+    assert stats["readers_open"] == 2
+    assert stats["reader_leases"] == 10
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_idle_connection_is_replaced(tmp_path) -> None:
+    """A pooled connection that fails its health check is swapped out."""
+    # Arrange
+    pool = SQLitePool(str(tmp_path / "pool.db"), health_check_interval=0)
+    async with pool.writer() as db:
+        broken = db
+    await broken.close()
+
+    # Act
+    try:
+        async with pool.writer() as db:
+            cursor = await db.execute("SELECT 1")
+            row = await cursor.fetchone()
+        stats = pool.stats()
+    finally:
+        await pool.close()
+
+    # Assert
+    assert db is not broken
+    assert row[0] == 1
+    assert stats["connections_replaced"] == 1
+
+
+@pytest.mark.asyncio
+async def test_reinitialize_resets_pool(tmp_path) -> None:
+    """Re-initializing with a new path never serves connections to the old file."""
+    orig_path = Database._db_path
+    orig_initialized = Database._initialized
+    try:
+        Database._initialized = False
+        await Database.initialize(str(tmp_path / "a.db"))
+        async with Database.get_connection() as db:
+            await db.execute(
+                "INSERT INTO missing_role_warnings(guild_id, reported_at) VALUES (1, 0)"
+            )
+            await db.commit()
+
+        Database._initialized = False
+        await Database.initialize(str(tmp_path / "b.db"))
+        count = await BaseRepository.fetch_value(
+            "SELECT COUNT(*) FROM missing_role_warnings"
+        )
+
+        assert count == 0
+        assert Database.pool_stats()["db_path"] == str(tmp_path / "b.db")
+    finally:
+        await Database.close()
+        Database._db_path = orig_path
+        Database._initialized = orig_initialized
+
+
+@pytest.mark.asyncio
+async def test_closed_pool_refuses_leases(tmp_path) -> None:
+    """Leasing after close() fails loudly instead of reopening silently."""
+    pool = SQLitePool(str(tmp_path / "pool.db"))
+    await pool.close()
+
+    with pytest.raises(RuntimeError):
+        async with pool.reader():
+            pass
+
+
+@pytest.mark.asyncio
+async def test_close_waits_for_held_writer_lease(tmp_path) -> None:
+    """close() lets an in-flight writer lease commit before closing it."""
+    path = tmp_path / "pool.db"
+    pool = SQLitePool(str(path))
+    leased = asyncio.Event()
+    release = asyncio.Event()
+
+    async def _write() -> None:
+        async with pool.writer() as db:
+            await db.execute("CREATE TABLE t (v INTEGER)")
+            leased.set()
+            await release.wait()
+            await db.execute("INSERT INTO t VALUES (1)")
+            await db.commit()
+
+    writer_task = asyncio.create_task(_write())
+    await leased.wait()
+    close_task = asyncio.create_task(pool.close())
+    await asyncio.sleep(0.05)
+    assert not close_task.done()
+
+    release.set()
+    await asyncio.wait_for(asyncio.gather(writer_task, close_task), timeout=2)
+
+    assert pool.stats()["writer_open"] is False
+    with sqlite3.connect(path) as check:
+        assert check.execute("SELECT v FROM t").fetchall() == [(1,)]
+
+
+@pytest.mark.asyncio
+async def test_close_gives_up_on_leases_after_timeout(tmp_path) -> None:
+    """A lease that outlives the close timeout has its connection closed."""
+    pool = SQLitePool(str(tmp_path / "pool.db"), close_timeout=0.05)
+    release = asyncio.Event()
+    leased = asyncio.Event()
+
+    async def _read() -> None:
+        async with pool.reader() as db:
+            leased.set()
+            await release.wait()
+            with pytest.raises(ValueError):
+                await db.execute("SELECT 1")
+
+    reader_task = asyncio.create_task(_read())
+    await leased.wait()
+    await asyncio.wait_for(pool.close(), timeout=1)
+
+    release.set()
+    await reader_task
+    assert pool.stats()["readers_open"] == 0
@@ -292,7 +292,7 @@ async def test_is_valid_rsi_handle_org_parse_exception(monkeypatch) -> None:
 
 @pytest.mark.asyncio
 async def test_is_valid_rsi_handle_reuses_parsed_documents(monkeypatch) -> None:
-    """Profile and organization pages should each be parsed once per validation."""
+    """Each page is parsed at most once; only the name-based org path uses soup."""
     http = FakeHTTP(
         {
             "https://robertsspaceindustries.com/citizens/TestUser/organizations": ORG_HTML,
@@ -316,4 +316,5 @@ async def test_is_valid_rsi_handle_reuses_parsed_documents(monkeypatch) -> None:
     )
 
     assert result[0] == 1
-    assert parse_inputs == [ORG_HTML, PROFILE_HTML]
+    assert result[1] == "CaseHandle"
+    assert parse_inputs == [ORG_HTML]
@@ -0,0 +1,29 @@
+"""Tests for the compact member-ID wire format."""
+
+import pytest
+
+from helpers.member_ids import member_ids_etag, pack_member_ids, unpack_member_ids
+
+
+def test_pack_roundtrip_sorts_and_dedupes() -> None:
+    ids = [246813579024681357, 1, 2**64 - 1, 1]
+
+    payload = pack_member_ids(ids)
+
+    assert len(payload) == 3 * 8
+    assert payload[:8] == (1).to_bytes(8, "little")
+    assert unpack_member_ids(payload) == [1, 246813579024681357, 2**64 - 1]
+
+
+def test_etag_ignores_input_order() -> None:
+    assert member_ids_etag(pack_member_ids([3, 1, 2])) == member_ids_etag(
+        pack_member_ids([1, 2, 3])
+    )
+    assert member_ids_etag(pack_member_ids([1, 2])) != member_ids_etag(
+        pack_member_ids([1, 2, 3])
+    )
+
+
+def test_unpack_rejects_truncated_payload() -> None:
+    with pytest.raises(ValueError):
+        unpack_member_ids(b"\x00" * 9)
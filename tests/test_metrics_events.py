@@ -17,6 +17,7 @@ import discord
 import pytest
 
 from cogs.metrics.events import MetricsEvents
+from services.metrics_service import MetricsService
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -33,6 +34,8 @@ def mock_metrics_service():
     service.record_game_start = AsyncMock()
     service.record_game_stop = AsyncMock()
     service.get_excluded_channel_ids = AsyncMock(return_value=set())
+    # Cold cache: the cog falls back to the awaited lookup above
+    service.get_excluded_channel_ids_cached = MagicMock(return_value=None)
     return service
 
 
@@ -101,6 +104,45 @@ class TestOnMessage:
 
         service.record_message.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_cached_exclusions_skip_awaited_lookup(self, cog_with_service):
+        cog, service = cog_with_service
+        service.get_excluded_channel_ids_cached.return_value = frozenset({77})
+        msg = MagicMock()
+        msg.author.bot = False
+        msg.guild = MagicMock()
+        msg.guild.id = 100
+        msg.author.id = 1
+        msg.channel.id = 78
+
+        await cog.on_message(msg)
+        msg.channel.id = 77
+        await cog.on_message(msg)
+
+        service.get_excluded_channel_ids.assert_not_awaited()
+        service.record_message.assert_called_once_with(100, 1, channel_id=78)
+
+    @pytest.mark.asyncio
+    async def test_warm_service_buffers_messages_without_config_reads(self):
+        config_service = MagicMock()
+        config_service.get_guild_setting = AsyncMock(return_value=[999])
+        service = MetricsService(config_service, bot=None, test_mode=True)
+        for guild_id in (100, 101, 102):
+            await service.get_excluded_channel_ids(guild_id)
+        config_service.get_guild_setting.reset_mock()
+        cog = MetricsEvents(MagicMock(services=SimpleNamespace(metrics=service)))
+
+        for i in range(300):
+            msg = SimpleNamespace(
+                author=SimpleNamespace(bot=False, id=1 + i % 7),
+                guild=SimpleNamespace(id=100 + i % 3),
+                channel=SimpleNamespace(id=999 if i % 10 == 0 else 55),
+            )
+            await cog.on_message(msg)  # type: ignore[arg-type]
+
+        assert service._total_messages_buffered == 270
+        config_service.get_guild_setting.assert_not_awaited()
+
 
 # ---------------------------------------------------------------------------
 # on_voice_state_update tests
@@ -15,6 +15,7 @@ Tests cover:
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import time
 from typing import cast
 from unittest.mock import AsyncMock, MagicMock
@@ -195,6 +196,45 @@ class TestExcludedChannelSettings:
             [],
         )
 
+    @pytest.mark.asyncio
+    async def test_cached_exclusions_serve_stale_and_refresh_in_background(
+        self, metrics_service: MetricsService
+    ) -> None:
+        get_setting_mock = cast(
+            "AsyncMock",
+            metrics_service._config_service.get_guild_setting,
+        )
+        get_setting_mock.side_effect = None
+        get_setting_mock.return_value = ["100"]
+        metrics_service._config_service.get_cached.return_value = None
+
+        # Cold cache without a config snapshot: the caller's fallback read is
+        # the only one (no background refresh is started alongside it)
+        assert metrics_service.get_excluded_channel_ids_cached(123) is None
+        assert not metrics_service._excluded_channels_refreshes
+        assert await metrics_service.get_excluded_channel_ids(123) == {100}
+        get_setting_mock.assert_awaited_once()
+        assert metrics_service.get_excluded_channel_ids_cached(123) == {100}
+
+        # Past the TTL the old set is still served while a refresh runs
+        get_setting_mock.return_value = ["200"]
+        metrics_service._excluded_channels_ttl_seconds = 0
+        assert metrics_service.get_excluded_channel_ids_cached(123) == {100}
+        await asyncio.gather(*metrics_service._excluded_channels_refreshes.values())
+        metrics_service._excluded_channels_ttl_seconds = 30
+        assert metrics_service.get_excluded_channel_ids_cached(123) == {200}
+
+    @pytest.mark.asyncio
+    async def test_cached_exclusions_built_from_config_snapshot(
+        self, metrics_service: MetricsService
+    ) -> None:
+        metrics_service._config_service.get_cached.return_value = ["5", "bad"]
+
+        assert metrics_service.get_excluded_channel_ids_cached(123) == frozenset({5})
+        cast(
+            "AsyncMock", metrics_service._config_service.get_guild_setting
+        ).assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_get_excluded_channel_ids_dedupes_concurrent_fetches(
         self, metrics_service: MetricsService
@@ -271,6 +311,26 @@ class TestFlushMessageBuffer:
         assert row is not None
         assert row[0] == 2
 
+    @pytest.mark.asyncio
+    async def test_flush_upserts_many_keys_across_guilds(
+        self, metrics_service: MetricsService
+    ) -> None:
+        """A large buffer inserts every key once, then accumulates on re-flush."""
+        keys = [(1 + i % 5, 10_000 + i, 1_700_000_000) for i in range(5_000)]
+        for _ in range(2):
+            for key in keys:
+                metrics_service._message_buffer[key] += 3
+            await metrics_service._flush_message_buffer()
+
+        assert not metrics_service._message_buffer
+        async with MetricsDatabase.get_read_connection() as db:
+            cursor = await db.execute(
+                "SELECT COUNT(*), SUM(message_count), COUNT(DISTINCT guild_id) "
+                "FROM message_counts"
+            )
+            row = await cursor.fetchone()
+        assert tuple(row) == (5_000, 30_000, 5)
+
     @pytest.mark.asyncio
     async def test_flush_empty_buffer_is_noop(
         self, metrics_service: MetricsService
@@ -423,6 +483,147 @@ class TestGameSessions:
         # Should not raise
 
 
+# ---------------------------------------------------------------------------
+# Batched session writes
+# ---------------------------------------------------------------------------
+
+
+async def _count_rows(table: str) -> int:
+    async with MetricsDatabase.get_read_connection() as db:
+        cursor = await db.execute(f"SELECT COUNT(*) FROM {table}")
+        row = await cursor.fetchone()
+    assert row is not None
+    return row[0]
+
+
+@pytest_asyncio.fixture()
+async def batching_service(metrics_service: MetricsService):
+    """MetricsService with the session writer loop running."""
+    metrics_service._session_flush_interval = 60
+    metrics_service._session_batch_size = 3
+    writer = asyncio.create_task(metrics_service._session_flush_loop())
+    metrics_service._session_flush_task = writer
+    yield metrics_service
+    writer.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await writer
+
+
+class TestSessionWriteBatching:
+    @pytest.mark.asyncio
+    async def test_session_rows_queue_until_batch_full(
+        self, batching_service: MetricsService
+    ) -> None:
+        # Arrange / Act
+        for user_id in (1, 2):
+            await batching_service.record_voice_join(100, user_id, channel_id=10)
+            await batching_service.record_voice_leave(100, user_id)
+
+        # Assert — below batch size nothing is written yet
+        assert await _count_rows("voice_sessions") == 0
+        health = await batching_service.health_check()
+        assert health["session_queue_depth"] == 2
+
+        # Act — the third row fills the batch and wakes the writer
+        await batching_service.record_game_start(100, 3, "Star Citizen")
+        await batching_service.record_game_stop(100, 3)
+        for _ in range(50):
+            if batching_service._session_flush_count:
+                break
+            await asyncio.sleep(0.01)
+
+        # Assert — one transaction wrote both tables
+        assert await _count_rows("voice_sessions") == 2
+        assert await _count_rows("game_sessions") == 1
+        health = await batching_service.health_check()
+        assert health["session_queue_depth"] == 0
+        assert health["session_flush_count"] == 1
+        assert health["session_rows_flushed"] == 3
+        assert health["last_session_flush_latency_ms"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_shutdown_drains_queued_sessions(
+        self, batching_service: MetricsService
+    ) -> None:
+        # Arrange
+        await batching_service.record_voice_join(100, 1, channel_id=10)
+        await batching_service.record_voice_leave(100, 1)
+        await batching_service.record_game_start(100, 2, "Star Citizen")
+
+        # Act
+        await batching_service.shutdown()
+
+        # Assert — queued row plus the still-open game session were written
+        assert await _count_rows("voice_sessions") == 1
+        assert await _count_rows("game_sessions") == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_requeues_rows(
+        self, metrics_service: MetricsService, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Arrange
+        def _broken_connection():
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr(MetricsDatabase, "get_connection", _broken_connection)
+        await metrics_service.record_voice_join(100, 1, channel_id=10)
+
+        # Act
+        await metrics_service.record_voice_leave(100, 1)
+
+        # Assert
+        assert len(metrics_service._pending_voice_rows) == 1
+        assert metrics_service._session_flush_failures == 1
+
+        # Act — recovery writes the retained row
+        monkeypatch.undo()
+        await metrics_service._flush_session_rows()
+
+        # Assert
+        assert await _count_rows("voice_sessions") == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_flushes_cap_the_queue(
+        self, metrics_service: MetricsService, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Arrange
+        def _broken_connection():
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr(MetricsDatabase, "get_connection", _broken_connection)
+        metrics_service._session_queue_limit = 2
+
+        # Act
+        for user_id in (1, 2, 3):
+            await metrics_service.record_voice_join(100, user_id, channel_id=10)
+            await metrics_service.record_voice_leave(100, user_id)
+
+        # Assert — the oldest row was dropped and counted
+        assert [row[1] for row in metrics_service._pending_voice_rows] == [2, 3]
+        health = await metrics_service.health_check()
+        assert health["session_rows_dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_user_metrics_discards_queued_rows(
+        self, batching_service: MetricsService
+    ) -> None:
+        # Arrange
+        await batching_service.record_voice_join(100, 1, channel_id=10)
+        await batching_service.record_voice_leave(100, 1)
+        await batching_service.record_voice_join(100, 2, channel_id=10)
+        await batching_service.record_voice_leave(100, 2)
+
+        # Act
+        await batching_service.delete_user_metrics(100, 1)
+        await batching_service._flush_session_rows()
+
+        # Assert
+        async with MetricsDatabase.get_read_connection() as db:
+            cursor = await db.execute("SELECT user_id FROM voice_sessions")
+            rows = [row[0] for row in await cursor.fetchall()]
+        assert rows == [2]
+
+
 # ---------------------------------------------------------------------------
 # Live snapshot
 # ---------------------------------------------------------------------------
@@ -796,6 +997,312 @@ class TestQueryMethods:
         assert len(result["timeseries"]) == 1
 
 
+# ---------------------------------------------------------------------------
+# Hourly rollup
+# ---------------------------------------------------------------------------
+
+
+class TestHourlyRollup:
+    @pytest.mark.asyncio
+    async def test_rollup_merges_messages_voice_and_games(
+        self, metrics_service: MetricsService
+    ) -> None:
+        # Arrange
+        hour = _hour_bucket(int(time.time())) - 3600
+        async with MetricsDatabase.get_connection() as db:
+            await db.executemany(
+                "INSERT INTO message_counts (guild_id, user_id, hour_bucket, bucket_seconds, message_count) "
+                "VALUES (?, ?, ?, 180, ?)",
+                [(100, 1, hour, 4), (100, 1, hour + 180, 1), (100, 2, hour, 2)],
+            )
+            await db.executemany(
+                "INSERT INTO voice_sessions (guild_id, user_id, channel_id, joined_at, left_at, duration_seconds) "
+                "VALUES (?, ?, 10, ?, ?, ?)",
+                [(100, 2, hour, hour + 600, 600), (200, 3, hour, hour + 60, 60)],
+            )
+            await db.executemany(
+                "INSERT INTO game_sessions (guild_id, user_id, game_name, started_at, ended_at, duration_seconds) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (100, 1, "Star Citizen", hour, hour + 900, 900),
+                    (100, 2, "Squadron 42", hour, hour + 100, 100),
+                ],
+            )
+            await db.commit()
+
+        # Act
+        await metrics_service._perform_rollup()
+
+        # Assert
+        async with MetricsDatabase.get_read_connection() as db:
+            cursor = await db.execute(
+                "SELECT guild_id, total_messages, unique_messagers, "
+                "total_voice_seconds, unique_voice_users, top_game "
+                "FROM metrics_hourly WHERE hour_bucket = ? ORDER BY guild_id",
+                (hour,),
+            )
+            guild_rows = [tuple(r) for r in await cursor.fetchall()]
+            cursor = await db.execute(
+                "SELECT guild_id, user_id, messages_sent, voice_seconds, games_json "
+                "FROM metrics_user_hourly WHERE hour_bucket = ? "
+                "ORDER BY guild_id, user_id",
+                (hour,),
+            )
+            user_rows = [tuple(r) for r in await cursor.fetchall()]
+
+        assert guild_rows == [
+            (100, 7, 2, 600, 1, "Star Citizen"),
+            (200, 0, 0, 60, 1, None),
+        ]
+        assert user_rows == [
+            (100, 1, 5, 0, '{"Star Citizen": 900}'),
+            (100, 2, 2, 600, '{"Squadron 42": 100}'),
+            (200, 3, 0, 60, None),
+        ]
+        assert metrics_service._last_rollup_at > 0
+
+    @pytest.mark.asyncio
+    async def test_rollup_writes_one_row_per_active_user(
+        self, metrics_service: MetricsService
+    ) -> None:
+        """Every active user gets exactly one per-user row with merged totals."""
+        # Arrange
+        users = 3_000
+        hour = _hour_bucket(int(time.time())) - 3600
+        async with MetricsDatabase.get_connection() as db:
+            await db.executemany(
+                "INSERT INTO message_counts (guild_id, user_id, hour_bucket, bucket_seconds, message_count) "
+                "VALUES (?, ?, ?, 180, 2)",
+                [(1 + i % 5, i, hour + (i % 20) * 180) for i in range(users)],
+            )
+            await db.executemany(
+                "INSERT INTO voice_sessions (guild_id, user_id, channel_id, joined_at, left_at, duration_seconds) "
+                "VALUES (?, ?, 10, ?, ?, 600)",
+                [(1 + i % 5, i, hour, hour + 600) for i in range(0, users, 3)],
+            )
+            await db.commit()
+
+        # Act
+        await metrics_service._perform_rollup()
+
+        # Assert
+        async with MetricsDatabase.get_read_connection() as db:
+            cursor = await db.execute(
+                "SELECT COUNT(*), SUM(messages_sent), SUM(voice_seconds) "
+                "FROM metrics_user_hourly WHERE hour_bucket = ?",
+                (hour,),
+            )
+            user_totals = tuple(await cursor.fetchone())
+            cursor = await db.execute(
+                "SELECT COUNT(*), SUM(unique_messagers), SUM(unique_voice_users) "
+                "FROM metrics_hourly WHERE hour_bucket = ?",
+                (hour,),
+            )
+            guild_totals = tuple(await cursor.fetchone())
+        assert user_totals == (users, users * 2, (users // 3) * 600)
+        assert guild_totals == (5, users, users // 3)
+
+    @pytest.mark.asyncio
+    async def test_rollup_is_idempotent(self, metrics_service: MetricsService) -> None:
+        # Arrange
+        hour = _hour_bucket(int(time.time())) - 3600
+        async with MetricsDatabase.get_connection() as db:
+            await db.execute(
+                "INSERT INTO message_counts (guild_id, user_id, hour_bucket, bucket_seconds, message_count) "
+                "VALUES (100, 1, ?, 180, 3)",
+                (hour,),
+            )
+            await db.commit()
+
+        # Act
+        await metrics_service._perform_rollup()
+        await metrics_service._perform_rollup()
+
+        # Assert
+        async with MetricsDatabase.get_read_connection() as db:
+            cursor = await db.execute(
+                "SELECT COUNT(*), SUM(messages_sent) FROM metrics_user_hourly"
+            )
+            row = await cursor.fetchone()
+        assert row is not None
+        assert tuple(row) == (1, 3)
+
+    @pytest.mark.asyncio
+    async def test_rollup_clips_sessions_to_each_hour(
+        self, metrics_service: MetricsService
+    ) -> None:
+        # Arrange — a voice session from 4h30m ago until 30m ago
+        now_hour = _hour_bucket(int(time.time()))
+        joined_at = now_hour - 4 * 3600 - 1800
+        left_at = now_hour - 1800
+        async with MetricsDatabase.get_connection() as db:
+            await db.execute(
+                "INSERT INTO voice_sessions (guild_id, user_id, channel_id, joined_at, left_at, duration_seconds) "
+                "VALUES (100, 1, 10, ?, ?, ?)",
+                (joined_at, left_at, left_at - joined_at),
+            )
+            await db.execute(
+                "INSERT INTO game_sessions (guild_id, user_id, game_name, started_at, ended_at, duration_seconds) "
+                "VALUES (100, 1, 'Star Citizen', ?, ?, ?)",
+                (joined_at, left_at, left_at - joined_at),
+            )
+            await db.commit()
+
+        # Act
+        await metrics_service._perform_rollup()
+
+        # Assert
+        async with MetricsDatabase.get_read_connection() as db:
+            cursor = await db.execute(
+                "SELECT hour_bucket, voice_seconds, games_json FROM metrics_user_hourly "
+                "ORDER BY hour_bucket"
+            )
+            rows = [tuple(r) for r in await cursor.fetchall()]
+        expected_seconds = [1800, 3600, 3600, 3600, 1800]
+        assert [r[0] for r in rows] == [
+            now_hour - 5 * 3600 + i * 3600 for i in range(5)
+        ]
+        assert [r[1] for r in rows] == expected_seconds
+        assert [r[2] for r in rows] == [
+            f'{{"Star Citizen": {seconds}}}' for seconds in expected_seconds
+        ]
+        assert sum(expected_seconds) == left_at - joined_at
+
+    @pytest.mark.asyncio
+    async def test_rollup_backfills_missed_hours_in_batches(
+        self, metrics_service: MetricsService
+    ) -> None:
+        # Arrange — messages in three past hours, one-hour batches
+        metrics_service._rollup_batch_hours = 1
+        now_hour = _hour_bucket(int(time.time()))
+        hours = [now_hour - 3 * 3600, now_hour - 2 * 3600, now_hour - 3600]
+        async with MetricsDatabase.get_connection() as db:
+            await db.executemany(
+                "INSERT INTO message_counts (guild_id, user_id, hour_bucket, bucket_seconds, message_count) "
+                "VALUES (100, 1, ?, 180, 2)",
+                [(hour,) for hour in hours],
+            )
+            await db.commit()
+
+        # Act
+        await metrics_service._perform_rollup()
+
+        # Assert
+        async with MetricsDatabase.get_read_connection() as db:
+            cursor = await db.execute(
+                "SELECT hour_bucket FROM metrics_hourly ORDER BY hour_bucket"
+            )
+            rolled = [r[0] for r in await cursor.fetchall()]
+            cursor = await db.execute(
+                "SELECT next_hour_bucket FROM metrics_rollup_state WHERE name = 'hourly'"
+            )
+            watermark = (await cursor.fetchone())[0]
+        assert rolled == hours
+        assert watermark == now_hour
+        health = await metrics_service.health_check()
+        assert health["rollup_next_hour"] == now_hour
+        assert health["rollup_hours_processed"] == 3
+
+    @pytest.mark.asyncio
+    async def test_late_session_rewinds_watermark(
+        self, metrics_service: MetricsService
+    ) -> None:
+        # Arrange — hours are rolled up before a long session is written
+        now_hour = _hour_bucket(int(time.time()))
+        await metrics_service._perform_rollup()
+        await metrics_service.record_voice_join(100, 1, channel_id=10)
+        metrics_service._voice_sessions[(100, 1)].joined_at = now_hour - 2 * 3600
+
+        # Act
+        await metrics_service.record_voice_leave(100, 1)
+        async with MetricsDatabase.get_read_connection() as db:
+            cursor = await db.execute(
+                "SELECT next_hour_bucket FROM metrics_rollup_state WHERE name = 'hourly'"
+            )
+            rewound = (await cursor.fetchone())[0]
+        await metrics_service._perform_rollup()
+
+        # Assert
+        assert rewound == now_hour - 2 * 3600
+        async with MetricsDatabase.get_read_connection() as db:
+            cursor = await db.execute(
+                "SELECT hour_bucket, total_voice_seconds FROM metrics_hourly "
+                "ORDER BY hour_bucket"
+            )
+            rows = [tuple(r) for r in await cursor.fetchall()]
+        assert rows == [(now_hour - 2 * 3600, 3600), (now_hour - 3600, 3600)]
+
+    @pytest.mark.asyncio
+    async def test_user_metrics_read_clipped_rollups(
+        self, metrics_service: MetricsService
+    ) -> None:
+        # Arrange
+        hour = _hour_bucket(int(time.time())) - 3600
+        async with MetricsDatabase.get_connection() as db:
+            await db.execute(
+                "INSERT INTO metrics_user_hourly "
+                "(guild_id, user_id, hour_bucket, messages_sent, voice_seconds, games_json) "
+                "VALUES (100, 1, ?, 0, 1200, ?)",
+                (hour, '{"Star Citizen": 600}'),
+            )
+            await db.execute(
+                "INSERT INTO message_counts (guild_id, user_id, hour_bucket, bucket_seconds, message_count) "
+                "VALUES (100, 1, ?, 180, 4), (100, 1, ?, 180, 1)",
+                (hour, hour + 180),
+            )
+            await db.commit()
+
+        # Act
+        result = await metrics_service.get_user_metrics(100, 1, days=7)
+
+        # Assert
+        assert result["total_voice_seconds"] == 1200
+        assert result["total_messages"] == 5
+        assert result["top_games"] == [
+            {"game_name": "Star Citizen", "total_seconds": 600}
+        ]
+        assert result["timeseries"] == [
+            {
+                "timestamp": hour,
+                "messages": 5,
+                "voice_seconds": 1200,
+                "game_seconds": 600,
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_user_metrics_include_unrolled_hours(
+        self, metrics_service: MetricsService
+    ) -> None:
+        # Arrange — hours rolled up, then sessions reaching into the live hour
+        now_hour = _hour_bucket(int(time.time()))
+        await metrics_service._perform_rollup()
+        await metrics_service.record_voice_join(100, 1, channel_id=10)
+        await metrics_service.record_game_start(100, 1, "Star Citizen")
+        metrics_service._voice_sessions[(100, 1)].joined_at = now_hour - 600
+        metrics_service._game_sessions[(100, 1)].started_at = now_hour - 600
+        await metrics_service.record_voice_leave(100, 1)
+        await metrics_service.record_game_stop(100, 1)
+        async with MetricsDatabase.get_read_connection() as db:
+            cursor = await db.execute("SELECT duration_seconds FROM voice_sessions")
+            duration = (await cursor.fetchone())[0]
+
+        # Act
+        result = await metrics_service.get_user_metrics(100, 1, days=7)
+
+        # Assert — the unrolled previous hour and the live hour both count
+        assert result["total_voice_seconds"] == duration
+        assert result["top_games"] == [
+            {"game_name": "Star Citizen", "total_seconds": duration}
+        ]
+        assert result["timeseries"][0] == {
+            "timestamp": now_hour - 3600,
+            "messages": 0,
+            "voice_seconds": 600,
+            "game_seconds": 600,
+        }
+
+
 # ---------------------------------------------------------------------------
 # Purge old data
 # ---------------------------------------------------------------------------
@@ -858,6 +1365,36 @@ class TestPurgeOldData:
             assert row is not None
             assert row[0] == 1
 
+    @pytest.mark.asyncio
+    async def test_purge_shrinks_cached_session_span(
+        self, metrics_service: MetricsService
+    ) -> None:
+        metrics_service._retention_days = 1
+        now = int(time.time())
+        old_ts = now - 200_000
+
+        async with MetricsDatabase.get_connection() as db:
+            await db.execute(
+                "INSERT INTO voice_sessions (guild_id, user_id, channel_id, joined_at, left_at, duration_seconds) "
+                "VALUES (100, 1, 10, ?, ?, 36000)",
+                (old_ts, old_ts + 36000),
+            )
+            await db.execute(
+                "INSERT INTO voice_sessions (guild_id, user_id, channel_id, joined_at, left_at, duration_seconds) "
+                "VALUES (100, 2, 10, ?, ?, 600)",
+                (now - 600, now),
+            )
+            await db.commit()
+            assert (
+                await metrics_service._max_session_span(db, "voice_sessions") == 36000
+            )
+
+        await metrics_service._purge_old_data()
+
+        assert "voice_sessions" not in metrics_service._session_spans
+        async with MetricsDatabase.get_connection() as db:
+            assert await metrics_service._max_session_span(db, "voice_sessions") == 600
+
 
 # ---------------------------------------------------------------------------
 # Health check
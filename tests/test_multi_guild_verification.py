@@ -207,7 +207,7 @@ async def test_full_cleanup_all_guilds(temp_db):
         )
 
         await db.execute(
-            """INSERT INTO auto_recheck_state (user_id, next_retry_at)
+            """INSERT OR REPLACE INTO auto_recheck_state (user_id, next_retry_at)
                VALUES (?, ?)""",
             (user_id, int(time.time())),
         )
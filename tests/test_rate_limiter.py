@@ -2,95 +2,169 @@ import time
 from unittest.mock import AsyncMock
 
 import pytest
-import pytest_asyncio
 
 from helpers import rate_limiter as rl
+from helpers.rate_limiter import RateLimitEngine
+from services.db.database import Database
 
 
-@pytest_asyncio.fixture(autouse=True)
-async def patch_db(monkeypatch):  # type: ignore[misc]
-    # Patch Database methods used by rate limiter
-    fetch = AsyncMock(return_value=None)
-    incr = AsyncMock()
-    reset = AsyncMock()
-    monkeypatch.setattr("helpers.rate_limiter.Database.fetch_rate_limit", fetch)
-    monkeypatch.setattr("helpers.rate_limiter.Database.increment_rate_limit", incr)
-    monkeypatch.setattr("helpers.rate_limiter.Database.reset_rate_limit", reset)
-    yield fetch, incr, reset
-
-
-@pytest.mark.asyncio
-async def test_check_rate_limit_within_window(monkeypatch, patch_db) -> None:
-    fetch, _incr, _reset = patch_db
-    now = int(time.time())
-    # 1 attempt within window; should not be rate-limited
-    fetch.return_value = (1, now)
+@pytest.fixture(autouse=True)
+def small_window(monkeypatch) -> None:
     monkeypatch.setattr(
         "helpers.rate_limiter.DEFAULT_RATE_LIMITS",
-        {"verification": {"max_attempts": 5, "window_seconds": 100}},
+        {
+            "verification": {"max_attempts": 5, "window_seconds": 100},
+            "recheck": {"max_attempts": 1, "window_seconds": 300},
+        },
     )
+
+
+def _seed(user_id: int, attempts: int, first: int, action: str = "verification"):
+    engine = RateLimitEngine.get()
+    window = rl._get_default_limits(action)[1]
+    engine._counters[(user_id, action)] = [attempts, first, window]
+    return engine
+
+
+@pytest.fixture
+def no_db(monkeypatch) -> None:
+    """Fail loudly if the interactive path reaches the database."""
+    boom = AsyncMock(side_effect=AssertionError("database touched"))
+    monkeypatch.setattr("helpers.rate_limiter.Database.fetch_rate_limit", boom)
+    monkeypatch.setattr("helpers.rate_limiter.Database.increment_rate_limit", boom)
+    monkeypatch.setattr("helpers.rate_limiter.Database.reset_rate_limit", boom)
+
+
+@pytest.mark.asyncio
+async def test_check_rate_limit_within_window(no_db) -> None:
+    _seed(1, 1, int(time.time()))
     limited, wait_until = await rl.check_rate_limit(1, "verification")
     assert limited is False
     assert wait_until == 0
 
 
 @pytest.mark.asyncio
-async def test_check_rate_limit_hit(monkeypatch, patch_db) -> None:
-    fetch, _incr, _reset = patch_db
+async def test_check_rate_limit_hit(no_db) -> None:
     now = int(time.time())
-    fetch.return_value = (5, now)
-    monkeypatch.setattr(
-        "helpers.rate_limiter.DEFAULT_RATE_LIMITS",
-        {"verification": {"max_attempts": 5, "window_seconds": 100}},
-    )
+    _seed(1, 5, now)
     limited, wait_until = await rl.check_rate_limit(1, "verification")
     assert limited is True
     assert wait_until == now + 100
 
 
 @pytest.mark.asyncio
-async def test_check_rate_limit_reset_after_window(monkeypatch, patch_db) -> None:
-    fetch, _incr, reset = patch_db
-    then = int(time.time()) - 1000
-    monkeypatch.setattr(
-        "helpers.rate_limiter.DEFAULT_RATE_LIMITS",
-        {"verification": {"max_attempts": 5, "window_seconds": 100}},
-    )
-    fetch.return_value = (5, then)
+async def test_check_rate_limit_reset_after_window(no_db) -> None:
+    engine = _seed(1, 5, int(time.time()) - 1000)
     limited, wait_until = await rl.check_rate_limit(1, "verification")
     assert limited is False
     assert wait_until == 0
-    reset.assert_awaited()
+    assert len(engine) == 0
+    assert engine._pending == {(1, "verification"): None}
 
 
 @pytest.mark.asyncio
-async def test_log_and_reset_attempts(patch_db) -> None:
-    _fetch, incr, reset = patch_db
+async def test_log_and_reset_attempts(no_db) -> None:
+    engine = RateLimitEngine.get()
     await rl.log_attempt(2, "verification")
-    incr.assert_awaited()
+    await rl.log_attempt(2, "verification")
+    assert engine.peek(2, "verification", 100)[0] == 2
+
     await rl.reset_attempts(2)
-    reset.assert_awaited()
+    assert engine.peek(2, "verification", 100) is None
+    assert engine._pending == {}
+    assert engine._pending_user_resets == {2}
 
 
 @pytest.mark.asyncio
-async def test_get_remaining_attempts(monkeypatch, patch_db) -> None:
-    fetch, _incr, _reset = patch_db
-    monkeypatch.setattr(
-        "helpers.rate_limiter.DEFAULT_RATE_LIMITS",
-        {"verification": {"max_attempts": 5, "window_seconds": 100}},
-    )
+async def test_log_attempt_opens_new_window_after_expiry(no_db) -> None:
+    engine = _seed(3, 5, int(time.time()) - 1000)
+    await rl.log_attempt(3, "verification")
+    attempts, first = engine.peek(3, "verification", 100)
+    assert attempts == 1
+    assert first >= int(time.time()) - 1
+
+
+@pytest.mark.asyncio
+async def test_get_remaining_attempts(no_db) -> None:
     now = int(time.time())
     # No record
-    fetch.return_value = None
     assert await rl.get_remaining_attempts(1, "verification") == 5
     # Within window with 2 attempts
-    fetch.return_value = (2, now)
+    _seed(1, 2, now)
     assert await rl.get_remaining_attempts(1, "verification") == 3
     # Expired window resets to max
-    fetch.return_value = (5, now - 1000)
+    _seed(1, 5, now - 1000)
     assert await rl.get_remaining_attempts(1, "verification") == 5
 
 
+def test_engine_bound_evicts_expired_before_live() -> None:
+    now = int(time.time())
+    engine = RateLimitEngine(max_entries=2)
+    engine.record(1, "verification", 100, now=now - 500)
+    engine.record(2, "verification", 100, now=now)
+    engine.record(3, "verification", 100, now=now)
+
+    assert len(engine) == 2
+    assert engine.peek(1, "verification", 100, now=now) is None
+    assert engine.peek(2, "verification", 100, now=now) == (1, now)
+    # Evicted counters still have their write queued
+    assert (1, "verification") in engine._pending
+
+
+@pytest.mark.asyncio
+async def test_flush_and_load_round_trip(temp_db) -> None:
+    now = int(time.time())
+    await rl.log_attempt(10, "verification")
+    await rl.log_attempt(10, "verification")
+    await rl.log_attempt(11, "recheck")
+    await rl.log_attempt(12, "verification")
+    await rl.reset_attempts(12)
+
+    async with Database.get_connection() as db:
+        await db.execute(
+            "INSERT INTO rate_limits(user_id, action, attempt_count, first_attempt) VALUES (12, 'verification', 4, ?)",
+            (now,),
+        )
+        await db.commit()
+
+    await rl.flush_attempts()
+    assert not RateLimitEngine.get().dirty
+
+    async with Database.get_connection() as db:
+        cursor = await db.execute(
+            "SELECT user_id, action, attempt_count FROM rate_limits ORDER BY user_id"
+        )
+        rows = [tuple(row) for row in await cursor.fetchall()]
+    assert rows == [(10, "verification", 2), (11, "recheck", 1)]
+
+    # A restart rehydrates the persisted counters
+    RateLimitEngine.reset_instance()
+    await rl.load_attempts()
+    limited, wait_until = await rl.check_rate_limit(11, "recheck")
+    assert limited is True
+    assert wait_until >= now + 300
+    assert await rl.get_remaining_attempts(10, "verification") == 3
+
+
+@pytest.mark.asyncio
+async def test_flush_failure_requeues_pending(monkeypatch) -> None:
+    engine = RateLimitEngine.get()
+    engine.record(5, "verification", 100)
+
+    class Boom:
+        async def __aenter__(self):
+            raise RuntimeError("db down")
+
+        async def __aexit__(self, *args) -> bool:
+            return False
+
+    monkeypatch.setattr(
+        "helpers.rate_limiter.BaseRepository.transaction", staticmethod(Boom)
+    )
+    await rl.flush_attempts()
+    assert engine._pending == {(5, "verification"): engine.peek(5, "verification", 100)}
+
+
 @pytest.mark.asyncio
 async def test_cleanup_attempts(monkeypatch) -> None:
     # Use a simple in-memory DB call path, patch Database.get_connection
@@ -98,6 +172,9 @@ async def test_cleanup_attempts(monkeypatch) -> None:
         async def execute(self, *args, **kwargs) -> None:
             return None
 
+        async def executemany(self, *args, **kwargs) -> None:
+            return None
+
         async def commit(self) -> None:
             return None
 
@@ -108,9 +185,65 @@ async def test_cleanup_attempts(monkeypatch) -> None:
         async def __aexit__(self, *args) -> bool:
             return False
 
-    def fake_conn(self):
+    def fake_conn(*_args):
         return Ctx()
 
     monkeypatch.setattr("helpers.rate_limiter.Database.get_connection", fake_conn)
+    engine = _seed(1, 1, int(time.time()) - 1000)
     # Should not raise
     await rl.cleanup_attempts()
+    assert len(engine) == 0
+
+
+class _GuildConfig:
+    """Guild config stub with a verification window longer than the default."""
+
+    async def get_setting(self, guild_id, key, default=None, parser=None):
+        return {
+            "rate_limits.max_attempts": 3,
+            "rate_limits.window_seconds": 3600,
+        }.get(key, default)
+
+
+@pytest.mark.asyncio
+async def test_guild_window_survives_prune_and_reload(temp_db) -> None:
+    """A guild window longer than the default is not cut short."""
+    guild_config = _GuildConfig()
+    now = int(time.time())
+    for _ in range(3):
+        await rl.log_attempt(guild_config, 1, 7, "verification")
+    limited, wait_until = await rl.check_rate_limit(guild_config, 1, 7, "verification")
+    assert limited is True
+    assert wait_until >= now + 3600
+
+    # Past the 100s default window: pruning keeps the guild-window counter
+    engine = RateLimitEngine.get()
+    engine.prune(now + 2001)
+    assert engine.check(7, "verification", 3, 3600, now=now + 2001)[0] is True
+
+    # A restart rehydrates with the longest configured window
+    async with Database.get_connection() as db:
+        await db.execute(
+            "INSERT INTO guild_settings(guild_id, key, value) VALUES (1, ?, '3600')",
+            ("rate_limits.window_seconds",),
+        )
+        await db.execute(
+            "INSERT INTO verification(user_id, rsi_handle, last_updated) "
+            "VALUES (8, 'h', 0)"
+        )
+        await db.execute(
+            "INSERT INTO rate_limits(user_id, action, attempt_count, first_attempt) "
+            "VALUES (8, 'verification', 3, ?)",
+            (now - 2001,),
+        )
+        await db.commit()
+    RateLimitEngine.reset_instance()
+    await rl.load_attempts()
+    limited, _ = await rl.check_rate_limit(guild_config, 1, 8, "verification")
+    assert limited is True
+
+    # Cleanup keeps rows that are still live under the guild window
+    await rl.cleanup_attempts()
+    async with Database.get_connection() as db:
+        cursor = await db.execute("SELECT COUNT(*) FROM rate_limits WHERE user_id = 8")
+        assert (await cursor.fetchone())[0] == 1
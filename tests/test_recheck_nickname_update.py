@@ -71,18 +71,20 @@ async def test_apply_roles_updates_nickname_with_moniker(monkeypatch, temp_db) -
     # Patch role/nick dependency helpers
     monkeypatch.setattr("helpers.role_helper.can_modify_nickname", lambda m: True)
 
-    # Capture edit_member calls
+    # Capture member.edit calls
     edits = {}
 
-    async def fake_edit_member(member_obj, **kwargs) -> None:
+    async def fake_edit_member(**kwargs) -> None:
         edits["nick"] = kwargs.get("nick")
 
-    monkeypatch.setattr("helpers.role_helper.edit_member", fake_edit_member)
+    monkeypatch.setattr(member, "edit", fake_edit_member, raising=False)
 
     async def immediate(task_fn) -> None:
         await task_fn()
 
-    monkeypatch.setattr("helpers.role_helper.enqueue_task", lambda fn: immediate(fn))
+    monkeypatch.setattr(
+        "helpers.role_helper.enqueue_task", lambda fn, **_: immediate(fn)
+    )
 
     # Initial assignment with moniker - nickname should be handle, not moniker
     await apply_roles_for_status(
@@ -129,15 +131,17 @@ async def test_apply_roles_fallback_to_handle(monkeypatch, temp_db) -> None:
 
     edits = {}
 
-    async def fake_edit_member(member_obj, **kwargs) -> None:
+    async def fake_edit_member(**kwargs) -> None:
         edits["nick"] = kwargs.get("nick")
 
-    monkeypatch.setattr("helpers.role_helper.edit_member", fake_edit_member)
+    monkeypatch.setattr(member, "edit", fake_edit_member, raising=False)
 
     async def immediate(task_fn) -> None:
         await task_fn()
 
-    monkeypatch.setattr("helpers.role_helper.enqueue_task", lambda fn: immediate(fn))
+    monkeypatch.setattr(
+        "helpers.role_helper.enqueue_task", lambda fn, **_: immediate(fn)
+    )
 
     await apply_roles_for_status(
         member,  # type: ignore[arg-type]
@@ -174,16 +178,18 @@ async def test_apply_roles_nickname_always_handle_even_if_moniker_present(
 
     edits = {}
 
-    async def fake_edit_member(member_obj, **kwargs) -> None:
+    async def fake_edit_member(**kwargs) -> None:
         edits.setdefault("calls", []).append(kwargs.get("nick"))
         edits["nick"] = kwargs.get("nick")
 
-    monkeypatch.setattr("helpers.role_helper.edit_member", fake_edit_member)
+    monkeypatch.setattr(member, "edit", fake_edit_member, raising=False)
 
     async def immediate(task_fn) -> None:
         await task_fn()
 
-    monkeypatch.setattr("helpers.role_helper.enqueue_task", lambda fn: immediate(fn))
+    monkeypatch.setattr(
+        "helpers.role_helper.enqueue_task", lambda fn, **_: immediate(fn)
+    )
 
     await apply_roles_for_status(
         member,  # type: ignore[arg-type]
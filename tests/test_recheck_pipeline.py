@@ -0,0 +1,234 @@
+"""
+Tests for the concurrent auto-recheck pipeline and the shared request budget.
+"""
+
+import asyncio
+import time
+import types
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from cogs.admin.recheck import AutoRecheck
+from helpers.http_helper import TokenBucket
+from services.db.database import Database
+from services.verification_state import GlobalVerificationState
+
+
+def _state(user_id: int, error: str | None = None) -> GlobalVerificationState:
+    return GlobalVerificationState(
+        user_id=user_id,
+        rsi_handle=f"Handle{user_id}",
+        status="main",
+        main_orgs=["TEST"],
+        affiliate_orgs=[],
+        community_moniker=None,
+        checked_at=int(time.time()),
+        error=error,
+    )
+
+
+def _make_cog(workers: int = 3, write_batch_size: int = 25) -> AutoRecheck:
+    bot = types.SimpleNamespace(
+        config={
+            "auto_recheck": {
+                "enabled": False,
+                "batch": {"workers": workers, "write_batch_size": write_batch_size},
+            }
+        },
+        http_client=types.SimpleNamespace(request_budget=None),
+        guilds=[],
+    )
+    return AutoRecheck(bot)  # type: ignore[arg-type]
+
+
+def _breaker(open_: bool = False, failures: int = 0) -> MagicMock:
+    breaker = MagicMock()
+    breaker.is_open.return_value = open_
+    breaker.failure_count = failures
+    return breaker
+
+
+async def _seed_verified(user_ids: list[int]) -> None:
+    async with Database.get_connection() as db:
+        await db.executemany(
+            "INSERT INTO verification (user_id, rsi_handle, last_updated) "
+            "VALUES (?, ?, 1)",
+            [(uid, f"handle{uid}") for uid in user_ids],
+        )
+        await db.commit()
+
+
+async def _recheck_rows() -> dict[int, tuple[int, str | None]]:
+    async with Database.get_connection() as db:
+        cursor = await db.execute(
+            "SELECT user_id, next_retry_at, last_error FROM auto_recheck_state"
+        )
+        return {row[0]: (row[1], row[2]) for row in await cursor.fetchall()}
+
+
+@pytest.mark.asyncio
+async def test_pipeline_runs_workers_concurrently_and_batches_writes(
+    temp_db,
+) -> None:
+    """Users are checked in parallel and schedules land in auto_recheck_state."""
+    # Arrange
+    user_ids = list(range(1, 10))
+    await _seed_verified(user_ids)
+    cog = _make_cog(workers=3, write_batch_size=4)
+    in_flight = 0
+    peak = 0
+
+    async def fake_compute(user_id, *_args, **_kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _state(user_id, error="boom" if user_id == 5 else None)
+
+    # Act
+    with (
+        patch("cogs.admin.recheck.compute_global_state", side_effect=fake_compute),
+        patch(
+            "cogs.admin.recheck.sync_user_to_all_guilds",
+            new_callable=AsyncMock,
+            return_value=[],
+        ),
+        patch("cogs.admin.recheck.get_rsi_circuit_breaker", return_value=_breaker()),
+    ):
+        run = await cog._run_pipeline([(uid, f"handle{uid}") for uid in user_ids])
+
+    # Assert
+    assert peak == 3
+    assert run.processed == len(user_ids)
+    assert run.pending_writes == 0
+    rows = await _recheck_rows()
+    assert set(rows) == set(user_ids)
+    assert rows[5][1] == "boom"
+    assert all(rows[uid][1] is None for uid in user_ids if uid != 5)
+    assert await Database.count_due_auto_rechecks(int(time.time())) == 0
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_stops_pipeline(temp_db) -> None:
+    """An open circuit breaker leaves every user due for the next run."""
+    await _seed_verified([1, 2])
+    cog = _make_cog()
+    compute = AsyncMock()
+
+    with (
+        patch("cogs.admin.recheck.compute_global_state", compute),
+        patch(
+            "cogs.admin.recheck.get_rsi_circuit_breaker",
+            return_value=_breaker(open_=True),
+        ),
+    ):
+        run = await cog._run_pipeline([(1, "handle1"), (2, "handle2")])
+
+    assert run.circuit_paused
+    compute.assert_not_awaited()
+    assert await Database.count_due_auto_rechecks(int(time.time())) == 2
+
+
+@pytest.mark.asyncio
+async def test_recent_forbidden_drains_with_single_worker(temp_db) -> None:
+    """Breaker failures short of opening shrink the pool to one worker."""
+    cog = _make_cog(workers=4)
+    in_flight = 0
+    peak = 0
+
+    async def fake_compute(user_id, *_args, **_kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.005)
+        in_flight -= 1
+        return _state(user_id, error="transient")
+
+    with (
+        patch("cogs.admin.recheck.compute_global_state", side_effect=fake_compute),
+        patch(
+            "cogs.admin.recheck.get_rsi_circuit_breaker",
+            return_value=_breaker(failures=1),
+        ),
+    ):
+        run = await cog._run_pipeline([(uid, "h") for uid in range(1, 6)])
+
+    assert peak == 1
+    assert run.processed == 5
+
+
+@pytest.mark.asyncio
+async def test_record_run_metrics_sets_throughput_and_backlog(temp_db) -> None:
+    """Throughput and backlog gauges are pushed to the health service."""
+    await _seed_verified([1, 2, 3])
+    cog = _make_cog()
+    health = types.SimpleNamespace(record_metric=AsyncMock(), set_metric=AsyncMock())
+    cog.bot.services = types.SimpleNamespace(health=health)
+    run = types.SimpleNamespace(processed=30, circuit_paused=False)
+
+    await cog._record_run_metrics(run, elapsed=60.0)  # type: ignore[arg-type]
+
+    assert cog.last_run_stats["users_per_minute"] == 30.0
+    assert cog.last_run_stats["backlog"] == 3
+    health.set_metric.assert_any_await("auto_check_users_per_minute", 30.0)
+    health.set_metric.assert_any_await("auto_check_backlog", 3)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_after_burst() -> None:
+    """Requests beyond the burst wait for refill at the configured rate."""
+    # Arrange
+    bucket = TokenBucket(rate_per_minute=600, burst=2)  # 10 tokens/s
+
+    # Act
+    start = time.monotonic()
+    for _ in range(4):
+        await bucket.acquire()
+    elapsed = time.monotonic() - start
+
+    # Assert
+    assert elapsed >= 0.15
+    assert bucket.stats()["acquired"] == 4
+    assert bucket.available() < 1
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_reservations_do_not_share_a_refill() -> None:
+    """Concurrent reservations are granted one at a time and pre-pay requests."""
+    # Arrange
+    bucket = TokenBucket(rate_per_minute=600, burst=2)  # 10 tokens/s
+    granted: list[float] = []
+
+    async def worker() -> None:
+        await bucket.reserve(2)
+        granted.append(time.monotonic())
+        # The reserved tokens cover this task's requests
+        before = bucket.available()
+        await bucket.acquire()
+        await bucket.acquire()
+        assert bucket.available() >= before
+
+    # Act
+    start = time.monotonic()
+    await asyncio.gather(worker(), worker(), worker())
+
+    # Assert — each grant waited for its own two tokens
+    assert granted[1] - start >= 0.15
+    assert granted[2] - start >= 0.35
+    assert bucket.stats()["acquired"] == 6
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_rejects_oversized_requests() -> None:
+    """Requests larger than the bucket fail; unreachable headroom is clamped."""
+    bucket = TokenBucket(rate_per_minute=600, burst=3)
+
+    with pytest.raises(ValueError):
+        await bucket.acquire(4)
+    with pytest.raises(ValueError):
+        await bucket.reserve(4)
+
+    await asyncio.wait_for(bucket.reserve(2, headroom=5), timeout=1)
+    assert bucket.available() < 2
@@ -59,7 +59,7 @@ async def test_no_prune_on_transient_cache_miss(temp_db) -> None:
             (123, "handle", 1),
         )
         await db.execute(
-            "INSERT INTO auto_recheck_state (user_id, "
+            "INSERT OR REPLACE INTO auto_recheck_state (user_id, "
             "last_auto_recheck, next_retry_at, fail_count) "
             "VALUES (?, ?, ?, ?)",
             (123, 0, 0, 0),
@@ -0,0 +1,139 @@
+"""Tests for coalesced role + nickname edits in apply_roles_for_status."""
+
+import types
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+
+from helpers import role_helper
+from helpers.role_helper import apply_roles_for_status, get_role_edit_stats
+
+
+class FakeRole:
+    def __init__(self, rid: int, name: str, default: bool = False) -> None:
+        self.id = rid
+        self.name = name
+        self._default = default
+
+    def is_default(self) -> bool:
+        return self._default
+
+    def __repr__(self) -> str:
+        return f"FakeRole({self.name})"
+
+
+EVERYONE = FakeRole(0, "@everyone", default=True)
+VERIFIED = FakeRole(1, "BotVerified")
+MAIN = FakeRole(2, "Main")
+AFFILIATE = FakeRole(3, "Affiliate")
+NON_MEMBER = FakeRole(4, "NonMember")
+OTHER = FakeRole(9, "Unmanaged")
+
+
+def _make_bot() -> types.SimpleNamespace:
+    settings = {
+        "roles.bot_verified_role": [1],
+        "roles.main_role": [2],
+        "roles.affiliate_role": [3],
+        "roles.nonmember_role": [4],
+    }
+
+    async def get_guild_setting(_guild_id, key, default=None):
+        return settings.get(key, default)
+
+    return types.SimpleNamespace(
+        services=types.SimpleNamespace(
+            config=types.SimpleNamespace(get_guild_setting=get_guild_setting)
+        ),
+        role_cache={1: VERIFIED, 2: MAIN, 3: AFFILIATE, 4: NON_MEMBER},
+    )
+
+
+def _make_member(roles: list, nick: str | None) -> types.SimpleNamespace:
+    return types.SimpleNamespace(
+        id=42,
+        guild=types.SimpleNamespace(id=123),
+        roles=[EVERYONE, *roles],
+        nick=nick,
+        edit=AsyncMock(),
+    )
+
+
+@pytest.fixture
+def immediate_queue(monkeypatch):
+    async def immediate(task_fn, **_kwargs) -> None:
+        await task_fn()
+
+    monkeypatch.setattr(role_helper, "enqueue_task", immediate)
+    monkeypatch.setattr(role_helper, "can_modify_nickname", lambda m: True)
+    monkeypatch.setattr(
+        role_helper.Database, "track_user_guild_membership", AsyncMock()
+    )
+    for key in role_helper._edit_stats:
+        monkeypatch.setitem(role_helper._edit_stats, key, 0)
+
+
+@pytest.mark.asyncio
+async def test_status_change_is_one_edit(immediate_queue) -> None:
+    """Role swap plus nickname change goes out as a single member.edit."""
+    # Arrange
+    member = _make_member([VERIFIED, AFFILIATE, OTHER], nick="old")
+
+    # Act
+    await apply_roles_for_status(member, "main", "Pilot", _make_bot())  # type: ignore[arg-type]
+
+    # Assert
+    member.edit.assert_awaited_once()
+    kwargs = member.edit.await_args.kwargs
+    assert kwargs["nick"] == "Pilot"
+    assert set(kwargs["roles"]) == {VERIFIED, MAIN, OTHER}
+    assert EVERYONE not in kwargs["roles"]
+    stats = get_role_edit_stats()
+    assert stats["edits_issued"] == 1
+    assert stats["api_calls_saved"] == 2  # remove + add + nick -> 1 edit
+
+
+@pytest.mark.asyncio
+async def test_unchanged_member_is_skipped(immediate_queue) -> None:
+    """Roles already held and matching nickname make no API call at all."""
+    member = _make_member([VERIFIED, MAIN], nick="Pilot")
+
+    await apply_roles_for_status(member, "main", "Pilot", _make_bot())  # type: ignore[arg-type]
+
+    member.edit.assert_not_awaited()
+    stats = get_role_edit_stats()
+    assert stats["edits_skipped"] == 1
+    assert stats["api_calls_saved"] == 1  # former redundant add_roles
+
+
+@pytest.mark.asyncio
+async def test_nick_only_change_omits_roles(immediate_queue) -> None:
+    """Only the fields that differ are sent."""
+    member = _make_member([VERIFIED, MAIN], nick=None)
+
+    await apply_roles_for_status(member, "main", "Pilot", _make_bot())  # type: ignore[arg-type]
+
+    member.edit.assert_awaited_once()
+    assert "roles" not in member.edit.await_args.kwargs
+
+
+@pytest.mark.asyncio
+async def test_forbidden_combined_edit_retries_fields_separately(
+    immediate_queue,
+) -> None:
+    """A Forbidden combined edit falls back to separate role and nick edits."""
+    # Arrange
+    member = _make_member([VERIFIED, AFFILIATE], nick="old")
+    forbidden = discord.Forbidden(MagicMock(status=403), "Missing Permissions")
+    member.edit.side_effect = [forbidden, forbidden, None]
+
+    # Act
+    await apply_roles_for_status(member, "main", "Pilot", _make_bot())  # type: ignore[arg-type]
+
+    # Assert
+    assert member.edit.await_count == 3
+    retried = [call.kwargs for call in member.edit.await_args_list[1:]]
+    assert set(retried[0]) == {"roles", "reason"}
+    assert retried[1]["nick"] == "Pilot"
+    assert get_role_edit_stats()["forbidden_fallbacks"] == 1
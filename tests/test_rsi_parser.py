@@ -0,0 +1,156 @@
+"""
+Tests for verification.rsi_parser — fast extractors and the parsing executor.
+
+The lxml extractors must agree with the BeautifulSoup helpers they replace,
+so most tests compare both implementations on the same HTML.
+"""
+
+import pytest
+
+from tests.factories.html_factories import (
+    load_sample_html,
+    make_org_html,
+    make_profile_html,
+)
+from verification import rsi_parser, rsi_verification
+from verification.rsi_parser import (
+    ParsedOrganizations,
+    ParsedProfile,
+    configure_parse_executor,
+    parse_organizations_page,
+    parse_profile_page,
+    run_parser,
+    shutdown_parse_executor,
+)
+from verification.rsi_verification import (
+    extract_handle,
+    extract_moniker,
+    parse_rsi_org_sids,
+)
+
+
+def _org_entry(label: str, value: str) -> str:
+    return (
+        f'<p class="entry"><span class="label">{label}</span>'
+        f'<strong class="value">{value}</strong></p>'
+    )
+
+
+ORG_PAGES = [
+    load_sample_html("sample_rsi_organizations.html"),
+    make_org_html(),
+    make_org_html(main_org="TEST", affiliates=[("A", True), ("B", False)]),
+    make_org_html(main_org="TEST", malformed=True),
+    "<html><body>"
+    '<div class="box-content org main visibility-V">'
+    f"{_org_entry('Organization', 'x')}"
+    f"{_org_entry('Spectrum Identification (SID)', 'TEST')}</div>"
+    '<div class="box-content org affiliation visibility-V">'
+    f"{_org_entry('SID', '&nbsp;')}</div>"
+    '<div class="box-content org affiliation visibility-R"></div>'
+    '<div class="box-content org affiliation visibility-V">'
+    f"{_org_entry('Spectrum Identification (SID)', ' XVII ')}</div>"
+    "</body></html>",
+    '<div class="box-content org main">'
+    f"{_org_entry('Spectrum Identification (SID)', '')}</div>",
+]
+
+PROFILE_PAGES = [
+    load_sample_html("sample_rsi_profile.html"),
+    make_profile_html(handle="Pilot", community_moniker="Ace"),
+    '<div class="profile"><div class="info">'
+    '<p class="entry"><strong class="value">Cool Moniker</strong></p>'
+    f"{_org_entry('Handle name', 'CaseHandle')}</div></div>",
+    '<div class="profile"><div class="info">'
+    f"{_org_entry('Handle name', 'CaseHandle')}</div></div>",
+    '<p class="entry"><strong class="value">Outside\u200b Info</strong></p>'
+    f"{_org_entry('Handle name', 'Other')}",
+    "<html><body><p>No profile here</p></body></html>",
+]
+
+
+@pytest.mark.parametrize("html", ORG_PAGES)
+def test_org_sids_match_soup_parser(html: str) -> None:
+    """Fast SID extraction returns exactly what parse_rsi_org_sids returns."""
+    # Act
+    parsed = parse_organizations_page(html)
+
+    # Assert
+    expected = parse_rsi_org_sids(html)
+    assert parsed.main_orgs == expected["main_orgs"]
+    assert parsed.affiliate_orgs == expected["affiliate_orgs"]
+    assert parsed.org_data is None
+
+
+@pytest.mark.parametrize("html", PROFILE_PAGES)
+def test_profile_fields_match_soup_parser(html: str) -> None:
+    """Fast handle/moniker extraction agrees with the soup helpers."""
+    # Act
+    parsed = parse_profile_page(html)
+
+    # Assert
+    handle = extract_handle(html)
+    assert parsed.handle == handle
+    assert parsed.moniker == extract_moniker(html, handle)
+
+
+def test_sample_pages_never_build_a_soup(monkeypatch) -> None:
+    """Real RSI pages are served by the lxml extractors alone."""
+    soups: list[str] = []
+    real_parse = rsi_verification._parse_html_document
+
+    def _recording_parse(html_content: str):
+        soups.append(html_content)
+        return real_parse(html_content)
+
+    monkeypatch.setattr(rsi_verification, "_parse_html_document", _recording_parse)
+
+    orgs = parse_organizations_page(load_sample_html("sample_rsi_organizations.html"))
+    profile = parse_profile_page(load_sample_html("sample_rsi_profile.html"))
+
+    assert orgs.affiliate_orgs == ["REDACTED"] * 3
+    assert profile.handle == "John_Doe"
+    assert soups == []
+
+
+def test_name_data_only_parsed_on_request() -> None:
+    """org_data is filled for the legacy name-based path."""
+    html = load_sample_html("sample_rsi_organizations.html")
+
+    parsed = parse_organizations_page(html, "TEST Squadron - Best Squadron!")
+
+    assert parsed.org_data is not None
+    assert parsed.org_data["main_organization"] == "test squadron - best squadron!"
+
+
+def test_empty_document_falls_back_to_soup() -> None:
+    """lxml rejects empty documents; the soup fallback still answers."""
+    assert parse_organizations_page("") == ParsedOrganizations()
+    assert parse_profile_page("") == ParsedProfile()
+
+
+@pytest.mark.parametrize("kind", ["inline", "thread", "process"])
+@pytest.mark.asyncio
+async def test_run_parser_on_each_executor_kind(kind: str) -> None:
+    """Every configurable executor kind returns the same parsed result."""
+    # Arrange
+    configure_parse_executor({"rsi": {"parser": {"executor": kind, "max_workers": 1}}})
+    html = load_sample_html("sample_rsi_profile.html")
+
+    # Act
+    try:
+        parsed = await run_parser(parse_profile_page, html)
+    finally:
+        shutdown_parse_executor(wait=True)
+        configure_parse_executor(None)
+
+    # Assert
+    assert parsed == ParsedProfile(handle="John_Doe", moniker=None)
+
+
+def test_unknown_executor_kind_defaults_to_thread() -> None:
+    configure_parse_executor({"rsi": {"parser": {"executor": "gpu"}}})
+    try:
+        assert rsi_parser._executor_kind == "thread"
+    finally:
+        configure_parse_executor(None)
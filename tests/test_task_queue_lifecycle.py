@@ -24,7 +24,7 @@ async def test_task_queue_workers_start_and_stop(monkeypatch):
     calls: list[tuple[str, object]] = []
 
     # Stubs for task queue lifecycle
-    async def fake_start_task_workers(num_workers: int = 2) -> None:
+    async def fake_start_task_workers(num_workers: int = 2, **_kwargs) -> None:
         calls.append(("start", num_workers))
 
     async def fake_stop_task_workers() -> None:
@@ -0,0 +1,248 @@
+"""Tests for the per-bucket, priority-aware Discord task scheduler."""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from helpers import task_queue
+from helpers.task_queue import (
+    Priority,
+    enqueue_task,
+    flush_tasks,
+    get_queue_stats,
+    start_task_workers,
+    stop_task_workers,
+    task_priority,
+)
+
+
+@pytest_asyncio.fixture
+async def scheduler():
+    """Fresh scheduler with workers started by each test."""
+    original = task_queue.task_queue
+    task_queue.task_queue = task_queue.TaskScheduler()
+    yield task_queue.task_queue
+    await stop_task_workers()
+    task_queue.task_queue = original
+
+
+def _recorder(log: list[str], name: str, delay: float = 0.0):
+    async def _task() -> str:
+        log.append(f"start:{name}")
+        if delay:
+            await asyncio.sleep(delay)
+        log.append(f"end:{name}")
+        return name
+
+    return _task
+
+
+@pytest.mark.asyncio
+async def test_enqueue_without_workers_runs_inline() -> None:
+    """With no workers, tasks still run (isolated tests rely on this)."""
+    log: list[str] = []
+
+    future = await enqueue_task(_recorder(log, "a"))
+
+    assert log == ["start:a", "end:a"]
+    assert future.result() == "a"
+
+
+@pytest.mark.asyncio
+async def test_slow_bucket_does_not_block_other_buckets(scheduler) -> None:
+    """A backed-up channel bucket leaves member edits unaffected."""
+    # Arrange
+    await start_task_workers(num_workers=2, rate_per_second=1000)
+    log: list[str] = []
+
+    # Act
+    for idx in range(3):
+        await enqueue_task(
+            _recorder(log, f"chan{idx}", delay=0.05), bucket="channel", major_id=1
+        )
+    member_future = await enqueue_task(
+        _recorder(log, "member"), bucket="member", major_id=10
+    )
+    await asyncio.wait_for(member_future, timeout=1)
+
+    # Assert
+    assert "end:member" in log
+    assert "start:chan1" not in log  # channel bucket still on its first task
+    await flush_tasks(max_wait=1)
+    assert log.count("end:chan2") == 1
+
+
+@pytest.mark.asyncio
+async def test_bucket_limit_of_one_runs_serially(scheduler) -> None:
+    """Tasks in a bucket limited to one slot never overlap."""
+    await start_task_workers(num_workers=4, rate_per_second=1000)
+    log: list[str] = []
+
+    for idx in range(4):
+        await enqueue_task(
+            _recorder(log, str(idx), delay=0.01), bucket="channel", major_id=5
+        )
+    await flush_tasks(max_wait=1)
+
+    assert log == [f"{edge}:{idx}" for idx in range(4) for edge in ("start", "end")]
+
+
+@pytest.mark.asyncio
+async def test_same_bucket_runs_up_to_its_concurrency(scheduler) -> None:
+    """Tasks sharing a bucket and major id overlap up to bucket_concurrency."""
+    await start_task_workers(num_workers=4, rate_per_second=1000, bucket_concurrency=2)
+    running = 0
+    peak = 0
+    release = asyncio.Event()
+
+    async def _task() -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await release.wait()
+        running -= 1
+
+    for _ in range(4):
+        await enqueue_task(_task, bucket="member", major_id=5)
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert running == 2  # both slots taken, the rest wait in the sub-queue
+
+    release.set()
+    await flush_tasks(max_wait=1)
+    assert peak == 2
+    assert get_queue_stats()["buckets"]["interactive:member"]["completed"] == 4
+
+
+@pytest.mark.asyncio
+async def test_interactive_jumps_ahead_of_bulk(scheduler) -> None:
+    """Queued bulk work waits while interactive work is pending."""
+    # Arrange
+    await start_task_workers(num_workers=1, rate_per_second=1000)
+    gate = asyncio.Event()
+    log: list[str] = []
+
+    async def blocker() -> None:
+        await gate.wait()
+
+    await enqueue_task(blocker, bucket="gate")
+    with task_priority(Priority.BULK):
+        for idx in range(3):
+            await enqueue_task(_recorder(log, f"bulk{idx}"), bucket="member")
+    await enqueue_task(_recorder(log, "click"), bucket="message")
+
+    # Act
+    gate.set()
+    await flush_tasks(max_wait=1)
+
+    # Assert
+    starts = [entry for entry in log if entry.startswith("start:")]
+    assert starts[0] == "start:click"
+
+
+@pytest.mark.asyncio
+async def test_interactive_work_overtakes_a_bulk_backlog(scheduler) -> None:
+    """Clicks queued behind a multi-guild bulk sync start within a few picks."""
+    await start_task_workers(num_workers=2, rate_per_second=10_000)
+    gate = asyncio.Event()
+    log: list[str] = []
+
+    async def blocker() -> None:
+        await gate.wait()
+
+    for worker in range(2):
+        await enqueue_task(blocker, bucket="gate", major_id=worker)
+    with task_priority(Priority.BULK):
+        for idx in range(100):
+            await enqueue_task(
+                _recorder(log, f"bulk{idx}"), bucket="member", major_id=idx % 5
+            )
+        for idx in range(10):
+            await enqueue_task(_recorder(log, f"chan{idx}"), bucket="channel")
+    for idx in range(3):
+        await enqueue_task(
+            _recorder(log, f"click{idx}"), bucket="channel_create", major_id=idx
+        )
+    gate.set()
+    await flush_tasks(max_wait=5)
+
+    starts = [entry for entry in log if entry.startswith("start:")]
+    assert len(starts) == 113
+    assert starts[:3] == ["start:click0", "start:click1", "start:click2"]
+    stats = get_queue_stats()
+    assert stats["pending"] == 0
+    assert stats["active_subqueues"] == 0
+    assert stats["buckets"]["bulk:member"]["completed"] == 100
+
+
+@pytest.mark.asyncio
+async def test_bulk_is_not_starved(scheduler) -> None:
+    """bulk_share_every guarantees bulk progress under interactive load."""
+    await start_task_workers(num_workers=1, rate_per_second=1000, bulk_share_every=2)
+    gate = asyncio.Event()
+    log: list[str] = []
+
+    async def blocker() -> None:
+        await gate.wait()
+
+    await enqueue_task(blocker, bucket="gate")
+    await enqueue_task(_recorder(log, "bulk"), priority=Priority.BULK, bucket="member")
+    for idx in range(6):
+        await enqueue_task(_recorder(log, f"ui{idx}"), bucket=f"ui{idx}")
+
+    gate.set()
+    await flush_tasks(max_wait=1)
+
+    starts = [entry for entry in log if entry.startswith("start:")]
+    assert starts.index("start:bulk") <= 2
+
+
+@pytest.mark.asyncio
+async def test_per_bucket_stats(scheduler) -> None:
+    """Stats are reported per priority and bucket with depth back at zero."""
+    await start_task_workers(num_workers=2, rate_per_second=1000)
+    for guild_id in range(3):
+        await enqueue_task(_recorder([], "m"), bucket="member", major_id=guild_id)
+    await enqueue_task(_recorder([], "b"), priority=Priority.BULK, bucket="member")
+    await flush_tasks(max_wait=1)
+
+    stats = get_queue_stats()
+
+    assert stats["pending"] == 0
+    assert stats["active_subqueues"] == 0
+    interactive = stats["buckets"]["interactive:member"]
+    assert interactive["enqueued"] == interactive["completed"] == 3
+    assert interactive["depth"] == 0
+    assert interactive["max_depth"] >= 1
+    assert stats["buckets"]["bulk:member"]["completed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_queued_work(scheduler) -> None:
+    """stop_task_workers lets queued tasks finish before workers exit."""
+    await start_task_workers(num_workers=1, rate_per_second=1000)
+    log: list[str] = []
+    for idx in range(3):
+        await enqueue_task(_recorder(log, str(idx), delay=0.01), bucket="member")
+
+    await stop_task_workers()
+
+    assert log.count("end:2") == 1
+    assert not task_queue._worker_tasks
+
+
+@pytest.mark.asyncio
+async def test_failed_task_resolves_future_with_exception(scheduler) -> None:
+    """A task that raises must not leave its caller awaiting forever."""
+    await start_task_workers(num_workers=1, rate_per_second=1000)
+
+    async def _boom() -> None:
+        raise ValueError("boom")
+
+    future = await enqueue_task(_boom, bucket="member")
+
+    with pytest.raises(ValueError, match="boom"):
+        await asyncio.wait_for(future, timeout=1)
+    await flush_tasks(max_wait=1)
+    assert get_queue_stats()["buckets"]["interactive:member"]["failed"] == 1
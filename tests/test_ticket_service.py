@@ -339,6 +339,27 @@ class TestTicketQueries:
         page3 = await ticket_svc.get_tickets(GUILD_ID, limit=2, offset=4)
         assert len(page3) == 1
 
+    @pytest.mark.asyncio
+    async def test_get_tickets_keyset_pagination(
+        self, ticket_svc: TicketService
+    ) -> None:
+        """Keyset pages walk every ticket once, newest first, even on ties."""
+        for i in range(5):
+            await ticket_svc.create_ticket(GUILD_ID, CHANNEL_ID, 9100 + i, USER_ID)
+
+        seen: list[int] = []
+        after = None
+        while True:
+            page = await ticket_svc.get_tickets(GUILD_ID, limit=2, after=after)
+            seen.extend(t["id"] for t in page)
+            if len(page) < 2:
+                break
+            after = (page[-1]["created_at"], page[-1]["id"])
+
+        all_tickets = await ticket_svc.get_tickets(GUILD_ID)
+        assert seen == [t["id"] for t in all_tickets]
+        assert len(seen) == 5
+
     @pytest.mark.asyncio
     async def test_get_tickets_filter_status(self, ticket_svc: TicketService) -> None:
         """Filtering by status works."""
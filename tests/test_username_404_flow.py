@@ -70,7 +70,7 @@ async def test_handle_username_404_idempotent(temp_db, monkeypatch) -> None:
             (101, "OldHandle", 1),
         )
         await db.execute(
-            "INSERT INTO auto_recheck_state(user_id, last_auto_recheck, "
+            "INSERT OR REPLACE INTO auto_recheck_state(user_id, last_auto_recheck, "
             "next_retry_at, fail_count) VALUES (?,?,?,?)",
             (101, 0, 0, 0),
         )
@@ -135,7 +135,9 @@ async def test_handle_username_404_idempotent(temp_db, monkeypatch) -> None:
     async def immediate(task_func) -> None:
         await task_func()
 
-    monkeypatch.setattr("helpers.username_404.enqueue_task", lambda fn: immediate(fn))
+    monkeypatch.setattr(
+        "helpers.username_404.enqueue_task", lambda fn, **_: immediate(fn)
+    )
 
     # First call should flag + remove roles + unschedule
     changed = await handle_username_404(bot, member, "OldHandle")  # type: ignore[arg-type]
@@ -213,7 +215,9 @@ async def test_handle_username_404_new_handle_reflags(temp_db, monkeypatch) -> N
     async def immediate(task_func) -> None:
         await task_func()
 
-    monkeypatch.setattr("helpers.username_404.enqueue_task", lambda fn: immediate(fn))
+    monkeypatch.setattr(
+        "helpers.username_404.enqueue_task", lambda fn, **_: immediate(fn)
+    )
 
     # First 404
     changed1 = await handle_username_404(bot, member, "FirstHandle")  # type: ignore[arg-type]
@@ -289,7 +293,9 @@ async def test_admin_recheck_404_posts_leadership_log(temp_db, monkeypatch) -> N
     async def immediate(task_func) -> None:
         await task_func()
 
-    monkeypatch.setattr("helpers.username_404.enqueue_task", lambda fn: immediate(fn))
+    monkeypatch.setattr(
+        "helpers.username_404.enqueue_task", lambda fn, **_: immediate(fn)
+    )
 
     # Patch leadership log channel send to be immediate (bypass task queue)
     async def leader_send_patch(channel, content, embed=None) -> None:
@@ -463,7 +469,9 @@ async def test_admin_recheck_404_leadership_changeset(temp_db, monkeypatch) -> N
     async def immediate(task_func) -> None:
         await task_func()
 
-    monkeypatch.setattr("helpers.username_404.enqueue_task", lambda fn: immediate(fn))
+    monkeypatch.setattr(
+        "helpers.username_404.enqueue_task", lambda fn, **_: immediate(fn)
+    )
     monkeypatch.setattr("helpers.username_404.flush_tasks", lambda: None)
 
     # Patch leadership log send to capture message
@@ -646,7 +654,9 @@ async def test_handle_username_404_new_handle_triggers_again(
     async def immediate(task_func) -> None:
         await task_func()
 
-    monkeypatch.setattr("helpers.username_404.enqueue_task", lambda fn: immediate(fn))
+    monkeypatch.setattr(
+        "helpers.username_404.enqueue_task", lambda fn, **_: immediate(fn)
+    )
     # First 404 (FirstHandle)
     changed1 = await handle_username_404(bot, member, "FirstHandle")  # type: ignore[arg-type]
     assert changed1 is True
@@ -17,6 +17,17 @@ from services.verification_bulk_service import (
 from services.verification_state import GlobalVerificationState, VerificationStatus
 
 
+@pytest.fixture(autouse=True)
+def no_handle_conflicts():
+    """Keep the pre-sync handle check off the real database."""
+    with patch(
+        "services.verification_state.find_handle_conflict",
+        new_callable=AsyncMock,
+        return_value=None,
+    ) as mock_conflict:
+        yield mock_conflict
+
+
 def _make_global_state(
     user_id: int, handle: str, status: VerificationStatus, error: str | None = None
 ):
@@ -63,7 +74,11 @@ async def test_perform_rsi_recheck_concurrent_execution():
         patch(
             "services.verification_state.compute_global_state", side_effect=mock_compute
         ),
-        patch("services.verification_state.store_global_state", new_callable=AsyncMock),
+        patch(
+            "services.verification_state.store_global_states",
+            new_callable=AsyncMock,
+            return_value={},
+        ),
         patch(
             "services.verification_scheduler.schedule_user_recheck",
             new_callable=AsyncMock,
@@ -104,7 +119,11 @@ async def test_perform_rsi_recheck_all_main():
         patch(
             "services.verification_state.compute_global_state", side_effect=mock_compute
         ),
-        patch("services.verification_state.store_global_state", new_callable=AsyncMock),
+        patch(
+            "services.verification_state.store_global_states",
+            new_callable=AsyncMock,
+            return_value={},
+        ),
         patch(
             "services.verification_scheduler.schedule_user_recheck",
             new_callable=AsyncMock,
@@ -153,7 +172,11 @@ async def test_perform_rsi_recheck_mixed_statuses():
         patch(
             "services.verification_state.compute_global_state", side_effect=mock_compute
         ),
-        patch("services.verification_state.store_global_state", new_callable=AsyncMock),
+        patch(
+            "services.verification_state.store_global_states",
+            new_callable=AsyncMock,
+            return_value={},
+        ),
         patch(
             "services.verification_scheduler.schedule_user_recheck",
             new_callable=AsyncMock,
@@ -194,7 +217,11 @@ async def test_perform_rsi_recheck_not_found():
         patch(
             "services.verification_state.compute_global_state", side_effect=mock_compute
         ),
-        patch("services.verification_state.store_global_state", new_callable=AsyncMock),
+        patch(
+            "services.verification_state.store_global_states",
+            new_callable=AsyncMock,
+            return_value={},
+        ),
         patch(
             "services.verification_scheduler.schedule_user_recheck",
             new_callable=AsyncMock,
@@ -237,7 +264,11 @@ async def test_perform_rsi_recheck_generic_error():
         patch(
             "services.verification_state.compute_global_state", side_effect=mock_compute
         ),
-        patch("services.verification_state.store_global_state", new_callable=AsyncMock),
+        patch(
+            "services.verification_state.store_global_states",
+            new_callable=AsyncMock,
+            return_value={},
+        ),
         patch(
             "services.verification_scheduler.schedule_user_recheck",
             new_callable=AsyncMock,
@@ -278,7 +309,11 @@ async def test_perform_rsi_recheck_no_handle():
         patch(
             "services.verification_state.compute_global_state", side_effect=mock_compute
         ),
-        patch("services.verification_state.store_global_state", new_callable=AsyncMock),
+        patch(
+            "services.verification_state.store_global_states",
+            new_callable=AsyncMock,
+            return_value={},
+        ),
         patch(
             "services.verification_scheduler.schedule_user_recheck",
             new_callable=AsyncMock,
@@ -320,7 +355,11 @@ async def test_perform_rsi_recheck_with_error_in_state():
         patch(
             "services.verification_state.compute_global_state", side_effect=mock_compute
         ),
-        patch("services.verification_state.store_global_state", new_callable=AsyncMock),
+        patch(
+            "services.verification_state.store_global_states",
+            new_callable=AsyncMock,
+            return_value={},
+        ),
         patch(
             "services.verification_scheduler.schedule_user_recheck",
             new_callable=AsyncMock,
@@ -539,7 +578,11 @@ async def test_perform_rsi_recheck_partial_failures():
         patch(
             "services.verification_state.compute_global_state", side_effect=mock_compute
         ),
-        patch("services.verification_state.store_global_state", new_callable=AsyncMock),
+        patch(
+            "services.verification_state.store_global_states",
+            new_callable=AsyncMock,
+            return_value={},
+        ),
         patch(
             "services.verification_scheduler.schedule_user_recheck",
             new_callable=AsyncMock,
@@ -589,7 +632,11 @@ async def test_guild_sync_called_on_successful_recheck() -> None:
         patch(
             "services.verification_state.compute_global_state", side_effect=mock_compute
         ),
-        patch("services.verification_state.store_global_state", new_callable=AsyncMock),
+        patch(
+            "services.verification_state.store_global_states",
+            new_callable=AsyncMock,
+            return_value={},
+        ),
         patch(
             "services.verification_scheduler.schedule_user_recheck",
             new_callable=AsyncMock,
@@ -632,16 +679,20 @@ async def test_guild_sync_not_called_on_error_state() -> None:
         patch(
             "services.verification_state.compute_global_state", side_effect=mock_compute
         ),
-        patch("services.verification_state.store_global_state", new_callable=AsyncMock),
+        patch(
+            "services.verification_state.store_global_states",
+            new_callable=AsyncMock,
+            return_value={},
+        ),
         patch(
             "services.verification_scheduler.schedule_user_recheck",
             new_callable=AsyncMock,
         ),
         patch("services.guild_sync.sync_user_to_all_guilds", mock_sync),
         patch(
-            "services.db.database.Database.get_auto_recheck_fail_count",
+            "services.db.database.Database.get_auto_recheck_fail_counts",
             new_callable=AsyncMock,
-            return_value=0,
+            return_value={1: 0},
         ),
         patch(
             "services.verification_scheduler.handle_recheck_failure",
@@ -660,7 +711,7 @@ async def test_guild_sync_not_called_on_error_state() -> None:
 
 @pytest.mark.asyncio
 async def test_store_not_called_on_error_state() -> None:
-    """Verify store_global_state is NOT called when compute returns an error."""
+    """Verify no state is persisted when compute returns an error."""
     from services.verification_bulk_service import VerificationBulkService
 
     bot = Mock()
@@ -679,22 +730,22 @@ async def test_store_not_called_on_error_state() -> None:
             user_id, handle, "non_member", error="RSI fetch failed"
         )
 
-    mock_store = AsyncMock()
+    mock_store = AsyncMock(return_value={})
 
     with (
         patch(
             "services.verification_state.compute_global_state", side_effect=mock_compute
         ),
-        patch("services.verification_state.store_global_state", mock_store),
+        patch("services.verification_state.store_global_states", mock_store),
         patch(
             "services.verification_scheduler.schedule_user_recheck",
             new_callable=AsyncMock,
         ),
         patch("services.guild_sync.sync_user_to_all_guilds", new_callable=AsyncMock),
         patch(
-            "services.db.database.Database.get_auto_recheck_fail_count",
+            "services.db.database.Database.get_auto_recheck_fail_counts",
             new_callable=AsyncMock,
-            return_value=0,
+            return_value={1: 0},
         ),
         patch(
             "services.verification_scheduler.handle_recheck_failure",
@@ -703,13 +754,14 @@ async def test_store_not_called_on_error_state() -> None:
     ):
         await service._perform_rsi_recheck(input_rows, guild_id=123456789)
 
-    # store_global_state must NOT have been called since error was set
-    mock_store.assert_not_awaited()
+    # The batch carries the failure but no state since error was set
+    mock_store.assert_awaited_once()
+    assert mock_store.call_args[0][0] == []
 
 
 @pytest.mark.asyncio
 async def test_handle_recheck_failure_called_on_error_state() -> None:
-    """Verify handle_recheck_failure IS called when compute returns an error."""
+    """Verify an error state is written as a recheck failure with backoff."""
     from services.verification_bulk_service import VerificationBulkService
 
     bot = Mock()
@@ -726,40 +778,33 @@ async def test_handle_recheck_failure_called_on_error_state() -> None:
     ) -> GlobalVerificationState:
         return _make_global_state(user_id, handle, "non_member", error="RSI is down")
 
-    mock_handle_failure = AsyncMock()
+    mock_store = AsyncMock(return_value={})
 
     with (
         patch(
             "services.verification_state.compute_global_state", side_effect=mock_compute
         ),
-        patch("services.verification_state.store_global_state", new_callable=AsyncMock),
-        patch(
-            "services.verification_scheduler.schedule_user_recheck",
-            new_callable=AsyncMock,
-        ),
+        patch("services.verification_state.store_global_states", mock_store),
         patch("services.guild_sync.sync_user_to_all_guilds", new_callable=AsyncMock),
         patch(
-            "services.db.database.Database.get_auto_recheck_fail_count",
+            "services.db.database.Database.get_auto_recheck_fail_counts",
             new_callable=AsyncMock,
-            return_value=2,
-        ),
-        patch(
-            "services.verification_scheduler.handle_recheck_failure",
-            mock_handle_failure,
+            return_value={1: 2},
         ),
     ):
         await service._perform_rsi_recheck(input_rows, guild_id=123456789)
 
-    mock_handle_failure.assert_awaited_once()
-    call_kwargs = mock_handle_failure.call_args
-    assert call_kwargs[0][0] == 1  # user_id
-    assert "RSI is down" in call_kwargs[0][1]  # error message
-    assert call_kwargs[1]["fail_count"] == 3  # incremented from 2
+    mock_store.assert_awaited_once()
+    [(user_id, next_retry_at, error)] = mock_store.call_args[1]["failures"]
+    assert user_id == 1
+    assert "RSI is down" in error
+    # Backoff for fail_count 3 (incremented from 2): 4 x 180 minutes
+    assert next_retry_at - int(time.time()) >= 4 * 180 * 60 - 5
 
 
 @pytest.mark.asyncio
 async def test_store_called_on_successful_recheck() -> None:
-    """Verify store_global_state IS called when compute succeeds (no error)."""
+    """Verify the state IS persisted when compute succeeds (no error)."""
     from services.verification_bulk_service import VerificationBulkService
 
     bot = Mock()
@@ -776,13 +821,13 @@ async def test_store_called_on_successful_recheck() -> None:
     ) -> GlobalVerificationState:
         return _make_global_state(user_id, handle, "affiliate")
 
-    mock_store = AsyncMock()
+    mock_store = AsyncMock(return_value={})
 
     with (
         patch(
             "services.verification_state.compute_global_state", side_effect=mock_compute
         ),
-        patch("services.verification_state.store_global_state", mock_store),
+        patch("services.verification_state.store_global_states", mock_store),
         patch(
             "services.verification_scheduler.schedule_user_recheck",
             new_callable=AsyncMock,
@@ -792,6 +837,142 @@ async def test_store_called_on_successful_recheck() -> None:
         await service._perform_rsi_recheck(input_rows, guild_id=123456789)
 
     mock_store.assert_awaited_once()
-    stored_state = mock_store.call_args[0][0]
+    [stored_state] = mock_store.call_args[0][0]
     assert stored_state.user_id == 1
     assert stored_state.status == "affiliate"
+
+
+@pytest.mark.asyncio
+async def test_handle_conflict_marks_row_as_error() -> None:
+    """Users skipped by the batch write for a handle conflict report an error."""
+    from services.verification_bulk_service import VerificationBulkService
+
+    bot = Mock()
+    bot.http_client = Mock()
+    bot.config = {}
+    service = VerificationBulkService(bot)
+
+    input_rows = [
+        StatusRow(1, "User1", "handle1", "main", 1609459200, "General"),
+        StatusRow(2, "User2", "handle2", "main", 1609459200, "General"),
+    ]
+
+    async def mock_compute(
+        user_id: int, handle: str, http_client: object, **kwargs: object
+    ) -> GlobalVerificationState:
+        return _make_global_state(user_id, handle, "main")
+
+    with (
+        patch(
+            "services.verification_state.compute_global_state", side_effect=mock_compute
+        ),
+        patch(
+            "services.verification_state.store_global_states",
+            new_callable=AsyncMock,
+            return_value={2: "RSI handle already verified by another user"},
+        ),
+        patch("services.guild_sync.sync_user_to_all_guilds", new_callable=AsyncMock),
+    ):
+        result_rows = await service._perform_rsi_recheck(input_rows, guild_id=123456789)
+
+    assert result_rows[0].rsi_error is None
+    assert result_rows[1].rsi_error == "RSI handle already verified by another user"
+
+
+@pytest.mark.asyncio
+async def test_handle_conflicts_skip_guild_sync(no_handle_conflicts) -> None:
+    """Handles held elsewhere or earlier in the batch never get roles applied."""
+    from services.verification_bulk_service import VerificationBulkService
+
+    bot = Mock()
+    bot.http_client = Mock()
+    bot.config = {}
+    service = VerificationBulkService(bot)
+
+    input_rows = [
+        StatusRow(1, "User1", "handle1", "main", 1609459200, "General"),
+        StatusRow(2, "User2", "taken", "main", 1609459200, "General"),
+        StatusRow(3, "User3", "Handle1", "main", 1609459200, "General"),
+    ]
+
+    async def mock_compute(
+        user_id: int, handle: str, http_client: object, **kwargs: object
+    ) -> GlobalVerificationState:
+        return _make_global_state(user_id, handle, "main")
+
+    async def mock_conflict(state: GlobalVerificationState) -> str | None:
+        return "held by user 9" if state.user_id == 2 else None
+
+    no_handle_conflicts.side_effect = mock_conflict
+    mock_sync = AsyncMock(return_value=[])
+    mock_store = AsyncMock(return_value={})
+
+    with (
+        patch(
+            "services.verification_state.compute_global_state", side_effect=mock_compute
+        ),
+        patch("services.verification_state.store_global_states", mock_store),
+        patch("services.guild_sync.sync_user_to_all_guilds", mock_sync),
+    ):
+        result_rows = await service._perform_rsi_recheck(input_rows, guild_id=123456789)
+
+    assert [call.args[0].user_id for call in mock_sync.await_args_list] == [1]
+    assert [state.user_id for state in mock_store.await_args.args[0]] == [1]
+    assert [row.rsi_error for row in result_rows] == [
+        None,
+        "held by user 9",
+        "RSI handle 'HANDLE1' is already verified by another user: 1",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_write_falls_back_to_per_user_writes() -> None:
+    """A batch that fails to commit is retried one user at a time."""
+    from services.guild_sync import GuildSyncResult
+    from services.verification_bulk_service import VerificationBulkService
+
+    bot = Mock()
+    bot.http_client = Mock()
+    bot.config = {}
+    service = VerificationBulkService(bot)
+
+    input_rows = [
+        StatusRow(1, "User1", "handle1", "main", 1609459200, "General"),
+        StatusRow(2, "User2", "handle2", "main", 1609459200, "General"),
+    ]
+
+    async def mock_compute(
+        user_id: int, handle: str, http_client: object, **kwargs: object
+    ) -> GlobalVerificationState:
+        return _make_global_state(user_id, handle, "main")
+
+    async def mock_sync(state: GlobalVerificationState, *args, **kwargs):
+        return [Mock(spec=GuildSyncResult, user_id=state.user_id, guild_id=42)]
+
+    async def mock_store(states, **kwargs):
+        if len(states) > 1:
+            raise RuntimeError("database is locked")
+        if states[0].user_id == 2:
+            raise RuntimeError("disk I/O error")
+        return {}
+
+    store = AsyncMock(side_effect=mock_store)
+
+    with (
+        patch(
+            "services.verification_state.compute_global_state", side_effect=mock_compute
+        ),
+        patch("services.verification_state.store_global_states", store),
+        patch("services.guild_sync.sync_user_to_all_guilds", side_effect=mock_sync),
+    ):
+        result_rows = await service._perform_rsi_recheck(input_rows, guild_id=123456789)
+
+    assert store.await_count == 3
+    retry = store.await_args_list[1]
+    assert [state.user_id for state in retry.args[0]] == [1]
+    assert retry.kwargs["memberships"] == [(1, 42)]
+    assert retry.kwargs["schedules"][0][0] == 1
+    assert result_rows[0].rsi_error is None
+    assert result_rows[1].rsi_error == (
+        "Failed to store verification state: disk I/O error"
+    )
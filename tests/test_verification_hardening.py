@@ -65,8 +65,14 @@ async def test_bulk_recheck_calls_guild_sync_on_success() -> None:
             side_effect=mock_compute,
         ),
         patch(
-            "services.verification_state.store_global_state",
+            "services.verification_state.find_handle_conflict",
             new_callable=AsyncMock,
+            return_value=None,
+        ),
+        patch(
+            "services.verification_state.store_global_states",
+            new_callable=AsyncMock,
+            return_value={},
         ),
         patch(
             "services.verification_scheduler.schedule_user_recheck",
@@ -104,7 +110,7 @@ async def test_bulk_recheck_skips_sync_on_error_state() -> None:
     ]
 
     mock_sync = AsyncMock(return_value=[])
-    mock_store = AsyncMock()
+    mock_store = AsyncMock(return_value={})
 
     async def mock_compute(user_id, handle, http_client, **kwargs):
         return _make_global_state(
@@ -117,7 +123,7 @@ async def test_bulk_recheck_skips_sync_on_error_state() -> None:
             side_effect=mock_compute,
         ),
         patch(
-            "services.verification_state.store_global_state",
+            "services.verification_state.store_global_states",
             mock_store,
         ),
         patch(
@@ -133,17 +139,18 @@ async def test_bulk_recheck_skips_sync_on_error_state() -> None:
             mock_sync,
         ),
         patch(
-            "services.db.database.Database.get_auto_recheck_fail_count",
+            "services.db.database.Database.get_auto_recheck_fail_counts",
             new_callable=AsyncMock,
-            return_value=0,
+            return_value={1: 0},
         ),
     ):
         result_rows = await service._perform_rsi_recheck(input_rows, guild_id=123)
 
     # Guild sync must NOT be called for error states
     mock_sync.assert_not_called()
-    # store_global_state must NOT be called for error states
-    mock_store.assert_not_called()
+    # No state may be persisted for error states
+    mock_store.assert_awaited_once()
+    assert mock_store.call_args[0][0] == []
 
     assert len(result_rows) == 1
     assert result_rows[0].rsi_error == "RSI fetch failed"
@@ -151,7 +158,7 @@ async def test_bulk_recheck_skips_sync_on_error_state() -> None:
 
 @pytest.mark.asyncio
 async def test_bulk_recheck_calls_handle_recheck_failure_on_error() -> None:
-    """Bulk pipeline must call handle_recheck_failure for error states."""
+    """Bulk pipeline must persist a recheck failure for error states."""
     from services.verification_bulk_service import VerificationBulkService
 
     bot = Mock()
@@ -163,7 +170,7 @@ async def test_bulk_recheck_calls_handle_recheck_failure_on_error() -> None:
         StatusRow(1, "User1", "handle1", "main", 1609459200, "General"),
     ]
 
-    mock_failure = AsyncMock()
+    mock_store = AsyncMock(return_value={})
 
     async def mock_compute(user_id, handle, http_client, **kwargs):
         return _make_global_state(
@@ -175,35 +182,23 @@ async def test_bulk_recheck_calls_handle_recheck_failure_on_error() -> None:
             "services.verification_state.compute_global_state",
             side_effect=mock_compute,
         ),
-        patch(
-            "services.verification_state.store_global_state",
-            new_callable=AsyncMock,
-        ),
-        patch(
-            "services.verification_scheduler.schedule_user_recheck",
-            new_callable=AsyncMock,
-        ),
-        patch(
-            "services.verification_scheduler.handle_recheck_failure",
-            mock_failure,
-        ),
+        patch("services.verification_state.store_global_states", mock_store),
         patch(
             "services.guild_sync.sync_user_to_all_guilds",
             new_callable=AsyncMock,
         ),
         patch(
-            "services.db.database.Database.get_auto_recheck_fail_count",
+            "services.db.database.Database.get_auto_recheck_fail_counts",
             new_callable=AsyncMock,
-            return_value=2,
+            return_value={1: 2},
         ),
     ):
         await service._perform_rsi_recheck(input_rows, guild_id=123)
 
-    mock_failure.assert_called_once()
-    call_kwargs = mock_failure.call_args
-    assert call_kwargs[0][0] == 1  # user_id
-    assert "RSI service down" in call_kwargs[0][1]  # error message
-    assert call_kwargs[1]["fail_count"] == 3  # incremented
+    mock_store.assert_awaited_once()
+    [(user_id, _next_retry_at, error)] = mock_store.call_args[1]["failures"]
+    assert user_id == 1
+    assert "RSI service down" in error
 
 
 # --- Phase 5: Error state persistence guard ---
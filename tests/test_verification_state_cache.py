@@ -0,0 +1,141 @@
+"""
+Tests for the bounded LRU/TTL caches in services.verification_state.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from helpers.http_helper import NotFoundError
+from services import verification_state
+from services.verification_state import (
+    _TTLCache,
+    clear_caches,
+    compute_global_state,
+    get_cache_stats,
+)
+
+CONFIG = {
+    "rsi": {
+        "cache_ttl_seconds": 300,
+        "cache_max_entries": 2,
+        "negative_cache_ttl_seconds": 60,
+        "min_interval_seconds": 0,
+    }
+}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    clear_caches()
+    breaker = MagicMock()
+    breaker.is_open.return_value = False
+    with patch.object(
+        verification_state, "get_rsi_circuit_breaker", return_value=breaker
+    ):
+        yield
+    clear_caches()
+
+
+def _valid(handle: str) -> tuple:
+    return (1, handle, None, ["TEST"], [])
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    """Reading an entry protects it from the next eviction."""
+    # Arrange
+    cache: _TTLCache[str, int] = _TTLCache(max_entries=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+
+    # Act
+    assert cache.get("a") == 1
+    cache.set("c", 3, ttl=60)
+
+    # Assert
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+
+
+def test_ttl_cache_expires_entries() -> None:
+    """Entries past their TTL count as misses and are dropped."""
+    cache: _TTLCache[str, int] = _TTLCache(max_entries=4)
+    with patch.object(verification_state.time, "monotonic", return_value=100.0):
+        cache.set("a", 1, ttl=10)
+    with patch.object(verification_state.time, "monotonic", return_value=111.0):
+        assert cache.get("a") is None
+
+    assert len(cache) == 0
+    assert cache.stats()["expirations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_state_skips_refetch() -> None:
+    """A second lookup within the TTL is served from cache."""
+    # Arrange
+    fetch = AsyncMock(return_value=_valid("Pilot"))
+
+    # Act
+    with patch.object(verification_state, "is_valid_rsi_handle", fetch):
+        first = await compute_global_state(1, "pilot", MagicMock(), config=CONFIG)
+        second = await compute_global_state(1, "PILOT", MagicMock(), config=CONFIG)
+
+    # Assert
+    assert first is second
+    assert fetch.await_count == 1
+    assert get_cache_stats()["states"]["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_is_bounded_by_config() -> None:
+    """rsi.cache_max_entries caps the number of cached users."""
+    fetch = AsyncMock(side_effect=lambda handle, *_: _valid(handle))
+
+    with patch.object(verification_state, "is_valid_rsi_handle", fetch):
+        for user_id in range(5):
+            await compute_global_state(
+                user_id, f"user{user_id}", MagicMock(), config=CONFIG
+            )
+
+    stats = get_cache_stats()["states"]
+    assert stats["size"] == 2
+    assert stats["evictions"] == 3
+
+
+@pytest.mark.asyncio
+async def test_not_found_is_negative_cached_even_on_force_refresh() -> None:
+    """A 404 handle is not refetched while its negative entry is live."""
+    # Arrange
+    fetch = AsyncMock(side_effect=NotFoundError("gone"))
+
+    # Act / Assert
+    with patch.object(verification_state, "is_valid_rsi_handle", fetch):
+        with pytest.raises(NotFoundError):
+            await compute_global_state(1, "Ghost", MagicMock(), config=CONFIG)
+        with pytest.raises(NotFoundError):
+            await compute_global_state(
+                2, "ghost", MagicMock(), config=CONFIG, force_refresh=True
+            )
+
+    assert fetch.await_count == 1
+    assert get_cache_stats()["not_found"]["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_negative_cache_can_be_disabled() -> None:
+    """negative_cache_ttl_seconds: 0 refetches every 404."""
+    config = {"rsi": {**CONFIG["rsi"], "negative_cache_ttl_seconds": 0}}
+    fetch = AsyncMock(side_effect=NotFoundError("gone"))
+
+    with patch.object(verification_state, "is_valid_rsi_handle", fetch):
+        for _ in range(2):
+            with pytest.raises(NotFoundError):
+                await compute_global_state(1, "Ghost", MagicMock(), config=config)
+
+    assert fetch.await_count == 2
+    assert get_cache_stats()["not_found"]["size"] == 0
@@ -208,6 +208,8 @@ class TestJTCManagement:
                 ),
             )
             await db.commit()
+        # Rows were written behind the service's back; reload its ownership index
+        await voice_service._load_managed_channels()
 
         # Simulate managed channel deletion
         await voice_service.handle_channel_deleted(guild_id, managed_channel_id)
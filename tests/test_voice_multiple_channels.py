@@ -260,6 +260,8 @@ class TestMultipleChannelsPerOwner:
                 (12345, 67890, 11111, 66666, base_time, base_time, 1),
             )
             await db.commit()
+        # Rows were written behind the service's back; reload its ownership index
+        await voice_service._load_managed_channels()
 
         # Get user's channel - should return the newest one
         channel_id = await voice_service.get_user_voice_channel(12345, 67890, 11111)
@@ -0,0 +1,161 @@
+"""
+Tests for the in-memory voice ownership index and VoiceService write-through.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+import pytest_asyncio
+
+from services.voice_ownership import OwnedChannel, VoiceOwnershipIndex
+from tests.factories.db_factories import seed_voice_channels
+
+
+def _row(
+    channel_id: int, owner_id: int, created_at: int, jtc: int = 20, guild: int = 1
+) -> tuple[int, int, int, int, int]:
+    return (channel_id, guild, jtc, owner_id, created_at)
+
+
+def test_latest_owned_returns_newest_channel() -> None:
+    """Owner lookups match the old ORDER BY created_at DESC LIMIT 1 query."""
+    index = VoiceOwnershipIndex()
+    index.load(
+        [
+            _row(100, owner_id=7, created_at=10),
+            _row(101, owner_id=7, created_at=30, jtc=21),
+            _row(102, owner_id=8, created_at=20),
+        ]
+    )
+
+    latest = index.latest_owned(1, 7)
+    assert latest is not None
+    assert latest.voice_channel_id == 101
+
+    scoped = index.latest_owned(1, 7, jtc_channel_id=20)
+    assert scoped is not None
+    assert scoped.voice_channel_id == 100
+    assert index.latest_owned(2, 7) is None
+
+
+def test_set_owner_moves_channel_between_owners() -> None:
+    """Transfers and orphaning re-key the owner side of the index."""
+    index = VoiceOwnershipIndex()
+    index.load([_row(100, owner_id=7, created_at=10)])
+
+    index.set_owner(100, 0)
+
+    assert index.owned_by(1, 7) == []
+    record = index.get(100)
+    assert record is not None
+    assert record.owner_id == 0
+    assert record.created_at == 10
+
+
+def test_remove_owner_scoped_to_guild() -> None:
+    index = VoiceOwnershipIndex()
+    index.load(
+        [
+            _row(100, owner_id=7, created_at=10, guild=1),
+            _row(200, owner_id=7, created_at=10, guild=2),
+        ]
+    )
+
+    assert index.remove_owner(7, guild_id=1) == [100]
+    assert 100 not in index
+    assert 200 in index
+
+
+def test_diff_reports_drift() -> None:
+    index = VoiceOwnershipIndex()
+    index.load([_row(100, owner_id=7, created_at=10), _row(101, 7, 11)])
+    index.upsert(OwnedChannel(102, 1, 20, 7, 12))
+
+    report = index.diff([_row(100, owner_id=9, created_at=10), _row(101, 7, 11)])
+
+    assert report["consistent"] is False
+    assert report["stale"] == [102]
+    assert report["mismatched"] == [100]
+    assert report["missing"] == []
+
+
+class TestVoiceServiceWriteThrough:
+    """VoiceService keeps the index in step with voice_channels."""
+
+    @pytest_asyncio.fixture
+    async def voice_service(self, temp_db):
+        from services.config_service import ConfigService
+        from services.voice_service import VoiceService
+
+        bot = MagicMock()
+        bot.get_channel.return_value = None
+        bot.guilds = []
+        config_service = MagicMock(spec=ConfigService)
+        service = VoiceService(config_service, bot, test_mode=True)
+        await seed_voice_channels(
+            [
+                {
+                    "guild_id": 1111,
+                    "jtc_channel_id": 2222,
+                    "owner_id": 42,
+                    "voice_channel_id": 3333,
+                    "is_active": 1,
+                },
+                {
+                    "guild_id": 1111,
+                    "jtc_channel_id": 2222,
+                    "owner_id": 43,
+                    "voice_channel_id": 4444,
+                    "is_active": 0,
+                },
+            ]
+        )
+        await service.initialize()
+        yield service
+        await service.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_initialize_loads_active_rows(self, voice_service) -> None:
+        assert voice_service.ownership_index.loaded
+        assert await voice_service._is_managed_channel(3333)
+        assert not await voice_service._is_managed_channel(4444)
+        assert await voice_service.get_jtc_for_owned_channel(3333, 42) == 2222
+        assert await voice_service.get_jtc_for_owned_channel(3333, 99) is None
+
+    @pytest.mark.asyncio
+    async def test_store_and_cleanup_update_index(self, voice_service) -> None:
+        await voice_service._store_user_channel(1111, 2222, 77, 5555)
+        assert await voice_service.get_user_voice_channel(1111, 2222, 77) == 5555
+
+        await voice_service.cleanup_by_channel_id(5555)
+        assert await voice_service.get_user_voice_channel(1111, 2222, 77) is None
+
+        report = await voice_service.audit_ownership_index()
+        assert report["consistent"] is True
+
+    @pytest.mark.asyncio
+    async def test_member_cleanup_forgets_owner(self, voice_service) -> None:
+        from helpers.voice_utils import forget_voice_owner
+        from services.db.database import Database
+
+        bot = MagicMock()
+        bot.services.voice = voice_service
+
+        await Database.cleanup_all_user_data(42)
+        forget_voice_owner(bot, 42)
+
+        assert not await voice_service._is_managed_channel(3333)
+        assert await voice_service.get_user_voice_channel(1111, 2222, 42) is None
+        report = await voice_service.audit_ownership_index()
+        assert report["consistent"] is True
+
+    @pytest.mark.asyncio
+    async def test_audit_repairs_out_of_process_writes(self, voice_service) -> None:
+        from services.db.database import Database
+
+        await Database.purge_voice_data(1111, 42)
+
+        report = await voice_service.audit_ownership_index()
+        assert report["stale"] == [3333]
+        assert not await voice_service._is_managed_channel(3333)
+        assert (await voice_service.audit_ownership_index())["consistent"] is True
@@ -81,7 +81,10 @@ class TestVoiceReconciliation:
             (12345, 333, 300, 203, 1234567892),  # Channel that doesn't exist
         ]
 
-        with patch.object(Database, "get_connection") as mock_db_conn:
+        with (
+            patch.object(Database, "get_connection") as mock_db_conn,
+            patch.object(Database, "get_read_connection", mock_db_conn),
+        ):
             mock_db = AsyncMock()
             mock_cursor = AsyncMock()
             mock_cursor.fetchall = AsyncMock(return_value=mock_channels)
@@ -101,6 +104,58 @@ class TestVoiceReconciliation:
                 mock_reconcile.assert_any_call(12345, 222, 200, 202, 1234567891)
                 mock_reconcile.assert_any_call(12345, 333, 300, 203, 1234567892)
 
+    @pytest.mark.asyncio
+    async def test_reconcile_all_guilds_keeps_guild_order(self, voice_service):
+        """Guilds run concurrently but each guild's channels stay in order."""
+        rows = [
+            (1, 11, 100, 201, 1),
+            (2, 21, 200, 202, 2),
+            (1, 12, 101, 201, 3),
+            (2, 22, 201, 202, 4),
+        ]
+        seen: list[tuple[int, int]] = []
+
+        async def _record(guild_id, voice_channel_id, *_args):
+            seen.append((guild_id, voice_channel_id))
+
+        with (
+            patch.object(
+                voice_service, "_purge_inactive_voice_channels", return_value=0
+            ),
+            patch(
+                "services.voice_service.BaseRepository.fetch_all",
+                AsyncMock(return_value=rows),
+            ),
+            patch.object(
+                voice_service, "_reconcile_single_channel", side_effect=_record
+            ),
+        ):
+            await voice_service.reconcile_all_guilds_on_ready()
+
+        assert sorted(seen) == sorted((row[0], row[1]) for row in rows)
+        assert [vc for guild, vc in seen if guild == 1] == [11, 12]
+        assert [vc for guild, vc in seen if guild == 2] == [21, 22]
+
+    @pytest.mark.asyncio
+    async def test_prefetch_owned_channels_uses_index(self, voice_service):
+        """A loaded ownership index answers the per-guild prefetch without SQL."""
+        voice_service.ownership_index.load(
+            [
+                (111, 12345, 201, 100, 10),
+                (112, 12345, 201, 100, 20),
+                (113, 12345, 999, 101, 30),
+                (114, 54321, 201, 102, 40),
+            ]
+        )
+
+        with patch(
+            "services.voice_service.BaseRepository.fetch_all", AsyncMock()
+        ) as mock_fetch:
+            owned = await voice_service._prefetch_guild_owned_channels(12345, [201])
+
+        mock_fetch.assert_not_called()
+        assert owned == {(201, 100): 112}
+
     @pytest.mark.asyncio
     async def test_reconcile_single_channel_nonexistent(self, voice_service, mock_bot):
         """Test reconciling a channel that doesn't exist - should remove from DB."""
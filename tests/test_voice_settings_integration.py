@@ -14,7 +14,9 @@ from helpers.voice_settings import (
     _create_settings_embed,
     _get_all_user_settings,
     fetch_channel_settings,
+    fetch_voice_settings_bulk,
     get_voice_settings_snapshots,
+    resolve_target_names_bulk,
 )
 from services.config_service import ConfigService
 from services.voice_service import VoiceService
@@ -285,6 +287,7 @@ class TestVoiceSettingsHelper:
                 side_effect=mock_fetch_one,
             ),
             patch("services.db.database.Database.get_connection") as mock_db,
+            patch("services.db.database.Database.get_read_connection", mock_db),
         ):
             mock_db.return_value.__aenter__.return_value = mock_conn
 
@@ -315,7 +318,10 @@ class TestVoiceSettingsHelper:
         ]
         mock_conn.execute.side_effect = [basic_cursor, feature_cursor]
 
-        with patch("services.db.database.Database.get_connection") as mock_db:
+        with (
+            patch("services.db.database.Database.get_connection") as mock_db,
+            patch("services.db.database.Database.get_read_connection", mock_db),
+        ):
             mock_db.return_value.__aenter__.return_value = mock_conn
 
             settings = await _get_all_user_settings(12345, 55555, 67890)
@@ -346,7 +352,10 @@ class TestVoiceSettingsHelper:
         ]
         mock_conn.execute.side_effect = [basic_cursor, feature_cursor]
 
-        with patch("services.db.database.Database.get_connection") as mock_db:
+        with (
+            patch("services.db.database.Database.get_connection") as mock_db,
+            patch("services.db.database.Database.get_read_connection", mock_db),
+        ):
             mock_db.return_value.__aenter__.return_value = mock_conn
 
             snapshots = await get_voice_settings_snapshots(12345, 67890)
@@ -360,6 +369,70 @@ class TestVoiceSettingsHelper:
             assert len(snapshots[1].soundboard_settings) == 1
             assert mock_conn.execute.await_count == 2
 
+    @pytest.mark.asyncio
+    async def test_fetch_voice_settings_bulk_groups_by_scope(self, temp_db):
+        """Bulk loading returns every scope's features from one pass."""
+        from services.db.database import Database
+
+        async with Database.get_connection() as db:
+            await db.executemany(
+                "INSERT INTO channel_settings (guild_id, jtc_channel_id, user_id, channel_name, user_limit, lock) VALUES (?, ?, ?, ?, ?, ?)",
+                [(1, 10, 100, "Alpha", 3, 1), (1, 10, 200, "Bravo", 0, 0)],
+            )
+            await db.executemany(
+                "INSERT INTO channel_permissions (guild_id, jtc_channel_id, user_id, target_id, target_type, permission) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (1, 10, 100, 555, "role", "permit"),
+                    (1, 10, 200, 555, "role", "reject"),
+                    (1, 10, 300, 555, "role", "permit"),
+                ],
+            )
+            await db.execute(
+                "INSERT INTO channel_ptt_settings (guild_id, jtc_channel_id, user_id, target_id, target_type, ptt_enabled) VALUES (?, ?, ?, ?, ?, ?)",
+                (1, 10, 200, 777, "user", 1),
+            )
+            await db.commit()
+
+        settings = await fetch_voice_settings_bulk(
+            [(1, 10, 100), (1, 10, 200), (1, 10, 300), (1, 10, 100)]
+        )
+
+        # Scope 300 has feature rows but no channel_settings row
+        assert set(settings) == {(1, 10, 100), (1, 10, 200)}
+        assert settings[(1, 10, 100)]["channel_name"] == "Alpha"
+        assert settings[(1, 10, 100)]["permissions"] == [(555, "role", "permit")]
+        assert settings[(1, 10, 200)]["permissions"] == [(555, "role", "reject")]
+        assert settings[(1, 10, 200)]["ptt_settings"] == [(777, "user", 1)]
+
+    @pytest.mark.asyncio
+    async def test_resolve_target_names_bulk_looks_up_each_target_once(self):
+        """Targets shared across snapshots are resolved once per batch."""
+        from utils.types import PermissionOverride, VoiceSettingsSnapshot
+
+        guild = MagicMock(spec=discord.Guild)
+        guild.id = 1
+        role = MagicMock()
+        role.name = "Crew"
+        guild.get_role.return_value = role
+        snapshots = [
+            VoiceSettingsSnapshot(
+                guild_id=1,
+                jtc_channel_id=10,
+                owner_id=owner_id,
+                permissions=[
+                    PermissionOverride(
+                        target_id="555", target_type="role", permission="permit"
+                    )
+                ],
+            )
+            for owner_id in (100, 200, 300)
+        ]
+
+        await resolve_target_names_bulk(guild, snapshots)
+
+        assert guild.get_role.call_count == 1
+        assert all(s.permissions[0].target_name == "@Crew" for s in snapshots)
+
     @pytest.mark.asyncio
     async def test_create_settings_embed_shows_unlocked_state(
         self, mock_guild, mock_member
@@ -95,7 +95,10 @@ class TestStrictScoping:
         jtc_channel_id = 100
         user_id = 67890
 
-        with patch("services.db.database.Database.get_connection") as mock_db:
+        with (
+            patch("services.db.database.Database.get_connection") as mock_db,
+            patch("services.db.database.Database.get_read_connection", mock_db),
+        ):
             mock_conn = AsyncMock()
             mock_cursor = AsyncMock()
             mock_db.return_value.__aenter__.return_value = mock_conn
@@ -128,7 +131,10 @@ class TestStrictScoping:
         jtc_channel_id = 100
         user_id = 67890
 
-        with patch("services.db.database.Database.get_connection") as mock_db:
+        with (
+            patch("services.db.database.Database.get_connection") as mock_db,
+            patch("services.db.database.Database.get_read_connection", mock_db),
+        ):
             mock_conn = AsyncMock()
             mock_cursor = AsyncMock()
             mock_db.return_value.__aenter__.return_value = mock_conn
@@ -159,7 +165,10 @@ class TestStrictScoping:
         jtc_channel_id = 100
         user_id = 67890
 
-        with patch("services.db.database.Database.get_connection") as mock_db:
+        with (
+            patch("services.db.database.Database.get_connection") as mock_db,
+            patch("services.db.database.Database.get_read_connection", mock_db),
+        ):
             mock_conn = AsyncMock()
             mock_cursor = AsyncMock()
             mock_db.return_value.__aenter__.return_value = mock_conn
@@ -190,7 +199,10 @@ class TestStrictScoping:
         jtc_channel_id = 100
         user_id = 67890
 
-        with patch("services.db.database.Database.get_connection") as mock_db:
+        with (
+            patch("services.db.database.Database.get_connection") as mock_db,
+            patch("services.db.database.Database.get_read_connection", mock_db),
+        ):
             mock_conn = AsyncMock()
             mock_db.return_value.__aenter__.return_value = mock_conn
             basic_cursor = AsyncMock()
@@ -277,7 +289,10 @@ class TestStrictScoping:
         jtc_channel_id_2 = 200
         user_id = 67890
 
-        with patch("services.db.database.Database.get_connection") as mock_db:
+        with (
+            patch("services.db.database.Database.get_connection") as mock_db,
+            patch("services.db.database.Database.get_read_connection", mock_db),
+        ):
             mock_conn = AsyncMock()
             mock_db.return_value.__aenter__.return_value = mock_conn
             basic_cursor_1 = AsyncMock()
@@ -16,6 +16,15 @@ class VoiceChannelResult(NamedTuple):
     metadata: dict[str, Any] | None = None  # For error-specific data like owner_display
 
 
+class VoiceSettingsScope(NamedTuple):
+    """One (guild, JTC, owner) settings scope for bulk snapshot loading."""
+
+    guild_id: int
+    jtc_channel_id: int
+    owner_id: int
+    voice_channel_id: int | None = None  # Adds channel metadata when set
+
+
 @dataclass
 class VoiceChannelInfo:
     """Information about a voice channel."""
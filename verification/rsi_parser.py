@@ -0,0 +1,348 @@
+"""
+RSI page parsing off the event loop.
+
+Raw organizations/profile HTML is handed to a parsing executor (thread pool,
+process pool, or inline — see ``rsi.parser`` in config.yaml) and comes back as
+small picklable result objects. Parsing uses targeted lxml tree walks that
+mirror the BeautifulSoup helpers in ``verification.rsi_verification``; those
+helpers remain the fallback whenever the fast path fails.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import lxml.html
+from lxml import etree
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+EXECUTOR_KINDS = ("thread", "process", "inline")
+DEFAULT_EXECUTOR_KIND = "thread"
+DEFAULT_MAX_WORKERS = 2
+
+
+@dataclass(slots=True, frozen=True)
+class ParsedOrganizations:
+    """Organization SIDs (and optionally names) parsed from an organizations page."""
+
+    main_orgs: list[str] = field(default_factory=list)
+    affiliate_orgs: list[str] = field(default_factory=list)
+    # Name-based data for legacy verification; None when not requested or
+    # when the name parse failed.
+    org_data: dict[str, Any] | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class ParsedProfile:
+    """Handle and community moniker parsed from a citizen profile page."""
+
+    handle: str | None = None
+    moniker: str | None = None
+
+
+# ---------------------------------------------------------------------------
+# Targeted lxml extractors
+# ---------------------------------------------------------------------------
+
+
+def _document(html_content: str) -> etree._Element:
+    return lxml.html.document_fromstring(html_content)
+
+
+def _has_classes(element: etree._Element, *names: str) -> bool:
+    classes = (element.get("class") or "").split()
+    return all(name in classes for name in names)
+
+
+def _descendants(
+    element: etree._Element, tag: str, *classes: str
+) -> Iterator[etree._Element]:
+    for child in element.iterdescendants(tag):
+        if _has_classes(child, *classes):
+            yield child
+
+
+def _first(element: etree._Element, tag: str, *classes: str) -> etree._Element | None:
+    return next(_descendants(element, tag, *classes), None)
+
+
+def _text(element: etree._Element) -> str:
+    """Equivalent of BeautifulSoup ``get_text(strip=True)``."""
+    return "".join(part.strip() for part in element.itertext())
+
+
+def _in_profile_info(element: etree._Element) -> bool:
+    """True when the element sits under ``.profile .info`` (CSS descendant)."""
+    seen_info = False
+    for ancestor in element.iterancestors():
+        if seen_info and _has_classes(ancestor, "profile"):
+            return True
+        seen_info = seen_info or _has_classes(ancestor, "info")
+    return False
+
+
+def _entry_sid(entry_container: etree._Element) -> tuple[list[etree._Element], str]:
+    """Return the container's ``p.entry`` nodes and the first SID value found."""
+    entries = list(_descendants(entry_container, "p", "entry"))
+    for entry in entries:
+        label = _first(entry, "span", "label")
+        if label is None:
+            continue
+        label_text = _text(label)
+        if "Spectrum" not in label_text and "SID" not in label_text:
+            continue
+        value = _first(entry, "strong", "value")
+        if value is not None:
+            sid = _text(value)
+            if sid and sid != "\xa0":
+                return entries, sid
+    return entries, ""
+
+
+def _fast_org_sids(root: etree._Element) -> tuple[list[str], list[str]]:
+    """lxml port of ``parse_rsi_org_sids``."""
+    main_orgs: list[str] = []
+    affiliate_orgs: list[str] = []
+
+    main_div = next(
+        (el for el in root.iter("*") if _has_classes(el, "box-content", "org", "main")),
+        None,
+    )
+    if main_div is not None:
+        if _has_classes(main_div, "visibility-R") or _has_classes(
+            main_div, "visibility-H"
+        ):
+            main_orgs.append("REDACTED")
+        else:
+            entries, sid = _entry_sid(main_div)
+            if sid:
+                main_orgs.append(sid)
+            elif entries:
+                main_orgs.append("REDACTED")
+
+    for affiliate_div in root.iter("*"):
+        if not _has_classes(affiliate_div, "box-content", "org", "affiliation"):
+            continue
+        if _has_classes(affiliate_div, "visibility-R") or _has_classes(
+            affiliate_div, "visibility-H"
+        ):
+            affiliate_orgs.append("REDACTED")
+            continue
+        _, sid = _entry_sid(affiliate_div)
+        affiliate_orgs.append(sid or "REDACTED")
+
+    return main_orgs, affiliate_orgs
+
+
+def _fast_handle(root: etree._Element) -> str | None:
+    """lxml port of ``extract_handle`` (label-based lookup)."""
+    for entry in _descendants(root, "p", "entry"):
+        label = _first(entry, "span", "label")
+        if label is not None and _text(label) == "Handle name":
+            value = _first(entry, "strong", "value")
+            if value is not None:
+                return _text(value)
+    return None
+
+
+def _fast_moniker(root: etree._Element, handle: str | None) -> str | None:
+    """lxml port of ``extract_moniker``."""
+    from verification.rsi_verification import _sanitize_moniker
+
+    entries = [
+        entry for entry in _descendants(root, "p", "entry") if _in_profile_info(entry)
+    ] or list(_descendants(root, "p", "entry"))
+
+    candidate: str | None = None
+    for entry in entries:
+        label = _first(entry, "span", "label")
+        if label is not None and _text(label) == "Handle name":
+            break
+        value = _first(entry, "strong", "value")
+        if value is not None and (text := _text(value)):
+            candidate = text
+            break
+
+    if not candidate:
+        strong = next(
+            (
+                el
+                for el in _descendants(root, "strong", "value")
+                if _in_profile_info(el)
+            ),
+            None,
+        )
+        if strong is None:
+            strong = _first(root, "strong", "value")
+        if strong is not None:
+            candidate = _text(strong)
+
+    if not candidate:
+        return None
+    sanitized = _sanitize_moniker(candidate)
+    if not sanitized:
+        return None
+    if handle and sanitized.lower() == handle.lower():
+        return None
+    return sanitized
+
+
+# ---------------------------------------------------------------------------
+# Executor entry points (must stay module-level for process pools)
+# ---------------------------------------------------------------------------
+
+
+def parse_organizations_page(
+    html_content: str, org_name: str | None = None
+) -> ParsedOrganizations:
+    """
+    Parse an organizations page into SIDs, plus name data when ``org_name`` is set.
+
+    AI Notes:
+        SID failures are logged and yield empty lists (the historic
+        behaviour of is_valid_rsi_handle); a failed name parse leaves
+        ``org_data`` as None so the caller can bail out the same way it
+        used to.
+    """
+    from verification.rsi_verification import (
+        parse_rsi_org_sids,
+        parse_rsi_organizations,
+    )
+
+    try:
+        main_orgs, affiliate_orgs = _fast_org_sids(_document(html_content))
+    except Exception:
+        logger.debug("Fast org SID parse failed; using BeautifulSoup", exc_info=True)
+        try:
+            sids = parse_rsi_org_sids(html_content)
+            main_orgs = sids.get("main_orgs", [])
+            affiliate_orgs = sids.get("affiliate_orgs", [])
+        except Exception:
+            logger.exception("Exception while parsing organization SIDs")
+            main_orgs, affiliate_orgs = [], []
+
+    org_data: dict[str, Any] | None = None
+    if org_name:
+        try:
+            org_data = parse_rsi_organizations(html_content, org_name)
+        except Exception:
+            logger.exception("Exception while parsing organization data")
+
+    return ParsedOrganizations(
+        main_orgs=main_orgs, affiliate_orgs=affiliate_orgs, org_data=org_data
+    )
+
+
+def parse_profile_page(html_content: str) -> ParsedProfile:
+    """Parse a citizen profile page into its cased handle and community moniker."""
+    from verification.rsi_verification import extract_handle, extract_moniker
+
+    try:
+        root = _document(html_content)
+    except Exception:
+        logger.debug("Fast profile parse failed; using BeautifulSoup", exc_info=True)
+        root = None
+
+    try:
+        handle = (
+            _fast_handle(root) if root is not None else extract_handle(html_content)
+        )
+    except Exception:
+        logger.exception("Exception while extracting cased handle")
+        handle = None
+
+    try:
+        moniker = (
+            _fast_moniker(root, handle)
+            if root is not None
+            else extract_moniker(html_content, handle)
+        )
+    except Exception:
+        logger.exception("Exception while extracting community moniker")
+        moniker = None
+
+    return ParsedProfile(handle=handle, moniker=moniker)
+
+
+# ---------------------------------------------------------------------------
+# Executor management
+# ---------------------------------------------------------------------------
+
+_executor: Executor | None = None
+_executor_kind: str = DEFAULT_EXECUTOR_KIND
+_max_workers: int = DEFAULT_MAX_WORKERS
+
+
+def configure_parse_executor(config: dict[str, Any] | None) -> None:
+    """
+    (Re)configure the parsing executor from the bot config.
+
+    Reads ``rsi.parser.executor`` (thread | process | inline) and
+    ``rsi.parser.max_workers``. The pool itself is created lazily on first use.
+    """
+    global _executor_kind, _max_workers
+    rsi_cfg = (config or {}).get("rsi", {}) if isinstance(config, dict) else {}
+    parser_cfg = rsi_cfg.get("parser", {}) if isinstance(rsi_cfg, dict) else {}
+    if not isinstance(parser_cfg, dict):
+        parser_cfg = {}
+
+    kind = str(parser_cfg.get("executor", DEFAULT_EXECUTOR_KIND)).lower()
+    if kind not in EXECUTOR_KINDS:
+        logger.warning(
+            "Unknown rsi.parser.executor %r; using %s", kind, DEFAULT_EXECUTOR_KIND
+        )
+        kind = DEFAULT_EXECUTOR_KIND
+
+    shutdown_parse_executor()
+    _executor_kind = kind
+    _max_workers = max(1, int(parser_cfg.get("max_workers", DEFAULT_MAX_WORKERS)))
+    logger.info(
+        "RSI parse executor configured: %s (max_workers=%d)", kind, _max_workers
+    )
+
+
+def _get_executor() -> Executor | None:
+    global _executor
+    if _executor_kind == "inline":
+        return None
+    if _executor is None:
+        if _executor_kind == "process":
+            # spawn: forking a process that already runs threads is unsafe
+            _executor = ProcessPoolExecutor(
+                max_workers=_max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        else:
+            _executor = ThreadPoolExecutor(
+                max_workers=_max_workers, thread_name_prefix="rsi-parse"
+            )
+    return _executor
+
+
+async def run_parser(func: Callable[..., T], *args: Any) -> T:
+    """Run a parse function on the configured executor (or inline)."""
+    executor = _get_executor()
+    if executor is None:
+        return func(*args)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(func, *args))
+
+
+def shutdown_parse_executor(wait: bool = False) -> None:
+    """Shut down the parsing pool (call on bot shutdown)."""
+    global _executor
+    executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
@@ -6,6 +6,11 @@ from bs4 import BeautifulSoup
 
 from helpers.circuit_breaker import get_rsi_circuit_breaker
 from helpers.http_helper import ForbiddenError, HTTPClient, NotFoundError
+from verification.rsi_parser import (
+    parse_organizations_page,
+    parse_profile_page,
+    run_parser,
+)
 
 RSI_HANDLE_REGEX = re.compile(r"^[A-Za-z0-9\[\]][A-Za-z0-9_\-\s\[\]]{0,59}$")
 logger = logging.getLogger(__name__)
@@ -100,17 +105,12 @@ async def is_valid_rsi_handle(
         logger.error(f"Failed to fetch organization data for handle: {user_handle}")
         return None, None, None, [], []
 
-    org_soup = _get_soup(org_html)
-
-    # Parse organization SIDs (new format - do this first)
-    try:
-        org_sids = parse_rsi_org_sids(org_soup)
-        main_orgs = org_sids.get("main_orgs", [])
-        affiliate_orgs = org_sids.get("affiliate_orgs", [])
-    except Exception:
-        logger.exception(f"Exception while parsing organization SIDs for {user_handle}")
-        main_orgs = []
-        affiliate_orgs = []
+    # Parse off the event loop; SID parse failures yield empty lists
+    org_page = await run_parser(
+        parse_organizations_page, org_html, None if org_sid else org_name
+    )
+    main_orgs = org_page.main_orgs
+    affiliate_orgs = org_page.affiliate_orgs
 
     # Determine verification value - prefer SID-based if available
     if org_sid:
@@ -124,15 +124,13 @@ async def is_valid_rsi_handle(
         )
     else:
         # Fall back to name-based verification for backward compatibility
-        try:
-            org_data = parse_rsi_organizations(org_soup, org_name)
-        except Exception:
-            logger.exception(
-                f"Exception while parsing organization data for {user_handle}"
-            )
+        if org_page.org_data is None:
+            logger.error(f"Failed to parse organization data for {user_handle}")
             return None, None, None, main_orgs, affiliate_orgs
 
-        verify_value = search_organization_case_insensitive(org_data, org_name)
+        verify_value = search_organization_case_insensitive(
+            org_page.org_data, org_name
+        )
         logger.debug(f"Name-based verification for {user_handle}: {verify_value}")
 
     # Fetch profile data (single fetch reused for handle + moniker)
@@ -143,36 +141,22 @@ async def is_valid_rsi_handle(
         logger.error(f"Failed to fetch profile data for handle: {user_handle}")
         return verify_value, None, None, main_orgs, affiliate_orgs
 
-    profile_soup = _get_soup(profile_html)
-
-    # Extract correctly cased handle
-    try:
-        cased_handle = extract_handle(profile_soup)
-        if cased_handle:
-            logger.debug(f"Cased handle for {user_handle}: {cased_handle}")
-        else:
-            logger.warning(f"Could not extract cased handle for {user_handle}")
-    except Exception:
-        logger.exception(f"Exception while extracting cased handle for {user_handle}")
-        cased_handle = None
-
-    # Extract community moniker
-    try:
-        community_moniker = extract_moniker(profile_soup, cased_handle)
-        if community_moniker:
-            logger.debug(
-                f"Extracted community moniker for {user_handle}: {community_moniker}"
-            )
-        else:
-            logger.info(
-                f"Community moniker not found or empty for {user_handle}; "
-                f"proceeding without it."
-            )
-    except Exception:
-        logger.exception(
-            f"Exception while extracting community moniker for {user_handle}"
+    profile = await run_parser(parse_profile_page, profile_html)
+    cased_handle = profile.handle
+    community_moniker = profile.moniker
+    if cased_handle:
+        logger.debug(f"Cased handle for {user_handle}: {cased_handle}")
+    else:
+        logger.warning(f"Could not extract cased handle for {user_handle}")
+    if community_moniker:
+        logger.debug(
+            f"Extracted community moniker for {user_handle}: {community_moniker}"
+        )
+    else:
+        logger.info(
+            f"Community moniker not found or empty for {user_handle}; "
+            f"proceeding without it."
         )
-        community_moniker = None
 
     return verify_value, cased_handle, community_moniker, main_orgs, affiliate_orgs
 
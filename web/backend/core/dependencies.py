@@ -67,6 +67,7 @@ _PROJECT_ROOT = project_root()
 sys.path.insert(0, str(_PROJECT_ROOT))
 
 from config.config_loader import ConfigLoader
+from helpers.member_ids import unpack_member_ids
 from services.config_service import ConfigService
 from services.db.database import Database
 from services.ticket_form_service import TicketFormService
@@ -199,6 +200,8 @@ async def shutdown_services() -> None:
     if _internal_api_client:
         await _internal_api_client.close()
 
+    await Database.close()
+
     logger.info("Services shut down")
 
 
@@ -220,9 +223,10 @@ async def get_db():
     """
     Dependency for database access.
 
-    Yields a connection context manager from the Database class.
+    Yields a per-request connection. Requests span internal API and Discord
+    calls, so they must not hold the bot's single pooled writer.
     """
-    async with Database.get_connection() as conn:
+    async with Database.get_transient_connection() as conn:
         yield conn
 
 
@@ -967,6 +971,28 @@ class InternalAPIClient:
         response.raise_for_status()
         return response.json()
 
+    async def get_guild_member_ids(
+        self, guild_id: int, etag: str | None = None
+    ) -> tuple[str | None, list[int] | None]:
+        """
+        Fetch every member ID of a guild in one compact response.
+
+        Args:
+            guild_id: Discord guild ID
+            etag: ETag from a previous call; the bot answers 304 if unchanged
+
+        Returns:
+            ``(etag, member_ids)``; ``member_ids`` is None when the set is
+            unchanged since ``etag``
+        """
+        client = await self._get_client()
+        headers = {"If-None-Match": etag} if etag else None
+        response = await client.get(f"/guilds/{guild_id}/member-ids", headers=headers)
+        if response.status_code == 304:
+            return response.headers.get("ETag", etag), None
+        response.raise_for_status()
+        return response.headers.get("ETag"), unpack_member_ids(response.content)
+
     async def get_guild_member(self, guild_id: int, user_id: int) -> dict:
         """
         Fetch single guild member with Discord enrichment.
@@ -1021,14 +1047,32 @@ class InternalAPIClient:
         return response.json()
 
     async def notify_guild_settings_refresh(
-        self, guild_id: int, source: str | None = None
+        self,
+        guild_id: int,
+        source: str | None = None,
+        *,
+        version: str | None = None,
+        keys: list[str] | None = None,
     ) -> dict:
-        """Notify the bot that guild configuration has changed."""
+        """Notify the bot that guild configuration has changed.
+
+        Args:
+            guild_id: Discord guild ID
+            source: Label for the settings area that changed
+            version: Settings version marker written with the change
+            keys: Setting keys the change touched; omit to reload everything
+        """
         client = await self._get_client()
-        json_body = {"source": source} if source else None
+        json_body: dict[str, object] = {}
+        if source:
+            json_body["source"] = source
+        if version:
+            json_body["version"] = version
+        if keys is not None:
+            json_body["keys"] = keys
         response = await client.post(
             f"/guilds/{guild_id}/config/refresh",
-            json=json_body,
+            json=json_body or None,
         )
         response.raise_for_status()
         return response.json()
@@ -1078,6 +1122,13 @@ class InternalAPIClient:
         payload = response.json()
         return payload.get("member_ids", [])
 
+    async def reload_voice_ownership(self) -> dict:
+        """Ask the bot to reload its voice ownership index from the database."""
+        client = await self._get_client()
+        response = await client.post("/voice/ownership/reload")
+        response.raise_for_status()
+        return response.json()
+
     async def get_occupied_voice_channels(self, guild_id: int) -> list[dict]:
         """Fetch all occupied voice/stage channels for a guild.
 
@@ -1,19 +1,23 @@
 """Shared guild-member utilities used by multiple route modules.
 
-Centralises guild-member-ID fetching (with a TTL cache), chunked
+Centralises guild-member-ID fetching (with a TTL cache), guild-scoped
 verification-table queries, and membership-status derivation so that
 ``routes/stats.py`` and ``routes/users.py`` share a single source of truth.
 """
 
 from __future__ import annotations
 
+import json
 import time
 from typing import TYPE_CHECKING
 
 from core.env_config import GUILD_IDS_CACHE_TTL
-from services.db.database import derive_membership_status
+from core.pagination import keyset_after
+from services.db.database import Database, derive_membership_status
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
+
     from core.dependencies import InternalAPIClient
 
 # ---------------------------------------------------------------------------
@@ -23,15 +27,12 @@ if TYPE_CHECKING:
 _GUILD_IDS_CACHE_TTL: int = GUILD_IDS_CACHE_TTL
 """Seconds before cached guild-member-ID sets expire."""
 
-_SQL_CHUNK_SIZE: int = 900
-"""Max parameters per SQL ``IN (…)`` clause (stays below SQLite's default
-``SQLITE_MAX_VARIABLE_NUMBER`` of 999)."""
-
 # ---------------------------------------------------------------------------
 # Guild-member-ID cache
 # ---------------------------------------------------------------------------
 
-_guild_ids_cache: dict[int, tuple[float, set[int]]] = {}
+_guild_ids_cache: dict[int, tuple[float, set[int], str | None]] = {}
+"""guild_id -> (expires_at, member_ids, etag)."""
 
 
 async def fetch_guild_member_ids(
@@ -42,106 +43,269 @@ async def fetch_guild_member_ids(
 
     Results are cached in-process for ``_GUILD_IDS_CACHE_TTL`` seconds to
     avoid repeated HTTP round-trips when multiple endpoints need the same
-    data within a short window (e.g. dashboard + users page).
+    data within a short window (e.g. dashboard + users page). Once expired,
+    the entry is revalidated with its ETag, so an unchanged member set costs
+    a single 304 response.
     """
     now = time.time()
     cached = _guild_ids_cache.get(guild_id)
     if cached and cached[0] > now:
         return cached[1]
 
-    member_ids: set[int] = set()
-    page_num = 1
-    page_size = 1000
+    etag, member_id_list = await internal_api.get_guild_member_ids(
+        guild_id, etag=cached[2] if cached else None
+    )
+    if member_id_list is None and cached:
+        member_ids = cached[1]
+    else:
+        member_ids = set(member_id_list or ())
 
-    while True:
-        data = await internal_api.get_guild_members(
-            guild_id,
-            page=page_num,
-            page_size=page_size,
-        )
-        members = data.get("members", [])
-        for member in members:
-            user_id = member.get("user_id")
-            if user_id is not None:
-                member_ids.add(int(user_id))
-        if len(members) < page_size:
-            break
-        page_num += 1
-
-    _guild_ids_cache[guild_id] = (now + _GUILD_IDS_CACHE_TTL, member_ids)
+    _guild_ids_cache[guild_id] = (now + _GUILD_IDS_CACHE_TTL, member_ids, etag)
     return member_ids
 
 
 # ---------------------------------------------------------------------------
-# Chunked verification helpers
+# Guild-scoped verification queries
 # ---------------------------------------------------------------------------
 
+MEMBER_SCOPE_SQL: str = "user_id IN (SELECT value FROM json_each(?))"
+"""Restricts a verification query to a member-ID set bound as one JSON array.
+
+A single parameter keeps large guilds clear of SQLite's variable limit and
+lets ``ORDER BY`` / ``LIMIT`` / ``COUNT`` run in one statement."""
+
+
+_ORDERED_MEMBER_SCOPE_SQL: str = f"+{MEMBER_SCOPE_SQL}"
+"""Member scope for ordered listings.
+
+The unary ``+`` stops SQLite from driving the query by member id (which
+evaluates every member, then sorts them all), so pages walk
+``idx_verification_keyset`` from the cursor and stop at ``LIMIT``."""
+
+
+def member_scope_param(member_ids: Iterable[int]) -> str:
+    """Encode *member_ids* as the JSON array bound to :data:`MEMBER_SCOPE_SQL`."""
+    return json.dumps(list(member_ids))
+
+
+def membership_status_sql(
+    organization_sid: str | None,
+    *,
+    missing_orgs_status: str = "unknown",
+) -> tuple[str, list]:
+    """SQL expression mirroring :func:`derive_status_from_orgs`.
+
+    Membership is looked up in the trigger-maintained
+    ``verification_org_membership`` index (upper-cased SIDs, REDACTED
+    excluded). Each kind is an uncorrelated ``IN`` list, which SQLite
+    builds once per statement from a range of
+    ``idx_verification_org_membership_org`` instead of probing the table
+    for every row. Empty or malformed org columns count as missing,
+    matching the route-level JSON parsing; *missing_orgs_status* is what
+    such rows derive to when an org SID is configured. Returns
+    ``(expression, params)``.
+    """
+    if not organization_sid:
+        return "'unknown'", []
+
+    member_of = (
+        "user_id IN (SELECT user_id FROM verification_org_membership"
+        " WHERE org_sid = ? AND kind = '{kind}')"
+    )
+    expression = (
+        "CASE WHEN json_valid(main_orgs) IS NOT 1 AND json_valid(affiliate_orgs) IS NOT 1"
+        " THEN ?"
+        f" WHEN {member_of.format(kind='main')} THEN 'main'"
+        f" WHEN {member_of.format(kind='affiliate')} THEN 'affiliate'"
+        " ELSE 'non_member' END"
+    )
+    target = organization_sid.upper()
+    return expression, [missing_orgs_status, target, target]
+
 
 async def count_verified_for_member_ids(
     db,
-    member_ids: set[int] | list[int],
+    member_ids: Iterable[int],
 ) -> int:
-    """``COUNT(*)`` from the *verification* table for given member IDs.
-
-    The query is split into chunks of ``_SQL_CHUNK_SIZE`` to respect
-    SQLite parameter limits on ``IN (…)`` clauses.
-    """
-    id_list = list(member_ids) if isinstance(member_ids, set) else member_ids
+    """``COUNT(*)`` from the *verification* table for given member IDs."""
+    id_list = list(member_ids)
     if not id_list:
         return 0
 
-    total = 0
-    for start in range(0, len(id_list), _SQL_CHUNK_SIZE):
-        chunk = id_list[start : start + _SQL_CHUNK_SIZE]
-        placeholders = ",".join("?" * len(chunk))
-        cursor = await db.execute(
-            f"SELECT COUNT(*) FROM verification WHERE user_id IN ({placeholders})",
-            chunk,
-        )
-        row = await cursor.fetchone()
-        total += row[0] if row else 0
-
-    return total
+    cursor = await db.execute(
+        f"SELECT COUNT(*) FROM verification WHERE {MEMBER_SCOPE_SQL}",
+        [member_scope_param(id_list)],
+    )
+    row = await cursor.fetchone()
+    return row[0] if row else 0
 
 
-async def query_verification_chunked(
+async def count_statuses_for_member_ids(
     db,
-    member_ids: set[int] | list[int],
+    member_ids: Iterable[int],
+    organization_sid: str | None,
+) -> dict[str, int]:
+    """Break guild members' verification rows down by derived membership status.
+
+    Rows whose org columns are both ``NULL`` have not been categorised yet
+    and are left out of the breakdown. ``main`` / ``affiliate`` are counted
+    from ``verification_org_membership`` alone (a user in both counts as
+    ``main``); one pass over the members' verification rows supplies the
+    categorised total and the ``unknown`` rows, and ``non_member`` is the
+    remainder. Statuses with no rows are omitted.
+    """
+    id_list = list(member_ids)
+    if not id_list:
+        return {}
+
+    scope = member_scope_param(id_list)
+    cursor = await db.execute(
+        "SELECT COUNT(*), COALESCE(SUM("
+        "json_valid(main_orgs) IS NOT 1 AND json_valid(affiliate_orgs) IS NOT 1"
+        "), 0) "
+        f"FROM verification WHERE {MEMBER_SCOPE_SQL} "
+        "AND NOT (main_orgs IS NULL AND affiliate_orgs IS NULL)",
+        [scope],
+    )
+    row = await cursor.fetchone()
+    categorised, unknown = (row[0], row[1]) if row else (0, 0)
+    if not organization_sid:
+        return {"unknown": categorised} if categorised else {}
+
+    # 'main' sorts after 'affiliate', so MAX(kind) applies main precedence
+    cursor = await db.execute(
+        "SELECT kind, COUNT(*) FROM ("
+        "SELECT MAX(kind) AS kind FROM verification_org_membership "
+        f"WHERE org_sid = ? AND {MEMBER_SCOPE_SQL} GROUP BY user_id"
+        ") GROUP BY kind",
+        [organization_sid.upper(), scope],
+    )
+    counts = dict(await cursor.fetchall())
+    counts["unknown"] = unknown
+    counts["non_member"] = (
+        categorised - unknown - counts.get("main", 0) - counts.get("affiliate", 0)
+    )
+    return {status: count for status, count in counts.items() if count}
+
+
+def build_verification_scope(
     columns: str,
     *,
+    organization_sid: str | None,
+    member_ids: Iterable[int] | None = None,
     where_clause: str = "",
     where_params: list | None = None,
-) -> list[tuple]:
-    """``SELECT <columns> FROM verification`` filtered to *member_ids*.
+    status_filters: list[str] | None = None,
+    exclude_ids: Iterable[int] | None = None,
+    missing_orgs_status: str = "unknown",
+) -> tuple[str, list]:
+    """Build a ``FROM`` source of verification rows with derived status.
+
+    The returned ``(from_sql, params)`` selects *columns* plus a trailing
+    ``membership_status`` column, already restricted to *member_ids* (when
+    given), the extra *where_clause*, *status_filters* and *exclude_ids*.
+    *missing_orgs_status* is passed through to :func:`membership_status_sql`.
+    Callers wrap it in ``SELECT COUNT(*)`` or an ordered, paged ``SELECT``.
+    """
+    status_sql, status_params = membership_status_sql(
+        organization_sid, missing_orgs_status=missing_orgs_status
+    )
 
-    Like :func:`count_verified_for_member_ids`, the query is chunked to
-    stay within SQLite parameter limits.  Results from all chunks are
-    concatenated — **no** ``ORDER BY`` is applied, so callers that need
-    ordering must sort in Python afterwards.
+    conditions: list[str] = []
+    params: list = [*status_params]
+    if member_ids is not None:
+        conditions.append(_ORDERED_MEMBER_SCOPE_SQL)
+        params.append(member_scope_param(member_ids))
+    if where_clause:
+        conditions.append(where_clause)
+        params.extend(where_params or [])
+    exclude_list = list(exclude_ids or ())
+    if exclude_list:
+        conditions.append("user_id NOT IN (SELECT value FROM json_each(?))")
+        params.append(member_scope_param(exclude_list))
+
+    where_sql = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    inner = (
+        f"SELECT {columns}, {status_sql} AS membership_status "
+        f"FROM verification{where_sql}"
+    )
+    outer_where = ""
+    if status_filters:
+        outer_where = (
+            f" WHERE membership_status IN ({','.join('?' * len(status_filters))})"
+        )
+        params.extend(status_filters)
+    return f"(SELECT * FROM ({inner}){outer_where})", params
 
-    *where_clause* and *where_params* allow additional SQL conditions
-    (e.g. search / org filters) to be AND-ed with the member filter.
-    """
-    id_list = list(member_ids) if isinstance(member_ids, set) else member_ids
-    if not id_list:
-        return []
 
-    extra_params = where_params or []
-    rows: list[tuple] = []
+VERIFICATION_KEYSET: tuple[str, str] = ("last_updated", "user_id")
+"""Sort key of scoped verification listings (both DESC; user_id breaks ties)."""
+
+_SCOPE_ORDER_BY = "last_updated DESC, user_id DESC"
 
-    for start in range(0, len(id_list), _SQL_CHUNK_SIZE):
-        chunk = id_list[start : start + _SQL_CHUNK_SIZE]
-        placeholders = ",".join("?" * len(chunk))
-        member_filter = f"user_id IN ({placeholders})"
-        combined = (
-            f"{member_filter} AND {where_clause}" if where_clause else member_filter
-        )
-        sql = f"SELECT {columns} FROM verification WHERE {combined}"
-        cursor = await db.execute(sql, chunk + extra_params)
-        chunk_rows = await cursor.fetchall()
-        rows.extend(chunk_rows)
 
-    return rows
+async def page_verification_scope(
+    db,
+    from_sql: str,
+    params: list,
+    *,
+    limit: int | None = None,
+    offset: int = 0,
+    after: tuple | None = None,
+    with_total: bool = True,
+) -> tuple[list[tuple], int | None]:
+    """Run an ordered page and (optionally) a ``COUNT`` over *from_sql*.
+
+    Rows are ordered newest first by :data:`VERIFICATION_KEYSET`. With
+    *after* (a decoded cursor) the page starts past that key instead of
+    skipping *offset* rows. Returns ``(rows, total)``; *total* is ``None``
+    when *with_total* is false.
+    """
+    total: int | None = None
+    if with_total:
+        cursor = await db.execute(f"SELECT COUNT(*) FROM {from_sql}", params)
+        row = await cursor.fetchone()
+        total = row[0] if row else 0
+        if total == 0:
+            return [], total
+
+    keyset_sql, keyset_params = keyset_after(VERIFICATION_KEYSET, after)
+    where_sql = f" WHERE {keyset_sql}" if keyset_sql else ""
+    query = f"SELECT * FROM {from_sql}{where_sql} ORDER BY {_SCOPE_ORDER_BY}"
+    page_params = [*params, *keyset_params]
+    if limit is not None:
+        query += " LIMIT ? OFFSET ?"
+        page_params.extend([limit, 0 if after is not None else offset])
+    cursor = await db.execute(query, page_params)
+    rows = await cursor.fetchall()
+    return list(rows), total
+
+
+async def iter_verification_scope(
+    from_sql: str,
+    params: list,
+    *,
+    batch_size: int = 500,
+) -> AsyncIterator[list[tuple]]:
+    """Yield rows of *from_sql* in keyset pages of *batch_size*, newest first.
+
+    Each page is read on its own pooled read connection, which is released
+    before the page is yielded. Callers can therefore do slow per-batch
+    work (Discord enrichment, a slow client) without pinning a reader, and
+    the result set is never materialised.
+    """
+    after: tuple | None = None
+    while True:
+        async with Database.get_read_connection() as db:
+            rows, _ = await page_verification_scope(
+                db, from_sql, params, limit=batch_size, after=after, with_total=False
+            )
+        if not rows:
+            return
+        yield rows
+        if len(rows) < batch_size:
+            return
+        after = tuple(rows[-1][column] for column in VERIFICATION_KEYSET)
 
 
 # ---------------------------------------------------------------------------
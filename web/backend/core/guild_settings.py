@@ -317,6 +317,45 @@ NEW_MEMBER_ROLE_DURATION_DAYS_KEY = "new_member_role.duration_days"
 NEW_MEMBER_ROLE_MAX_SERVER_AGE_DAYS_KEY = "new_member_role.max_server_age_days"
 SETTINGS_VERSION_NEW_MEMBER_ROLE_SOURCE = "new_member_role"
 
+# Keys written by each settings section; pushed to the bot so it reloads only these
+ROLE_SETTINGS_KEYS = (
+    BOT_ADMINS_KEY,
+    DISCORD_MANAGERS_KEY,
+    MODERATORS_KEY,
+    STAFF_KEY,
+    BOT_VERIFIED_ROLE_KEY,
+    MAIN_ROLE_KEY,
+    AFFILIATE_ROLE_KEY,
+    NONMEMBER_ROLE_KEY,
+    DELEGATION_POLICIES_KEY,
+)
+CHANNEL_SETTINGS_KEYS = (
+    VERIFICATION_CHANNEL_KEY,
+    BOT_SPAM_CHANNEL_KEY,
+    PUBLIC_ANNOUNCEMENT_CHANNEL_KEY,
+    LEADERSHIP_ANNOUNCEMENT_CHANNEL_KEY,
+)
+VOICE_SETTINGS_KEYS = (SELECTABLE_ROLES_KEY,)
+METRICS_SETTINGS_KEYS = (
+    METRICS_EXCLUDED_CHANNEL_IDS_KEY,
+    METRICS_TRACKED_GAMES_MODE_KEY,
+    METRICS_TRACKED_GAMES_KEY,
+    METRICS_MIN_VOICE_MINUTES_KEY,
+    METRICS_MIN_GAME_MINUTES_KEY,
+    METRICS_MIN_MESSAGES_KEY,
+)
+ORGANIZATION_SETTINGS_KEYS = (
+    ORGANIZATION_SID_KEY,
+    ORGANIZATION_NAME_KEY,
+    ORGANIZATION_LOGO_URL_KEY,
+)
+NEW_MEMBER_ROLE_SETTINGS_KEYS = (
+    NEW_MEMBER_ROLE_ENABLED_KEY,
+    NEW_MEMBER_ROLE_ID_KEY,
+    NEW_MEMBER_ROLE_DURATION_DAYS_KEY,
+    NEW_MEMBER_ROLE_MAX_SERVER_AGE_DAYS_KEY,
+)
+
 
 def _coerce_role_list(value: Any) -> list[str]:
     """Convert stored JSON values into a list of string IDs to preserve precision."""
@@ -543,6 +582,23 @@ def _make_version_payload(source: str | None = None) -> str:
     return json.dumps(payload)
 
 
+async def get_settings_version(db: Connection, guild_id: int) -> str | None:
+    """Return the guild's current settings version marker, if one was written."""
+    cursor = await db.execute(
+        "SELECT value FROM guild_settings WHERE guild_id = ? AND key = ?",
+        (guild_id, SETTINGS_VERSION_KEY),
+    )
+    row = await cursor.fetchone()
+    if not row:
+        return None
+    try:
+        payload = json.loads(row[0])
+    except (TypeError, json.JSONDecodeError):
+        return None
+    version = payload.get("version") if isinstance(payload, dict) else None
+    return str(version) if version else None
+
+
 async def _touch_settings_version(
     db: Connection, guild_id: int, *, source: str | None = None
 ) -> None:
@@ -4,8 +4,19 @@ Pagination constants and utilities for the web API.
 Provides shared pagination defaults and caps for consistent behavior
 across user and voice endpoints, especially for cross-guild queries
 that may return large datasets (100k+ members).
+
+Listings that can grow large also support keyset (cursor) pagination:
+the client echoes back an opaque ``next_cursor`` and the next page is an
+indexed range scan on the sort key, so deep pages cost the same as the
+first one.
 """
 
+import base64
+import binascii
+import json
+
+from fastapi import HTTPException
+
 # --- Pagination Defaults ---
 
 # Default page sizes
@@ -55,3 +66,66 @@ def is_all_guilds_mode(active_guild_id: str | None) -> bool:
         True if in "All Guilds" mode
     """
     return active_guild_id == ALL_GUILDS_SENTINEL
+
+
+# --- Keyset (cursor) pagination ---
+
+
+def encode_cursor(*values: int | str) -> str:
+    """Encode a row's sort-key values as an opaque, URL-safe cursor."""
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str | None,
+    arity: int,
+    *,
+    types: tuple[type[int] | type[str], ...] | None = None,
+) -> tuple | None:
+    """
+    Decode a cursor produced by :func:`encode_cursor`.
+
+    Args:
+        cursor: Opaque cursor from the client (``None`` for the first page)
+        arity: Number of sort-key values the listing expects
+        types: Expected type of each value (``int`` or ``str``); all
+            ``int`` by default
+
+    Returns:
+        Tuple of sort-key values, or None when no cursor was given
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed or a value has the
+            wrong type
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError, UnicodeDecodeError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+    if not isinstance(values, list) or len(values) != arity:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    for value, expected in zip(values, types or (int,) * arity, strict=True):
+        # bool is an int subclass but never a valid sort key
+        if not isinstance(value, expected) or isinstance(value, bool):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    return tuple(values)
+
+
+def keyset_after(columns: tuple[str, ...], after: tuple | None) -> tuple[str, list]:
+    """
+    Build the WHERE fragment selecting rows past *after* in descending order.
+
+    Listings order by ``columns`` all DESC (the last column being a unique
+    tie-breaker), so the next page is a single row-value comparison that
+    SQLite can serve from a matching index.
+
+    Returns:
+        (condition, params) — condition is empty string when *after* is None.
+    """
+    if after is None:
+        return "", []
+    return f"({', '.join(columns)}) < ({', '.join('?' * len(columns))})", list(after)
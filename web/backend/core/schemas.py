@@ -162,9 +162,10 @@ class UserSearchResponse(BaseModel):
 
     success: bool = True
     items: list[VerificationRecord]
-    total: int
+    total: int | None  # None when include_total=false
     page: int
     page_size: int
+    next_cursor: str | None = None  # Keyset cursor for the following page
 
 
 # Voice schemas
@@ -1023,9 +1024,10 @@ class TicketListResponse(BaseModel):
 
     success: bool = True
     items: list[TicketInfo] = Field(default_factory=list)
-    total: int = 0
+    total: int | None = 0  # None when include_total=false
     page: int = 1
     page_size: int = 20
+    next_cursor: str | None = None  # Keyset cursor for the following page
 
 
 class TicketStatsResponse(BaseModel):